@@ -8,9 +8,15 @@ from typing import TYPE_CHECKING, Any, TypedDict
 from config import url
 
 from .adjustment_calculator import AdjustmentCalculator
-from .constants import DEFAULT_LOCALE, AdjustmentTarget, AdjustmentType
+from .async_http_client import AsyncBillingAPIClient, gather_with_concurrency
+from .constants import (
+    DEFAULT_LOCALE,
+    DEFAULT_MAX_CONCURRENCY,
+    AdjustmentTarget,
+    AdjustmentType,
+)
 from .exceptions import APIRequestException, ValidationException
-from .http_client import BillingAPIClient
+from .http_client import BillingAPIClient, HTTPMethod, RequestSpec
 
 if TYPE_CHECKING:
     from .billing_types import AdjustmentData
@@ -34,22 +40,20 @@ class LegacyAdjustmentParams(TypedDict, total=False):
 logger = logging.getLogger(__name__)
 
 
-class AdjustmentManager:
-    """Manages billing adjustments (discounts/surcharges)."""
+class _AdjustmentManagerBase:
+    """Parameter handling shared by the sync and async adjustment managers."""
 
-    def __init__(self, month: str, client: BillingAPIClient | None = None) -> None:
-        """Initialize adjustment manager.
+    def __init__(self, month: str) -> None:
+        """Initialize shared adjustment state.
 
         Args:
             month: Target month in YYYY-MM format
-            client: Optional BillingAPIClient instance for dependency injection
         """
         self.month = month
-        self._client = client if client else BillingAPIClient(url.BASE_BILLING_URL)
 
     def __repr__(self) -> str:
-        """Return string representation of AdjustmentManager."""
-        return f"AdjustmentManager(month={self.month})"
+        """Return string representation of the manager."""
+        return f"{type(self).__name__}(month={self.month})"
 
     def _normalize_adjustment_params(
         self, **kwargs: Any
@@ -167,31 +171,14 @@ class AdjustmentManager:
 
         return endpoint, adjustment_data
 
-    def apply_adjustment(self, **kwargs: Any) -> dict[str, Any]:
-        """Apply discount or surcharge to billing group or project.
-
-        Supports both modern and legacy parameter names for backward compatibility.
-
-        Modern parameters:
-            adjustment_amount: Amount or percentage of adjustment
-            adjustment_type: Type of adjustment (FIXED_DISCOUNT, RATE_DISCOUNT, etc.)
-            adjustment_target: Target type (BillingGroup or Project)
-            target_id: ID of the target (billing group ID or project ID)
-            description: Description of the adjustment
-
-        Legacy parameters:
-            adjustment: Amount (legacy name for adjustment_amount)
-            adjustmentType: Type (legacy name for adjustment_type)
-            adjustmentTarget: Target (legacy name for adjustment_target)
-            projectId: Project ID (when target is Project)
-            billingGroupId: Billing group ID (when target is BillingGroup)
+    def _prepare_adjustment(self, **kwargs: Any) -> tuple[str, AdjustmentData]:
+        """Normalize, validate and build an adjustment request.
 
         Returns:
-            API response data
+            Tuple of (endpoint, adjustment_data)
 
         Raises:
             ValidationException: If parameters are invalid
-            APIRequestException: If API request fails
         """
         # Normalize parameters
         (
@@ -230,41 +217,16 @@ class AdjustmentManager:
             self.month,
         )
 
-        try:
-            response = self._client.post(endpoint, json_data=adjustment_data)
-            logger.info(
-                "Successfully applied adjustment to %s %s",
-                adjustment_target,
-                target_id,
-            )
-        except APIRequestException:
-            logger.exception("Failed to apply adjustment")
-            raise
-        else:
-            return response
+        return endpoint, adjustment_data
 
-    def get_adjustments(
+    def _build_list_request(
         self,
         adjustment_target: AdjustmentTarget | str,
         target_id: str,
-        page: int = 1,
-        items_per_page: int = 50,
-    ) -> list[str]:
-        """Get list of adjustment IDs for a target.
-
-        Args:
-            adjustment_target: Target type (BillingGroup or Project)
-            target_id: ID of the target
-            page: Page number for pagination
-            items_per_page: Number of items per page
-
-        Returns:
-            List of adjustment IDs
-
-        Raises:
-            ValidationException: If parameters are invalid
-            APIRequestException: If API request fails
-        """
+        page: int,
+        items_per_page: int,
+    ) -> tuple[str, dict[str, Any]]:
+        """Build the endpoint and query parameters for listing adjustments."""
         adjustment_target_str = (
             adjustment_target.value
             if isinstance(adjustment_target, AdjustmentTarget)
@@ -291,17 +253,7 @@ class AdjustmentManager:
             "Retrieving adjustments for %s %s", adjustment_target_str, target_id
         )
 
-        try:
-            response = self._client.get(endpoint, params=params)
-            adjustment_ids = [
-                item["adjustmentId"] for item in response.get("adjustments", [])
-            ]
-            logger.info("Found %d adjustments", len(adjustment_ids))
-        except APIRequestException:
-            logger.exception("Failed to retrieve adjustments")
-            raise
-        else:
-            return adjustment_ids
+        return endpoint, params
 
     def _extract_adjustment_ids_from_dict(
         self,
@@ -364,30 +316,18 @@ class AdjustmentManager:
             return BILLING_GROUP_ADJUSTMENTS_ENDPOINT
         return PROJECT_ADJUSTMENTS_ENDPOINT
 
-    def _delete_single_adjustment(self, endpoint: str, adj_id: str) -> None:
-        """Delete a single adjustment."""
-        redacted_adj_id = f"...{adj_id[-4:]}" if adj_id and len(adj_id) > 4 else "***"
-        logger.info("Deleting adjustment %s", redacted_adj_id)
-        try:
-            self._client.delete(endpoint, params={"adjustmentIds": adj_id})
-            logger.info("Successfully deleted adjustment %s", redacted_adj_id)
-        except APIRequestException:
-            logger.exception("Failed to delete adjustment %s", redacted_adj_id)
-            raise
-
-    def delete_adjustment(
+    def _resolve_delete_request(
         self,
         adjustment_ids: str | list[str] | dict[str, Any],
-        adjustment_target: AdjustmentTarget | str | None = None,
-    ) -> None:
-        """Delete one or more adjustments.
+        adjustment_target: AdjustmentTarget | str | None,
+    ) -> tuple[str, list[str]] | None:
+        """Normalize IDs and target for deletion.
 
-        Args:
-            adjustment_ids: Single adjustment ID or list of IDs to delete
-            adjustment_target: Target type (BillingGroup or Project)
+        Returns:
+            Tuple of (endpoint, adjustment_ids), or None if there is nothing to delete
 
         Raises:
-            APIRequestException: If any deletion fails
+            ValidationException: If adjustment target is missing
         """
         # Prepare adjustment IDs
         adjustment_ids, adjustment_target = self._prepare_adjustment_ids(
@@ -396,7 +336,7 @@ class AdjustmentManager:
 
         if not adjustment_ids:
             logger.info("No adjustment IDs to delete")
-            return
+            return None
 
         # Validate target
         if not adjustment_target:
@@ -410,10 +350,146 @@ class AdjustmentManager:
             else adjustment_target
         )
 
-        # Get endpoint and delete each adjustment
-        endpoint = self._get_delete_endpoint(adjustment_target_str)
-        for adj_id in adjustment_ids:
-            self._delete_single_adjustment(endpoint, adj_id)
+        return self._get_delete_endpoint(adjustment_target_str), adjustment_ids
+
+    @staticmethod
+    def _redact_adjustment_id(adj_id: str) -> str:
+        """Mask an adjustment ID for logging."""
+        return f"...{adj_id[-4:]}" if adj_id and len(adj_id) > 4 else "***"
+
+
+class AdjustmentManager(_AdjustmentManagerBase):
+    """Manages billing adjustments (discounts/surcharges)."""
+
+    def __init__(self, month: str, client: BillingAPIClient | None = None) -> None:
+        """Initialize adjustment manager.
+
+        Args:
+            month: Target month in YYYY-MM format
+            client: Optional BillingAPIClient instance for dependency injection
+        """
+        super().__init__(month)
+        self._client = client if client else BillingAPIClient(url.BASE_BILLING_URL)
+
+    def apply_adjustment(self, **kwargs: Any) -> dict[str, Any]:
+        """Apply discount or surcharge to billing group or project.
+
+        Supports both modern and legacy parameter names for backward compatibility.
+
+        Modern parameters:
+            adjustment_amount: Amount or percentage of adjustment
+            adjustment_type: Type of adjustment (FIXED_DISCOUNT, RATE_DISCOUNT, etc.)
+            adjustment_target: Target type (BillingGroup or Project)
+            target_id: ID of the target (billing group ID or project ID)
+            description: Description of the adjustment
+
+        Legacy parameters:
+            adjustment: Amount (legacy name for adjustment_amount)
+            adjustmentType: Type (legacy name for adjustment_type)
+            adjustmentTarget: Target (legacy name for adjustment_target)
+            projectId: Project ID (when target is Project)
+            billingGroupId: Billing group ID (when target is BillingGroup)
+
+        Returns:
+            API response data
+
+        Raises:
+            ValidationException: If parameters are invalid
+            APIRequestException: If API request fails
+        """
+        endpoint, adjustment_data = self._prepare_adjustment(**kwargs)
+
+        try:
+            response = self._client.post(endpoint, json_data=adjustment_data)
+            logger.info("Successfully applied adjustment via %s", endpoint)
+        except APIRequestException:
+            logger.exception("Failed to apply adjustment")
+            raise
+        else:
+            return response
+
+    def get_adjustments(
+        self,
+        adjustment_target: AdjustmentTarget | str,
+        target_id: str,
+        page: int = 1,
+        items_per_page: int = 50,
+    ) -> list[str]:
+        """Get list of adjustment IDs for a target.
+
+        Args:
+            adjustment_target: Target type (BillingGroup or Project)
+            target_id: ID of the target
+            page: Page number for pagination
+            items_per_page: Number of items per page
+
+        Returns:
+            List of adjustment IDs
+
+        Raises:
+            ValidationException: If parameters are invalid
+            APIRequestException: If API request fails
+        """
+        endpoint, params = self._build_list_request(
+            adjustment_target, target_id, page, items_per_page
+        )
+
+        try:
+            response = self._client.get(endpoint, params=params)
+            adjustment_ids = [
+                item["adjustmentId"] for item in response.get("adjustments", [])
+            ]
+            logger.info("Found %d adjustments", len(adjustment_ids))
+        except APIRequestException:
+            logger.exception("Failed to retrieve adjustments")
+            raise
+        else:
+            return adjustment_ids
+
+    def delete_adjustment(
+        self,
+        adjustment_ids: str | list[str] | dict[str, Any],
+        adjustment_target: AdjustmentTarget | str | None = None,
+        max_concurrency: int | None = None,
+    ) -> None:
+        """Delete one or more adjustments concurrently.
+
+        Args:
+            adjustment_ids: Single adjustment ID or list of IDs to delete
+            adjustment_target: Target type (BillingGroup or Project)
+            max_concurrency: Optional cap on in-flight requests
+
+        Raises:
+            APIRequestException: If any deletion fails (first failure in input order)
+        """
+        delete_request = self._resolve_delete_request(adjustment_ids, adjustment_target)
+        if delete_request is None:
+            return
+
+        endpoint, ids = delete_request
+        outcomes = self._client.map_requests(
+            [
+                RequestSpec(
+                    HTTPMethod.DELETE, endpoint, params={"adjustmentIds": adj_id}
+                )
+                for adj_id in ids
+            ],
+            max_concurrency=max_concurrency,
+        )
+
+        first_error: Exception | None = None
+        for adj_id, outcome in zip(ids, outcomes, strict=True):
+            redacted_adj_id = self._redact_adjustment_id(adj_id)
+            if isinstance(outcome, Exception):
+                logger.error(
+                    "Failed to delete adjustment %s: %s", redacted_adj_id, outcome
+                )
+                first_error = first_error or outcome
+            else:
+                logger.info("Successfully deleted adjustment %s", redacted_adj_id)
+
+        if first_error is not None:
+            raise first_error
 
     def delete_all_adjustments(
         self, adjustment_target: AdjustmentTarget | str, target_id: str
@@ -453,3 +529,138 @@ class AdjustmentManager:
             return {"adjustments": adjustments}
         # Return empty list if no target specified
         return {"adjustments": []}
+
+
+class AsyncAdjustmentManager(_AdjustmentManagerBase):
+    """Asyncio counterpart of AdjustmentManager.
+
+    Multiple adjustments are deleted concurrently on the client's event loop.
+    """
+
+    def __init__(
+        self,
+        month: str,
+        client: AsyncBillingAPIClient | None = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> None:
+        """Initialize async adjustment manager.
+
+        Args:
+            month: Target month in YYYY-MM format
+            client: Optional AsyncBillingAPIClient instance for dependency injection
+            max_concurrency: Maximum number of requests in flight for bulk calls
+        """
+        super().__init__(month)
+        self._client = client if client else AsyncBillingAPIClient(url.BASE_BILLING_URL)
+        self.max_concurrency = max_concurrency
+
+    async def apply_adjustment(self, **kwargs: Any) -> dict[str, Any]:
+        """Apply discount or surcharge to billing group or project.
+
+        Accepts the same modern and legacy parameters as
+        AdjustmentManager.apply_adjustment.
+
+        Returns:
+            API response data
+
+        Raises:
+            ValidationException: If parameters are invalid
+            APIRequestException: If API request fails
+        """
+        endpoint, adjustment_data = self._prepare_adjustment(**kwargs)
+
+        try:
+            response = await self._client.post(endpoint, json_data=adjustment_data)
+            logger.info("Successfully applied adjustment via %s", endpoint)
+        except APIRequestException:
+            logger.exception("Failed to apply adjustment")
+            raise
+        else:
+            return response
+
+    async def get_adjustments(
+        self,
+        adjustment_target: AdjustmentTarget | str,
+        target_id: str,
+        page: int = 1,
+        items_per_page: int = 50,
+    ) -> list[str]:
+        """Get list of adjustment IDs for a target.
+
+        Args:
+            adjustment_target: Target type (BillingGroup or Project)
+            target_id: ID of the target
+            page: Page number for pagination
+            items_per_page: Number of items per page
+
+        Returns:
+            List of adjustment IDs
+
+        Raises:
+            APIRequestException: If API request fails
+        """
+        endpoint, params = self._build_list_request(
+            adjustment_target, target_id, page, items_per_page
+        )
+
+        try:
+            response = await self._client.get(endpoint, params=params)
+        except APIRequestException:
+            logger.exception("Failed to retrieve adjustments")
+            raise
+
+        return [item["adjustmentId"] for item in response.get("adjustments", [])]
+
+    async def delete_adjustment(
+        self,
+        adjustment_ids: str | list[str] | dict[str, Any],
+        adjustment_target: AdjustmentTarget | str | None = None,
+    ) -> None:
+        """Delete one or more adjustments concurrently.
+
+        Args:
+            adjustment_ids: Single adjustment ID or list of IDs to delete
+            adjustment_target: Target type (BillingGroup or Project)
+
+        Raises:
+            APIRequestException: If any deletion fails (first failure in input order)
+        """
+        delete_request = self._resolve_delete_request(adjustment_ids, adjustment_target)
+        if delete_request is None:
+            return
+
+        endpoint, ids = delete_request
+        outcomes = await gather_with_concurrency(
+            (
+                self._client.delete(endpoint, params={"adjustmentIds": adj_id})
+                for adj_id in ids
+            ),
+            limit=self.max_concurrency,
+        )
+
+        for adj_id, outcome in zip(ids, outcomes, strict=True):
+            if isinstance(outcome, BaseException):
+                logger.error(
+                    "Failed to delete adjustment %s",
+                    self._redact_adjustment_id(adj_id),
+                )
+                raise outcome
+
+    async def delete_all_adjustments(
+        self, adjustment_target: AdjustmentTarget | str, target_id: str
+    ) -> int:
+        """Delete all adjustments for a target.
+
+        Args:
+            adjustment_target: Target type (BillingGroup or Project)
+            target_id: ID of the target
+
+        Returns:
+            Number of adjustments deleted
+        """
+        adjustment_ids = await self.get_adjustments(adjustment_target, target_id)
+
+        if adjustment_ids:
+            await self.delete_adjustment(adjustment_ids, adjustment_target)
+
+        return len(adjustment_ids)
@@ -15,7 +15,11 @@ class CalculationManager:
     """Manages billing calculations and resource cleanup."""
 
     def __init__(
-        self, month: str, uuid: str, client: BillingAPIClient | None = None
+        self,
+        month: str,
+        uuid: str,
+        client: BillingAPIClient | None = None,
+        progress_stream: bool = False,
     ) -> None:
         """Initialize calculation manager.
 
@@ -23,9 +27,12 @@ class CalculationManager:
             month: Target month in YYYY-MM format
             uuid: User UUID for calculations
             client: Optional HTTP client for API requests
+            progress_stream: Whether to wait on the server-sent progress
+                stream instead of polling
         """
         self.month = month
         self.uuid = uuid
+        self.progress_stream = progress_stream
         self._client = client or BillingAPIClient(url.BASE_BILLING_URL)
 
     def __repr__(self) -> str:
@@ -71,23 +78,30 @@ class CalculationManager:
             raise
 
     def _wait_for_calculation_completion(
-        self, timeout: int = 300, check_interval: int = 3
+        self, timeout: int = 300, check_interval: float | None = None
     ) -> bool:
         """Wait for calculation to complete.
 
         Args:
             timeout: Maximum time to wait in seconds
-            check_interval: Seconds between progress checks
+            check_interval: Fixed seconds between progress checks; None polls
+                on an adaptive schedule driven by the reported progress
 
         Returns:
             True if completed successfully, False if timeout
         """
+        query = f"month={self.month}&uuid={self.uuid}"
         result = self._client.wait_for_completion(
-            check_endpoint=f"billing/admin/progress?month={self.month}&uuid={self.uuid}",
+            check_endpoint=f"billing/admin/progress?{query}",
             status_field="status",
             success_value="COMPLETED",
             timeout=timeout,
             check_interval=check_interval,
+            stream_endpoint=(
+                f"billing/admin/progress/stream?{query}"
+                if self.progress_stream
+                else None
+            ),
         )
         # Convert result to bool - assuming success if no exception
         return bool(result)
@@ -1,13 +1,17 @@
 """Contract management for billing system."""
 
+from __future__ import annotations
+
 import logging
 from typing import TYPE_CHECKING, Any
 
 from config import url
 
+from .async_http_client import AsyncBillingAPIClient, gather_with_concurrency
+from .constants import DEFAULT_MAX_CONCURRENCY
 from .contract_validator import ContractValidator
 from .exceptions import APIRequestException
-from .http_client import BillingAPIClient
+from .http_client import BillingAPIClient, HTTPMethod, RequestSpec
 
 if TYPE_CHECKING:
     from .billing_types import ContractData
@@ -17,8 +21,84 @@ logger = logging.getLogger(__name__)
 # Common headers
 JSON_HEADERS = {"Accept": "application/json", "Content-Type": "application/json"}
 
+# Attempts per counter when fetching prices
+COUNTER_PRICE_MAX_RETRIES = 3
+
+
+class _ContractManagerBase:
+    """Validation and payload logic shared by the sync and async managers."""
+
+    def __init__(self, month: str, billing_group_id: str) -> None:
+        """Initialize shared contract state.
+
+        Args:
+            month: Target month in YYYY-MM format
+            billing_group_id: Billing group ID for contract operations
+
+        Raises:
+            ValidationException: If parameters are invalid
+        """
+        ContractValidator.validate_month_format(month)
+        ContractValidator.validate_billing_group_id(billing_group_id)
+        self.month = month
+        self.billing_group_id = billing_group_id
+
+    def __repr__(self) -> str:
+        """Return string representation of the manager."""
+        return f"{type(self).__name__}(month={self.month}, billing_group_id={self.billing_group_id})"
+
+    def _build_contract_data(
+        self, contract_id: str, name: str, is_default: bool
+    ) -> ContractData:
+        """Validate contract ID and build the contract application payload."""
+        ContractValidator.validate_contract_id(contract_id)
+
+        return {
+            "contractId": contract_id,
+            "defaultYn": "Y" if is_default else "N",
+            "monthFrom": self.month,
+            "name": ContractValidator.format_contract_name(name),
+        }
 
-class ContractManager:
+    @staticmethod
+    def _counter_price_spec(contract_id: str, counter_name: str) -> RequestSpec:
+        """Build the price lookup request for a single counter."""
+        return RequestSpec(
+            HTTPMethod.GET,
+            f"billing/admin/contracts/{contract_id}/products/prices",
+            headers=JSON_HEADERS,
+            params={"counterNames": counter_name},
+        )
+
+    @staticmethod
+    def _parse_counter_price(
+        counter_name: str, response: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Extract prices and the computed discount from a price response."""
+        prices = response.get("prices", {})
+        price = prices.get("price", 0)
+        original_price = prices.get("originalPrice", 0)
+
+        logger.info(
+            "Counter {counter_name} - Discounted: {price}, Original: %s",
+            original_price,
+        )
+
+        # Use ContractValidator for discount calculation
+        discount_amount, discount_rate = ContractValidator.calculate_discount(
+            original_price, price
+        )
+
+        return {
+            "counter_name": counter_name,
+            "price": price,
+            "original_price": original_price,
+            "discount_amount": float(discount_amount),
+            "discount_rate": float(discount_rate),
+        }
+
+
+class ContractManager(_ContractManagerBase):
     """Manages billing contracts for billing groups."""
 
     def __init__(
@@ -37,16 +117,9 @@ class ContractManager:
         Raises:
             ValidationException: If parameters are invalid
         """
-        ContractValidator.validate_month_format(month)
-        ContractValidator.validate_billing_group_id(billing_group_id)
-        self.month = month
-        self.billing_group_id = billing_group_id
+        super().__init__(month, billing_group_id)
         self._client = client if client else BillingAPIClient(url.BASE_BILLING_URL)
 
-    def __repr__(self) -> str:
-        """Return string representation of ContractManager."""
-        return f"ContractManager(month={self.month}, billing_group_id={self.billing_group_id})"
-
     def apply_contract(
         self,
         contract_id: str,
@@ -66,18 +139,10 @@ class ContractManager:
         Raises:
             APIRequestException: If contract application fails
         """
-        # Validate contract ID
-        ContractValidator.validate_contract_id(contract_id)
+        contract_data = self._build_contract_data(contract_id, name, is_default)
 
         headers = JSON_HEADERS
 
-        contract_data: ContractData = {
-            "contractId": contract_id,
-            "defaultYn": "Y" if is_default else "N",
-            "monthFrom": self.month,
-            "name": ContractValidator.format_contract_name(name),
-        }
-
         endpoint = f"billing/admin/billing-groups/{self.billing_group_id}"
 
         logger.info(
@@ -166,43 +231,192 @@ class ContractManager:
         Raises:
             APIRequestException: If query fails
         """
-        headers = JSON_HEADERS
-
-        params = {"counterNames": counter_name}
-
-        endpoint = f"billing/admin/contracts/{contract_id}/products/prices"
+        spec = self._counter_price_spec(contract_id, counter_name)
 
         logger.info(
             "Getting price for counter {counter_name} in contract %s", contract_id
         )
 
         # Retry logic for potential temporary failures
-        max_retries = 3
+        max_retries = COUNTER_PRICE_MAX_RETRIES
         for attempt in range(max_retries):
             try:
-                response = self._client.get(endpoint, headers=headers, params=params)
+                response = self._client.get(
+                    spec.endpoint, headers=spec.headers, params=spec.params
+                )
+                return self._parse_counter_price(counter_name, response)
+            except APIRequestException as e:
+                if attempt < max_retries - 1:
+                    logger.warning("Attempt %s failed, retrying...", attempt + 1)
+                    continue
+                logger.exception(
+                    "Failed to get counter price after {max_retries} attempts: %s", e
+                )
+                raise
+        # This should never be reached due to the raise above
+        msg = "Unexpected code path in get_counter_price"
+        raise RuntimeError(msg)
+
+    def get_multiple_counter_prices(
+        self,
+        contract_id: str,
+        counter_names: list[str],
+        max_concurrency: int | None = None,
+    ) -> dict[str, dict[str, Any]]:
+        """Get prices for multiple counters in the contract concurrently.
 
-                prices = response.get("prices", {})
-                price = prices.get("price", 0)
-                original_price = prices.get("originalPrice", 0)
+        Failed lookups are retried as a batch, up to the same number of
+        attempts as get_counter_price.
 
-                logger.info(
-                    "Counter {counter_name} - Discounted: {price}, Original: %s",
-                    original_price,
-                )
+        Args:
+            contract_id: Contract ID
+            counter_names: List of counter names to query
+            max_concurrency: Optional cap on in-flight requests
 
-                # Use ContractValidator for discount calculation
-                discount_amount, discount_rate = ContractValidator.calculate_discount(
-                    original_price, price
+        Returns:
+            Dictionary mapping counter names to their price information
+        """
+        results: dict[str, dict[str, Any]] = {}
+        errors: dict[str, APIRequestException] = {}
+        pending = list(dict.fromkeys(counter_names))
+
+        for attempt in range(COUNTER_PRICE_MAX_RETRIES):
+            if not pending:
+                break
+            if attempt:
+                logger.warning(
+                    "Retrying %s failed counter price lookups (attempt %s)",
+                    len(pending),
+                    attempt + 1,
                 )
 
-                return {
-                    "counter_name": counter_name,
-                    "price": price,
-                    "original_price": original_price,
-                    "discount_amount": float(discount_amount),
-                    "discount_rate": float(discount_rate),
-                }
+            outcomes = self._client.map_requests(
+                [self._counter_price_spec(contract_id, name) for name in pending],
+                max_concurrency=max_concurrency,
+            )
+
+            retry = []
+            for counter_name, outcome in zip(pending, outcomes, strict=True):
+                if isinstance(outcome, APIRequestException):
+                    errors[counter_name] = outcome
+                    retry.append(counter_name)
+                elif isinstance(outcome, Exception):
+                    raise outcome
+                else:
+                    errors.pop(counter_name, None)
+                    results[counter_name] = self._parse_counter_price(
+                        counter_name, outcome
+                    )
+            pending = retry
+
+        for counter_name, error in errors.items():
+            logger.error("Failed to get price for %s: %s", counter_name, error)
+            results[counter_name] = {"error": str(error)}
+
+        return {name: results[name] for name in dict.fromkeys(counter_names)}
+
+
+class AsyncContractManager(_ContractManagerBase):
+    """Asyncio counterpart of ContractManager."""
+
+    def __init__(
+        self,
+        month: str,
+        billing_group_id: str,
+        client: AsyncBillingAPIClient | None = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> None:
+        """Initialize async contract manager.
+
+        Args:
+            month: Target month in YYYY-MM format
+            billing_group_id: Billing group ID for contract operations
+            client: Optional AsyncBillingAPIClient instance for dependency injection
+            max_concurrency: Maximum number of requests in flight for bulk calls
+
+        Raises:
+            ValidationException: If parameters are invalid
+        """
+        super().__init__(month, billing_group_id)
+        self._client = client if client else AsyncBillingAPIClient(url.BASE_BILLING_URL)
+        self.max_concurrency = max_concurrency
+
+    async def apply_contract(
+        self,
+        contract_id: str,
+        name: str = "billing group default",
+        is_default: bool = True,
+    ) -> dict[str, Any]:
+        """Apply contract to billing group.
+
+        Args:
+            contract_id: Contract ID to apply
+            name: Name for the contract application
+            is_default: Whether this is the default contract
+
+        Returns:
+            API response data
+
+        Raises:
+            APIRequestException: If contract application fails
+        """
+        contract_data = self._build_contract_data(contract_id, name, is_default)
+        endpoint = f"billing/admin/billing-groups/{self.billing_group_id}"
+
+        try:
+            response = await self._client.put(
+                endpoint, headers=JSON_HEADERS, json_data=contract_data
+            )
+            logger.info("Successfully applied contract %s", contract_id)
+            return response
+        except APIRequestException as e:
+            logger.exception("Failed to apply contract: %s", e)
+            raise
+
+    async def delete_contract(self) -> dict[str, Any]:
+        """Delete contract from billing group.
+
+        Returns:
+            API response data
+
+        Raises:
+            APIRequestException: If contract deletion fails
+        """
+        endpoint = f"billing/admin/billing-groups/{self.billing_group_id}/contracts"
+
+        try:
+            response = await self._client.delete(endpoint, headers=JSON_HEADERS)
+            logger.info("Successfully deleted contract")
+            return response
+        except APIRequestException as e:
+            logger.exception("Failed to delete contract: %s", e)
+            raise
+
+    async def get_counter_price(
+        self, contract_id: str, counter_name: str
+    ) -> dict[str, Any]:
+        """Get price for a specific counter in the contract.
+
+        Args:
+            contract_id: Contract ID
+            counter_name: Counter name to query price for
+
+        Returns:
+            Price information including original and discounted prices
+
+        Raises:
+            APIRequestException: If query fails
+        """
+        spec = self._counter_price_spec(contract_id, counter_name)
+
+        # Retry logic for potential temporary failures
+        max_retries = COUNTER_PRICE_MAX_RETRIES
+        for attempt in range(max_retries):
+            try:
+                response = await self._client.get(
+                    spec.endpoint, headers=spec.headers, params=spec.params
+                )
+                return self._parse_counter_price(counter_name, response)
             except APIRequestException as e:
                 if attempt < max_retries - 1:
                     logger.warning("Attempt %s failed, retrying...", attempt + 1)
@@ -215,10 +429,10 @@ class ContractManager:
         msg = "Unexpected code path in get_counter_price"
         raise RuntimeError(msg)
 
-    def get_multiple_counter_prices(
+    async def get_multiple_counter_prices(
         self, contract_id: str, counter_names: list[str]
     ) -> dict[str, dict[str, Any]]:
-        """Get prices for multiple counters in the contract.
+        """Get prices for multiple counters concurrently.
 
         Args:
             contract_id: Contract ID
@@ -227,14 +441,21 @@ class ContractManager:
         Returns:
             Dictionary mapping counter names to their price information
         """
-        results = {}
+        outcomes = await gather_with_concurrency(
+            (
+                self.get_counter_price(contract_id, counter_name)
+                for counter_name in counter_names
+            ),
+            limit=self.max_concurrency,
+        )
 
-        for counter_name in counter_names:
-            try:
-                price_info = self.get_counter_price(contract_id, counter_name)
-                results[counter_name] = price_info
-            except APIRequestException as e:
-                logger.exception("Failed to get price for {counter_name}: %s", e)
-                results[counter_name] = {"error": str(e)}
+        results: dict[str, dict[str, Any]] = {}
+        for counter_name, outcome in zip(counter_names, outcomes, strict=True):
+            if isinstance(outcome, APIRequestException):
+                results[counter_name] = {"error": str(outcome)}
+            elif isinstance(outcome, BaseException):
+                raise outcome
+            else:
+                results[counter_name] = outcome
 
         return results
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import time
 import warnings
@@ -12,9 +13,10 @@ from typing import Any, Self
 
 from config import url
 
-from .constants import CreditType
+from .async_http_client import AsyncBillingAPIClient, gather_with_concurrency
+from .constants import DEFAULT_MAX_CONCURRENCY, CreditType
 from .exceptions import APIRequestException, ValidationException
-from .http_client import BillingAPIClient
+from .http_client import BillingAPIClient, HTTPMethod, RequestSpec
 
 logger = logging.getLogger(__name__)
 
@@ -127,23 +129,36 @@ class CreditAPIClient:
         logger.debug(f"Granting coupon credit: {coupon_code}")
         return self._client.post(endpoint, headers=headers)
 
-    def grant_campaign_credit(
-        self, campaign_id: str, credit_request: CreditRequest, uuid: str
-    ) -> CreditData:
-        """Grant campaign-based credit."""
+    @classmethod
+    def campaign_credit_spec(
+        cls, campaign_id: str, credit_request: CreditRequest, uuid: str
+    ) -> RequestSpec:
+        """Build the request for a campaign-based credit grant."""
         headers = {
             "Accept": DEFAULT_ACCEPT_HEADER,
             "Content-Type": "application/json",
             "uuid": uuid,
         }
 
-        endpoint = self.CAMPAIGN_CREDIT_ENDPOINT.format(campaign_id=campaign_id)
-        data = credit_request.to_api_format()
+        return RequestSpec(
+            HTTPMethod.POST,
+            cls.CAMPAIGN_CREDIT_ENDPOINT.format(campaign_id=campaign_id),
+            headers=headers,
+            json_data=credit_request.to_api_format(),
+        )
+
+    def grant_campaign_credit(
+        self, campaign_id: str, credit_request: CreditRequest, uuid: str
+    ) -> CreditData:
+        """Grant campaign-based credit."""
+        spec = self.campaign_credit_spec(campaign_id, credit_request, uuid)
 
         logger.debug(
             f"Granting campaign credit: {campaign_id}, amount: {credit_request.amount}"
         )
-        return self._client.post(endpoint, headers=headers, json_data=data)
+        return self._client.post(
+            spec.endpoint, headers=spec.headers, json_data=spec.json_data
+        )
 
     def get_credit_history(
         self,
@@ -211,38 +226,157 @@ class CreditCalculator:
         return (start_date.strftime("%Y-%m-%d"), end_date.strftime("%Y-%m-%d"))
 
 
-class CreditManager:
-    """Manages credit operations including granting, inquiry, and cancellation.
-
-    This class provides a high-level interface for credit-related operations,
-    handling validation, error handling, and complex business logic.
-    """
+class _CreditManagerBase:
+    """Validation and request-building logic shared by sync and async managers."""
 
     # Default values
     DEFAULT_CREDIT_NAME = "QA Billing Test Credit"
     DEFAULT_EXPIRATION_MONTHS = 12
 
-    def __init__(self, uuid: str, client: BillingAPIClient | None = None) -> None:
-        """Initialize credit manager.
+    def __init__(self, uuid: str) -> None:
+        """Initialize shared credit state.
 
         Args:
             uuid: User UUID for credit operations
-            client: Optional custom API client
+
+        Raises:
+            ValidationException: If UUID is empty
         """
         if not uuid:
             msg = "UUID cannot be empty"
             raise ValidationException(msg)
 
         self.uuid = uuid
+
+    def __repr__(self) -> str:
+        """Return string representation of the manager."""
+        return f"{type(self).__name__}(uuid={self.uuid!r})"
+
+    def _build_credit_request(
+        self,
+        campaign_id: str | None,
+        amount: CreditAmount | None,
+        credit_name: str | None = None,
+        credit_type: CreditType | None = None,
+        expiration_months: int | None = None,
+        expiration_date_from: str | None = None,
+        expiration_date_to: str | None = None,
+    ) -> tuple[str, CreditRequest]:
+        """Validate grant parameters and build the credit request.
+
+        Returns:
+            Tuple of (campaign_id, credit_request)
+
+        Raises:
+            ValidationException: If parameters are invalid
+        """
+        # Validate amount is provided
+        if amount is None:
+            msg = "Credit amount must be provided"
+            raise ValidationException(msg)
+
+        # Auto-generate campaign ID if not provided
+        if not campaign_id:
+            if credit_type:
+                # Use credit type in campaign ID
+                campaign_id = f"{credit_type.value}-{int(time.time())}"
+            else:
+                # Default campaign ID
+                campaign_id = f"CAMPAIGN-{int(time.time())}"
+
+        CreditCalculator.validate_credit_amount(amount)
+
+        # Set defaults
+        credit_name = credit_name or self.DEFAULT_CREDIT_NAME
+        expiration_months = expiration_months or self.DEFAULT_EXPIRATION_MONTHS
+
+        # Calculate dates if not provided
+        if not expiration_date_from or not expiration_date_to:
+            calc_from, calc_to = CreditCalculator.calculate_expiration_dates(
+                expiration_months
+            )
+            expiration_date_from = expiration_date_from or calc_from
+            expiration_date_to = expiration_date_to or calc_to
+
+        # Create credit request
+        credit_request = CreditRequest(
+            campaign_id=campaign_id,
+            amount=amount,
+            credit_name=credit_name,
+            expiration_period=expiration_months,
+            expiration_date_from=expiration_date_from,
+            expiration_date_to=expiration_date_to,
+            uuid_list=[self.uuid],
+        )
+
+        # Add credit type to request data if provided
+        if credit_type:
+            setattr(credit_request, "credit_type", credit_type)
+
+        return campaign_id, credit_request
+
+    @staticmethod
+    def _cancel_credit_spec(campaign_id: str, reason: str) -> RequestSpec:
+        """Build the request for cancelling a campaign's credit."""
+        return RequestSpec(
+            HTTPMethod.DELETE,
+            f"billing/admin/credits/{campaign_id}/cancel",
+            params={"reason": reason},
+        )
+
+    @staticmethod
+    def _normalize_credit_type(credit_type: CreditType | str) -> CreditType:
+        """Convert a credit type name to CreditType.
+
+        Raises:
+            ValidationException: If credit type is invalid
+        """
+        if isinstance(credit_type, CreditType):
+            return credit_type
+        try:
+            return CreditType(credit_type.upper())
+        except ValueError:
+            msg = f"Invalid credit type: {credit_type}"
+            raise ValidationException(msg)
+
+    @staticmethod
+    def _parse_credit_history(
+        response: CreditData,
+    ) -> tuple[CreditAmount, list[CreditHistory]]:
+        """Parse a credit history response into (total, entries)."""
+        history_data = response.get("creditHistories", [])
+        histories = [CreditHistory.from_api_response(item) for item in history_data]
+
+        # Calculate total
+        total_credit = CreditCalculator.calculate_total_from_history(histories)
+
+        logger.info(
+            f"Found {len(histories)} credit entries, total: {total_credit:,.2f}"
+        )
+
+        return total_credit, histories
+
+
+class CreditManager(_CreditManagerBase):
+    """Manages credit operations including granting, inquiry, and cancellation.
+
+    This class provides a high-level interface for credit-related operations,
+    handling validation, error handling, and complex business logic.
+    """
+
+    def __init__(self, uuid: str, client: BillingAPIClient | None = None) -> None:
+        """Initialize credit manager.
+
+        Args:
+            uuid: User UUID for credit operations
+            client: Optional custom API client
+        """
+        super().__init__(uuid)
         self._client = client or BillingAPIClient(url.BASE_BILLING_URL)
         self._api = CreditAPIClient(self._client)
 
         logger.info(f"Initialized CreditManager for UUID: {uuid}")
 
-    def __repr__(self) -> str:
-        """Return string representation of CreditManager."""
-        return f"CreditManager(uuid={self.uuid!r})"
-
     def __enter__(self) -> Self:
         """Context manager entry."""
         return self
@@ -356,52 +490,20 @@ class CreditManager:
             ValidationException: If parameters are invalid
             APIRequestException: If credit grant fails
         """
-        # Validate amount is provided
-        if amount is None:
-            msg = "Credit amount must be provided"
-            raise ValidationException(msg)
-
-        # Auto-generate campaign ID if not provided
-        if not campaign_id:
-            if credit_type:
-                # Use credit type in campaign ID
-                campaign_id = f"{credit_type.value}-{int(time.time())}"
-            else:
-                # Default campaign ID
-                campaign_id = f"CAMPAIGN-{int(time.time())}"
-
-        CreditCalculator.validate_credit_amount(amount)
-
-        # Set defaults
-        credit_name = credit_name or self.DEFAULT_CREDIT_NAME
-        expiration_months = expiration_months or self.DEFAULT_EXPIRATION_MONTHS
-
-        # Calculate dates if not provided
-        if not expiration_date_from or not expiration_date_to:
-            calc_from, calc_to = CreditCalculator.calculate_expiration_dates(
-                expiration_months
-            )
-            expiration_date_from = expiration_date_from or calc_from
-            expiration_date_to = expiration_date_to or calc_to
-
-        # Create credit request
-        credit_request = CreditRequest(
-            campaign_id=campaign_id,
-            amount=amount,
-            credit_name=credit_name,
-            expiration_period=expiration_months,
-            expiration_date_from=expiration_date_from,
-            expiration_date_to=expiration_date_to,
-            uuid_list=[self.uuid],
+        campaign_id, credit_request = self._build_credit_request(
+            campaign_id,
+            amount,
+            credit_name,
+            credit_type,
+            expiration_months,
+            expiration_date_from,
+            expiration_date_to,
         )
 
-        # Add credit type to request data if provided
-        if credit_type:
-            setattr(credit_request, "credit_type", credit_type)
-
         logger.info(
             f"Granting credit: {amount} via campaign {campaign_id} "
-            f"(expires: {expiration_date_from} to {expiration_date_to})"
+            f"(expires: {credit_request.expiration_date_from} "
+            f"to {credit_request.expiration_date_to})"
         )
 
         try:
@@ -435,13 +537,7 @@ class CreditManager:
             ValidationException: If credit type is invalid
             APIRequestException: If inquiry fails
         """
-        # Normalize credit type
-        if isinstance(credit_type, str):
-            try:
-                credit_type = CreditType(credit_type.upper())
-            except ValueError:
-                msg = f"Invalid credit type: {credit_type}"
-                raise ValidationException(msg)
+        credit_type = self._normalize_credit_type(credit_type)
 
         logger.info(f"Getting credit history: type={credit_type.value}, page={page}")
 
@@ -450,18 +546,7 @@ class CreditManager:
                 self.uuid, credit_type, page, items_per_page
             )
 
-            # Parse response
-            history_data = response.get("creditHistories", [])
-            histories = [CreditHistory.from_api_response(item) for item in history_data]
-
-            # Calculate total
-            total_credit = CreditCalculator.calculate_total_from_history(histories)
-
-            logger.info(
-                f"Found {len(histories)} credit entries, total: {total_credit:,.2f}"
-            )
-
-            return total_credit, histories
+            return self._parse_credit_history(response)
 
         except APIRequestException as e:
             logger.exception(f"Failed to get credit history: {e}")
@@ -550,28 +635,39 @@ class CreditManager:
             }
 
     def bulk_grant_credit(
-        self, campaign_ids: list[str], amount: CreditAmount, **kwargs: Any
+        self,
+        campaign_ids: list[str],
+        amount: CreditAmount,
+        max_concurrency: int | None = None,
+        **kwargs: Any,
     ) -> dict[str, CreditData | Exception]:
-        """Grant credit to multiple campaigns.
+        """Grant credit to multiple campaigns concurrently.
 
         Args:
             campaign_ids: List of campaign IDs
             amount: Credit amount to grant to each
+            max_concurrency: Optional cap on in-flight requests
             **kwargs: Additional arguments for grant_credit
 
         Returns:
             Dictionary mapping campaign ID to result or exception
         """
+        specs: dict[str, RequestSpec] = {}
         results: dict[str, CreditData | Exception] = {}
 
         for campaign_id in campaign_ids:
             try:
-                result = self.grant_credit(campaign_id, amount, **kwargs)
-                results[campaign_id] = result
-
-            except Exception as e:
-                logger.exception(f"Failed to grant credit to {campaign_id}: {e}")
+                _, credit_request = self._build_credit_request(
+                    campaign_id=campaign_id, amount=amount, **kwargs
+                )
+            except ValidationException as e:
                 results[campaign_id] = e
+                continue
+            specs[campaign_id] = CreditAPIClient.campaign_credit_spec(
+                campaign_id, credit_request, self.uuid
+            )
+
+        results.update(self._map_bulk_requests(specs, max_concurrency))
 
         # Summary
         success_count = sum(1 for r in results.values() if not isinstance(r, Exception))
@@ -580,30 +676,29 @@ class CreditManager:
             f"{success_count}/{len(campaign_ids)} successful"
         )
 
-        return results
+        return {campaign_id: results[campaign_id] for campaign_id in campaign_ids}
 
     def bulk_cancel_credit(
-        self, campaign_ids: list[str], reason: str = "Bulk cancellation"
+        self,
+        campaign_ids: list[str],
+        reason: str = "Bulk cancellation",
+        max_concurrency: int | None = None,
     ) -> dict[str, CreditData | Exception]:
-        """Cancel credit for multiple campaigns.
+        """Cancel credit for multiple campaigns concurrently.
 
         Args:
             campaign_ids: List of campaign IDs
             reason: Reason for cancellation
+            max_concurrency: Optional cap on in-flight requests
 
         Returns:
             Dictionary mapping campaign ID to result or exception
         """
-        results: dict[str, CreditData | Exception] = {}
-
-        for campaign_id in campaign_ids:
-            try:
-                result = self.cancel_credit(campaign_id, reason)
-                results[campaign_id] = result
-
-            except Exception as e:
-                logger.exception(f"Failed to cancel credit for {campaign_id}: {e}")
-                results[campaign_id] = e
+        specs = {
+            campaign_id: self._cancel_credit_spec(campaign_id, reason)
+            for campaign_id in campaign_ids
+        }
+        results = self._map_bulk_requests(specs, max_concurrency)
 
         # Summary
         success_count = sum(1 for r in results.values() if not isinstance(r, Exception))
@@ -614,9 +709,133 @@ class CreditManager:
 
         return results
 
+    def _map_bulk_requests(
+        self, specs: dict[str, RequestSpec], max_concurrency: int | None
+    ) -> dict[str, CreditData | Exception]:
+        """Run keyed requests through map_requests and log failures."""
+        if not specs:
+            return {}
+
+        outcomes = self._client.map_requests(
+            list(specs.values()), max_concurrency=max_concurrency
+        )
+
+        results: dict[str, CreditData | Exception] = {}
+        for campaign_id, outcome in zip(specs, outcomes, strict=True):
+            if isinstance(outcome, Exception):
+                logger.error(f"Bulk credit request failed for {campaign_id}: {outcome}")
+            results[campaign_id] = outcome
+        return results
+
     def cancel_credit(self, campaign_id: str, reason: str = "test") -> dict[str, Any]:
         """Cancel a credit.
 
+        Args:
+            campaign_id: ID of the campaign to cancel
+            reason: Reason for cancellation
+
+        Returns:
+            Cancellation result
+        """
+        spec = self._cancel_credit_spec(campaign_id, reason)
+
+        try:
+            return self._client.delete(spec.endpoint, params=spec.params)
+        except APIRequestException as e:
+            logger.exception("Failed to cancel credit: %s", e)
+            raise
+
+
+class AsyncCreditManager(_CreditManagerBase):
+    """Asyncio counterpart of CreditManager.
+
+    Bulk grant and cancel operations run concurrently on the client's event
+    loop, bounded by ``max_concurrency``.
+    """
+
+    def __init__(
+        self,
+        uuid: str,
+        client: AsyncBillingAPIClient | None = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> None:
+        """Initialize async credit manager.
+
+        Args:
+            uuid: User UUID for credit operations
+            client: Optional custom async API client
+            max_concurrency: Maximum number of requests in flight for bulk calls
+        """
+        super().__init__(uuid)
+        self._client = client or AsyncBillingAPIClient(url.BASE_BILLING_URL)
+        self.max_concurrency = max_concurrency
+
+    async def __aenter__(self) -> Self:
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(
+        self,
+        _exc_type: type[BaseException] | None,
+        _exc_val: BaseException | None,
+        _exc_tb: object,
+    ) -> None:
+        """Async context manager exit - close client."""
+        await self._client.aclose()
+
+    async def grant_credit(
+        self,
+        campaign_id: str | None = None,
+        amount: CreditAmount | None = None,
+        credit_name: str | None = None,
+        credit_type: CreditType | None = None,
+        expiration_months: int | None = None,
+        expiration_date_from: str | None = None,
+        expiration_date_to: str | None = None,
+    ) -> CreditData:
+        """Grant credit to user through campaign.
+
+        See CreditManager.grant_credit for argument details.
+
+        Raises:
+            ValidationException: If parameters are invalid
+            APIRequestException: If credit grant fails
+        """
+        campaign_id, credit_request = self._build_credit_request(
+            campaign_id,
+            amount,
+            credit_name,
+            credit_type,
+            expiration_months,
+            expiration_date_from,
+            expiration_date_to,
+        )
+
+        headers = {
+            "Accept": DEFAULT_ACCEPT_HEADER,
+            "Content-Type": "application/json",
+            "uuid": self.uuid,
+        }
+        endpoint = CreditAPIClient.CAMPAIGN_CREDIT_ENDPOINT.format(
+            campaign_id=campaign_id
+        )
+
+        try:
+            response = await self._client.post(
+                endpoint, headers=headers, json_data=credit_request.to_api_format()
+            )
+            logger.info(f"Successfully granted credit: {amount}")
+            return response
+
+        except APIRequestException as e:
+            logger.exception(f"Failed to grant credit: {e}")
+            raise
+
+    async def cancel_credit(
+        self, campaign_id: str, reason: str = "test"
+    ) -> dict[str, Any]:
+        """Cancel a credit.
+
         Args:
             campaign_id: ID of the campaign to cancel
             reason: Reason for cancellation
@@ -628,11 +847,155 @@ class CreditManager:
         params = {"reason": reason}
 
         try:
-            return self._client.delete(endpoint, params=params)
+            return await self._client.delete(endpoint, params=params)
         except APIRequestException as e:
             logger.exception("Failed to cancel credit: %s", e)
             raise
 
+    async def get_credit_history(
+        self,
+        credit_type: CreditType | str = CreditType.FREE,
+        page: int = 1,
+        items_per_page: int = 100,
+    ) -> tuple[CreditAmount, list[CreditHistory]]:
+        """Get credit history for specified type.
+
+        Args:
+            credit_type: Type of credit (FREE or PAID)
+            page: Page number for pagination
+            items_per_page: Number of items per page
+
+        Returns:
+            Tuple of (total_amount, credit_history_list)
+
+        Raises:
+            ValidationException: If credit type is invalid
+            APIRequestException: If inquiry fails
+        """
+        credit_type = self._normalize_credit_type(credit_type)
+
+        params = {
+            "uuid": self.uuid,
+            "creditType": credit_type.value,
+            "page": page,
+            "itemsPerPage": items_per_page,
+        }
+
+        try:
+            response = await self._client.get(
+                CreditAPIClient.CREDIT_HISTORY_ENDPOINT,
+                headers={"Accept": DEFAULT_ACCEPT_HEADER},
+                params=params,
+            )
+            return self._parse_credit_history(response)
+
+        except APIRequestException as e:
+            logger.exception(f"Failed to get credit history: {e}")
+            raise
+
+    async def get_credit_balance(
+        self, include_paid: bool = True
+    ) -> dict[str, CreditAmount]:
+        """Get current credit balance, fetching credit types concurrently.
+
+        Args:
+            include_paid: Whether to include paid credits
+
+        Returns:
+            Dictionary with credit balances by type
+
+        Raises:
+            APIRequestException: If inquiry fails
+        """
+        credit_types = [CreditType.FREE]
+        if include_paid:
+            credit_types.append(CreditType.PAID)
+
+        histories = await asyncio.gather(
+            *(self.get_credit_history(credit_type) for credit_type in credit_types)
+        )
+
+        balance = {"free": 0.0, "paid": 0.0, "total": 0.0}
+        for credit_type, (total, _) in zip(credit_types, histories, strict=True):
+            balance[credit_type.value.lower()] = total
+        balance["total"] = balance["free"] + balance["paid"]
+
+        return balance
+
+    async def bulk_grant_credit(
+        self, campaign_ids: list[str], amount: CreditAmount, **kwargs: Any
+    ) -> dict[str, CreditData | Exception]:
+        """Grant credit to multiple campaigns concurrently.
+
+        Args:
+            campaign_ids: List of campaign IDs
+            amount: Credit amount to grant to each
+            **kwargs: Additional arguments for grant_credit
+
+        Returns:
+            Dictionary mapping campaign ID to result or exception
+        """
+        outcomes = await gather_with_concurrency(
+            (
+                self.grant_credit(campaign_id, amount, **kwargs)
+                for campaign_id in campaign_ids
+            ),
+            limit=self.max_concurrency,
+        )
+        results = self._collect_bulk_results(campaign_ids, outcomes)
+
+        success_count = sum(1 for r in results.values() if not isinstance(r, Exception))
+        logger.info(
+            f"Bulk credit grant completed: "
+            f"{success_count}/{len(campaign_ids)} successful"
+        )
+
+        return results
+
+    async def bulk_cancel_credit(
+        self, campaign_ids: list[str], reason: str = "Bulk cancellation"
+    ) -> dict[str, CreditData | Exception]:
+        """Cancel credit for multiple campaigns concurrently.
+
+        Args:
+            campaign_ids: List of campaign IDs
+            reason: Reason for cancellation
+
+        Returns:
+            Dictionary mapping campaign ID to result or exception
+        """
+        outcomes = await gather_with_concurrency(
+            (self.cancel_credit(campaign_id, reason) for campaign_id in campaign_ids),
+            limit=self.max_concurrency,
+        )
+        results = self._collect_bulk_results(campaign_ids, outcomes)
+
+        success_count = sum(1 for r in results.values() if not isinstance(r, Exception))
+        logger.info(
+            f"Bulk credit cancellation completed: "
+            f"{success_count}/{len(campaign_ids)} successful"
+        )
+
+        return results
+
+    @staticmethod
+    def _collect_bulk_results(
+        campaign_ids: list[str], outcomes: list[Any]
+    ) -> dict[str, CreditData | Exception]:
+        """Map gathered outcomes back to campaign IDs.
+
+        Raises:
+            BaseException: Re-raises cancellations and other non-Exception errors
+        """
+        results: dict[str, CreditData | Exception] = {}
+        for campaign_id, outcome in zip(campaign_ids, outcomes, strict=True):
+            if isinstance(outcome, BaseException) and not isinstance(
+                outcome, Exception
+            ):
+                raise outcome
+            results[campaign_id] = outcome
+        return results
+
 
 # Legacy compatibility alias
 class Credit(CreditManager):
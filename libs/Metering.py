@@ -2,33 +2,88 @@
 
 import calendar
 import logging
+from collections.abc import Iterable, Iterator
 from datetime import datetime
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from config import url
 
+from .async_http_client import AsyncBillingAPIClient, gather_with_concurrency
 from .billing_types import MeteringData, MeteringRequest
-from .constants import CounterType
+from .constants import (
+    DEFAULT_MAX_CONCURRENCY,
+    DEFAULT_METER_BATCH_BYTES,
+    MAX_BATCH_SIZE,
+    CounterType,
+)
 from .exceptions import APIRequestException, ValidationException
-from .http_client import BillingAPIClient
+from .http_client import BillingAPIClient, HTTPMethod, RequestSpec
+from .json_codec import get_codec
+
+if TYPE_CHECKING:
+    from .metering_dedup import MeteringDedupFilter
+    from .metering_ingest import IngestStats
+    from .metering_spool import MeteringSpool
 
 logger = logging.getLogger(__name__)
 
+# Bytes of '{"meterList":[]}' around the comma-separated meters
+_METER_LIST_OVERHEAD = len(b'{"meterList":[]}')
 
-class MeteringManager:
-    """Manages metering data submission and deletion."""
 
-    def __init__(
-        self,
-        month: str,
-        client: BillingAPIClient | None = None,
-        appkey: str | None = None,
-    ) -> None:
-        """Initialize metering manager.
+def iter_meter_lists(
+    meters: Iterable[MeteringData], batch_size: int, max_batch_bytes: int
+) -> Iterator[list[MeteringData]]:
+    """Lazily pack meters, in order, into chunks for one ``meterList`` each.
+
+    A chunk holds at most ``batch_size`` meters and, when encoded, at most
+    ``max_batch_bytes`` bytes; a single meter larger than the byte budget is
+    sent on its own. Only the chunk being filled is held in memory.
+
+    Args:
+        meters: Meter records, possibly a generator
+        batch_size: Maximum meters per chunk
+        max_batch_bytes: Maximum encoded size of ``{"meterList": chunk}``
+
+    Returns:
+        Iterator over the chunks
+
+    Raises:
+        ValidationException: If batch_size is outside 1..MAX_BATCH_SIZE
+    """
+    if not 1 <= batch_size <= MAX_BATCH_SIZE:
+        msg = f"batch_size must be between 1 and {MAX_BATCH_SIZE}, got {batch_size}"
+        raise ValidationException(msg)
+
+    def pack() -> Iterator[list[MeteringData]]:
+        codec = get_codec()
+        chunk: list[MeteringData] = []
+        size = _METER_LIST_OVERHEAD
+        for meter in meters:
+            meter_size = len(codec.dumps(meter))
+            if chunk and (
+                len(chunk) >= batch_size or size + meter_size + 1 > max_batch_bytes
+            ):
+                yield chunk
+                chunk = []
+                size = _METER_LIST_OVERHEAD
+            # Every meter after the first is preceded by a comma
+            size += meter_size + bool(chunk)
+            chunk.append(meter)
+        if chunk:
+            yield chunk
+
+    return pack()
+
+
+class _MeteringManagerBase:
+    """Request-building logic shared by the sync and async metering managers."""
+
+    def __init__(self, month: str, appkey: str | None = None) -> None:
+        """Initialize shared metering state.
 
         Args:
             month: Target month in YYYY-MM format
-            client: Optional API client (creates default if not provided)
             appkey: Optional default app key for metering operations
 
         Raises:
@@ -36,13 +91,12 @@ class MeteringManager:
         """
         self._validate_month_format(month)
         self.month = month
-        self._client = client or BillingAPIClient(url.BASE_METERING_URL)
         self._iaas_template = self._create_default_template()
         self.appkey = appkey
 
     def __repr__(self) -> str:
-        """Return string representation of MeteringManager."""
-        return f"MeteringManager(month={self.month})"
+        """Return string representation of the manager."""
+        return f"{type(self).__name__}(month={self.month})"
 
     @staticmethod
     def _validate_month_format(month: str) -> None:
@@ -83,7 +137,7 @@ class MeteringManager:
             ]
         }
 
-    def send_metering(
+    def _build_metering_data(
         self,
         app_key: str,
         counter_name: str,
@@ -93,25 +147,11 @@ class MeteringManager:
         resource_id: str = "test",
         resource_name: str = "test",
         parent_resource_id: str = "test",
-    ) -> dict[str, Any]:
-        """Send metering data for an app.
-
-        Args:
-            app_key: Application key
-            counter_name: Name of the counter (e.g., "compute.c2.c8m8")
-            counter_type: Type of counter (DELTA or GAUGE)
-            counter_unit: Unit of measurement (e.g., "HOURS", "KB")
-            counter_volume: Volume to report
-            resource_id: Resource identifier
-            resource_name: Resource name
-            parent_resource_id: Parent resource identifier
-
-        Returns:
-            API response data
+    ) -> MeteringData:
+        """Validate the counter type and build a single meter record.
 
         Raises:
-            ValidationException: If parameters are invalid
-            APIRequestException: If metering submission fails
+            ValidationException: If counter type is invalid
         """
         # Normalize counter type
         counter_type_str = (
@@ -126,7 +166,7 @@ class MeteringManager:
             raise ValidationException(msg)
 
         # Build metering data
-        metering_data: MeteringData = {
+        return {
             "appKey": app_key,
             "counterName": counter_name,
             "counterType": counter_type_str,
@@ -139,6 +179,158 @@ class MeteringManager:
             "timestamp": f"{self.month}-01T13:00:00.000+09:00",
         }
 
+    @staticmethod
+    def _pack_meter_lists(
+        meters: list[MeteringData], batch_size: int, max_batch_bytes: int
+    ) -> list[range]:
+        """Split meters into consecutive index ranges, one per ``meterList``.
+
+        Raises:
+            ValidationException: If batch_size is outside 1..MAX_BATCH_SIZE
+        """
+        chunks: list[range] = []
+        start = 0
+        for batch in iter_meter_lists(meters, batch_size, max_batch_bytes):
+            chunks.append(range(start, start + len(batch)))
+            start += len(batch)
+        return chunks
+
+    @staticmethod
+    def _meter_results(chunk: range, outcome: Any) -> list[dict[str, Any]]:
+        """Map one chunk's response back to a result per meter.
+
+        Every meter of a rejected chunk fails with the chunk's error; meters of
+        an accepted chunk succeed and get their ID from ``meterIds`` when the
+        response lists one per meter.
+        """
+        if isinstance(outcome, APIRequestException):
+            return [{"success": False, "error": str(outcome)} for _ in chunk]
+
+        meter_ids = outcome.get("meterIds") if isinstance(outcome, dict) else None
+        results: list[dict[str, Any]] = []
+        for position in range(len(chunk)):
+            result: dict[str, Any] = {"success": True, "response": outcome}
+            if isinstance(meter_ids, list) and len(meter_ids) == len(chunk):
+                result["meterId"] = meter_ids[position]
+            results.append(result)
+        return results
+
+    def _month_date_range(self) -> tuple[str, str]:
+        """Get the first and last day of the target month."""
+        year, month = map(int, self.month.split("-"))
+        _, last_day = calendar.monthrange(year, month)
+        return f"{self.month}-01", f"{self.month}-{last_day:02d}"
+
+
+class MeteringManager(_MeteringManagerBase):
+    """Manages metering data submission and deletion."""
+
+    def __init__(
+        self,
+        month: str,
+        client: BillingAPIClient | None = None,
+        appkey: str | None = None,
+        spool: "MeteringSpool | None" = None,
+        idempotency_keys: bool = False,
+        dedup: "MeteringDedupFilter | None" = None,
+    ) -> None:
+        """Initialize metering manager.
+
+        Args:
+            month: Target month in YYYY-MM format
+            client: Optional API client (creates default if not provided)
+            appkey: Optional default app key for metering operations
+            spool: Optional write-ahead spool; meters are written to it
+                before sending and stay there until the API accepts them
+            idempotency_keys: Stamp each meter with a unique
+                ``idempotencyKey`` before it is spooled or sent; retries and
+                replays of the same record reuse it, so the server can drop
+                the copies
+            dedup: Optional filter that drops meters already delivered
+                before they are sent (implies idempotency_keys)
+
+        Raises:
+            ValidationException: If month format is invalid
+        """
+        super().__init__(month, appkey)
+        self._client = client or BillingAPIClient(url.BASE_METERING_URL)
+        self.spool = spool
+        self.idempotency_keys = idempotency_keys or dedup is not None
+        self.dedup = dedup
+
+    def _prepare_meters(self, meters: list[MeteringData]) -> list[MeteringData]:
+        """Stamp idempotency keys and drop delivered meters, as configured."""
+        if not self.idempotency_keys:
+            return meters
+        from .metering_dedup import assign_idempotency_keys
+
+        meters = assign_idempotency_keys(meters)
+        return self.dedup.filter(meters) if self.dedup is not None else meters
+
+    def _post_meters(self, meters: list[MeteringData]) -> dict[str, Any]:
+        """Post a meterList, spooling it first when a spool is configured."""
+        meters = self._prepare_meters(meters)
+        if not meters:
+            logger.info("Skipping metering request: every meter was a duplicate")
+            return {
+                "header": {
+                    "isSuccessful": True,
+                    "resultCode": 0,
+                    "resultMessage": "DUPLICATE",
+                },
+                "meterIds": [],
+            }
+
+        seqs = self.spool.append(meters) if self.spool is not None else None
+        request_data: MeteringRequest = {"meterList": meters}
+        response = self._client.post("billing/meters", json_data=request_data)
+        if seqs is not None and self.spool is not None:
+            self.spool.ack(seqs)
+        if self.dedup is not None:
+            self.dedup.mark_delivered(meters)
+        return response
+
+    def send_metering(
+        self,
+        app_key: str,
+        counter_name: str,
+        counter_type: CounterType | str,
+        counter_unit: str,
+        counter_volume: str,
+        resource_id: str = "test",
+        resource_name: str = "test",
+        parent_resource_id: str = "test",
+    ) -> dict[str, Any]:
+        """Send metering data for an app.
+
+        Args:
+            app_key: Application key
+            counter_name: Name of the counter (e.g., "compute.c2.c8m8")
+            counter_type: Type of counter (DELTA or GAUGE)
+            counter_unit: Unit of measurement (e.g., "HOURS", "KB")
+            counter_volume: Volume to report
+            resource_id: Resource identifier
+            resource_name: Resource name
+            parent_resource_id: Parent resource identifier
+
+        Returns:
+            API response data
+
+        Raises:
+            ValidationException: If parameters are invalid
+            APIRequestException: If metering submission fails
+        """
+        metering_data = self._build_metering_data(
+            app_key,
+            counter_name,
+            counter_type,
+            counter_unit,
+            counter_volume,
+            resource_id,
+            resource_name,
+            parent_resource_id,
+        )
+
         request_data: MeteringRequest = {"meterList": [metering_data]}
 
         logger.info(
@@ -147,13 +339,44 @@ class MeteringManager:
         )
 
         try:
-            response = self._client.post("billing/meters", json_data=request_data)
+            response = self._post_meters(request_data["meterList"])
             logger.info("Successfully sent metering data for %s", self.month)
             return response
         except APIRequestException as e:
             logger.exception("Failed to send metering data: %s", e)
             raise
 
+    def send_meter_list(self, meters: list[MeteringData]) -> dict[str, Any]:
+        """Send already-built meter records in one ``meterList`` request.
+
+        Args:
+            meters: Records as built by ``_build_metering_data``
+
+        Returns:
+            API response data
+
+        Raises:
+            APIRequestException: If metering submission fails
+        """
+        return self._post_meters(meters)
+
+    def replay_spool(self, **kwargs: Any) -> "IngestStats":
+        """Resend meters left in the spool by failed sends or a crash.
+
+        Args:
+            **kwargs: Batching options for MeteringSpool.replay
+
+        Returns:
+            Counters for the replay
+
+        Raises:
+            ValidationException: If no spool is configured
+        """
+        if self.spool is None:
+            msg = "replay_spool requires a MeteringManager created with a spool"
+            raise ValidationException(msg)
+        return self.spool.replay(self._client, **kwargs)
+
     def send_iaas_metering(
         self,
         counter_name: str,
@@ -248,11 +471,7 @@ class MeteringManager:
         if isinstance(app_keys, str):
             app_keys = [app_keys]
 
-        # Calculate date range for the month
-        year, month = map(int, self.month.split("-"))
-        _, last_day = calendar.monthrange(year, month)
-        from_date = f"{self.month}-01"
-        to_date = f"{self.month}-{last_day:02d}"
+        from_date, to_date = self._month_date_range()
 
         deleted_count = 0
 
@@ -273,29 +492,249 @@ class MeteringManager:
         return {"deleted_count": deleted_count}
 
     def send_batch_metering(
-        self, app_key: str, meters: list[dict[str, Any]]
+        self,
+        app_key: str,
+        meters: list[dict[str, Any]],
+        max_concurrency: int | None = None,
+        batch_size: int = 1,
+        max_batch_bytes: int = DEFAULT_METER_BATCH_BYTES,
     ) -> dict[str, Any]:
-        """Send batch metering data.
+        """Send batch metering data concurrently.
+
+        With ``batch_size`` above one, meters are packed into multi-record
+        ``meterList`` requests, so 50,000 meters take hundreds of requests
+        instead of 50,000.
 
         Args:
             app_key: Application key
             meters: List of meter data dictionaries
+            max_concurrency: Optional cap on in-flight requests
+            batch_size: Maximum meters per request (1 sends each on its own)
+            max_batch_bytes: Maximum encoded size of one request body
 
         Returns:
-            Batch submission result with individual results
+            Batch submission result with individual results in input order
+            and the number of requests sent
+
+        Raises:
+            ValidationException: If any meter is invalid or batch_size is out
+                of range (nothing is sent)
+            Exception: The first error other than APIRequestException raised
+                by a request, after every delivered chunk has been acked
         """
+        built = [
+            self._build_metering_data(**{**meter, "app_key": app_key})
+            for meter in meters
+        ]
+        records = self._prepare_meters(built)
+        chunks = self._pack_meter_lists(records, batch_size, max_batch_bytes)
+        seqs = self.spool.append(records) if self.spool is not None else None
+        specs = [
+            RequestSpec(
+                HTTPMethod.POST,
+                "billing/meters",
+                json_data={"meterList": records[chunk.start : chunk.stop]},
+            )
+            for chunk in chunks
+        ]
+
+        outcomes = self._client.map_requests(specs, max_concurrency=max_concurrency)
+
+        # Settle every chunk before raising, so delivered meters are acked
         results = []
+        unexpected: Exception | None = None
+        for chunk, outcome in zip(chunks, outcomes, strict=True):
+            if isinstance(outcome, Exception):
+                logger.error(
+                    "Failed to send meters %d-%d (%s...): %s",
+                    chunk.start,
+                    chunk.stop - 1,
+                    records[chunk.start]["counterName"],
+                    outcome,
+                )
+                if not isinstance(outcome, APIRequestException):
+                    unexpected = unexpected or outcome
+                    continue
+            else:
+                if seqs is not None and self.spool is not None:
+                    self.spool.ack(seqs[chunk.start : chunk.stop])
+                if self.dedup is not None:
+                    self.dedup.mark_delivered(records[chunk.start : chunk.stop])
+            results.extend(self._meter_results(chunk, outcome))
+        if unexpected is not None:
+            raise unexpected
+
+        if len(records) < len(built):
+            # Put the meters the dedup filter dropped back in input order
+            sent = iter(results)
+            kept = {id(record) for record in records}
+            results = [
+                (
+                    next(sent)
+                    if id(record) in kept
+                    else {"success": True, "duplicate": True}
+                )
+                for record in built
+            ]
 
-        for meter in meters:
-            try:
-                # Send each meter individually
-                meter_data = {**meter, "app_key": app_key}
-                response = self.send_metering(**meter_data)
-                results.append({"success": True, "response": response})
-            except APIRequestException as e:
-                logger.exception(
-                    f"Failed to send meter {meter.get('counter_name')}: %s", e
+        return {"results": results, "requests": len(chunks)}
+
+
+class AsyncMeteringManager(_MeteringManagerBase):
+    """Asyncio counterpart of MeteringManager.
+
+    Batch operations run concurrently on the client's event loop instead of
+    one request after another.
+    """
+
+    def __init__(
+        self,
+        month: str,
+        client: AsyncBillingAPIClient | None = None,
+        appkey: str | None = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> None:
+        """Initialize async metering manager.
+
+        Args:
+            month: Target month in YYYY-MM format
+            client: Optional async API client (creates default if not provided)
+            appkey: Optional default app key for metering operations
+            max_concurrency: Maximum number of requests in flight for batch calls
+
+        Raises:
+            ValidationException: If month format is invalid
+        """
+        super().__init__(month, appkey)
+        self._client = client or AsyncBillingAPIClient(url.BASE_METERING_URL)
+        self.max_concurrency = max_concurrency
+
+    async def send_metering(
+        self,
+        app_key: str,
+        counter_name: str,
+        counter_type: CounterType | str,
+        counter_unit: str,
+        counter_volume: str,
+        resource_id: str = "test",
+        resource_name: str = "test",
+        parent_resource_id: str = "test",
+    ) -> dict[str, Any]:
+        """Send metering data for an app.
+
+        See MeteringManager.send_metering for argument details.
+
+        Raises:
+            ValidationException: If parameters are invalid
+            APIRequestException: If metering submission fails
+        """
+        metering_data = self._build_metering_data(
+            app_key,
+            counter_name,
+            counter_type,
+            counter_unit,
+            counter_volume,
+            resource_id,
+            resource_name,
+            parent_resource_id,
+        )
+
+        request_data: MeteringRequest = {"meterList": [metering_data]}
+
+        try:
+            response = await self._client.post("billing/meters", json_data=request_data)
+            logger.info("Successfully sent metering data for %s", self.month)
+            return response
+        except APIRequestException as e:
+            logger.exception("Failed to send metering data: %s", e)
+            raise
+
+    async def delete_metering(self, app_keys: str | list[str]) -> dict[str, Any]:
+        """Delete metering data for specified app keys concurrently.
+
+        Args:
+            app_keys: Single app key or list of app keys
+
+        Returns:
+            API response data
+
+        Raises:
+            APIRequestException: If any deletion fails
+        """
+        # Normalize to list
+        if isinstance(app_keys, str):
+            app_keys = [app_keys]
+
+        from_date, to_date = self._month_date_range()
+
+        results = await gather_with_concurrency(
+            (
+                self._client.delete(
+                    "billing/admin/meters",
+                    params={"appKey": app_key, "from": from_date, "to": to_date},
+                )
+                for app_key in app_keys
+            ),
+            limit=self.max_concurrency,
+        )
+
+        for app_key, result in zip(app_keys, results, strict=True):
+            if isinstance(result, BaseException):
+                logger.error(
+                    "Failed to delete metering data for %s: %s", app_key, result
                 )
-                results.append({"success": False, "error": str(e)})
+                raise result
+
+        logger.info("Deleted metering data for %s app keys", len(app_keys))
+        return {"deleted_count": len(app_keys)}
+
+    async def send_batch_metering(
+        self,
+        app_key: str,
+        meters: list[dict[str, Any]],
+        batch_size: int = 1,
+        max_batch_bytes: int = DEFAULT_METER_BATCH_BYTES,
+    ) -> dict[str, Any]:
+        """Send batch metering data concurrently.
 
-        return {"results": results}
+        See MeteringManager.send_batch_metering for batching details.
+
+        Args:
+            app_key: Application key
+            meters: List of meter data dictionaries
+            batch_size: Maximum meters per request (1 sends each on its own)
+            max_batch_bytes: Maximum encoded size of one request body
+
+        Returns:
+            Batch submission result with individual results in input order
+            and the number of requests sent
+
+        Raises:
+            ValidationException: If any meter is invalid or batch_size is out
+                of range (nothing is sent)
+        """
+        records = [
+            self._build_metering_data(**{**meter, "app_key": app_key})
+            for meter in meters
+        ]
+        chunks = self._pack_meter_lists(records, batch_size, max_batch_bytes)
+        outcomes = await gather_with_concurrency(
+            (
+                self._client.post(
+                    "billing/meters",
+                    json_data={"meterList": records[chunk.start : chunk.stop]},
+                )
+                for chunk in chunks
+            ),
+            limit=self.max_concurrency,
+        )
+
+        results = []
+        for chunk, outcome in zip(chunks, outcomes, strict=True):
+            if isinstance(outcome, BaseException) and not isinstance(
+                outcome, APIRequestException
+            ):
+                raise outcome
+            results.extend(self._meter_results(chunk, outcome))
+
+        return {"results": results, "requests": len(chunks)}
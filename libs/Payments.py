@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from dataclasses import dataclass
 from datetime import datetime
@@ -10,6 +11,7 @@ from typing import TYPE_CHECKING, Any, Self
 
 from config import url
 
+from .async_http_client import AsyncBillingAPIClient
 from .constants import PaymentStatus
 from .exceptions import APIRequestException, ValidationException
 from .http_client import BillingAPIClient
@@ -258,7 +260,65 @@ class PaymentAPIWrapper:
         return self._client.get(endpoint, headers=headers)
 
 
-class PaymentManager:
+class _PaymentManagerBase:
+    """Validation and response parsing shared by the sync and async managers."""
+
+    def __init__(self, month: str, uuid: str) -> None:
+        """Initialize shared payment state.
+
+        Args:
+            month: Target month in YYYY-MM format
+            uuid: User UUID for payment operations
+
+        Raises:
+            ValidationException: If month format is invalid
+        """
+        # Validate inputs
+        PaymentValidator.validate_month_format(month)
+
+        self.month = month
+        self.uuid = uuid
+
+    def __repr__(self) -> str:
+        """Return string representation of the manager."""
+        return f"{type(self).__name__}(month={self.month!r}, uuid={self.uuid!r})"
+
+    def _parse_payment_status(
+        self, response: dict[str, Any], source: str
+    ) -> PaymentInfo:
+        """Parse payment status from API response."""
+        statements = response.get("statements", [])
+
+        if not statements:
+            logger.warning(f"No payment statements found via {source} API")
+            return "", PaymentStatus.UNKNOWN
+
+        # Parse first statement (assuming integrated payment)
+        statement = PaymentStatement.from_api_response(statements[0])
+
+        logger.info(
+            f"Payment status via {source}: {statement.payment_status.name} "
+            f"(Group ID: {statement.payment_group_id})"
+        )
+
+        return statement.payment_group_id, statement.payment_status
+
+    @staticmethod
+    def _sum_unpaid(response: dict[str, Any]) -> float:
+        """Sum the total amount of all unpaid statements in a response."""
+        statements = response.get("statements", [])
+        if not statements:
+            logger.info("No unpaid statements found")
+            return 0.0
+
+        # Sum all unpaid amounts
+        total_unpaid = sum(float(stmt.get("totalAmount", 0)) for stmt in statements)
+
+        logger.info(f"Total unpaid amount: {total_unpaid:,.2f}")
+        return total_unpaid
+
+
+class PaymentManager(_PaymentManagerBase):
     """Manages payment operations including inquiry, modification, and cancellation.
 
     This class provides a high-level interface for payment-related operations,
@@ -278,11 +338,7 @@ class PaymentManager:
         Raises:
             ValidationException: If month format is invalid
         """
-        # Validate inputs
-        PaymentValidator.validate_month_format(month)
-
-        self.month = month
-        self.uuid = uuid
+        super().__init__(month, uuid)
 
         # Initialize API client
         self._client: PaymentAPIClient = client or PaymentAPIClient(
@@ -295,10 +351,6 @@ class PaymentManager:
 
         logger.info(f"Initialized PaymentManager for {month}, UUID: {uuid}")
 
-    def __repr__(self) -> str:
-        """Return string representation of PaymentManager."""
-        return f"PaymentManager(month={self.month!r}, uuid={self.uuid!r})"
-
     def __enter__(self) -> Self:
         """Context manager entry."""
         return self
@@ -337,26 +389,6 @@ class PaymentManager:
 
         raise APIRequestException("Unsupported client type for get_statements_console")
 
-    def _parse_payment_status(
-        self, response: dict[str, Any], source: str
-    ) -> PaymentInfo:
-        """Parse payment status from API response."""
-        statements = response.get("statements", [])
-
-        if not statements:
-            logger.warning(f"No payment statements found via {source} API")
-            return "", PaymentStatus.UNKNOWN
-
-        # Parse first statement (assuming integrated payment)
-        statement = PaymentStatement.from_api_response(statements[0])
-
-        logger.info(
-            f"Payment status via {source}: {statement.payment_status.name} "
-            f"(Group ID: {statement.payment_group_id})"
-        )
-
-        return statement.payment_group_id, statement.payment_status
-
     def get_payment_status(self, use_admin_api: bool = False) -> PaymentInfo:
         """Get payment status for the month.
 
@@ -567,16 +599,7 @@ class PaymentManager:
                         "Unsupported client type for get_unpaid_statements"
                     )
 
-            statements = response.get("statements", [])
-            if not statements:
-                logger.info("No unpaid statements found")
-                return 0.0
-
-            # Sum all unpaid amounts
-            total_unpaid = sum(float(stmt.get("totalAmount", 0)) for stmt in statements)
-
-            logger.info(f"Total unpaid amount: {total_unpaid:,.2f}")
-            return total_unpaid
+            return self._sum_unpaid(response)
 
         except APIRequestException as e:
             logger.exception(f"Failed to check unpaid amount: {e}")
@@ -877,3 +900,201 @@ class PaymentManager:
             ]
 
         return payment_method in allowed_methods
+
+
+class AsyncPaymentManager(_PaymentManagerBase):
+    """Asyncio counterpart of PaymentManager.
+
+    Talks to the same endpoints as PaymentAPIWrapper so many UUIDs can be
+    inspected or paid concurrently from a single event loop.
+    """
+
+    def __init__(
+        self, month: str, uuid: str, client: AsyncBillingAPIClient | None = None
+    ) -> None:
+        """Initialize async payment manager.
+
+        Args:
+            month: Target month in YYYY-MM format
+            uuid: User UUID for payment operations
+            client: Optional custom async API client
+
+        Raises:
+            ValidationException: If month format is invalid
+        """
+        super().__init__(month, uuid)
+        self._client = client or AsyncBillingAPIClient(url.BASE_BILLING_URL)
+
+    async def __aenter__(self) -> Self:
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(
+        self,
+        _exc_type: type[BaseException] | None,
+        _exc_val: BaseException | None,
+        _exc_tb: object,
+    ) -> None:
+        """Async context manager exit - close client."""
+        await self._client.aclose()
+
+    async def get_payment_status(self, use_admin_api: bool = False) -> PaymentInfo:
+        """Get payment status for the month.
+
+        Args:
+            use_admin_api: Whether to use admin API (True) or console API (False)
+
+        Returns:
+            Tuple of (payment_group_id, PaymentStatus)
+
+        Raises:
+            APIRequestException: If inquiry fails
+        """
+        try:
+            if use_admin_api:
+                response = await self._client.get(
+                    PaymentAPIWrapper.ADMIN_API_ENDPOINT,
+                    headers=JSON_HEADERS,
+                    params={
+                        "page": 1,
+                        "itemsPerPage": 10,
+                        "monthFrom": self.month,
+                        "monthTo": self.month,
+                        "uuid": self.uuid,
+                    },
+                )
+                source = "admin"
+            else:
+                response = await self._client.get(
+                    f"{PaymentAPIWrapper.CONSOLE_API_PREFIX}/{self.month}/statements",
+                    headers={**JSON_UTF8_HEADERS, "lang": "kr", "uuid": self.uuid},
+                )
+                source = "console"
+
+            return self._parse_payment_status(response, source)
+
+        except APIRequestException as e:
+            logger.exception(f"Failed to get payment status: {e}")
+            raise
+
+    async def change_payment_status(
+        self,
+        payment_group_id: str,
+        target_status: PaymentStatus = PaymentStatus.REGISTERED,
+    ) -> PaymentData:
+        """Change payment status.
+
+        Args:
+            payment_group_id: Payment group ID to modify
+            target_status: Target payment status
+
+        Returns:
+            API response data
+
+        Raises:
+            ValidationException: If payment group ID is invalid
+            APIRequestException: If status change fails
+        """
+        PaymentValidator.validate_payment_group_id(payment_group_id)
+
+        try:
+            return await self._client.put(
+                f"{PaymentAPIWrapper.ADMIN_API_ENDPOINT}/{self.month}/status",
+                headers=JSON_CONTENT_HEADERS,
+                json_data={
+                    "paymentGroupId": payment_group_id,
+                    "paymentStatusCode": target_status.value,
+                },
+            )
+        except APIRequestException as e:
+            logger.exception(f"Failed to change payment status: {e}")
+            raise
+
+    async def cancel_payment(self, payment_group_id: str) -> PaymentData:
+        """Cancel payment.
+
+        Args:
+            payment_group_id: Payment group ID to cancel
+
+        Returns:
+            API response data
+
+        Raises:
+            ValidationException: If payment group ID is invalid
+            APIRequestException: If cancellation fails
+        """
+        PaymentValidator.validate_payment_group_id(payment_group_id)
+
+        try:
+            return await self._client.delete(
+                f"{PaymentAPIWrapper.ADMIN_API_ENDPOINT}/{self.month}",
+                headers=JSON_UTF8_HEADERS,
+                params={"paymentGroupId": payment_group_id},
+            )
+        except APIRequestException as e:
+            logger.exception(f"Failed to cancel payment: {e}")
+            raise
+
+    async def make_payment(
+        self, payment_group_id: str, retry_on_failure: bool = True, max_retries: int = 3
+    ) -> PaymentData | None:
+        """Make immediate payment with retry logic.
+
+        Args:
+            payment_group_id: Payment group ID to pay
+            retry_on_failure: Whether to retry on failure
+            max_retries: Maximum number of retries
+
+        Returns:
+            API response data or None if all retries failed
+
+        Raises:
+            ValidationException: If payment group ID is invalid
+            APIRequestException: If payment fails after retries
+        """
+        PaymentValidator.validate_payment_group_id(payment_group_id)
+
+        last_error = None
+
+        for attempt in range(max_retries):
+            try:
+                return await self._client.post(
+                    f"{PaymentAPIWrapper.CONSOLE_API_PREFIX}/{self.month}",
+                    headers={**JSON_UTF8_HEADERS, "uuid": self.uuid},
+                    json_data={"paymentGroupId": payment_group_id},
+                )
+
+            except APIRequestException as e:
+                last_error = e
+                logger.warning(f"Payment attempt {attempt + 1} failed: {e}")
+
+                if not retry_on_failure or attempt == max_retries - 1:
+                    break
+
+                await asyncio.sleep(2**attempt)  # 1s, 2s, 4s...
+
+        # All retries failed
+        if last_error:
+            raise last_error
+
+        return None
+
+    async def check_unpaid(self) -> float:
+        """Check unpaid amount for the month.
+
+        Returns:
+            Total unpaid amount
+
+        Raises:
+            APIRequestException: If inquiry fails
+        """
+        try:
+            response = await self._client.get(
+                f"{PaymentAPIWrapper.CONSOLE_API_PREFIX}/{self.month}/statements/unpaid",
+                headers={**JSON_HEADERS, "lang": "kr", "uuid": self.uuid},
+            )
+            return self._sum_unpaid(response)
+
+        except APIRequestException as e:
+            logger.exception(f"Failed to check unpaid amount: {e}")
+            raise
@@ -9,7 +9,8 @@ __version__ = "0.2.0"
 __author__ = "Billing Test Team"
 
 # Import main classes for easier access
-from .Adjustment import AdjustmentManager
+from .Adjustment import AdjustmentManager, AsyncAdjustmentManager
+from .async_http_client import AsyncBillingAPIClient
 from .Batch import BatchManager
 from .Calculation import CalculationManager
 from .constants import (
@@ -21,22 +22,33 @@ from .constants import (
     MemberCountry,
     PaymentStatus,
 )
-from .Contract import ContractManager
-from .Credit import CreditManager
+from .Contract import AsyncContractManager, ContractManager
+from .Credit import AsyncCreditManager, CreditManager
 from .exceptions import (
     APIRequestException,
     AuthenticationException,
     BillingTestException,
+    CircuitOpenException,
     ConfigurationException,
     DuplicateResourceException,
     ResourceNotFoundException,
     TimeoutException,
     ValidationException,
 )
+from .flow_control import FlowControl
 from .http_client import BillingAPIClient
 from .InitializeConfig import ConfigurationManager, InitializeConfig
-from .Metering import MeteringManager
-from .Payments import PaymentManager
+from .Metering import AsyncMeteringManager, MeteringManager
+from .metering_dedup import MeteringDedupFilter
+from .metering_emitter import BufferedMeteringEmitter, OverflowPolicy
+from .metering_preaggregator import MeteringPreAggregator
+from .metering_spool import MeteringSpool
+from .Payments import AsyncPaymentManager, PaymentManager
+from .request_compression import RequestCompression
+from .request_stats import RequestStats
+from .response_cache import ResponseCache
+from .retry_policy import RetryBudget, deadline
+from .wsgi_transport import WSGIAdapter
 
 # Define public API
 __all__ = [
@@ -44,12 +56,20 @@ __all__ = [
     "AdjustmentManager",
     "AdjustmentTarget",
     "AdjustmentType",
+    "AsyncAdjustmentManager",
+    "AsyncBillingAPIClient",
+    "AsyncContractManager",
+    "AsyncCreditManager",
+    "AsyncMeteringManager",
+    "AsyncPaymentManager",
     "AuthenticationException",
     "BatchJobCode",
     "BatchManager",
     "BillingAPIClient",
     "BillingTestException",
+    "BufferedMeteringEmitter",
     "CalculationManager",
+    "CircuitOpenException",
     "ConfigurationException",
     "ConfigurationManager",
     "ContractManager",
@@ -57,12 +77,23 @@ __all__ = [
     "CreditManager",
     "CreditType",
     "DuplicateResourceException",
+    "FlowControl",
     "InitializeConfig",
     "MemberCountry",
+    "MeteringDedupFilter",
     "MeteringManager",
+    "MeteringPreAggregator",
+    "MeteringSpool",
+    "OverflowPolicy",
     "PaymentManager",
     "PaymentStatus",
+    "RequestCompression",
+    "RequestStats",
     "ResourceNotFoundException",
+    "ResponseCache",
+    "RetryBudget",
     "TimeoutException",
     "ValidationException",
+    "WSGIAdapter",
+    "deadline",
 ]
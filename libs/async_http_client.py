@@ -0,0 +1,507 @@
+"""Asyncio HTTP client for billing API interactions.
+
+Mirrors :class:`libs.http_client.BillingAPIClient` on top of ``httpx`` so a
+single event loop can keep thousands of requests in flight instead of
+spreading blocking calls across threads.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import TYPE_CHECKING, Any, Self, TypeVar
+
+from .constants import (
+    DEFAULT_MAX_CONCURRENCY,
+    DEFAULT_POOL_SIZE,
+    DEFAULT_TIMEOUT,
+)
+from .exceptions import APIRequestException
+from .flow_control import parse_retry_after
+from .http_client import (
+    DEFAULT_ACCEPT_HEADER,
+    BaseAPIClient,
+    Headers,
+    HTTPMethod,
+    JsonData,
+    Params,
+    RequestData,
+    RetryConfig,
+)
+from .json_codec import JSONCodec
+from .polling import AdaptivePolling
+from .request_stats import RequestStats
+from .retry_policy import RetryBudget, check_deadline
+
+# Optional import - the asyncio client is an optional feature
+try:
+    import httpx
+
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Iterable
+    from wsgiref.types import WSGIApplication
+
+    from .request_compression import RequestCompression
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Mirrors urllib3.util.retry.Retry so both clients honour Retry-After alike
+RETRY_AFTER_STATUS_CODES = frozenset({413, 429, 503})
+
+
+async def gather_with_concurrency(
+    aws: Iterable[Awaitable[T]],
+    *,
+    limit: int = DEFAULT_MAX_CONCURRENCY,
+) -> list[T | BaseException]:
+    """Await all awaitables with at most ``limit`` running at once.
+
+    Args:
+        aws: Awaitables to run
+        limit: Maximum number of awaitables in flight
+
+    Returns:
+        Results in input order; failures are returned as exception instances
+    """
+    semaphore = asyncio.Semaphore(max(1, limit))
+
+    async def _bounded(aw: Awaitable[T]) -> T:
+        async with semaphore:
+            return await aw
+
+    return await asyncio.gather(*(_bounded(aw) for aw in aws), return_exceptions=True)
+
+
+class AsyncBillingAPIClient(BaseAPIClient):
+    """Asyncio HTTP client for billing API requests.
+
+    Exposes the same ``request``/``get``/``post``/``put``/``delete``/``patch``/
+    ``wait_for_completion`` surface as ``BillingAPIClient``, honours the same
+    ``RetryConfig`` and validates responses with the same header checks.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        timeout: int = DEFAULT_TIMEOUT,
+        retry_config: RetryConfig | None = None,
+        use_mock: bool = False,
+        max_connections: int = DEFAULT_POOL_SIZE,
+        transport: httpx.AsyncBaseTransport | None = None,
+        codec: JSONCodec | None = None,
+        retry_budget: RetryBudget | None = None,
+        stats: RequestStats | None = None,
+        wsgi_app: WSGIApplication | None = None,
+        request_compression: RequestCompression | None = None,
+    ) -> None:
+        """Initialize async API client.
+
+        Args:
+            base_url: Base URL for API endpoints
+            timeout: Request timeout in seconds
+            retry_config: Optional retry configuration
+            use_mock: Whether to use mock server
+            max_connections: Maximum number of pooled connections
+            transport: Optional httpx transport (e.g. for in-process testing)
+            codec: JSON codec for response bodies (defaults to get_codec())
+            retry_budget: Retry budget shared by all requests of the client
+                (defaults to a new RetryBudget)
+            stats: Per-endpoint request statistics to record into (defaults
+                to the process-wide get_request_stats())
+            wsgi_app: Optional WSGI application (e.g. ``mock_server.app``) to
+                call in-process when no ``transport`` is given
+            request_compression: Optional gzip/deflate compression of JSON
+                bodies above a size threshold (sent with Content-Encoding)
+
+        Raises:
+            ImportError: If httpx is not installed
+        """
+        if not HTTPX_AVAILABLE:
+            msg = "httpx is required for AsyncBillingAPIClient (pip install httpx)"
+            raise ImportError(msg)
+
+        if transport is None and wsgi_app is not None:
+            from .wsgi_transport import AsyncWSGITransport
+
+            transport = AsyncWSGITransport(wsgi_app)
+
+        super().__init__(
+            base_url,
+            timeout,
+            retry_config,
+            use_mock,
+            codec,
+            retry_budget,
+            stats,
+            request_compression,
+        )
+        self.max_connections = max_connections
+        self._transport = transport
+        self._headers: Headers = {
+            "Accept": DEFAULT_ACCEPT_HEADER,
+            "User-Agent": "AsyncBillingAPIClient/1.0",
+        }
+
+        self._client: httpx.AsyncClient | None = None
+
+        # Initialize client
+        self._setup_client()
+
+    def _setup_client(self) -> None:
+        """Set up the httpx client with a shared connection pool."""
+        self._client = httpx.AsyncClient(
+            headers=self._headers,
+            timeout=httpx.Timeout(self.timeout),
+            limits=httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_connections,
+            ),
+            follow_redirects=True,
+            max_redirects=self.retry_config.redirect,
+            transport=self._transport,
+        )
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Get the current httpx client, creating if necessary."""
+        if self._client is None or self._client.is_closed:
+            self._setup_client()
+        assert self._client is not None  # nosec B101
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the client and release pooled connections."""
+        if self._client:
+            await self._client.aclose()
+            self._client = None
+
+    async def __aenter__(self) -> Self:
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(
+        self,
+        _exc_type: type[BaseException] | None,
+        _exc_val: BaseException | None,
+        _exc_tb: object,
+    ) -> None:
+        """Async context manager exit - close client."""
+        await self.aclose()
+
+    def _is_retryable_status(self, method: HTTPMethod, status_code: int) -> bool:
+        """Check if a response status should be retried for the method."""
+        return (
+            method.value in self.retry_config.allowed_methods
+            and status_code in self.retry_config.status_forcelist
+        )
+
+    async def _send(
+        self,
+        method: HTTPMethod,
+        url: str,
+        request_kwargs: dict[str, Any],
+    ) -> tuple[httpx.Response, int]:
+        """Send a request, retrying according to ``RetryConfig``.
+
+        Backoff and the decision to retry at all follow ``retry_policy``, so
+        retries stop at the current deadline or once the budget is spent.
+
+        Returns:
+            The final response and the number of retries it took
+
+        Raises:
+            APIRequestException: If retries are exhausted on a transport error
+            TimeoutException: If the current deadline has already passed
+        """
+        total = self.retry_config.total
+        connect = self.retry_config.connect
+        read = self.retry_config.read
+        consecutive_errors = 0
+        self.retry_policy.record_request()
+
+        while True:
+            remaining = check_deadline(f"request to {url}")
+            attempt_kwargs = request_kwargs
+            if remaining is not None:
+                attempt_kwargs = {
+                    **request_kwargs,
+                    "timeout": min(self.timeout, remaining),
+                }
+
+            try:
+                response = await self.client.request(
+                    method.value, url, **attempt_kwargs
+                )
+            except (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout) as e:
+                # Request never reached the server - always safe to retry
+                total -= 1
+                connect -= 1
+                consecutive_errors += 1
+                wait_time = self.retry_policy.backoff(consecutive_errors)
+                if total < 0 or connect < 0 or not self.retry_policy.admit(wait_time):
+                    raise
+                logger.warning(f"Connection failed ({e}), retrying...")
+                await asyncio.sleep(wait_time)
+                continue
+            except (httpx.ReadError, httpx.ReadTimeout, httpx.RemoteProtocolError) as e:
+                if method.value not in self.retry_config.allowed_methods:
+                    raise
+                total -= 1
+                read -= 1
+                consecutive_errors += 1
+                wait_time = self.retry_policy.backoff(consecutive_errors)
+                if total < 0 or read < 0 or not self.retry_policy.admit(wait_time):
+                    raise
+                logger.warning(f"Read failed ({e}), retrying...")
+                await asyncio.sleep(wait_time)
+                continue
+
+            if not self._is_retryable_status(method, response.status_code):
+                return response, consecutive_errors
+
+            total -= 1
+            consecutive_errors += 1
+            retry_after = (
+                parse_retry_after(response.headers.get("Retry-After"))
+                if self.retry_config.respect_retry_after_header
+                and response.status_code in RETRY_AFTER_STATUS_CODES
+                else None
+            )
+            wait_time = (
+                self.retry_policy.backoff(consecutive_errors)
+                if retry_after is None
+                else retry_after
+            )
+            if total < 0 or not self.retry_policy.admit(wait_time):
+                if self.retry_config.raise_on_status:
+                    msg = (
+                        f"Max retries exceeded with url: {url} "
+                        f"(too many {response.status_code} error responses)"
+                    )
+                    raise httpx.HTTPError(msg)
+                return response, consecutive_errors - 1
+
+            logger.warning(
+                f"Received HTTP {response.status_code}, retrying in {wait_time:.2f}s..."
+            )
+            await asyncio.sleep(wait_time)
+
+    async def request(
+        self,
+        method: str | HTTPMethod,
+        endpoint: str,
+        headers: Headers | None = None,
+        params: Params | None = None,
+        json_data: JsonData | None = None,
+        data: RequestData | None = None,
+        **kwargs: Any,
+    ) -> JsonData:
+        """Make HTTP request to API.
+
+        Args:
+            method: HTTP method
+            endpoint: API endpoint path
+            headers: Optional request headers
+            params: Optional query parameters
+            json_data: Optional JSON body data
+            data: Optional form data
+            **kwargs: Additional arguments passed to httpx
+
+        Returns:
+            Response data
+
+        Raises:
+            APIRequestException: If request fails
+        """
+        # Validate method
+        method = HTTPMethod(method.upper()) if isinstance(method, str) else method
+
+        # Build URL without params (they'll be passed separately)
+        url = self._build_url(endpoint)
+
+        request_kwargs: dict[str, Any] = {"headers": headers, **kwargs}
+        if params:
+            # Match requests, which drops None-valued query parameters
+            request_kwargs["params"] = {
+                k: v for k, v in params.items() if v is not None
+            }
+        if json_data is not None and self.request_compression is not None:
+            request_kwargs["content"], request_kwargs["headers"] = (
+                self.request_compression.json_request(
+                    self.codec.dumps(json_data), dict(headers or {})
+                )
+            )
+        elif json_data is not None:
+            request_kwargs["json"] = json_data
+        if isinstance(data, str | bytes):
+            request_kwargs["content"] = data
+        elif data:
+            request_kwargs["data"] = data
+
+        # Log request details
+        logger.debug(
+            f"Making async {method.value} request to {endpoint} "
+            f"(params: {len(params or {})}, "
+            f"json: {'yes' if json_data else 'no'}, "
+            f"data: {'yes' if data else 'no'})"
+        )
+
+        telemetry_attrs = self._telemetry_attributes(method, url)
+        start_time = time.time()
+
+        with self._telemetry.span(
+            f"http.{method.value.lower()}", telemetry_attrs
+        ) as span:
+            try:
+                response, retries = await self._send(method, url, request_kwargs)
+            except httpx.HTTPError as e:
+                self.stats.record(
+                    method.value, endpoint, None, time.time() - start_time
+                )
+                logger.exception(f"Request failed: {e}")
+                msg = f"Request failed: {e}"
+                raise APIRequestException(msg)
+
+            elapsed_ms = (time.time() - start_time) * 1000
+            self.stats.record(
+                method.value,
+                endpoint,
+                response.status_code,
+                elapsed_ms / 1000,
+                bytes_sent=len(response.request.content),
+                bytes_received=len(response.content),
+                retries=retries,
+            )
+
+            # Update telemetry
+            if span:
+                span.set_attribute("http.status_code", response.status_code)
+                span.set_attribute("http.response_time_ms", elapsed_ms)
+
+            self._telemetry.record_api_call(
+                endpoint=telemetry_attrs["http.path"],
+                method=method.value,
+                status_code=response.status_code,
+                response_time=elapsed_ms / 1000,  # Convert back to seconds
+            )
+
+            # Validate and return response
+            return self._validate_response(response)
+
+    # Convenience methods for common HTTP verbs
+    async def get(self, endpoint: str, **kwargs: Any) -> JsonData:
+        """Make GET request."""
+        return await self.request(HTTPMethod.GET, endpoint, **kwargs)
+
+    async def post(self, endpoint: str, **kwargs: Any) -> JsonData:
+        """Make POST request."""
+        return await self.request(HTTPMethod.POST, endpoint, **kwargs)
+
+    async def put(self, endpoint: str, **kwargs: Any) -> JsonData:
+        """Make PUT request."""
+        return await self.request(HTTPMethod.PUT, endpoint, **kwargs)
+
+    async def delete(self, endpoint: str, **kwargs: Any) -> JsonData:
+        """Make DELETE request."""
+        return await self.request(HTTPMethod.DELETE, endpoint, **kwargs)
+
+    async def patch(self, endpoint: str, **kwargs: Any) -> JsonData:
+        """Make PATCH request."""
+        return await self.request(HTTPMethod.PATCH, endpoint, **kwargs)
+
+    async def wait_for_completion(
+        self,
+        check_endpoint: str,
+        *,
+        status_field: str = "status",
+        success_value: str = "COMPLETED",
+        timeout: int = 300,
+        check_interval: float | None = None,
+        progress_callback: Callable[[JsonData], None] | None = None,
+        polling: AdaptivePolling | None = None,
+    ) -> JsonData:
+        """Wait for an async operation to complete.
+
+        Polls at a fixed ``check_interval`` when one is given and on an
+        adaptive schedule otherwise.
+
+        Args:
+            check_endpoint: Endpoint to check status
+            status_field: Field name containing status
+            success_value: Value indicating completion
+            timeout: Maximum seconds to wait
+            check_interval: Fixed seconds between checks
+            progress_callback: Optional callback for progress updates
+            polling: Adaptive polling policy (defaults to AdaptivePolling())
+
+        Returns:
+            Final response data
+
+        Raises:
+            APIRequestException: If operation fails or times out
+        """
+        start_time = time.time()
+        last_response = None
+        schedule = (polling or AdaptivePolling()).schedule()
+
+        while time.time() - start_time < timeout:
+            try:
+                response = await self.get(check_endpoint)
+                last_response = response
+
+                # Check if completed
+                if self._check_completion(response, status_field, success_value):
+                    logger.info("Operation completed successfully")
+                    return response
+
+                # Call progress callback if provided
+                if progress_callback:
+                    progress_callback(response)
+
+            except APIRequestException as e:
+                logger.warning(f"Status check failed: {e}")
+
+            # Wait before next check
+            remaining_time = timeout - (time.time() - start_time)
+            if check_interval is None:
+                interval = schedule.next_delay(last_response)
+            else:
+                interval = check_interval
+            wait_time = min(interval, remaining_time)
+            if wait_time > 0:
+                await asyncio.sleep(wait_time)
+
+        # Timeout reached
+        msg = f"Operation timed out after {timeout}s"
+        raise APIRequestException(msg, response_data=last_response)
+
+    def set_auth_token(self, token: str) -> None:
+        """Set authorization token for all requests."""
+        self._headers["Authorization"] = f"Bearer {token}"
+        self.client.headers["Authorization"] = f"Bearer {token}"
+
+    def clear_auth_token(self) -> None:
+        """Remove authorization token."""
+        self._headers.pop("Authorization", None)
+        self.client.headers.pop("Authorization", None)
+
+    async def get_statements_console(self, month: str, uuid: str) -> dict[str, Any]:
+        """Get billing statements using console API.
+
+        Args:
+            month: Billing month
+            uuid: Project UUID
+
+        Returns:
+            Billing statements response
+        """
+        return await self.get(
+            "billing/console/statements", params={"uuid": uuid, "month": month}
+        )
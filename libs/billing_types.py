@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Any, TypedDict
+from typing import Any, NotRequired, TypedDict
 
 
 class LocaleDescription(TypedDict):
@@ -38,6 +38,7 @@ class MeteringData(TypedDict):
     resourceName: str
     source: str
     timestamp: str
+    idempotencyKey: NotRequired[str]
 
 
 class MeteringRequest(TypedDict):
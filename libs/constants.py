@@ -343,6 +343,60 @@ MAX_CREDIT_AMOUNT: Final[int] = 1_000_000_000  # 1 billion
 MAX_ADJUSTMENT_PERCENTAGE: Final[float] = 100.0
 MAX_RETRY_ATTEMPTS: Final[int] = 10
 
+# Connection pooling and concurrency
+DEFAULT_POOL_SIZE: Final[int] = 100
+DEFAULT_MAX_CONCURRENCY: Final[int] = 16
+
+# Metering batches
+DEFAULT_METER_BATCH_BYTES: Final[int] = 1024 * 1024  # encoded meterList budget
+DEFAULT_INGEST_BATCH_SIZE: Final[int] = 500  # meters per request when streaming
+DEFAULT_INGEST_PROGRESS_INTERVAL: Final[float] = 5.0  # seconds
+DEFAULT_EMITTER_BATCH_SIZE: Final[int] = 100  # meters per background flush
+DEFAULT_EMITTER_MAX_AGE: Final[float] = 1.0  # seconds an event may wait
+DEFAULT_EMITTER_QUEUE_SIZE: Final[int] = 10_000  # buffered events
+DEFAULT_SPOOL_SEGMENT_BYTES: Final[int] = 64 * 1024 * 1024  # spool segment size
+DEFAULT_SPOOL_FSYNC_INTERVAL: Final[float] = 0.05  # seconds between spool fsyncs
+DEFAULT_DEDUP_CAPACITY: Final[int] = 1_000_000  # keys per dedup filter generation
+DEFAULT_DEDUP_ERROR_RATE: Final[float] = 1e-6  # dedup false-positive rate
+
+# Request compression
+DEFAULT_COMPRESSION_MIN_SIZE: Final[int] = 1024  # bytes; smaller bodies go as-is
+DEFAULT_COMPRESSION_LEVEL: Final[int] = 6
+
+# Metering aggregation
+DEFAULT_COLUMNAR_MIN_RECORDS: Final[int] = 1_000  # records before numpy pays off
+DEFAULT_TIMESTAMP_CACHE_SIZE: Final[int] = 16_384  # a year of hourly stamps
+DEFAULT_MAPREDUCE_SHARD_BYTES: Final[int] = 64 * 1024 * 1024  # dump bytes per task
+DEFAULT_QUANTILE_SKETCH_K: Final[int] = 200  # sketch accuracy; ~3k values kept
+DEFAULT_OUTLIER_MIN_SAMPLES: Final[int] = 3  # readings per counter before flagging
+DEFAULT_ZSCORE_THRESHOLD: Final[float] = 2.0  # standard deviations from the mean
+DEFAULT_MAD_THRESHOLD: Final[float] = 3.5  # modified z-score (Iglewicz-Hoaglin)
+DEFAULT_HLL_PRECISION: Final[int] = 14  # 16 KiB of registers, ~0.8% error
+
+# Response caching
+DEFAULT_CACHE_TTL: Final[float] = 0.0  # seconds; only endpoint_ttls are cached
+DEFAULT_CACHE_MAX_ENTRIES: Final[int] = 1024
+
+# Adaptive completion polling
+DEFAULT_POLL_INITIAL_INTERVAL: Final[float] = 0.1  # seconds
+DEFAULT_POLL_MAX_INTERVAL: Final[float] = 10.0  # seconds
+DEFAULT_POLL_MULTIPLIER: Final[float] = 2.0
+DEFAULT_POLL_JITTER: Final[float] = 0.1  # +/- fraction of each interval
+
+# Retry budgets and backoff
+DEFAULT_BACKOFF_MAX: Final[float] = 30.0  # seconds, cap on one backoff sleep
+DEFAULT_RETRY_BUDGET_RATIO: Final[float] = 0.1  # retries per request
+DEFAULT_RETRY_BUDGET_RESERVE: Final[int] = 10  # retries allowed in a burst
+
+# Adaptive concurrency limiting and circuit breaking
+DEFAULT_LIMITER_INITIAL_LIMIT: Final[int] = 8
+DEFAULT_LIMITER_MAX_LIMIT: Final[int] = 64
+DEFAULT_LIMITER_BACKOFF_RATIO: Final[float] = 0.5
+DEFAULT_LIMITER_LATENCY_TOLERANCE: Final[float] = 2.0  # x smoothed latency
+DEFAULT_MAX_RETRY_AFTER: Final[float] = 60.0  # seconds
+DEFAULT_BREAKER_FAILURE_THRESHOLD: Final[int] = 5
+DEFAULT_BREAKER_RECOVERY_TIMEOUT: Final[float] = 30.0  # seconds
+
 # Rate limiting
 RATE_LIMIT_CALLS_PER_MINUTE: Final[int] = 60
 RATE_LIMIT_CALLS_PER_HOUR: Final[int] = 1000
@@ -6,6 +6,7 @@ various error conditions in the billing system.
 
 from __future__ import annotations
 
+import math
 from dataclasses import dataclass
 from enum import Enum
 from typing import Any
@@ -613,6 +614,42 @@ class ServerException(BillingTestException):
         self.server_error_code = error_code
 
 
+class CircuitOpenException(BillingTestException):
+    """Exception raised when a circuit breaker rejects a request without sending it."""
+
+    def __init__(
+        self,
+        message: str,
+        group: str | None = None,
+        retry_after: float | None = None,
+        context: ErrorContext | None = None,
+    ) -> None:
+        """Initialize circuit open exception.
+
+        Args:
+            message: Error message
+            group: Endpoint group whose circuit is open
+            retry_after: Seconds until the circuit lets a probe request through
+            context: Error context
+        """
+        if context is None:
+            details: dict[str, Any] = {}
+            if group:
+                details["group"] = group
+
+            context = ErrorContext(
+                error_code=ErrorCode.SERVICE_UNAVAILABLE,
+                details=details,
+                retry_after=math.ceil(retry_after) if retry_after else None,
+                is_retryable=True,
+                suggested_action="Wait for the backend to recover before retrying",
+            )
+
+        super().__init__(message, context)
+        self.group = group
+        self.retry_after = retry_after
+
+
 class NetworkException(BillingTestException):
     """Exception raised for network-related errors."""
 
@@ -0,0 +1,484 @@
+"""Adaptive concurrency limiting and circuit breaking for API requests.
+
+FlowControl gives every host/endpoint group its own AIMD concurrency limit
+and circuit breaker. The limit grows by about one slot per window of
+successful requests and is cut multiplicatively on 429 responses, server
+errors and latency spikes; a ``Retry-After`` header pauses the whole group.
+While a group's backend keeps failing, its breaker opens and requests fail
+fast with CircuitOpenException instead of queueing retries against it.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import asdict, dataclass
+from email.utils import parsedate_to_datetime
+from enum import Enum
+from fnmatch import fnmatchcase
+from typing import TYPE_CHECKING, Any
+from urllib.parse import urlparse
+
+from .constants import (
+    DEFAULT_BREAKER_FAILURE_THRESHOLD,
+    DEFAULT_BREAKER_RECOVERY_TIMEOUT,
+    DEFAULT_LIMITER_BACKOFF_RATIO,
+    DEFAULT_LIMITER_INITIAL_LIMIT,
+    DEFAULT_LIMITER_LATENCY_TOLERANCE,
+    DEFAULT_LIMITER_MAX_LIMIT,
+    DEFAULT_MAX_RETRY_AFTER,
+)
+from .exceptions import CircuitOpenException
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+
+DEFAULT_GROUP = "default"
+
+
+class CircuitState(str, Enum):
+    """Circuit breaker states."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+def parse_retry_after(value: str | None, now: float | None = None) -> float | None:
+    """Parse a ``Retry-After`` header value.
+
+    Args:
+        value: Header value, either delay seconds or an HTTP date
+        now: Current wall-clock time, for HTTP dates
+
+    Returns:
+        Seconds to wait, or None if the value is missing or malformed
+    """
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+    return max(retry_at - (time.time() if now is None else now), 0.0)
+
+
+class AdaptiveLimiter:
+    """AIMD concurrency limit for one endpoint group.
+
+    Each successful request adds ``1 / limit`` to the limit, so it grows by
+    about one slot per window of requests. An overload signal multiplies the
+    limit by ``backoff_ratio``, at most once per window: requests that were
+    already in flight when the limit was last cut do not cut it again.
+    A request counts as a latency spike when it takes more than
+    ``latency_tolerance`` times the smoothed latency of earlier requests.
+    """
+
+    LATENCY_SMOOTHING = 0.1
+    LATENCY_WARMUP = 5
+
+    def __init__(
+        self,
+        initial_limit: int = DEFAULT_LIMITER_INITIAL_LIMIT,
+        min_limit: int = 1,
+        max_limit: int = DEFAULT_LIMITER_MAX_LIMIT,
+        backoff_ratio: float = DEFAULT_LIMITER_BACKOFF_RATIO,
+        latency_tolerance: float = DEFAULT_LIMITER_LATENCY_TOLERANCE,
+        max_retry_after: float = DEFAULT_MAX_RETRY_AFTER,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the limiter.
+
+        Args:
+            initial_limit: Concurrency limit to start from
+            min_limit: Lowest the limit can be cut to
+            max_limit: Highest the limit can grow to
+            backoff_ratio: Factor applied to the limit on overload
+            latency_tolerance: Multiple of the smoothed latency that counts
+                as a spike
+            max_retry_after: Cap on how long a Retry-After header pauses
+                the group
+            clock: Monotonic time source, injectable for tests
+        """
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            msg = (
+                "Expected 1 <= min_limit <= initial_limit <= max_limit, got "
+                f"{min_limit}, {initial_limit}, {max_limit}"
+            )
+            raise ValueError(msg)
+        if not 0 < backoff_ratio < 1:
+            msg = f"backoff_ratio must be between 0 and 1, got {backoff_ratio}"
+            raise ValueError(msg)
+
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff_ratio = backoff_ratio
+        self.latency_tolerance = latency_tolerance
+        self.max_retry_after = max_retry_after
+        self._clock = clock
+
+        self._limit = float(initial_limit)
+        self._in_flight = 0
+        self._paused_until = 0.0
+        self._last_decrease = float("-inf")
+        self._latency: float | None = None
+        self._samples = 0
+        self._cond = threading.Condition()
+
+    @property
+    def limit(self) -> int:
+        """Get the current concurrency limit."""
+        with self._cond:
+            return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """Get the number of requests holding a slot."""
+        with self._cond:
+            return self._in_flight
+
+    @property
+    def pause_remaining(self) -> float:
+        """Get the seconds left on a Retry-After pause."""
+        with self._cond:
+            return max(self._paused_until - self._clock(), 0.0)
+
+    def acquire(self, timeout: float | None = None) -> float | None:
+        """Wait for a free slot.
+
+        Args:
+            timeout: Maximum seconds to wait, or None to wait indefinitely
+
+        Returns:
+            The time the slot was taken, to pass to ``release``, or None if
+            no slot became free within the timeout
+        """
+        deadline = None if timeout is None else self._clock() + timeout
+        with self._cond:
+            while True:
+                now = self._clock()
+                if now >= self._paused_until and self._in_flight < int(self._limit):
+                    self._in_flight += 1
+                    return now
+
+                waits = [self._paused_until - now] if now < self._paused_until else []
+                if deadline is not None:
+                    if now >= deadline:
+                        return None
+                    waits.append(deadline - now)
+                self._cond.wait(min(waits) if waits else None)
+
+    def release(
+        self,
+        started: float,
+        overloaded: bool = False,
+        retry_after: float | None = None,
+    ) -> None:
+        """Return a slot and adjust the limit from the request's outcome.
+
+        Args:
+            started: Value returned by ``acquire``
+            overloaded: Whether the server signalled overload (429 or 5xx)
+            retry_after: Seconds the server asked clients to wait
+        """
+        with self._cond:
+            now = self._clock()
+            self._in_flight -= 1
+
+            if retry_after:
+                pause = min(retry_after, self.max_retry_after)
+                self._paused_until = max(self._paused_until, now + pause)
+
+            if overloaded or self._is_latency_spike(now - started):
+                if started >= self._last_decrease:
+                    self._limit = max(self._limit * self.backoff_ratio, self.min_limit)
+                    self._last_decrease = now
+            else:
+                self._limit = min(self._limit + 1 / self._limit, self.max_limit)
+
+            self._cond.notify_all()
+
+    def _is_latency_spike(self, latency: float) -> bool:
+        """Record a latency sample and check it against the smoothed latency."""
+        baseline = self._latency
+        self._samples += 1
+        if baseline is None:
+            self._latency = latency
+            return False
+
+        self._latency = baseline + self.LATENCY_SMOOTHING * (latency - baseline)
+        return (
+            self._samples > self.LATENCY_WARMUP
+            and latency > baseline * self.latency_tolerance
+        )
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker for one endpoint group.
+
+    After ``failure_threshold`` consecutive failures the circuit opens and
+    rejects requests. Once ``recovery_timeout`` has passed it half-opens and
+    lets a single probe through: success closes the circuit, failure opens
+    it for another ``recovery_timeout``.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = DEFAULT_BREAKER_FAILURE_THRESHOLD,
+        recovery_timeout: float = DEFAULT_BREAKER_RECOVERY_TIMEOUT,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the breaker.
+
+        Args:
+            failure_threshold: Consecutive failures that open the circuit
+            recovery_timeout: Seconds the circuit stays open before a probe
+            clock: Monotonic time source, injectable for tests
+        """
+        if failure_threshold < 1:
+            msg = f"failure_threshold must be positive, got {failure_threshold}"
+            raise ValueError(msg)
+
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self._clock = clock
+
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> CircuitState:
+        """Get the current state, moving from open to half-open when due."""
+        with self._lock:
+            return self._current_state()
+
+    def retry_after(self) -> float:
+        """Get the seconds until an open circuit accepts a probe."""
+        with self._lock:
+            if self._state is not CircuitState.OPEN:
+                return 0.0
+            return max(self._opened_at + self.recovery_timeout - self._clock(), 0.0)
+
+    def allow(self) -> bool:
+        """Check whether a request may be sent, claiming the probe if half-open."""
+        with self._lock:
+            state = self._current_state()
+            if state is CircuitState.CLOSED:
+                return True
+            if state is CircuitState.HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return True
+            return False
+
+    def record_success(self) -> None:
+        """Record a request the backend answered."""
+        with self._lock:
+            self._failures = 0
+            self._probe_in_flight = False
+            self._state = CircuitState.CLOSED
+
+    def record_failure(self) -> None:
+        """Record a request the backend failed to answer."""
+        with self._lock:
+            self._failures += 1
+            self._probe_in_flight = False
+            if (
+                self._state is CircuitState.HALF_OPEN
+                or self._failures >= self.failure_threshold
+            ):
+                self._state = CircuitState.OPEN
+                self._opened_at = self._clock()
+
+    def _current_state(self) -> CircuitState:
+        """Get the state; the caller must hold the lock."""
+        if (
+            self._state is CircuitState.OPEN
+            and self._clock() >= self._opened_at + self.recovery_timeout
+        ):
+            self._state = CircuitState.HALF_OPEN
+        return self._state
+
+
+@dataclass(frozen=True)
+class FlowPermit:
+    """A slot held by one in-flight request."""
+
+    group: str
+    started: float
+
+
+@dataclass(frozen=True)
+class GroupStatus:
+    """Point-in-time view of one endpoint group, for throughput scheduling."""
+
+    limit: int
+    in_flight: int
+    circuit: str
+    pause_remaining: float
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a plain dictionary."""
+        return asdict(self)
+
+
+class FlowControl:
+    """Per host/endpoint group concurrency limits and circuit breakers.
+
+    Requests are grouped by host plus the name of the first glob pattern in
+    ``endpoint_groups`` their path matches (``default`` when none match),
+    e.g. ``{"admin": "billing/admin/*", "meters": "billing/meters*"}``.
+    Each group gets its own AdaptiveLimiter and CircuitBreaker, created on
+    first use.
+    """
+
+    def __init__(
+        self,
+        endpoint_groups: Mapping[str, str] | None = None,
+        initial_limit: int = DEFAULT_LIMITER_INITIAL_LIMIT,
+        min_limit: int = 1,
+        max_limit: int = DEFAULT_LIMITER_MAX_LIMIT,
+        backoff_ratio: float = DEFAULT_LIMITER_BACKOFF_RATIO,
+        latency_tolerance: float = DEFAULT_LIMITER_LATENCY_TOLERANCE,
+        max_retry_after: float = DEFAULT_MAX_RETRY_AFTER,
+        failure_threshold: int = DEFAULT_BREAKER_FAILURE_THRESHOLD,
+        recovery_timeout: float = DEFAULT_BREAKER_RECOVERY_TIMEOUT,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize flow control.
+
+        Args:
+            endpoint_groups: Group name to glob pattern, matched in order
+            initial_limit: Starting concurrency limit of each group
+            min_limit: Lowest a group's limit can be cut to
+            max_limit: Highest a group's limit can grow to
+            backoff_ratio: Factor applied to a group's limit on overload
+            latency_tolerance: Multiple of the smoothed latency that counts
+                as a spike
+            max_retry_after: Cap on how long a Retry-After header pauses a
+                group
+            failure_threshold: Consecutive failures that open a group's circuit
+            recovery_timeout: Seconds a circuit stays open before a probe
+            clock: Monotonic time source, injectable for tests
+        """
+        self.endpoint_groups = dict(endpoint_groups or {})
+        self._limiter_options: dict[str, Any] = {
+            "initial_limit": initial_limit,
+            "min_limit": min_limit,
+            "max_limit": max_limit,
+            "backoff_ratio": backoff_ratio,
+            "latency_tolerance": latency_tolerance,
+            "max_retry_after": max_retry_after,
+            "clock": clock,
+        }
+        self._breaker_options: dict[str, Any] = {
+            "failure_threshold": failure_threshold,
+            "recovery_timeout": recovery_timeout,
+            "clock": clock,
+        }
+        # Fail on bad settings now rather than on the first request
+        AdaptiveLimiter(**self._limiter_options)
+        CircuitBreaker(**self._breaker_options)
+
+        self._groups: dict[str, tuple[AdaptiveLimiter, CircuitBreaker]] = {}
+        self._lock = threading.Lock()
+
+    def group_for(self, url: str) -> str:
+        """Get the group key ``host/name`` for a request URL."""
+        parsed = urlparse(url)
+        path = parsed.path.lstrip("/")
+        for name, pattern in self.endpoint_groups.items():
+            if fnmatchcase(path, pattern.lstrip("/")):
+                return f"{parsed.netloc}/{name}"
+        return f"{parsed.netloc}/{DEFAULT_GROUP}"
+
+    def limiter(self, group: str) -> AdaptiveLimiter:
+        """Get the concurrency limiter of a group."""
+        return self._group(group)[0]
+
+    def breaker(self, group: str) -> CircuitBreaker:
+        """Get the circuit breaker of a group."""
+        return self._group(group)[1]
+
+    def acquire(self, url: str) -> FlowPermit:
+        """Wait for a slot in the request's group.
+
+        Args:
+            url: Full request URL
+
+        Returns:
+            Permit to pass to ``release`` once the request finishes
+
+        Raises:
+            CircuitOpenException: If the group's circuit is open
+        """
+        group = self.group_for(url)
+        limiter, breaker = self._group(group)
+        if not breaker.allow():
+            retry_after = breaker.retry_after()
+            msg = (
+                f"Circuit open for {group}; failing fast "
+                f"(next probe in {retry_after:.1f}s)"
+            )
+            raise CircuitOpenException(msg, group=group, retry_after=retry_after)
+
+        started = limiter.acquire()
+        assert started is not None  # nosec B101 - no timeout given
+        return FlowPermit(group, started)
+
+    def release(
+        self,
+        permit: FlowPermit,
+        status_code: int | None = None,
+        retry_after: str | None = None,
+    ) -> None:
+        """Report a finished request.
+
+        Args:
+            permit: Permit returned by ``acquire``
+            status_code: Response status, or None if no response arrived
+            retry_after: Raw ``Retry-After`` header of the response
+        """
+        limiter, breaker = self._group(permit.group)
+        failed = status_code is None or status_code >= 500
+        if failed:
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+        limiter.release(
+            permit.started,
+            overloaded=failed or status_code == 429,
+            retry_after=parse_retry_after(retry_after),
+        )
+
+    def snapshot(self) -> dict[str, GroupStatus]:
+        """Get the current limit and circuit state of every group seen so far."""
+        with self._lock:
+            groups = dict(self._groups)
+        return {
+            group: GroupStatus(
+                limit=limiter.limit,
+                in_flight=limiter.in_flight,
+                circuit=breaker.state.value,
+                pause_remaining=limiter.pause_remaining,
+            )
+            for group, (limiter, breaker) in groups.items()
+        }
+
+    def _group(self, group: str) -> tuple[AdaptiveLimiter, CircuitBreaker]:
+        """Get or create the limiter and breaker of a group."""
+        with self._lock:
+            controls = self._groups.get(group)
+            if controls is None:
+                controls = (
+                    AdaptiveLimiter(**self._limiter_options),
+                    CircuitBreaker(**self._breaker_options),
+                )
+                self._groups[group] = controls
+            return controls
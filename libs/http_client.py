@@ -2,37 +2,66 @@
 
 from __future__ import annotations
 
+import contextvars
 import logging
+import threading
 import time
 from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from contextlib import contextmanager
 from dataclasses import dataclass
 from enum import Enum
-from functools import wraps
-from typing import TYPE_CHECKING, Any, Self, TypeVar, cast
+from functools import partial, wraps
+from itertools import takewhile
+from typing import TYPE_CHECKING, Any, Protocol, Self, TypeVar, cast
 from urllib.parse import urlencode, urljoin, urlparse
 
 import requests
-from requests.adapters import HTTPAdapter
+from urllib3.exceptions import MaxRetryError, ResponseError
 from urllib3.util.retry import Retry
 
 from .constants import (
-    DEFAULT_CHECK_INTERVAL,
+    DEFAULT_BACKOFF_MAX,
+    DEFAULT_MAX_CONCURRENCY,
+    DEFAULT_POOL_SIZE,
     DEFAULT_RETRY_COUNT,
     DEFAULT_TIMEOUT,
     HEADER_MESSAGE_KEY,
     HEADER_SUCCESS_KEY,
 )
 from .exceptions import APIRequestException
+from .flow_control import parse_retry_after
+from .json_codec import JSONCodec, get_codec
+from .polling import AdaptivePolling, iter_sse_events
+from .request_stats import (
+    PhaseTimingAdapter,
+    RequestPhases,
+    RequestStats,
+    capture_phases,
+    get_request_stats,
+    mark_headers_received,
+)
+from .retry_policy import RetryBudget, RetryPolicy, check_deadline
+from .single_flight import SingleFlight
+from .wsgi_transport import WSGIAdapter
 
 if TYPE_CHECKING:
-    from requests.models import Response
+    from collections.abc import Hashable, Iterable, Iterator, Mapping
+    from types import TracebackType
+    from wsgiref.types import WSGIApplication
+
+    from urllib3.connectionpool import ConnectionPool
+    from urllib3.response import BaseHTTPResponse
+
+    from .flow_control import FlowControl
+    from .request_compression import RequestCompression
+    from .response_cache import ResponseCache
 
 # Type aliases for clarity
 Headers = dict[str, str]
 Params = dict[str, Any]
 JsonData = dict[str, Any]
-RequestData = str | dict[str, Any]
+RequestData = str | bytes | dict[str, Any]
 
 # Generic type for decorated functions
 F = TypeVar("F", bound=Callable[..., Any])
@@ -53,12 +82,27 @@ class HTTPMethod(str, Enum):
     PATCH = "PATCH"
 
 
+class ResponseLike(Protocol):
+    """Minimal response surface shared by requests and httpx responses."""
+
+    status_code: int
+
+    @property
+    def text(self) -> str: ...
+
+    @property
+    def headers(self) -> Mapping[str, str]: ...
+
+    def json(self) -> Any: ...
+
+
 @dataclass
 class RetryConfig:
     """Configuration for retry behavior."""
 
     total: int = DEFAULT_RETRY_COUNT
     backoff_factor: float = 2.0
+    backoff_max: float = DEFAULT_BACKOFF_MAX
     status_forcelist: tuple[int, ...] = (429, 500, 502, 503, 504)
     allowed_methods: tuple[str, ...] = ("GET", "POST", "PUT", "DELETE", "PATCH")
     respect_retry_after_header: bool = True
@@ -83,6 +127,28 @@ class APIResponse:
         return 200 <= self.status_code < 300
 
 
+@dataclass(frozen=True)
+class RequestSpec:
+    """Description of a single request for BillingAPIClient.map_requests."""
+
+    method: str | HTTPMethod
+    endpoint: str
+    headers: Headers | None = None
+    params: Params | None = None
+    json_data: JsonData | None = None
+    data: RequestData | None = None
+
+    def request_kwargs(self) -> dict[str, Any]:
+        """Get keyword arguments for the verb methods, omitting unset fields."""
+        kwargs = {
+            "headers": self.headers,
+            "params": self.params,
+            "json_data": self.json_data,
+            "data": self.data,
+        }
+        return {key: value for key, value in kwargs.items() if value is not None}
+
+
 class TelemetryManager:
     """Manages telemetry integration."""
 
@@ -135,8 +201,22 @@ def retry_on_exception(
     ),
     max_retries: int = 10,
     backoff_factor: float = 2.0,
+    policy: RetryPolicy | None = None,
 ) -> Callable[[F], F]:
-    """Decorator for retrying functions on specific exceptions."""
+    """Decorator for retrying functions on specific exceptions.
+
+    Sleeps use full-jitter backoff capped at ``DEFAULT_BACKOFF_MAX`` and stop
+    early once the next attempt would start after the current ``deadline()``.
+
+    Args:
+        exceptions: Exception types that trigger a retry
+        max_retries: Maximum number of attempts
+        backoff_factor: Base of the exponential backoff in seconds
+        policy: Retry policy to follow instead of one built from
+            ``backoff_factor``, e.g. a client's ``retry_policy`` so the
+            decorator spends the same retry budget
+    """
+    retry_policy = policy or RetryPolicy(backoff_factor=backoff_factor)
 
     def decorator(func: F) -> F:
         @wraps(func)
@@ -148,15 +228,16 @@ def retry_on_exception(
                     return func(*args, **kwargs)
                 except exceptions as e:
                     last_exception = e
-                    if attempt < max_retries - 1:
-                        wait_time = backoff_factor * (2**attempt)
+                    wait_time = retry_policy.backoff(attempt + 1)
+                    if attempt < max_retries - 1 and retry_policy.admit(wait_time):
                         logger.warning(
                             f"Attempt {attempt + 1} failed: {e}. "
-                            f"Retrying in {wait_time}s..."
+                            f"Retrying in {wait_time:.2f}s..."
                         )
                         time.sleep(wait_time)
                     else:
-                        logger.exception(f"All {max_retries} attempts failed")
+                        logger.exception(f"Giving up after {attempt + 1} attempts")
+                        break
 
             if last_exception:
                 raise last_exception
@@ -167,10 +248,70 @@ def retry_on_exception(
     return decorator
 
 
-class BillingAPIClient:
-    """HTTP client for billing API requests with retry and error handling.
+class PolicyRetry(Retry):
+    """urllib3 Retry that backs off and gives up according to a RetryPolicy.
 
-    Implements connection pooling, automatic retries, and telemetry integration.
+    Backoff sleeps use the policy's full jitter, and a retry is refused
+    (ending the request with its last response or error) when it would start
+    after the current deadline or the policy's retry budget is spent.
+    """
+
+    policy: RetryPolicy | None = None
+    _backoff: float | None = None
+
+    def new(self, **kw: Any) -> Self:
+        """Copy the retry state, keeping the policy."""
+        retry = super().new(**kw)
+        retry.policy = self.policy
+        return retry
+
+    def get_backoff_time(self) -> float:
+        """Get the backoff before the next attempt, fixed once drawn."""
+        if self.policy is None:
+            return super().get_backoff_time()
+        if self._backoff is None:
+            consecutive_errors = len(
+                list(
+                    takewhile(
+                        lambda h: h.redirect_location is None, reversed(self.history)
+                    )
+                )
+            )
+            self._backoff = self.policy.backoff(consecutive_errors)
+        return self._backoff
+
+    def increment(
+        self,
+        method: str | None = None,
+        url: str | None = None,
+        response: BaseHTTPResponse | None = None,
+        error: Exception | None = None,
+        _pool: ConnectionPool | None = None,
+        _stacktrace: TracebackType | None = None,
+    ) -> Self:
+        """Record a failed attempt, refusing the retry if the policy says so."""
+        retry = super().increment(method, url, response, error, _pool, _stacktrace)
+        if self.policy is None or retry.history[-1].redirect_location:
+            return retry
+
+        wait = None
+        if response is not None and retry.respect_retry_after_header:
+            wait = retry.get_retry_after(response)
+        if wait is None:
+            wait = retry.get_backoff_time()
+        if not self.policy.admit(wait):
+            reason = error or ResponseError("retry refused by deadline or budget")
+            pool = cast("ConnectionPool", _pool)
+            raise MaxRetryError(pool, url or "", reason) from reason
+        return retry
+
+
+class BaseAPIClient:
+    """Transport-independent core shared by the sync and asyncio API clients.
+
+    Holds the client configuration and implements URL building, response
+    validation and completion checks so every transport applies the same
+    request/response semantics.
     """
 
     def __init__(
@@ -179,83 +320,40 @@ class BillingAPIClient:
         timeout: int = DEFAULT_TIMEOUT,
         retry_config: RetryConfig | None = None,
         use_mock: bool = False,
+        codec: JSONCodec | None = None,
+        retry_budget: RetryBudget | None = None,
+        stats: RequestStats | None = None,
+        request_compression: RequestCompression | None = None,
     ) -> None:
-        """Initialize API client.
+        """Initialize shared client configuration.
 
         Args:
             base_url: Base URL for API endpoints
             timeout: Request timeout in seconds
             retry_config: Optional retry configuration
             use_mock: Whether to use mock server
+            codec: JSON codec for response bodies (defaults to get_codec())
+            retry_budget: Retry budget shared by all requests of the client
+                (defaults to a new RetryBudget)
+            stats: Per-endpoint request statistics to record into (defaults
+                to the process-wide get_request_stats())
+            request_compression: Optional compression of large JSON bodies
         """
         # Use provided base_url even when use_mock is True to support different ports
         self.base_url = base_url
         self.timeout = timeout
         self.retry_config = retry_config or RetryConfig()
         self.use_mock = use_mock
-
-        self._session: requests.Session | None = None
-        self._telemetry = TelemetryManager()
-
-        # Initialize session
-        self._setup_session()
-
-    def _setup_session(self) -> None:
-        """Set up requests session with retry strategy."""
-        self._session = requests.Session()
-
-        retry_strategy = Retry(
-            total=self.retry_config.total,
-            connect=self.retry_config.connect,
-            read=self.retry_config.read,
-            redirect=self.retry_config.redirect,
+        self.codec = codec or get_codec()
+        self.retry_policy = RetryPolicy(
             backoff_factor=self.retry_config.backoff_factor,
-            status_forcelist=list(self.retry_config.status_forcelist),
-            allowed_methods=list(self.retry_config.allowed_methods),
-            respect_retry_after_header=self.retry_config.respect_retry_after_header,
-            raise_on_status=self.retry_config.raise_on_status,
-        )
-
-        adapter = HTTPAdapter(
-            max_retries=retry_strategy, pool_connections=100, pool_maxsize=100
+            backoff_max=self.retry_config.backoff_max,
+            budget=retry_budget or RetryBudget(),
         )
-        self._session.mount("https://", adapter)
-        self._session.mount("http://", adapter)
-
-        # Set default headers
-        self._session.headers.update(
-            {
-                "Accept": DEFAULT_ACCEPT_HEADER,
-                "User-Agent": "BillingAPIClient/1.0",
-            }
-        )
-
-    @property
-    def session(self) -> requests.Session:
-        """Get the current session, creating if necessary."""
-        if self._session is None:
-            self._setup_session()
-        assert self._session is not None  # nosec B101
-        return self._session
-
-    def close(self) -> None:
-        """Close the session and release resources."""
-        if self._session:
-            self._session.close()
-            self._session = None
+        self.stats = stats or get_request_stats()
+        self.request_compression = request_compression
 
-    def __enter__(self) -> Self:
-        """Context manager entry."""
-        return self
-
-    def __exit__(
-        self,
-        _exc_type: type[BaseException] | None,
-        _exc_val: BaseException | None,
-        _exc_tb: object,
-    ) -> None:
-        """Context manager exit - close session."""
-        self.close()
+        self._telemetry = TelemetryManager()
 
     def _build_url(self, endpoint: str, params: Params | None = None) -> str:
         """Build full URL from endpoint and parameters.
@@ -280,7 +378,7 @@ class BillingAPIClient:
 
         return url
 
-    def _validate_response(self, response: Response) -> JsonData:
+    def _validate_response(self, response: ResponseLike) -> JsonData:
         """Validate and parse API response.
 
         Args:
@@ -294,7 +392,7 @@ class BillingAPIClient:
         """
         # Try to parse JSON response
         try:
-            data = response.json()
+            data = self._decode_json(response)
         except ValueError as e:
             # For non-JSON responses, check if it's expected
             if response.headers.get("content-type", "").startswith("text/"):
@@ -310,7 +408,22 @@ class BillingAPIClient:
                 error_msg, status_code=response.status_code, response_data=data
             )
 
-        # Check API-specific success indicator
+        self._check_api_header(data)
+        return cast("JsonData", data)
+
+    def _decode_json(self, response: ResponseLike) -> Any:
+        """Decode a response body with the client's JSON codec.
+
+        Responses without a raw byte body (e.g. test doubles) fall back to
+        their own ``json()``.
+        """
+        content = getattr(response, "content", None)
+        if isinstance(content, bytes | bytearray):
+            return self.codec.loads(content)
+        return response.json()
+
+    def _check_api_header(self, data: Any) -> None:
+        """Raise if the API-specific success indicator reports a failure."""
         if isinstance(data, dict):
             header = data.get("header", {})
             if header and not header.get(HEADER_SUCCESS_KEY, True):
@@ -318,8 +431,6 @@ class BillingAPIClient:
                 msg = f"API error: {message}"
                 raise APIRequestException(msg, response_data=data)
 
-        return cast("JsonData", data)
-
     def _extract_error_message(self, data: Any, status_code: int) -> str:
         """Extract error message from response data."""
         if isinstance(data, dict):
@@ -335,6 +446,203 @@ class BillingAPIClient:
 
         return f"HTTP {status_code}: Request failed"
 
+    def _request_timeout(self, endpoint: str) -> float:
+        """Get the timeout for one attempt, shortened to the current deadline.
+
+        Raises:
+            TimeoutException: If the current deadline has already passed
+        """
+        remaining = check_deadline(f"request to {endpoint}")
+        return self.timeout if remaining is None else min(self.timeout, remaining)
+
+    def _telemetry_attributes(self, method: HTTPMethod, url: str) -> dict[str, Any]:
+        """Build span attributes describing an outgoing request."""
+        parsed_url = urlparse(url)
+        return {
+            "http.method": method.value,
+            "http.url": url,
+            "http.host": parsed_url.netloc,
+            "http.path": parsed_url.path,
+            "http.scheme": parsed_url.scheme,
+        }
+
+    def _check_completion(
+        self, response: JsonData, status_field: str, success_value: str
+    ) -> bool:
+        """Check if response indicates completion."""
+        # Handle nested status fields (e.g., "result.status")
+        current: Any = response
+        for field in status_field.split("."):
+            if isinstance(current, dict) and field in current:
+                current = current[field]
+            else:
+                return False
+
+        # At this point, current should be a string value to compare
+        return bool(current == success_value)
+
+
+class BillingAPIClient(BaseAPIClient):
+    """HTTP client for billing API requests with retry and error handling.
+
+    Implements connection pooling, automatic retries, and telemetry integration.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        timeout: int = DEFAULT_TIMEOUT,
+        retry_config: RetryConfig | None = None,
+        use_mock: bool = False,
+        max_workers: int = DEFAULT_MAX_CONCURRENCY,
+        cache: ResponseCache | None = None,
+        coalesce_gets: bool = True,
+        codec: JSONCodec | None = None,
+        flow_control: FlowControl | None = None,
+        retry_budget: RetryBudget | None = None,
+        stats: RequestStats | None = None,
+        wsgi_app: WSGIApplication | None = None,
+        request_compression: RequestCompression | None = None,
+    ) -> None:
+        """Initialize API client.
+
+        Args:
+            base_url: Base URL for API endpoints
+            timeout: Request timeout in seconds
+            retry_config: Optional retry configuration
+            use_mock: Whether to use mock server
+            max_workers: Size of the worker pool used by map_requests
+            cache: Optional response cache for GET requests; any other
+                method sent through this client invalidates it
+            coalesce_gets: Whether concurrent identical GETs share a single
+                in-flight request
+            codec: JSON codec for response bodies (defaults to get_codec())
+            flow_control: Optional adaptive concurrency limits and circuit
+                breakers per host/endpoint group
+            retry_budget: Retry budget shared by all requests of the client
+                (defaults to a new RetryBudget)
+            stats: Per-endpoint request statistics to record into (defaults
+                to the process-wide get_request_stats())
+            wsgi_app: Optional WSGI application (e.g. ``mock_server.app``) to
+                call in-process instead of sending requests over the network
+            request_compression: Optional gzip/deflate compression of JSON
+                bodies above a size threshold (sent with Content-Encoding)
+        """
+        super().__init__(
+            base_url,
+            timeout,
+            retry_config,
+            use_mock,
+            codec,
+            retry_budget,
+            stats,
+            request_compression,
+        )
+        self.max_workers = max_workers
+        self.wsgi_app = wsgi_app
+        self.cache = cache
+        self.flow_control = flow_control
+        self.single_flight: SingleFlight[JsonData] | None = (
+            SingleFlight() if coalesce_gets else None
+        )
+
+        self._session: requests.Session | None = None
+        self._executor: ThreadPoolExecutor | None = None
+        self._executor_lock = threading.Lock()
+
+        # Initialize session
+        self._setup_session()
+
+    def _setup_session(self) -> None:
+        """Set up requests session with retry strategy."""
+        self._session = requests.Session()
+
+        # Under flow control, 429s are retried by _dispatch so the limiter sees
+        # them, and Retry-After pauses the whole endpoint group instead of the
+        # one connection urllib3 would sleep on
+        status_forcelist = list(self.retry_config.status_forcelist)
+        respect_retry_after = self.retry_config.respect_retry_after_header
+        if self.flow_control is not None:
+            status_forcelist = [s for s in status_forcelist if s != 429]
+            respect_retry_after = False
+        retry_strategy = PolicyRetry(
+            total=self.retry_config.total,
+            connect=self.retry_config.connect,
+            read=self.retry_config.read,
+            redirect=self.retry_config.redirect,
+            backoff_factor=self.retry_config.backoff_factor,
+            backoff_max=self.retry_config.backoff_max,
+            status_forcelist=status_forcelist,
+            allowed_methods=list(self.retry_config.allowed_methods),
+            respect_retry_after_header=respect_retry_after,
+            raise_on_status=self.retry_config.raise_on_status,
+        )
+        retry_strategy.policy = self.retry_policy
+
+        adapter: PhaseTimingAdapter | WSGIAdapter
+        if self.wsgi_app is not None:
+            adapter = WSGIAdapter(self.wsgi_app, max_retries=retry_strategy)
+        else:
+            adapter = PhaseTimingAdapter(
+                max_retries=retry_strategy,
+                pool_connections=DEFAULT_POOL_SIZE,
+                pool_maxsize=DEFAULT_POOL_SIZE,
+            )
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+
+        self._session.hooks["response"].append(mark_headers_received)
+
+        # Set default headers
+        self._session.headers.update(
+            {
+                "Accept": DEFAULT_ACCEPT_HEADER,
+                "User-Agent": "BillingAPIClient/1.0",
+            }
+        )
+
+    @property
+    def session(self) -> requests.Session:
+        """Get the current session, creating if necessary."""
+        if self._session is None:
+            self._setup_session()
+        assert self._session is not None  # nosec B101
+        return self._session
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """Get the shared worker pool for map_requests, creating if necessary."""
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="billing-api",
+                )
+            return self._executor
+
+    def close(self) -> None:
+        """Close the session and release resources."""
+        with self._executor_lock:
+            if self._executor:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+        if self._session:
+            self._session.close()
+            self._session = None
+
+    def __enter__(self) -> Self:
+        """Context manager entry."""
+        return self
+
+    def __exit__(
+        self,
+        _exc_type: type[BaseException] | None,
+        _exc_val: BaseException | None,
+        _exc_tb: object,
+    ) -> None:
+        """Context manager exit - close session."""
+        self.close()
+
     def request(
         self,
         method: str | HTTPMethod,
@@ -361,6 +669,8 @@ class BillingAPIClient:
 
         Raises:
             APIRequestException: If request fails
+            CircuitOpenException: If flow control is failing fast for the
+                endpoint's group
         """
         # Validate method
         method = HTTPMethod(method.upper()) if isinstance(method, str) else method
@@ -373,6 +683,12 @@ class BillingAPIClient:
         if headers:
             request_headers.update(headers)
 
+        if json_data is not None and self.request_compression is not None:
+            data, request_headers = self.request_compression.json_request(
+                self.codec.dumps(json_data), request_headers
+            )
+            json_data = None
+
         # Log request details
         logger.debug(
             f"Making {method.value} request to {endpoint} "
@@ -381,15 +697,60 @@ class BillingAPIClient:
             f"data: {'yes' if data else 'no'})"
         )
 
+        # Collapse concurrent identical GETs into one in-flight request
+        if self.single_flight is not None and method is HTTPMethod.GET:
+            key = self._request_key(url, params, request_headers)
+            return self.single_flight.do(
+                key,
+                lambda: self._send(
+                    method,
+                    endpoint,
+                    url,
+                    request_headers,
+                    params,
+                    json_data,
+                    data,
+                    **kwargs,
+                ),
+            )
+
+        return self._send(
+            method, endpoint, url, request_headers, params, json_data, data, **kwargs
+        )
+
+    def _send(
+        self,
+        method: HTTPMethod,
+        endpoint: str,
+        url: str,
+        request_headers: dict[str, str | bytes],
+        params: Params | None,
+        json_data: JsonData | None,
+        data: RequestData | None,
+        **kwargs: Any,
+    ) -> JsonData:
+        """Send a prepared request through the response cache and session."""
+        # Serve fresh cached GETs locally; stale ones are revalidated by ETag
+        cache_key: Hashable | None = None
+        cache_ttl = 0.0
+        cache_generation = 0
+        sent_headers = request_headers
+        if self.cache is not None and method is HTTPMethod.GET:
+            cache_ttl = self.cache.ttl_for(endpoint)
+            if cache_ttl > 0:
+                cache_key = self._request_key(url, params, request_headers)
+                cache_generation = self.cache.generation
+                cached = self.cache.get(cache_key)
+                if cached is not None:
+                    logger.debug(f"Cache hit for {endpoint}")
+                    return cached
+                etag = self.cache.etag_for(cache_key)
+                if etag:
+                    sent_headers = {**request_headers, "If-None-Match": etag}
+
         # Prepare telemetry attributes
         parsed_url = urlparse(url)
-        telemetry_attrs = {
-            "http.method": method.value,
-            "http.url": url,
-            "http.host": parsed_url.netloc,
-            "http.path": parsed_url.path,
-            "http.scheme": parsed_url.scheme,
-        }
+        telemetry_attrs = self._telemetry_attributes(method, url)
 
         start_time = time.time()
 
@@ -397,18 +758,23 @@ class BillingAPIClient:
             f"http.{method.value.lower()}", telemetry_attrs
         ) as span:
             try:
-                response = self.session.request(
-                    method=method.value,
-                    url=url,
-                    headers=request_headers,
-                    params=params,
-                    json=json_data,
-                    data=data,
-                    timeout=self.timeout,
-                    **kwargs,
-                )
+                with capture_phases() as phases:
+                    response = self._dispatch(
+                        method=method.value,
+                        url=url,
+                        headers=sent_headers,
+                        params=params,
+                        json=json_data,
+                        data=data,
+                        timeout=self._request_timeout(endpoint),
+                        **kwargs,
+                    )
+                phases.finish()
 
                 elapsed_ms = (time.time() - start_time) * 1000
+                self._record_stats(
+                    method, endpoint, response, phases, elapsed_ms / 1000
+                )
 
                 # Update telemetry
                 if span:
@@ -422,14 +788,242 @@ class BillingAPIClient:
                     response_time=elapsed_ms / 1000,  # Convert back to seconds
                 )
 
-                # Validate and return response
-                return self._validate_response(response)
+                if cache_key is None:
+                    # Validate and return response
+                    return self._validate_response(response)
+
+                result = self._cache_response(
+                    response, cache_key, cache_ttl, cache_generation
+                )
 
             except requests.RequestException as e:
+                self.stats.record(
+                    method.value, endpoint, None, time.time() - start_time
+                )
                 logger.exception(f"Request failed: {e}")
                 msg = f"Request failed: {e}"
                 raise APIRequestException(msg)
 
+            finally:
+                if self.cache is not None and method is not HTTPMethod.GET:
+                    self.cache.invalidate()
+
+        if result is None:
+            # Cache was invalidated while revalidating; fetch the full body
+            return self._send(
+                method,
+                endpoint,
+                url,
+                request_headers,
+                params,
+                json_data,
+                data,
+                **kwargs,
+            )
+        return result
+
+    def _record_stats(
+        self,
+        method: HTTPMethod,
+        endpoint: str,
+        response: requests.Response,
+        phases: RequestPhases,
+        latency: float,
+    ) -> None:
+        """Record a completed request in the client's request stats.
+
+        Sizes and urllib3 retry history are read defensively: stats must
+        never fail a request, whatever the transport put on the response.
+        """
+        body = response.request.body
+        if isinstance(body, str):
+            body = body.encode()
+        history = getattr(getattr(response.raw, "retries", None), "history", ())
+        content = response.content
+        self.stats.record(
+            method.value,
+            endpoint,
+            response.status_code,
+            latency,
+            phases=phases,
+            bytes_sent=len(body) if isinstance(body, bytes) else 0,
+            bytes_received=len(content) if isinstance(content, bytes) else 0,
+            retries=(len(history) if isinstance(history, tuple) else 0)
+            + max(phases.responses - 1, 0),
+        )
+
+    def _dispatch(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """Send a request through the session, under flow control if enabled.
+
+        With flow control, each attempt holds a slot in its endpoint group and
+        429 responses are retried here rather than by urllib3, so the group's
+        limiter sees every rejection and every thread honours Retry-After.
+
+        Raises:
+            CircuitOpenException: If the endpoint group's circuit is open
+        """
+        self.retry_policy.record_request()
+        if self.flow_control is None:
+            return self.session.request(method=method, url=url, **kwargs)
+
+        attempt = 0
+        while True:
+            permit = self.flow_control.acquire(url)
+            response: requests.Response | None = None
+            try:
+                response = self.session.request(method=method, url=url, **kwargs)
+            finally:
+                self.flow_control.release(
+                    permit,
+                    status_code=response.status_code if response is not None else None,
+                    retry_after=(
+                        response.headers.get("Retry-After")
+                        if response is not None
+                        else None
+                    ),
+                )
+
+            if response.status_code != 429 or attempt >= self.retry_config.total:
+                return response
+
+            # A Retry-After pause is served by the limiter on the next acquire
+            attempt += 1
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            wait_time = (
+                self.retry_policy.backoff(attempt) if retry_after is None else 0.0
+            )
+            if not self.retry_policy.admit(retry_after or wait_time):
+                return response
+
+            logger.debug(f"Rate limited by {url}; retry {attempt}")
+            response.close()
+            time.sleep(wait_time)
+            kwargs["timeout"] = self._request_timeout(url)
+
+    def _cache_response(
+        self,
+        response: requests.Response,
+        cache_key: Hashable,
+        ttl: float,
+        generation: int,
+    ) -> JsonData | None:
+        """Resolve a cacheable GET response against the response cache.
+
+        Returns:
+            Response data, or None when a 304 arrived for an entry that has
+            been invalidated in the meantime
+        """
+        assert self.cache is not None  # nosec B101
+        if response.status_code == 304:
+            return self.cache.revalidate(cache_key, ttl)
+
+        result = self._validate_response(response)
+        self.cache.store(
+            cache_key,
+            result,
+            ttl,
+            etag=response.headers.get("ETag"),
+            generation=generation,
+        )
+        return result
+
+    @staticmethod
+    def _request_key(
+        url: str, params: Params | None, headers: Mapping[str, str | bytes]
+    ) -> Hashable:
+        """Build a cache/coalescing key from everything that shapes a GET."""
+        query = tuple(
+            sorted((k, repr(v)) for k, v in (params or {}).items() if v is not None)
+        )
+        return (url, query, tuple(sorted(headers.items())))
+
+    def map_requests(
+        self,
+        specs: Iterable[RequestSpec],
+        *,
+        max_concurrency: int | None = None,
+    ) -> list[JsonData | Exception]:
+        """Run many requests on the shared worker pool.
+
+        At most ``max_concurrency`` requests are in flight at once, so a large
+        batch never floods the pool or the server. The caller's ``deadline()``
+        applies to every request. Must not be called from one of the pool's
+        own worker threads.
+
+        Args:
+            specs: Requests to run
+            max_concurrency: Cap on in-flight requests (defaults to max_workers)
+
+        Returns:
+            One entry per spec in input order: the response data, or the
+            exception raised by that request
+        """
+        results: list[JsonData | Exception | None] = []
+        for index, outcome in self.iter_requests(
+            specs, max_concurrency=max_concurrency
+        ):
+            results.extend([None] * (index + 1 - len(results)))
+            results[index] = outcome
+        return cast("list[JsonData | Exception]", results)
+
+    def iter_requests(
+        self,
+        specs: Iterable[RequestSpec],
+        *,
+        max_concurrency: int | None = None,
+    ) -> Iterator[tuple[int, JsonData | Exception]]:
+        """Run requests from a lazy iterable, yielding each as it completes.
+
+        Specs are pulled only as slots free up, so at most ``max_concurrency``
+        are in flight or buffered at any time and a generator of any length
+        runs in constant memory. Otherwise behaves like map_requests.
+
+        Args:
+            specs: Requests to run, possibly a generator
+            max_concurrency: Cap on in-flight requests (defaults to max_workers)
+
+        Yields:
+            ``(index, outcome)`` in completion order, where ``index`` is the
+            spec's position and ``outcome`` the response data or the
+            exception raised by that request
+        """
+        limit = max(1, min(max_concurrency or self.max_workers, self.max_workers))
+        pending = enumerate(specs)
+        in_flight: dict[Future[JsonData], int] = {}
+        completed = 0
+
+        def submit_next() -> bool:
+            item = next(pending, None)
+            if item is None:
+                return False
+            index, spec = item
+            # Run in a copy of the caller's context so its deadline applies
+            call = partial(
+                self.request, spec.method, spec.endpoint, **spec.request_kwargs()
+            )
+            future = self.executor.submit(contextvars.copy_context().run, call)
+            in_flight[future] = index
+            return True
+
+        while len(in_flight) < limit and submit_next():
+            pass
+
+        while in_flight:
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                index = in_flight.pop(future)
+                exc = future.exception()
+                if exc is not None and not isinstance(exc, Exception):
+                    raise exc
+                submit_next()
+                completed += 1
+                yield index, exc if exc is not None else future.result()
+
+        if completed:
+            logger.debug(
+                f"Completed {completed} mapped requests (concurrency: {limit})"
+            )
+
     # Convenience methods for common HTTP verbs
     def get(self, endpoint: str, **kwargs: Any) -> JsonData:
         """Make GET request."""
@@ -451,6 +1045,51 @@ class BillingAPIClient:
         """Make PATCH request."""
         return self.request(HTTPMethod.PATCH, endpoint, **kwargs)
 
+    def stream_events(
+        self,
+        endpoint: str,
+        headers: Headers | None = None,
+        params: Params | None = None,
+    ) -> Iterator[JsonData]:
+        """Consume a server-sent event stream of JSON payloads.
+
+        Args:
+            endpoint: API endpoint path serving text/event-stream
+            headers: Optional request headers
+            params: Optional query parameters
+
+        Yields:
+            Parsed event data, validated like regular responses
+
+        Raises:
+            APIRequestException: If the stream cannot be opened or read
+        """
+        url = self._build_url(endpoint)
+        request_headers = {"Accept": "text/event-stream", **(headers or {})}
+
+        try:
+            with self.session.get(
+                url,
+                headers=request_headers,
+                params=params,
+                timeout=self._request_timeout(endpoint),
+                stream=True,
+            ) as response:
+                if response.status_code >= 400:
+                    self._validate_response(response)
+                lines = response.iter_lines(decode_unicode=True)
+                for _event, data in iter_sse_events(lines):
+                    try:
+                        payload = self.codec.loads(data)
+                    except ValueError as e:
+                        msg = f"Invalid JSON event: {e}"
+                        raise APIRequestException(msg) from e
+                    self._check_api_header(payload)
+                    yield cast("JsonData", payload)
+        except requests.RequestException as e:
+            msg = f"Event stream failed: {e}"
+            raise APIRequestException(msg) from e
+
     def wait_for_completion(
         self,
         check_endpoint: str,
@@ -458,18 +1097,27 @@ class BillingAPIClient:
         status_field: str = "status",
         success_value: str = "COMPLETED",
         timeout: int = 300,
-        check_interval: int = DEFAULT_CHECK_INTERVAL,
+        check_interval: float | None = None,
         progress_callback: Callable[[JsonData], None] | None = None,
+        polling: AdaptivePolling | None = None,
+        stream_endpoint: str | None = None,
     ) -> JsonData:
         """Wait for an async operation to complete.
 
+        If ``stream_endpoint`` is given, progress is first read from that
+        server-sent event stream, falling back to polling if the stream fails
+        or ends early. Polling uses a fixed ``check_interval`` when one is
+        given and an adaptive schedule otherwise.
+
         Args:
             check_endpoint: Endpoint to check status
             status_field: Field name containing status
             success_value: Value indicating completion
             timeout: Maximum seconds to wait
-            check_interval: Seconds between checks
+            check_interval: Fixed seconds between checks
             progress_callback: Optional callback for progress updates
+            polling: Adaptive polling policy (defaults to AdaptivePolling())
+            stream_endpoint: Optional endpoint pushing progress events
 
         Returns:
             Final response data
@@ -480,6 +1128,22 @@ class BillingAPIClient:
         start_time = time.time()
         last_response = None
 
+        if stream_endpoint:
+            try:
+                for event in self.stream_events(stream_endpoint):
+                    last_response = event
+                    if self._check_completion(event, status_field, success_value):
+                        logger.info("Operation completed successfully")
+                        return event
+                    if progress_callback:
+                        progress_callback(event)
+                    if time.time() - start_time >= timeout:
+                        break
+            except APIRequestException as e:
+                logger.warning(f"Progress stream failed, polling instead: {e}")
+
+        schedule = (polling or AdaptivePolling()).schedule()
+
         while time.time() - start_time < timeout:
             try:
                 response = self.get(check_endpoint)
@@ -499,7 +1163,11 @@ class BillingAPIClient:
 
             # Wait before next check
             remaining_time = timeout - (time.time() - start_time)
-            wait_time = min(check_interval, remaining_time)
+            if check_interval is None:
+                interval = schedule.next_delay(last_response)
+            else:
+                interval = check_interval
+            wait_time = min(interval, remaining_time)
             if wait_time > 0:
                 time.sleep(wait_time)
 
@@ -507,21 +1175,6 @@ class BillingAPIClient:
         msg = f"Operation timed out after {timeout}s"
         raise APIRequestException(msg, response_data=last_response)
 
-    def _check_completion(
-        self, response: JsonData, status_field: str, success_value: str
-    ) -> bool:
-        """Check if response indicates completion."""
-        # Handle nested status fields (e.g., "result.status")
-        current: Any = response
-        for field in status_field.split("."):
-            if isinstance(current, dict) and field in current:
-                current = current[field]
-            else:
-                return False
-
-        # At this point, current should be a string value to compare
-        return bool(current == success_value)
-
     def set_auth_token(self, token: str) -> None:
         """Set authorization token for all requests."""
         self.session.headers["Authorization"] = f"Bearer {token}"
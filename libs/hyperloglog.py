@@ -0,0 +1,110 @@
+"""HyperLogLog distinct-value estimation with bounded memory.
+
+A HyperLogLog sketch of precision p keeps 2**p one-byte registers, whatever
+the number of values added, and estimates the number of distinct values
+with a relative standard error of 1.04 / sqrt(2**p). Values are hashed with
+blake2b rather than the built-in hash, which is salted per process, so
+sketches built in different worker processes merge exactly: the merge of
+two sketches equals the sketch of the union of their values.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import math
+from collections.abc import Iterable
+
+from .constants import DEFAULT_HLL_PRECISION
+
+MIN_PRECISION = 4
+MAX_PRECISION = 18
+
+_HASH_BITS = 64
+_INVERSE_POWERS = [2.0**-rank for rank in range(_HASH_BITS + 1)]
+
+
+class HyperLogLog:
+    """Mergeable HyperLogLog sketch over values identified by their str().
+
+    Example:
+        >>> sketch = HyperLogLog(precision=12)
+        >>> sketch.update(resource_ids)
+        >>> sketch.count(), sketch.standard_error
+    """
+
+    def __init__(self, precision: int = DEFAULT_HLL_PRECISION) -> None:
+        """Initialize an empty sketch.
+
+        Args:
+            precision: Number of index bits; the sketch keeps 2**precision
+                registers
+
+        Raises:
+            ValueError: If precision is outside MIN_PRECISION..MAX_PRECISION
+        """
+        if not MIN_PRECISION <= precision <= MAX_PRECISION:
+            raise ValueError(
+                f"precision must be between {MIN_PRECISION} and {MAX_PRECISION}"
+            )
+        self.precision = precision
+        self._registers = bytearray(1 << precision)
+        self._value_bits = _HASH_BITS - precision
+        self._value_mask = (1 << self._value_bits) - 1
+
+    @property
+    def standard_error(self) -> float:
+        """Relative standard error of count()."""
+        return 1.04 / math.sqrt(len(self._registers))
+
+    def add(self, value: object) -> None:
+        """Add one value; non-strings such as numeric ids count by their str()."""
+        digest = hashlib.blake2b(str(value).encode(), digest_size=8).digest()
+        hashed = int.from_bytes(digest, "big")
+        index = hashed >> self._value_bits
+        rank = self._value_bits - (hashed & self._value_mask).bit_length() + 1
+        if rank > self._registers[index]:
+            self._registers[index] = rank
+
+    def update(self, values: Iterable[object]) -> HyperLogLog:
+        """Add every value of an iterable; returns self for chaining."""
+        for value in values:
+            self.add(value)
+        return self
+
+    def merge(self, other: HyperLogLog) -> HyperLogLog:
+        """Fold in another sketch; returns self for chaining.
+
+        Raises:
+            ValueError: If the sketches have different precision
+        """
+        if other.precision != self.precision:
+            raise ValueError("Cannot merge sketches of different precision")
+        self._registers = bytearray(map(max, self._registers, other._registers))
+        return self
+
+    def count(self) -> int:
+        """Estimated number of distinct values added."""
+        registers = len(self._registers)
+        estimate = (
+            _alpha(registers)
+            * registers
+            * registers
+            / sum(_INVERSE_POWERS[rank] for rank in self._registers)
+        )
+        if estimate <= 2.5 * registers:
+            # Linear counting is more accurate while many registers are empty
+            zeros = self._registers.count(0)
+            if zeros:
+                estimate = registers * math.log(registers / zeros)
+        return round(estimate)
+
+
+def _alpha(registers: int) -> float:
+    """Bias correction constant for a number of registers."""
+    if registers == 16:
+        return 0.673
+    if registers == 32:
+        return 0.697
+    if registers == 64:
+        return 0.709
+    return 0.7213 / (1 + 1.079 / registers)
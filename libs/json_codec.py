@@ -0,0 +1,178 @@
+"""Pluggable JSON codec with optional orjson/msgspec acceleration.
+
+The fastest installed backend is used by default (orjson, then msgspec, then
+the stdlib ``json`` module). Set ``BILLING_JSON_CODEC`` to force a backend.
+Every backend encodes ``Decimal`` as a string so domain amounts keep their
+exact value, matching what Flask's own JSON provider does.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import json
+import os
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from functools import cache
+from typing import Any
+from uuid import UUID
+
+from .exceptions import ConfigurationException
+
+# Optional imports - fast JSON backends are optional speedups
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import msgspec
+
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    MSGSPEC_AVAILABLE = False
+
+CODEC_ENV_VAR = "BILLING_JSON_CODEC"
+
+
+def encode_default(obj: Any) -> Any:
+    """Convert values the JSON backends cannot encode natively.
+
+    Args:
+        obj: Value that failed native encoding
+
+    Returns:
+        A JSON-encodable replacement
+
+    Raises:
+        TypeError: If the value has no JSON representation
+    """
+    if isinstance(obj, Decimal):
+        return str(obj)
+    if isinstance(obj, datetime | date):
+        return obj.isoformat()
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, UUID):
+        return str(obj)
+    if isinstance(obj, set | frozenset):
+        return list(obj)
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    msg = f"Object of type {type(obj).__name__} is not JSON serializable"
+    raise TypeError(msg)
+
+
+class JSONCodec:
+    """Stdlib ``json`` codec; the always-available fallback."""
+
+    name = "json"
+
+    def dumps(self, obj: Any) -> bytes:
+        """Encode an object as UTF-8 JSON."""
+        return json.dumps(
+            obj, default=encode_default, ensure_ascii=False, separators=(",", ":")
+        ).encode()
+
+    def loads(self, data: bytes | bytearray | str) -> Any:
+        """Decode JSON text.
+
+        Raises:
+            ValueError: If the input is not valid JSON
+        """
+        return json.loads(data)
+
+
+class OrjsonCodec(JSONCodec):
+    """orjson-backed codec."""
+
+    name = "orjson"
+
+    def dumps(self, obj: Any) -> bytes:
+        """Encode an object as UTF-8 JSON."""
+        encoded: bytes = orjson.dumps(
+            obj, default=encode_default, option=orjson.OPT_NON_STR_KEYS
+        )
+        return encoded
+
+    def loads(self, data: bytes | bytearray | str) -> Any:
+        """Decode JSON text.
+
+        Raises:
+            ValueError: If the input is not valid JSON
+        """
+        return orjson.loads(data)
+
+
+class MsgspecCodec(JSONCodec):
+    """msgspec-backed codec."""
+
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        """Create reusable encoder and decoder instances."""
+        self._encoder = msgspec.json.Encoder(
+            enc_hook=encode_default, decimal_format="string"
+        )
+        self._decoder = msgspec.json.Decoder()
+
+    def dumps(self, obj: Any) -> bytes:
+        """Encode an object as UTF-8 JSON."""
+        encoded: bytes = self._encoder.encode(obj)
+        return encoded
+
+    def loads(self, data: bytes | bytearray | str) -> Any:
+        """Decode JSON text.
+
+        Raises:
+            ValueError: If the input is not valid JSON
+        """
+        try:
+            return self._decoder.decode(data)
+        except msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+
+
+def available_codecs() -> list[str]:
+    """Get the names of the installed codecs, fastest first."""
+    names = []
+    if ORJSON_AVAILABLE:
+        names.append(OrjsonCodec.name)
+    if MSGSPEC_AVAILABLE:
+        names.append(MsgspecCodec.name)
+    names.append(JSONCodec.name)
+    return names
+
+
+def get_codec(name: str | None = None) -> JSONCodec:
+    """Get a codec by name, or the preferred one.
+
+    Args:
+        name: Codec name ("orjson", "msgspec" or "json"); defaults to the
+            ``BILLING_JSON_CODEC`` environment variable, then the fastest
+            installed codec
+
+    Returns:
+        Shared codec instance
+
+    Raises:
+        ConfigurationException: If the codec is unknown or not installed
+    """
+    name = name or os.environ.get(CODEC_ENV_VAR) or available_codecs()[0]
+    if name not in available_codecs():
+        msg = f"JSON codec {name!r} is not available (installed: {available_codecs()})"
+        raise ConfigurationException(msg, config_key=CODEC_ENV_VAR)
+    return _codec_instance(name)
+
+
+@cache
+def _codec_instance(name: str) -> JSONCodec:
+    """Create the shared instance of an installed codec."""
+    if name == OrjsonCodec.name:
+        return OrjsonCodec()
+    if name == MsgspecCodec.name:
+        return MsgspecCodec()
+    return JSONCodec()
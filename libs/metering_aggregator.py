@@ -1,12 +1,28 @@
 """Metering Aggregator for aggregating metering data by various dimensions."""
 
+import heapq
 from collections import defaultdict
-from dataclasses import dataclass
+from dataclasses import dataclass, field, replace
 from datetime import datetime
 from decimal import ROUND_HALF_UP, Decimal
-from typing import Any, Dict, List, Optional, Tuple
-
-from .constants import CounterType
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .constants import (
+    DEFAULT_COLUMNAR_MIN_RECORDS,
+    DEFAULT_HLL_PRECISION,
+    CounterType,
+)
+from .hyperloglog import HyperLogLog
+from .metering_outliers import OutlierDetector
+from .timestamp_parser import parse_timestamp
+
+# Record field and key prefix for each aggregation dimension
+DIMENSION_FIELDS = {
+    "app_key": ("appKey", "app"),
+    "counter_name": ("counterName", "counter"),
+    "counter_type": ("counterType", "type"),
+    "resource_id": ("resourceId", "resource"),
+}
 
 
 @dataclass
@@ -49,6 +65,334 @@ class AggregatedMetrics:
     dimensions: AggregationDimension
 
 
+@dataclass(slots=True)
+class RunningMetrics:
+    """Constant-size running state of one aggregation group.
+
+    Variance uses Welford's online update over float volumes; totals, minima
+    and maxima stay exact Decimals.
+    """
+
+    dimension_values: Dict[str, Any]
+    min_volume: Decimal
+    max_volume: Decimal
+    start_time: datetime
+    end_time: datetime
+    record_count: int = 0
+    total_volume: Decimal = Decimal(0)
+    mean: float = 0.0
+    m2: float = 0.0
+
+    def add(self, volume: Decimal, timestamp: datetime) -> None:
+        """Fold one record into the running state."""
+        self.record_count += 1
+        self.total_volume += volume
+        if volume < self.min_volume:
+            self.min_volume = volume
+        if volume > self.max_volume:
+            self.max_volume = volume
+        if timestamp < self.start_time:
+            self.start_time = timestamp
+        if timestamp > self.end_time:
+            self.end_time = timestamp
+
+        value = float(volume)
+        delta = value - self.mean
+        self.mean += delta / self.record_count
+        self.m2 += delta * (value - self.mean)
+
+    def merge(self, other: "RunningMetrics") -> None:
+        """Fold in the state of the same group over later records.
+
+        Sums, extremes and time ranges combine exactly; mean and variance use
+        Chan et al.'s pairwise update.
+        """
+        if not other.record_count:
+            return
+        count = self.record_count + other.record_count
+        delta = other.mean - self.mean
+        self.mean += delta * other.record_count / count
+        self.m2 += (
+            other.m2 + delta * delta * self.record_count * other.record_count / count
+        )
+        self.record_count = count
+        self.total_volume += other.total_volume
+        if other.min_volume < self.min_volume:
+            self.min_volume = other.min_volume
+        if other.max_volume > self.max_volume:
+            self.max_volume = other.max_volume
+        if other.start_time < self.start_time:
+            self.start_time = other.start_time
+        if other.end_time > self.end_time:
+            self.end_time = other.end_time
+
+    @property
+    def variance(self) -> float:
+        """Population variance of the volumes."""
+        return self.m2 / self.record_count if self.record_count else 0.0
+
+    @property
+    def std_dev(self) -> float:
+        """Population standard deviation of the volumes."""
+        return float(self.variance**0.5)
+
+    def to_metrics(self) -> AggregatedMetrics:
+        """Convert to the AggregatedMetrics the batch path returns."""
+        return AggregatedMetrics(
+            total_volume=self.total_volume,
+            record_count=self.record_count,
+            avg_volume=self.total_volume / self.record_count,
+            max_volume=self.max_volume,
+            min_volume=self.min_volume,
+            start_time=self.start_time,
+            end_time=self.end_time,
+            dimensions=AggregationDimension(**self.dimension_values),
+        )
+
+
+@dataclass(slots=True)
+class CounterTotals:
+    """Running totals of one counter in a usage summary."""
+
+    delta: Decimal = Decimal("0")
+    gauge: Optional[Decimal] = None
+    gauge_time: Optional[datetime] = None
+    resources: Optional[HyperLogLog] = None
+
+    def set_gauge(self, volume: Decimal, timestamp: datetime) -> None:
+        """Keep the latest reading; on equal timestamps the later one wins."""
+        if self.gauge_time is None or timestamp >= self.gauge_time:
+            self.gauge = volume
+            self.gauge_time = timestamp
+
+
+@dataclass
+class UsagePartial:
+    """Mergeable partial state of a usage summary.
+
+    Partials built from separate slices of the records merge exactly:
+    DELTA totals add, the latest GAUGE reading wins by timestamp, resource
+    sets union and time ranges widen. Merge partials in record order so ties
+    resolve as a single pass would.
+
+    With ``resource_precision`` set, distinct resources are also counted
+    overall and per counter with HyperLogLog sketches of that precision,
+    and ``keep_resources`` can be turned off so the exact resource set,
+    which grows with every resource seen, is not kept at all.
+    """
+
+    record_count: int = 0
+    counters: Dict[str, CounterTotals] = field(default_factory=dict)
+    resources: set[str] = field(default_factory=set)
+    start_time: Optional[datetime] = None
+    end_time: Optional[datetime] = None
+    resource_precision: Optional[int] = None
+    keep_resources: bool = True
+    resource_sketch: Optional[HyperLogLog] = None
+
+    def __post_init__(self) -> None:
+        """Create the overall resource sketch in approximate mode."""
+        if self.resource_precision is not None and self.resource_sketch is None:
+            self.resource_sketch = HyperLogLog(self.resource_precision)
+
+    def add(self, record: Dict[str, Any]) -> None:
+        """Fold one metering record into the summary."""
+        counter_name = record.get("counterName", "unknown")
+        counter_type = record.get("counterType")
+        volume = Decimal(str(record.get("counterVolume", 0)))
+        resource_id = record.get("resourceId")
+        timestamp = MeteringAggregator._parse_timestamp(record.get("timestamp", ""))
+
+        self.record_count += 1
+        if resource_id:
+            if self.keep_resources:
+                self.resources.add(resource_id)
+            if self.resource_sketch is not None:
+                self.resource_sketch.add(resource_id)
+        self._widen(timestamp, timestamp)
+
+        if counter_type == CounterType.DELTA.value:
+            totals = self.counters.setdefault(counter_name, CounterTotals())
+            totals.delta += volume
+        elif counter_type == CounterType.GAUGE.value:
+            totals = self.counters.setdefault(counter_name, CounterTotals())
+            totals.set_gauge(volume, timestamp)
+        else:
+            return
+
+        if resource_id and self.resource_precision is not None:
+            if totals.resources is None:
+                totals.resources = HyperLogLog(self.resource_precision)
+            totals.resources.add(resource_id)
+
+    def update(self, records: Iterable[Dict[str, Any]]) -> "UsagePartial":
+        """Fold every record of an iterable; returns self for chaining."""
+        for record in records:
+            self.add(record)
+        return self
+
+    def merge(self, other: "UsagePartial") -> "UsagePartial":
+        """Fold in a partial over later records; returns self for chaining.
+
+        Raises:
+            ValueError: If the partials track resources differently
+        """
+        if other.resource_precision != self.resource_precision:
+            raise ValueError("Cannot merge partials with different resource precision")
+        self.record_count += other.record_count
+        self.resources |= other.resources
+        if self.resource_sketch is not None and other.resource_sketch is not None:
+            self.resource_sketch.merge(other.resource_sketch)
+        if other.start_time is not None and other.end_time is not None:
+            self._widen(other.start_time, other.end_time)
+        for name, theirs in other.counters.items():
+            mine = self.counters.setdefault(name, CounterTotals())
+            mine.delta += theirs.delta
+            if theirs.gauge is not None and theirs.gauge_time is not None:
+                mine.set_gauge(theirs.gauge, theirs.gauge_time)
+            if theirs.resources is not None:
+                if mine.resources is None:
+                    mine.resources = HyperLogLog(theirs.resources.precision)
+                mine.resources.merge(theirs.resources)
+        return self
+
+    def to_summary(self) -> Dict[str, Any]:
+        """Render the summary in create_usage_summary's format."""
+        counters: Dict[str, Dict[str, Any]] = {}
+        for name, totals in self.counters.items():
+            counters[name] = {
+                "delta_total": float(
+                    totals.delta.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+                ),
+                "latest_gauge": float(totals.gauge) if totals.gauge else None,
+            }
+            if self.resource_precision is not None:
+                counters[name]["distinct_resources"] = self._distinct(totals.resources)
+
+        summary: Dict[str, Any] = {
+            "total_records": self.record_count,
+            "counters": counters,
+        }
+        if self.keep_resources:
+            summary["resources"] = list(self.resources)
+        if self.resource_precision is not None:
+            summary["distinct_resources"] = self._distinct(self.resource_sketch)
+        summary["time_range"] = (
+            {"start": self.start_time.isoformat(), "end": self.end_time.isoformat()}
+            if self.start_time is not None and self.end_time is not None
+            else None
+        )
+        return summary
+
+    def _distinct(self, sketch: Optional[HyperLogLog]) -> Dict[str, Any]:
+        """Distinct-resource estimate of a sketch with its standard error."""
+        if sketch is None:
+            sketch = HyperLogLog(self.resource_precision or DEFAULT_HLL_PRECISION)
+        return {"estimate": sketch.count(), "standard_error": sketch.standard_error}
+
+    def _widen(self, start: datetime, end: datetime) -> None:
+        """Extend the time range to cover start..end."""
+        if self.start_time is None or start < self.start_time:
+            self.start_time = start
+        if self.end_time is None or end > self.end_time:
+            self.end_time = end
+
+
+@dataclass(slots=True)
+class LatestReading:
+    """Newest reading seen for one key, with its arrival order for ties."""
+
+    timestamp: datetime
+    sequence: int
+    volume: Decimal
+
+
+class LatestValueIndex:
+    """Newest reading per (counter, resource), built in a single pass.
+
+    A reading replaces the stored one if its timestamp is later or equal, so
+    among readings with the same timestamp the one that arrived last wins,
+    exactly as after a stable sort by timestamp.
+    """
+
+    def __init__(self, counter_type: Optional[str] = CounterType.GAUGE.value):
+        """Initialize the index.
+
+        Args:
+            counter_type: Only index records of this counter type; None
+                indexes every record
+        """
+        self.counter_type = counter_type
+        self._sequence = 0
+        self._latest: Dict[str, Dict[Any, LatestReading]] = {}
+
+    def add(self, record: Dict[str, Any]) -> None:
+        """Fold one metering record into the index."""
+        if self.counter_type and record.get("counterType") != self.counter_type:
+            return
+        counter_name = record.get("counterName")
+        if not counter_name:
+            return
+
+        self._sequence += 1
+        timestamp = MeteringAggregator._parse_timestamp(record.get("timestamp", ""))
+        by_resource = self._latest.setdefault(counter_name, {})
+        resource_id = record.get("resourceId")
+        current = by_resource.get(resource_id)
+        if current is None or timestamp >= current.timestamp:
+            volume = Decimal(str(record.get("counterVolume", 0)))
+            by_resource[resource_id] = LatestReading(timestamp, self._sequence, volume)
+
+    def update(self, records: Iterable[Dict[str, Any]]) -> "LatestValueIndex":
+        """Fold every record of an iterable; returns self for chaining."""
+        for record in records:
+            self.add(record)
+        return self
+
+    def latest(
+        self, counter_name: str, resource_id: Optional[str] = None
+    ) -> Optional[Decimal]:
+        """Newest reading of a counter for one resource.
+
+        Args:
+            counter_name: Counter to look up
+            resource_id: Resource to look up; None matches records without one
+
+        Returns:
+            The newest volume, or None if there is no reading
+        """
+        reading = self._latest.get(counter_name, {}).get(resource_id)
+        return reading.volume if reading else None
+
+    def latest_by_counter(self) -> Dict[str, Decimal]:
+        """Newest reading of each counter across all of its resources."""
+        return {
+            counter_name: max(
+                by_resource.values(), key=lambda r: (r.timestamp, r.sequence)
+            ).volume
+            for counter_name, by_resource in self._latest.items()
+        }
+
+    def top_k(self, counter_name: str, k: int) -> List[Tuple[Any, Decimal]]:
+        """Resources with the largest newest readings of a counter.
+
+        Args:
+            counter_name: Counter to rank resources by
+            k: Number of resources to return
+
+        Returns:
+            Up to k (resource_id, volume) pairs, largest first; equal volumes
+            are ordered by resource id
+        """
+        readings = self._latest.get(counter_name, {})
+        return _top_k(((r, reading.volume) for r, reading in readings.items()), k)
+
+
+def _top_k(items: Iterable[Tuple[Any, Decimal]], k: int) -> List[Tuple[Any, Decimal]]:
+    """Largest k (key, volume) pairs via a bounded heap, ties by key."""
+    return heapq.nsmallest(k, items, key=lambda item: (-item[1], str(item[0])))
+
+
 class MeteringAggregator:
     """Handles metering data aggregation.
 
@@ -56,6 +400,9 @@ class MeteringAggregator:
     making it easier to test independently from API interactions.
     """
 
+    # Aggregation engines; "auto" picks numpy for large inputs when installed
+    ENGINES = ("auto", "decimal", "numpy")
+
     # Time bucket formats
     TIME_FORMATS = {
         "hour": "%Y-%m-%d %H:00",
@@ -80,16 +427,9 @@ class MeteringAggregator:
         dim_parts = []
         dim_values = {}
 
-        dimension_mapping = {
-            "app_key": ("appKey", "app"),
-            "counter_name": ("counterName", "counter"),
-            "counter_type": ("counterType", "type"),
-            "resource_id": ("resourceId", "resource"),
-        }
-
         for dim in dimensions:
-            if dim in dimension_mapping:
-                record_key, prefix = dimension_mapping[dim]
+            if dim in DIMENSION_FIELDS:
+                record_key, prefix = DIMENSION_FIELDS[dim]
                 if record_key in record:
                     value = record[record_key]
                     dim_parts.append(f"{prefix}:{value}")
@@ -97,61 +437,48 @@ class MeteringAggregator:
 
         return "|".join(dim_parts), dim_values
 
-    @classmethod
-    def _calculate_final_metrics(cls, data: Dict[str, Any]) -> AggregatedMetrics:
-        """Calculate final aggregated metrics from collected data."""
-        volumes = data["volumes"]
-        timestamps = data["timestamps"]
-
-        # Default timestamp if none exists
-        default_time = datetime.now()
-
-        return AggregatedMetrics(
-            total_volume=sum(volumes),
-            record_count=len(volumes),
-            avg_volume=sum(volumes) / len(volumes) if volumes else Decimal("0"),
-            max_volume=max(volumes) if volumes else Decimal("0"),
-            min_volume=min(volumes) if volumes else Decimal("0"),
-            start_time=min(timestamps) if timestamps else default_time,
-            end_time=max(timestamps) if timestamps else default_time,
-            dimensions=AggregationDimension(**data["dimension_values"]),
-        )
-
     @classmethod
     def aggregate_by_dimensions(
-        cls, metering_data: List[Dict[str, Any]], dimensions: List[str]
+        cls,
+        metering_data: List[Dict[str, Any]],
+        dimensions: List[str],
+        engine: str = "auto",
     ) -> Dict[str, AggregatedMetrics]:
         """Aggregate metering data by specified dimensions.
 
         Args:
             metering_data: List of metering records
             dimensions: List of dimensions to group by (app_key, counter_name, etc.)
+            engine: "decimal" for the streaming Decimal path, "numpy" for the
+                columnar engine, or "auto" to use numpy for large inputs when it
+                is installed. Both engines give equal results.
 
         Returns:
             Dictionary mapping dimension keys to aggregated metrics
-        """
-        aggregated: defaultdict[str, Dict[str, Any]] = defaultdict(
-            lambda: {"volumes": [], "timestamps": [], "dimension_values": {}}
-        )
-
-        for record in metering_data:
-            key, dim_values = cls._build_dimension_key(record, dimensions)
-
-            # Add data to aggregation
-            volume = Decimal(str(record.get("counterVolume", 0)))
-            timestamp = cls._parse_timestamp(record.get("timestamp", ""))
-
-            aggregated[key]["volumes"].append(volume)
-            aggregated[key]["timestamps"].append(timestamp)
-            aggregated[key]["dimension_values"] = dim_values
 
-        # Calculate final metrics
-        results = {}
-        for key, data in aggregated.items():
-            if data["volumes"]:
-                results[key] = cls._calculate_final_metrics(data)
+        Raises:
+            ValueError: If the engine is unknown, or "numpy" is requested for
+                records it cannot represent exactly
+        """
+        if engine not in cls.ENGINES:
+            raise ValueError(f"Invalid engine: {engine}")
+        if engine != "decimal":
+            # Imported here: the columnar module builds on this one
+            from .metering_columnar import NUMPY_AVAILABLE, MeteringColumns
+
+            columnar = engine == "numpy" or (
+                NUMPY_AVAILABLE and len(metering_data) >= DEFAULT_COLUMNAR_MIN_RECORDS
+            )
+            if columnar:
+                try:
+                    columns = MeteringColumns.from_records(metering_data)
+                except ValueError:
+                    if engine == "numpy":
+                        raise
+                else:
+                    return columns.aggregate(dimensions)
 
-        return results
+        return StreamingAggregator(dimensions).update(metering_data).results()
 
     @classmethod
     def aggregate_by_time_bucket(
@@ -208,70 +535,83 @@ class MeteringAggregator:
 
     @classmethod
     def get_latest_gauge_values(
-        cls, metering_data: List[Dict[str, Any]]
+        cls, metering_data: Iterable[Dict[str, Any]]
     ) -> Dict[str, Decimal]:
         """Get latest GAUGE values for each counter.
 
+        Runs in a single pass over the records (see LatestValueIndex); among
+        readings with the same timestamp the later record wins.
+
         Args:
             metering_data: List of metering records
 
         Returns:
             Dictionary mapping counter names to latest gauge values
         """
-        gauges = {}
+        index = LatestValueIndex().update(metering_data)
+        return {
+            counter_name: volume.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+            for counter_name, volume in index.latest_by_counter().items()
+        }
 
-        # Sort by timestamp to ensure we get the latest
-        sorted_data = sorted(
-            metering_data, key=lambda x: cls._parse_timestamp(x.get("timestamp", ""))
-        )
+    @classmethod
+    def top_resources_by_volume(
+        cls,
+        metering_data: Iterable[Dict[str, Any]],
+        k: int,
+        counter_name: Optional[str] = None,
+    ) -> Dict[str, List[Tuple[Any, Decimal]]]:
+        """Find the resources with the most DELTA usage of each counter.
 
-        for record in sorted_data:
-            if record.get("counterType") != CounterType.GAUGE.value:
-                continue
+        Volumes are summed per (counter, resource) in one pass and the top k
+        of each counter are taken with a bounded heap, so no full sort is
+        needed.
 
-            counter_name = record.get("counterName")
-            if counter_name:
-                volume = Decimal(str(record.get("counterVolume", 0)))
-                gauges[counter_name] = volume.quantize(
-                    Decimal("0.01"), rounding=ROUND_HALF_UP
-                )
+        Args:
+            metering_data: Metering records
+            k: Number of resources per counter
+            counter_name: Optional counter name to filter by
 
-        return gauges
+        Returns:
+            Dictionary mapping counter names to up to k (resource_id, total)
+            pairs, largest first; equal totals are ordered by resource id
+        """
+        totals: Dict[str, Dict[Any, Decimal]] = {}
+        for record in metering_data:
+            if record.get("counterType") != CounterType.DELTA.value:
+                continue
+            name = record.get("counterName")
+            if counter_name and name != counter_name:
+                continue
+            volume = Decimal(str(record.get("counterVolume", 0)))
+            by_resource = totals.setdefault(name, {})
+            resource_id = record.get("resourceId")
+            by_resource[resource_id] = by_resource.get(resource_id, 0) + volume
+
+        return {
+            name: _top_k(by_resource.items(), k) for name, by_resource in totals.items()
+        }
 
     @classmethod
     def detect_outliers(
-        cls, metering_data: List[Dict[str, Any]], std_dev_threshold: float = 2.0
+        cls, metering_data: Iterable[Dict[str, Any]], std_dev_threshold: float = 2.0
     ) -> List[Dict[str, Any]]:
         """Detect outlier records based on volume.
 
+        Each counter is judged against its own mean and standard deviation,
+        so a counter with large volumes does not flag every record of a
+        smaller one. For streaming or robust (median/MAD) screening use
+        OutlierDetector directly.
+
         Args:
-            metering_data: List of metering records
+            metering_data: Metering records
             std_dev_threshold: Number of standard deviations for outlier detection
 
         Returns:
-            List of outlier records
+            List of outlier records, in input order
         """
-        if len(metering_data) < 3:
-            return []  # Need at least 3 records for meaningful outlier detection
-
-        volumes = [float(record.get("counterVolume", 0)) for record in metering_data]
-
-        # Calculate mean and standard deviation
-        mean = sum(volumes) / len(volumes)
-        variance = sum((x - mean) ** 2 for x in volumes) / len(volumes)
-        std_dev = variance**0.5
-
-        if std_dev == 0:
-            return []  # All values are the same
-
-        # Find outliers
-        outliers = []
-        for i, volume in enumerate(volumes):
-            z_score = abs((volume - mean) / std_dev)
-            if z_score > std_dev_threshold:
-                outliers.append(metering_data[i])
-
-        return outliers
+        records = list(metering_data)
+        return OutlierDetector(threshold=std_dev_threshold).detect(records)
 
     @classmethod
     def calculate_growth_rate(
@@ -310,112 +650,120 @@ class MeteringAggregator:
         if not timestamp_str:
             return datetime.now()
 
-        # Try different formats
-        formats = [
-            "%Y-%m-%dT%H:%M:%S.%f%z",
-            "%Y-%m-%dT%H:%M:%S%z",
-            "%Y-%m-%dT%H:%M:%S",
-            "%Y-%m-%d %H:%M:%S",
-        ]
-
-        for fmt in formats:
-            try:
-                return datetime.strptime(timestamp_str.replace("+09:00", "+0900"), fmt)
-            except ValueError:
-                continue
+        parsed = parse_timestamp(timestamp_str)
 
         # If all formats fail, return current time
-        return datetime.now()
+        return parsed if parsed is not None else datetime.now()
 
     @classmethod
-    def _aggregate_counter_totals(
-        cls, metering_data: List[Dict[str, Any]]
-    ) -> tuple[defaultdict, set, list]:
-        """Aggregate counter totals from metering data.
+    def create_usage_summary(
+        cls,
+        metering_data: Iterable[Dict[str, Any]],
+        approximate: bool = False,
+        precision: int = DEFAULT_HLL_PRECISION,
+        include_resources: Optional[bool] = None,
+    ) -> Dict[str, Any]:
+        """Create a comprehensive usage summary.
+
+        The latest GAUGE reading of each counter is chosen by timestamp, so
+        summaries of separately aggregated slices merge exactly (see
+        UsagePartial).
+
+        In approximate mode distinct resources are counted overall and per
+        counter with HyperLogLog, reported as ``distinct_resources``:
+        ``{"estimate": int, "standard_error": float}``, the error being
+        relative (1.04 / sqrt(2**precision)). The exact ``resources`` list is
+        then left out unless include_resources is set.
+
+        Args:
+            metering_data: Metering records; any iterable is consumed in one pass
+            approximate: Count distinct resources with HyperLogLog
+            precision: HyperLogLog precision (4-18) in approximate mode
+            include_resources: Return the exact resource list; defaults to
+                True unless approximate
 
         Returns:
-            Tuple of (counter_totals, resources, timestamps)
+            Dictionary containing usage summary
         """
-        counter_totals: defaultdict[str, Dict[str, Decimal | None]] = defaultdict(
-            lambda: {"delta": Decimal("0"), "gauge": None}
+        if include_resources is None:
+            include_resources = not approximate
+        usage = UsagePartial(
+            resource_precision=precision if approximate else None,
+            keep_resources=include_resources,
         )
-        resources = set()
-        timestamps = []
+        return usage.update(metering_data).to_summary()
 
-        for record in metering_data:
-            counter_name = record.get("counterName", "unknown")
-            counter_type = record.get("counterType")
-            volume = Decimal(str(record.get("counterVolume", 0)))
-            resource_id = record.get("resourceId")
-            timestamp = cls._parse_timestamp(record.get("timestamp", ""))
 
-            if resource_id:
-                resources.add(resource_id)
-            timestamps.append(timestamp)
+class StreamingAggregator:
+    """Single-pass aggregation by dimensions in constant memory per group.
 
-            if counter_type == CounterType.DELTA.value:
-                current_delta = counter_totals[counter_name]["delta"]
-                if current_delta is not None:
-                    counter_totals[counter_name]["delta"] = current_delta + volume
-            elif counter_type == CounterType.GAUGE.value:
-                counter_totals[counter_name]["gauge"] = volume
+    Records can come from any iterator, such as a generator over a large
+    JSON-lines dump; only one RunningMetrics is kept per group, so memory
+    grows with the number of groups rather than records.
 
-        return counter_totals, resources, timestamps
-
-    @classmethod
-    def _format_counter_results(cls, counter_totals: defaultdict) -> Dict[str, Any]:
-        """Format counter totals into result dictionary."""
-        counters = {}
-        for name, values in counter_totals.items():
-            delta_value = values["delta"]
-            counters[name] = {
-                "delta_total": float(
-                    delta_value.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
-                    if delta_value is not None
-                    else Decimal("0")
-                ),
-                "latest_gauge": float(values["gauge"]) if values["gauge"] else None,
-            }
-        return counters
+    Example:
+        >>> aggregator = StreamingAggregator(["resource_id"])
+        >>> aggregator.update(read_records(path))
+        >>> results = aggregator.results()
+    """
 
-    @classmethod
-    def create_usage_summary(
-        cls, metering_data: List[Dict[str, Any]]
-    ) -> Dict[str, Any]:
-        """Create a comprehensive usage summary.
+    def __init__(self, dimensions: List[str]) -> None:
+        """Initialize the aggregator.
 
         Args:
-            metering_data: List of metering records
-
-        Returns:
-            Dictionary containing usage summary
+            dimensions: Dimensions to group by (app_key, counter_name, etc.)
         """
-        if not metering_data:
-            return {
-                "total_records": 0,
-                "counters": {},
-                "resources": [],
-                "time_range": None,
-            }
-
-        # Aggregate data
-        counter_totals, resources, timestamps = cls._aggregate_counter_totals(
-            metering_data
+        self.dimensions = dimensions
+        self.record_count = 0
+        self._groups: Dict[str, RunningMetrics] = {}
+
+    def __len__(self) -> int:
+        """Number of groups seen so far."""
+        return len(self._groups)
+
+    @property
+    def groups(self) -> Dict[str, RunningMetrics]:
+        """Running state per dimension key, in order of first appearance."""
+        return self._groups
+
+    def add(self, record: Dict[str, Any]) -> None:
+        """Fold one metering record into its group."""
+        key, dim_values = MeteringAggregator._build_dimension_key(
+            record, self.dimensions
         )
-
-        # Format results
-        counters = cls._format_counter_results(counter_totals)
-
-        return {
-            "total_records": len(metering_data),
-            "counters": counters,
-            "resources": list(resources),
-            "time_range": (
-                {
-                    "start": min(timestamps).isoformat(),
-                    "end": max(timestamps).isoformat(),
-                }
-                if timestamps
-                else None
-            ),
-        }
+        volume = Decimal(str(record.get("counterVolume", 0)))
+        timestamp = MeteringAggregator._parse_timestamp(record.get("timestamp", ""))
+
+        group = self._groups.get(key)
+        if group is None:
+            group = RunningMetrics(dim_values, volume, volume, timestamp, timestamp)
+            self._groups[key] = group
+        group.add(volume, timestamp)
+        self.record_count += 1
+
+    def update(self, records: Iterable[Dict[str, Any]]) -> "StreamingAggregator":
+        """Fold every record of an iterable; returns self for chaining."""
+        for record in records:
+            self.add(record)
+        return self
+
+    def merge(self, other: "StreamingAggregator") -> "StreamingAggregator":
+        """Fold in an aggregator over later records; returns self.
+
+        Raises:
+            ValueError: If the aggregators group by different dimensions
+        """
+        if other.dimensions != self.dimensions:
+            raise ValueError("Cannot merge aggregators over different dimensions")
+        for key, theirs in other._groups.items():
+            mine = self._groups.get(key)
+            if mine is None:
+                self._groups[key] = replace(theirs)
+            else:
+                mine.merge(theirs)
+        self.record_count += other.record_count
+        return self
+
+    def results(self) -> Dict[str, AggregatedMetrics]:
+        """Aggregated metrics per dimension key so far."""
+        return {key: group.to_metrics() for key, group in self._groups.items()}
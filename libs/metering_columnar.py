@@ -0,0 +1,338 @@
+"""Columnar NumPy engine for metering aggregation.
+
+MeteringAggregator's Decimal path builds a string key, a Decimal and a parsed
+datetime for every record. MeteringColumns ingests the records once into typed
+arrays instead: dimension fields become category codes, volumes become exact
+scaled int64 integers and timestamps int64 epoch microseconds. Each distinct
+volume string and timestamp is converted only once, and the group-by itself
+runs in NumPy.
+
+Volumes are scaled by the largest number of fractional digits seen, so sums
+are exact and results equal the Decimal path's. Inputs that cannot be
+represented exactly (non-finite volumes, sums that would overflow int64,
+naive and aware timestamps mixed) raise ValueError from ``from_records``.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Hashable, Iterable, Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+from typing import TYPE_CHECKING, Any
+
+from .metering_aggregator import (
+    DIMENSION_FIELDS,
+    AggregatedMetrics,
+    AggregationDimension,
+    MeteringAggregator,
+)
+from .timestamp_parser import epoch_microseconds
+
+# Optional imports - numpy is only needed for the columnar engine
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+if TYPE_CHECKING:
+    import numpy.typing as npt
+
+    IntArray = npt.NDArray[np.int64]
+
+_INT64_MAX = 2**63 - 1
+
+
+class _Missing:
+    """Category value for a field absent from the record."""
+
+    def __repr__(self) -> str:
+        return "<missing>"
+
+
+MISSING = _Missing()
+
+
+@dataclass(frozen=True)
+class Category:
+    """A factorized column: per-record codes into a list of distinct values.
+
+    Attributes:
+        codes: Index into ``values`` for every record
+        values: Distinct values, in first-seen order unless ranked
+    """
+
+    codes: IntArray
+    values: list[Any]
+
+    @classmethod
+    def factorize(cls, column: Iterable[Hashable], size: int) -> Category:
+        """Assign each distinct value a code in first-seen order."""
+        table: dict[Hashable, int] = {}
+        codes = np.fromiter(
+            (table.setdefault(value, len(table)) for value in column),
+            dtype=np.int64,
+            count=size,
+        )
+        return cls(codes, list(table))
+
+    def ranked(self, sort_keys: Sequence[Any]) -> tuple[Category, IntArray]:
+        """Renumber codes so their order follows ``sort_keys``.
+
+        Args:
+            sort_keys: Sort key for each entry of ``values``
+
+        Returns:
+            The renumbered category and the permutation applied to ``values``
+        """
+        order = sorted(range(len(self.values)), key=sort_keys.__getitem__)
+        rank = np.empty(len(order), dtype=np.int64)
+        rank[order] = np.arange(len(order), dtype=np.int64)
+        return (
+            Category(rank[self.codes], [self.values[i] for i in order]),
+            np.asarray(order, dtype=np.int64),
+        )
+
+
+@dataclass(frozen=True)
+class MeteringColumns:
+    """Metering records stored as typed columns.
+
+    Volume and timestamp codes are ranked: a smaller code means a smaller
+    value, so per-group minima and maxima reduce over codes and map straight
+    back to the original Decimal and datetime objects.
+
+    Attributes:
+        size: Number of records
+        dimensions: Category column for each record field in DIMENSION_FIELDS
+        volumes: Ranked volume codes; values are Decimals
+        volume_scale: Power of ten the scaled volumes are multiplied by
+        scaled_volumes: Exact volume times ``10**volume_scale`` per value
+        volume_exponents: Decimal exponent of each volume value
+        timestamps: Ranked timestamp codes; values are datetimes
+        epoch_us: Microseconds since the epoch per timestamp value
+    """
+
+    size: int
+    dimensions: dict[str, Category]
+    volumes: Category
+    volume_scale: int
+    scaled_volumes: IntArray
+    volume_exponents: IntArray
+    timestamps: Category
+    epoch_us: IntArray
+
+    @classmethod
+    def from_records(cls, records: Sequence[dict[str, Any]]) -> MeteringColumns:
+        """Ingest metering records into columns.
+
+        Args:
+            records: Metering records as accepted by MeteringAggregator
+
+        Returns:
+            The records in columnar form
+
+        Raises:
+            ImportError: If numpy is not installed
+            ValueError: If the records cannot be represented exactly
+        """
+        if not NUMPY_AVAILABLE:
+            msg = "numpy is required for the columnar engine (pip install numpy)"
+            raise ImportError(msg)
+
+        size = len(records)
+        dimensions = {
+            field: Category.factorize((r.get(field, MISSING) for r in records), size)
+            for field, _ in DIMENSION_FIELDS.values()
+        }
+
+        # Factorize the strings Decimal is built from, so 1 and 1.0 stay apart
+        volumes = Category.factorize(
+            (str(r.get("counterVolume", 0)) for r in records), size
+        )
+        decimals = [Decimal(value) for value in volumes.values]
+        volumes, order = volumes.ranked(decimals)
+        volumes = Category(volumes.codes, [decimals[i] for i in order])
+        scale, scaled, exponents = _scale_volumes(volumes.values, size)
+
+        timestamps = Category.factorize((r.get("timestamp", "") for r in records), size)
+        parsed = [MeteringAggregator._parse_timestamp(t) for t in timestamps.values]
+        epochs = _epoch_microseconds(parsed)
+        timestamps, order = timestamps.ranked(epochs)
+        timestamps = Category(timestamps.codes, [parsed[i] for i in order])
+
+        return cls(
+            size=size,
+            dimensions=dimensions,
+            volumes=volumes,
+            volume_scale=scale,
+            scaled_volumes=scaled,
+            volume_exponents=exponents,
+            timestamps=timestamps,
+            epoch_us=np.asarray(epochs, dtype=np.int64)[order],
+        )
+
+    @property
+    def volume_array(self) -> IntArray:
+        """Scaled int64 volume of every record."""
+        return self.scaled_volumes[self.volumes.codes]
+
+    @property
+    def epoch_array(self) -> IntArray:
+        """int64 epoch microseconds of every record."""
+        return self.epoch_us[self.timestamps.codes]
+
+    def group_codes(self, dimensions: Sequence[str]) -> tuple[IntArray, list[str]]:
+        """Combine the category codes of the requested dimensions.
+
+        Args:
+            dimensions: Dimension names, as for aggregate_by_dimensions
+
+        Returns:
+            A group id per record and the record field of each dimension
+        """
+        fields = [DIMENSION_FIELDS[d][0] for d in dimensions if d in DIMENSION_FIELDS]
+        group = np.zeros(self.size, dtype=np.int64)
+        groups = 1
+        for field in fields:
+            category = self.dimensions[field]
+            if groups * len(category.values) > _INT64_MAX:
+                # Densify before the mixed-radix id could overflow
+                uniques, inverse = np.unique(group, return_inverse=True)
+                group, groups = inverse.astype(np.int64), len(uniques)
+            group = group * len(category.values) + category.codes
+            groups *= len(category.values)
+        return group, fields
+
+    def aggregate(self, dimensions: Sequence[str]) -> dict[str, AggregatedMetrics]:
+        """Aggregate by dimensions; equivalent to the Decimal path.
+
+        Args:
+            dimensions: Dimensions to group by (app_key, counter_name, etc.)
+
+        Returns:
+            Dictionary mapping dimension keys to aggregated metrics, in the
+            order each key first appears
+        """
+        if not self.size:
+            return {}
+
+        group, fields = self.group_codes(dimensions)
+        # One stable sort: groups become contiguous runs, earliest record first
+        order = np.argsort(group, kind="stable")
+        boundaries = np.flatnonzero(np.diff(group[order])) + 1
+        starts = np.concatenate(([0], boundaries))
+        counts = np.diff(np.concatenate((starts, [self.size])))
+        first = order[starts]
+
+        volume_codes = self.volumes.codes[order]
+        totals = np.add.reduceat(self.scaled_volumes[volume_codes], starts)
+        exponents = np.minimum.reduceat(self.volume_exponents[volume_codes], starts)
+        min_volumes = np.minimum.reduceat(volume_codes, starts)
+        max_volumes = np.maximum.reduceat(volume_codes, starts)
+        time_codes = self.timestamps.codes[order]
+        start_times = np.minimum.reduceat(time_codes, starts)
+        end_times = np.maximum.reduceat(time_codes, starts)
+
+        # Emit groups in order of first appearance, as the Decimal path does
+        rank = np.argsort(first, kind="stable")
+        labels = self._group_labels(first[rank], dimensions, fields)
+        volumes = self.volumes.values
+        times = self.timestamps.values
+        results: dict[str, AggregatedMetrics] = {}
+        for (key, dim_values), total, exponent, count, low, high, start, end in zip(
+            labels,
+            totals[rank].tolist(),
+            exponents[rank].tolist(),
+            counts[rank].tolist(),
+            min_volumes[rank].tolist(),
+            max_volumes[rank].tolist(),
+            start_times[rank].tolist(),
+            end_times[rank].tolist(),
+            strict=True,
+        ):
+            total_volume = _unscale(total, self.volume_scale, exponent)
+            results[key] = AggregatedMetrics(
+                total_volume=total_volume,
+                record_count=count,
+                avg_volume=total_volume / count,
+                max_volume=volumes[high],
+                min_volume=volumes[low],
+                start_time=times[start],
+                end_time=times[end],
+                dimensions=AggregationDimension(**dim_values),
+            )
+        return results
+
+    def _group_labels(
+        self, rows: IntArray, dimensions: Sequence[str], fields: list[str]
+    ) -> list[tuple[str, dict[str, Any]]]:
+        """Build the dimension key and values for one record of each group."""
+        names = [d for d in dimensions if d in DIMENSION_FIELDS]
+        columns = []
+        for name, field in zip(names, fields, strict=True):
+            category = self.dimensions[field]
+            values = [category.values[c] for c in category.codes[rows].tolist()]
+            columns.append((name, DIMENSION_FIELDS[name][1], values))
+
+        labels = []
+        for i in range(len(rows)):
+            parts = []
+            dim_values: dict[str, Any] = {}
+            for name, prefix, values in columns:
+                value = values[i]
+                if value is not MISSING:
+                    parts.append(f"{prefix}:{value}")
+                    dim_values[name] = value
+            labels.append(("|".join(parts), dim_values))
+        return labels
+
+
+def _scale_volumes(
+    decimals: list[Decimal], size: int
+) -> tuple[int, IntArray, IntArray]:
+    """Convert distinct volumes to exact int64 integers at a common scale.
+
+    Raises:
+        ValueError: If a volume is not finite or a sum could overflow int64
+    """
+    if not all(d.is_finite() for d in decimals):
+        raise ValueError("Non-finite volumes cannot be scaled")
+    exponents = [int(d.as_tuple().exponent) for d in decimals]
+    scale = max([0, *(-e for e in exponents)])
+    scaled = []
+    for d, exponent in zip(decimals, exponents, strict=True):
+        sign, digits, _ = d.as_tuple()
+        # Built from the digits so no context precision can round it
+        value = int("".join(map(str, digits))) * 10 ** (exponent + scale)
+        scaled.append(-value if sign else value)
+    largest = max((abs(v) for v in scaled), default=0)
+    if largest * size > _INT64_MAX:
+        raise ValueError("Volumes too large for exact int64 sums")
+    return (
+        scale,
+        np.asarray(scaled, dtype=np.int64),
+        np.asarray(exponents, dtype=np.int64),
+    )
+
+
+def _unscale(total: int, scale: int, exponent: int) -> Decimal:
+    """Rebuild a Decimal sum with the exponent Decimal addition would give."""
+    value = Decimal(total).scaleb(-scale)
+    if exponent == -scale:
+        return value
+    return value.quantize(Decimal(1).scaleb(min(exponent, 0)))
+
+
+def _epoch_microseconds(timestamps: list[datetime]) -> list[int]:
+    """Microseconds since the epoch for naive or aware datetimes.
+
+    Raises:
+        ValueError: If naive and aware datetimes are mixed
+    """
+    aware = {t.tzinfo is not None for t in timestamps}
+    if len(aware) > 1:
+        raise ValueError("Cannot order naive and aware timestamps together")
+    return [epoch_microseconds(t) for t in timestamps]
@@ -0,0 +1,200 @@
+"""Idempotency keys and client-side duplicate filtering for metering.
+
+Every meter can carry an ``idempotencyKey`` field, a random key assigned
+once when the record is first prepared for sending and stored on it. A
+request replayed by a transport retry, a spool replay or an emitter resend
+sends the same record and so the same key, and the server can drop the
+copies, while a new usage event always gets a new key even when its content
+matches an earlier one. MeteringDedupFilter remembers the keys of delivered
+meters in a rotating Bloom filter and drops repeats before they are sent at
+all.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import math
+import uuid
+from typing import TYPE_CHECKING
+
+from .constants import DEFAULT_DEDUP_CAPACITY, DEFAULT_DEDUP_ERROR_RATE
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from .billing_types import MeteringData
+
+IDEMPOTENCY_KEY_FIELD = "idempotencyKey"
+
+
+def new_idempotency_key() -> str:
+    """Generate a fresh idempotency key.
+
+    Returns:
+        32-character hex key
+    """
+    return uuid.uuid4().hex
+
+
+def assign_idempotency_keys(meters: Iterable[MeteringData]) -> list[MeteringData]:
+    """Stamp each meter that has no idempotency key with a fresh one.
+
+    Keys are never derived from content: two events with identical fields
+    are distinct usage and get distinct keys. A meter that already carries a
+    key keeps it, so resending the same records reuses their keys.
+
+    Args:
+        meters: Meter records, updated in place
+
+    Returns:
+        The same records as a list
+    """
+    records = list(meters)
+    for meter in records:
+        if not meter.get(IDEMPOTENCY_KEY_FIELD):
+            meter[IDEMPOTENCY_KEY_FIELD] = new_idempotency_key()
+    return records
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over hex idempotency keys."""
+
+    def __init__(self, capacity: int, error_rate: float) -> None:
+        """Size the filter for ``capacity`` keys at ``error_rate``.
+
+        Args:
+            capacity: Keys the filter is sized for
+            error_rate: False-positive probability at capacity
+
+        Raises:
+            ValueError: If capacity or error_rate is out of range
+        """
+        if capacity < 1 or not 0 < error_rate < 1:
+            raise ValueError("capacity must be positive and error_rate in (0, 1)")
+        self.capacity = capacity
+        self.size = max(
+            8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        )
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.count = 0
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, key: str) -> list[int]:
+        # Double hashing over a 128-bit digest, so any key string works
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        value = int.from_bytes(digest, "big")
+        first, second = value >> 64, (value & 0xFFFFFFFFFFFFFFFF) | 1
+        return [(first + i * second) % self.size for i in range(self.hashes)]
+
+    def __contains__(self, key: str) -> bool:
+        """Check whether the key was probably added."""
+        return all(self._bits[p >> 3] & (1 << (p & 7)) for p in self._positions(key))
+
+    def add(self, key: str) -> None:
+        """Add a key."""
+        for position in self._positions(key):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+
+class RotatingBloomFilter:
+    """Bloom filter that forgets old keys to keep memory bounded.
+
+    Keys go into the current generation; once it holds ``capacity`` keys it
+    becomes the previous generation and a fresh one starts. Lookups check
+    both, so at least the last ``capacity`` keys are always remembered.
+    """
+
+    def __init__(
+        self,
+        capacity: int = DEFAULT_DEDUP_CAPACITY,
+        error_rate: float = DEFAULT_DEDUP_ERROR_RATE,
+    ) -> None:
+        """Initialize the filter.
+
+        Args:
+            capacity: Keys per generation
+            error_rate: False-positive probability of each generation
+        """
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self._current = BloomFilter(capacity, error_rate)
+        self._previous: BloomFilter | None = None
+
+    @property
+    def memory_bytes(self) -> int:
+        """Get the size of the bit arrays."""
+        generations = 2 if self._previous is not None else 1
+        return generations * len(self._current._bits)
+
+    def __contains__(self, key: str) -> bool:
+        """Check whether the key was probably added recently."""
+        return key in self._current or (
+            self._previous is not None and key in self._previous
+        )
+
+    def add(self, key: str) -> None:
+        """Add a key, rotating generations when the current one is full."""
+        if self._current.count >= self.capacity:
+            self._previous = self._current
+            self._current = BloomFilter(self.capacity, self.error_rate)
+        self._current.add(key)
+
+
+class MeteringDedupFilter:
+    """Drop meters whose idempotency key was already delivered.
+
+    A Bloom filter has no false negatives but does have false positives: with
+    the default error rate, about one unique meter in a million is dropped
+    as a duplicate. Keys are only remembered once ``mark_delivered`` is
+    called, so a failed send can be retried.
+    """
+
+    def __init__(
+        self,
+        capacity: int = DEFAULT_DEDUP_CAPACITY,
+        error_rate: float = DEFAULT_DEDUP_ERROR_RATE,
+    ) -> None:
+        """Initialize the filter.
+
+        Args:
+            capacity: Delivered keys remembered per generation
+            error_rate: False-positive probability of each generation
+        """
+        self._seen = RotatingBloomFilter(capacity, error_rate)
+        self.checked = 0
+        self.dropped = 0
+
+    def filter(self, meters: Iterable[MeteringData]) -> list[MeteringData]:
+        """Return the meters that were not delivered before.
+
+        Args:
+            meters: Records carrying idempotency keys
+
+        Returns:
+            Records to send, in order
+        """
+        fresh = []
+        for meter in meters:
+            self.checked += 1
+            key = meter.get("idempotencyKey")
+            if key and key in self._seen:
+                self.dropped += 1
+            else:
+                fresh.append(meter)
+        return fresh
+
+    def mark_delivered(self, meters: Iterable[MeteringData]) -> None:
+        """Remember the keys of meters the API accepted."""
+        for meter in meters:
+            key = meter.get("idempotencyKey")
+            if key:
+                self._seen.add(key)
+
+    def to_dict(self) -> dict[str, int]:
+        """Get counters and memory use."""
+        return {
+            "checked": self.checked,
+            "dropped": self.dropped,
+            "memory_bytes": self._seen.memory_bytes,
+        }
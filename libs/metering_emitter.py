@@ -0,0 +1,371 @@
+"""Background buffered metering for request paths.
+
+BufferedMeteringEmitter takes usage events without waiting on the network,
+holds them in a bounded in-memory queue and sends them in ``meterList``
+batches from a background thread once enough events, bytes or time have
+accumulated. ``flush()`` waits until everything emitted so far has been
+sent; ``close()`` flushes and stops the thread.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import deque
+from dataclasses import asdict, dataclass
+from enum import Enum
+from typing import TYPE_CHECKING, Any, Self
+
+from .constants import (
+    DEFAULT_EMITTER_BATCH_SIZE,
+    DEFAULT_EMITTER_MAX_AGE,
+    DEFAULT_EMITTER_QUEUE_SIZE,
+    DEFAULT_METER_BATCH_BYTES,
+    CounterType,
+)
+from .json_codec import get_codec
+from .metering_dedup import assign_idempotency_keys
+from .request_stats import LatencyHistogram
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from .billing_types import MeteringData
+    from .Metering import MeteringManager
+
+logger = logging.getLogger(__name__)
+
+
+class OverflowPolicy(str, Enum):
+    """What emit does when the queue is full."""
+
+    BLOCK = "block"  # wait for room, up to block_timeout if one is set
+    DROP_NEWEST = "drop_newest"  # reject the new event
+    DROP_OLDEST = "drop_oldest"  # evict the oldest queued event
+
+
+@dataclass
+class EmitterStats:
+    """Counters for a buffered emitter."""
+
+    emitted: int = 0
+    sent: int = 0
+    failed: int = 0
+    dropped: int = 0
+    flushes: int = 0
+    queue_depth: int = 0
+    peak_queue_depth: int = 0
+
+    def to_dict(self) -> dict[str, int]:
+        """Convert counters to a plain dictionary."""
+        return asdict(self)
+
+
+@dataclass
+class _Event:
+    """One queued meter record."""
+
+    meter: MeteringData
+    size: int
+    queued_at: float
+
+
+class BufferedMeteringEmitter:
+    """Send metering events in background batches instead of inline.
+
+    A batch is sent as soon as ``max_batch_size`` events or
+    ``max_batch_bytes`` encoded bytes are queued, or the oldest queued event
+    is ``max_age`` seconds old. Events are validated when emitted, so bad
+    input still fails at the call site. Failed batches are logged, counted
+    and passed to ``on_error``; they are not retried beyond what the
+    manager's client already does.
+
+    When the queue is full, the default BLOCK policy makes emit wait for
+    room, so no event is lost but a stalled API stalls the caller. Set
+    ``block_timeout`` to bound the wait; an event that times out is dropped
+    with a warning.
+    """
+
+    def __init__(
+        self,
+        manager: MeteringManager,
+        *,
+        max_batch_size: int = DEFAULT_EMITTER_BATCH_SIZE,
+        max_batch_bytes: int = DEFAULT_METER_BATCH_BYTES,
+        max_age: float = DEFAULT_EMITTER_MAX_AGE,
+        max_queue_size: int = DEFAULT_EMITTER_QUEUE_SIZE,
+        overflow: OverflowPolicy | str = OverflowPolicy.BLOCK,
+        block_timeout: float | None = None,
+        on_error: Callable[[list[MeteringData], Exception], None] | None = None,
+    ) -> None:
+        """Initialize the emitter and start its background thread.
+
+        Args:
+            manager: Metering manager whose client sends the batches
+            max_batch_size: Events that trigger a flush, and the batch cap
+            max_batch_bytes: Encoded bytes that trigger a flush, and the cap
+            max_age: Seconds the oldest event may wait before a flush
+            max_queue_size: Maximum events buffered at once
+            overflow: What emit does when the queue is full
+            block_timeout: Longest a blocking emit waits for room before the
+                event is dropped (None waits forever)
+            on_error: Called with a failed batch and its exception
+
+        Raises:
+            ValueError: If a size or age is not positive
+        """
+        if min(max_batch_size, max_batch_bytes, max_queue_size) < 1 or max_age <= 0:
+            msg = "batch size, batch bytes, queue size and max_age must be positive"
+            raise ValueError(msg)
+
+        self.manager = manager
+        self.max_batch_size = max_batch_size
+        self.max_batch_bytes = max_batch_bytes
+        self.max_age = max_age
+        self.max_queue_size = max_queue_size
+        self.overflow = OverflowPolicy(overflow)
+        self.block_timeout = block_timeout
+        self.on_error = on_error
+
+        self._codec = get_codec()
+        self._queue: deque[_Event] = deque()
+        self._queued_bytes = 0
+        self._accepted = 0
+        self._completed = 0
+        self._flush_target = 0
+        self._closed = False
+        self._stats = EmitterStats()
+        self._flush_latency = LatencyHistogram()
+        self._cond = threading.Condition()
+        self._thread = threading.Thread(
+            target=self._run, name="metering-emitter", daemon=True
+        )
+        self._thread.start()
+
+    def __enter__(self) -> Self:
+        """Context manager entry."""
+        return self
+
+    def __exit__(
+        self,
+        _exc_type: type[BaseException] | None,
+        _exc_val: BaseException | None,
+        _exc_tb: object,
+    ) -> None:
+        """Context manager exit - flush and stop."""
+        self.close()
+
+    @property
+    def stats(self) -> EmitterStats:
+        """Get a snapshot of the emitter counters."""
+        with self._cond:
+            self._stats.queue_depth = len(self._queue)
+            return EmitterStats(**self._stats.to_dict())
+
+    def snapshot(self) -> dict[str, Any]:
+        """Get counters plus the flush latency summary in milliseconds."""
+        with self._cond:
+            latency = self._flush_latency.summary()
+        return {**self.stats.to_dict(), "flush_latency_ms": latency}
+
+    def emit(
+        self,
+        app_key: str,
+        counter_name: str,
+        counter_type: CounterType | str,
+        counter_unit: str,
+        counter_volume: str,
+        resource_id: str = "test",
+        resource_name: str = "test",
+        parent_resource_id: str = "test",
+    ) -> bool:
+        """Queue one metering event; arguments are as for send_metering.
+
+        Returns:
+            True if the event was queued, False if the overflow policy
+            dropped it
+
+        Raises:
+            ValidationException: If the event is invalid
+            RuntimeError: If the emitter is closed
+        """
+        meter = self.manager._build_metering_data(
+            app_key,
+            counter_name,
+            counter_type,
+            counter_unit,
+            counter_volume,
+            resource_id,
+            resource_name,
+            parent_resource_id,
+        )
+        return self.emit_meter(meter)
+
+    def emit_meter(self, meter: MeteringData) -> bool:
+        """Queue one already-built meter record.
+
+        Returns:
+            True if the record was queued, False if the overflow policy
+            dropped it
+
+        Raises:
+            RuntimeError: If the emitter is closed
+        """
+        if self.manager.idempotency_keys:
+            # Key the record now so a resend of a failed batch reuses it
+            assign_idempotency_keys([meter])
+        event = _Event(meter, len(self._codec.dumps(meter)) + 1, time.monotonic())
+        with self._cond:
+            self._check_open()
+            if len(self._queue) >= self.max_queue_size and not self._make_room():
+                self._stats.dropped += 1
+                return False
+
+            self._queue.append(event)
+            self._queued_bytes += event.size
+            self._accepted += 1
+            self._stats.emitted += 1
+            self._stats.peak_queue_depth = max(
+                self._stats.peak_queue_depth, len(self._queue)
+            )
+            if (
+                len(self._queue) >= self.max_batch_size
+                or self._queued_bytes >= self.max_batch_bytes
+                or len(self._queue) == 1
+            ):
+                self._cond.notify_all()
+            return True
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Send everything emitted so far and wait for it to finish.
+
+        Args:
+            timeout: Longest to wait in seconds (None waits forever)
+
+        Returns:
+            True if every earlier event was sent (or failed) in time
+        """
+        with self._cond:
+            target = self._accepted
+            self._flush_target = max(self._flush_target, target)
+            self._cond.notify_all()
+            return self._cond.wait_for(lambda: self._completed >= target, timeout)
+
+    def close(self, timeout: float | None = None) -> None:
+        """Flush queued events and stop the background thread.
+
+        Emitting after close raises RuntimeError; closing twice is harmless.
+
+        Args:
+            timeout: Longest to wait for the final flush in seconds
+        """
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._flush_target = self._accepted
+            self._cond.notify_all()
+        self._thread.join(timeout)
+
+    def _check_open(self) -> None:
+        if self._closed:
+            msg = "BufferedMeteringEmitter is closed"
+            raise RuntimeError(msg)
+
+    def _make_room(self) -> bool:
+        """Apply the overflow policy to a full queue; caller holds the lock."""
+        if self.overflow is OverflowPolicy.DROP_NEWEST:
+            return False
+        if self.overflow is OverflowPolicy.DROP_OLDEST:
+            evicted = self._queue.popleft()
+            self._queued_bytes -= evicted.size
+            self._completed += 1
+            self._stats.dropped += 1
+            self._cond.notify_all()
+            return True
+
+        # Flush now instead of waiting for the age threshold
+        self._flush_target = max(self._flush_target, self._accepted)
+        self._cond.notify_all()
+        has_room = self._cond.wait_for(
+            lambda: self._closed or len(self._queue) < self.max_queue_size,
+            self.block_timeout,
+        )
+        self._check_open()
+        if not has_room:
+            logger.warning(
+                f"Dropped metering event: queue still full after {self.block_timeout}s"
+            )
+        return has_room
+
+    def _flush_due(self) -> bool:
+        """Check whether a batch should be sent now; caller holds the lock."""
+        if not self._queue:
+            return False
+        return (
+            self._closed
+            or self._completed < self._flush_target
+            or len(self._queue) >= self.max_batch_size
+            or self._queued_bytes >= self.max_batch_bytes
+            or time.monotonic() - self._queue[0].queued_at >= self.max_age
+        )
+
+    def _take_batch(self) -> list[MeteringData]:
+        """Dequeue the next batch; caller holds the lock."""
+        batch: list[MeteringData] = []
+        size = 0
+        while self._queue and len(batch) < self.max_batch_size:
+            event = self._queue[0]
+            if batch and size + event.size > self.max_batch_bytes:
+                break
+            self._queue.popleft()
+            self._queued_bytes -= event.size
+            size += event.size
+            batch.append(event.meter)
+        self._cond.notify_all()
+        return batch
+
+    def _run(self) -> None:
+        """Background loop sending batches as they become due."""
+        while True:
+            with self._cond:
+                while not self._flush_due():
+                    if self._closed and not self._queue:
+                        return
+                    timeout = None
+                    if self._queue:
+                        age = time.monotonic() - self._queue[0].queued_at
+                        timeout = max(self.max_age - age, 0.0)
+                    self._cond.wait(timeout)
+                batch = self._take_batch()
+
+            self._send(batch)
+
+    def _send(self, batch: list[MeteringData]) -> None:
+        """Send one batch and record the outcome."""
+        started = time.perf_counter()
+        error: Exception | None = None
+        try:
+            self.manager.send_meter_list(batch)
+        except Exception as e:
+            error = e
+            logger.exception(f"Failed to send {len(batch)} buffered meters: {e}")
+        latency = time.perf_counter() - started
+
+        with self._cond:
+            self._flush_latency.record(latency * 1000)
+            self._stats.flushes += 1
+            if error is None:
+                self._stats.sent += len(batch)
+            else:
+                self._stats.failed += len(batch)
+            self._completed += len(batch)
+            self._cond.notify_all()
+
+        if error is not None and self.on_error is not None:
+            try:
+                self.on_error(batch, error)
+            except Exception as e:
+                # A failing callback must not kill the thread flush() waits on
+                logger.exception(f"on_error callback failed: {e}")
@@ -0,0 +1,413 @@
+"""Streaming metering ingestion from JSONL and CSV dumps.
+
+Records are read lazily from a file (gzip detected automatically), validated,
+packed into ``meterList`` batches and sent through a bounded window of
+in-flight requests, so memory stays flat however large the dump is.
+Throughput is reported as it goes.
+
+Each JSONL line or CSV row is one meter using the API field names
+(``appKey``, ``counterName``, ``counterType``, ``counterUnit``,
+``counterVolume``, ``timestamp`` and optionally ``resourceId``,
+``resourceName``, ``parentResourceId``, ``source``).
+
+Usage:
+    python -m libs.metering_ingest meters.jsonl.gz --base-url http://localhost:5000
+"""
+
+from __future__ import annotations
+
+import csv
+import gzip
+import logging
+import sys
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any, cast
+
+from .constants import (
+    DEFAULT_INGEST_BATCH_SIZE,
+    DEFAULT_INGEST_PROGRESS_INTERVAL,
+    DEFAULT_MAX_CONCURRENCY,
+    DEFAULT_METER_BATCH_BYTES,
+    CounterType,
+)
+from .exceptions import APIRequestException, ValidationException
+from .http_client import BillingAPIClient, HTTPMethod, RequestSpec
+from .json_codec import get_codec
+from .Metering import iter_meter_lists
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator, Sequence
+
+    from .billing_types import MeteringData
+
+logger = logging.getLogger(__name__)
+
+FORMATS = ("jsonl", "csv")
+
+REQUIRED_FIELDS = (
+    "appKey",
+    "counterName",
+    "counterType",
+    "counterUnit",
+    "counterVolume",
+    "timestamp",
+)
+
+# Same defaults MeteringManager fills in for meters it builds
+OPTIONAL_FIELD_DEFAULTS = {
+    "parentResourceId": "test",
+    "resourceId": "test",
+    "resourceName": "test",
+    "source": "qa.billing.test",
+}
+
+_COUNTER_TYPES = frozenset(t.value for t in CounterType)
+_GZIP_MAGIC = b"\x1f\x8b"
+
+
+@dataclass
+class IngestStats:
+    """Progress counters of one ingestion run."""
+
+    records: int = 0
+    bytes_read: int = 0
+    invalid: int = 0
+    batches: int = 0
+    sent: int = 0
+    failed: int = 0
+    started_at: float = field(default_factory=time.monotonic)
+
+    @property
+    def elapsed(self) -> float:
+        """Get seconds since the run started."""
+        return time.monotonic() - self.started_at
+
+    @property
+    def records_per_second(self) -> float:
+        """Get valid records read per second."""
+        elapsed = self.elapsed
+        return self.records / elapsed if elapsed > 0 else 0.0
+
+    @property
+    def bytes_per_second(self) -> float:
+        """Get uncompressed input bytes read per second."""
+        elapsed = self.elapsed
+        return self.bytes_read / elapsed if elapsed > 0 else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert counters and rates to a plain dictionary."""
+        counters = asdict(self)
+        del counters["started_at"]
+        return {
+            **counters,
+            "elapsed": round(self.elapsed, 3),
+            "records_per_second": round(self.records_per_second, 1),
+            "bytes_per_second": round(self.bytes_per_second, 1),
+        }
+
+    def __str__(self) -> str:
+        """Format as a one-line progress report."""
+        return (
+            f"{self.records} records ({self.records_per_second:,.0f}/s, "
+            f"{self.bytes_per_second / 1024 / 1024:,.2f} MiB/s), "
+            f"{self.batches} batches, {self.sent} sent, {self.failed} failed, "
+            f"{self.invalid} invalid"
+        )
+
+
+def _detect_format(path: Path) -> str:
+    """Infer the record format from the file name."""
+    suffixes = [s.lower() for s in path.suffixes if s.lower() != ".gz"]
+    suffix = suffixes[-1] if suffixes else ""
+    if suffix in (".jsonl", ".ndjson", ".json"):
+        return "jsonl"
+    if suffix == ".csv":
+        return "csv"
+    msg = f"Cannot tell the format of {path}; pass one of {', '.join(FORMATS)}"
+    raise ValidationException(msg)
+
+
+def _open_binary(path: Path) -> IO[bytes]:
+    """Open a file for reading, decompressing it if it is gzip."""
+    with path.open("rb") as probe:
+        compressed = probe.read(2) == _GZIP_MAGIC
+    if compressed:
+        return cast("IO[bytes]", gzip.open(path, "rb"))
+    return path.open("rb")
+
+
+def _counted_lines(stream: IO[bytes], stats: IngestStats) -> Iterator[bytes]:
+    """Yield raw lines while counting the bytes read."""
+    for line in stream:
+        stats.bytes_read += len(line)
+        yield line
+
+
+def _raw_records(path: Path, fmt: str, stats: IngestStats) -> Iterator[tuple[int, Any]]:
+    """Yield ``(line number, record)`` pairs without validating them."""
+    with _open_binary(path) as stream:
+        lines = _counted_lines(stream, stats)
+        if fmt == "jsonl":
+            codec = get_codec()
+            for number, line in enumerate(lines, start=1):
+                if line.strip():
+                    try:
+                        yield number, codec.loads(line)
+                    except ValueError as e:
+                        yield number, {"_error": f"invalid JSON: {e}"}
+        else:
+            text = (line.decode("utf-8-sig") for line in lines)
+            reader = csv.DictReader(text)
+            for row in reader:
+                yield (
+                    reader.line_num,
+                    {k: v for k, v in row.items() if v not in (None, "")},
+                )
+
+
+def validate_meter(
+    record: Any, app_key: str | None = None
+) -> tuple[MeteringData | None, str | None]:
+    """Check one raw record and turn it into a meterList entry.
+
+    Args:
+        record: Parsed JSON object or CSV row
+        app_key: App key for records that carry none
+
+    Returns:
+        ``(meter, None)`` for a valid record, else ``(None, reason)``
+    """
+    if not isinstance(record, dict):
+        return None, "record is not an object"
+    if "_error" in record:
+        return None, str(record["_error"])
+
+    meter = {**OPTIONAL_FIELD_DEFAULTS, **record}
+    if app_key and not meter.get("appKey"):
+        meter["appKey"] = app_key
+    missing = [name for name in REQUIRED_FIELDS if meter.get(name) in (None, "")]
+    if missing:
+        return None, f"missing {', '.join(missing)}"
+    if meter["counterType"] not in _COUNTER_TYPES:
+        return None, f"invalid counterType {meter['counterType']!r}"
+
+    meter["counterVolume"] = str(meter["counterVolume"])
+    return cast("MeteringData", meter), None
+
+
+def iter_meter_records(
+    path: str | Path,
+    fmt: str | None = None,
+    *,
+    app_key: str | None = None,
+    strict: bool = True,
+    stats: IngestStats | None = None,
+) -> Iterator[MeteringData]:
+    """Lazily read and validate meters from a JSONL or CSV file.
+
+    Args:
+        path: Input file, optionally gzip-compressed
+        fmt: ``"jsonl"`` or ``"csv"`` (inferred from the file name if None)
+        app_key: App key for records that carry none
+        strict: Raise on the first invalid record instead of skipping it
+        stats: Counters to update while reading
+
+    Yields:
+        Valid meter records, in file order
+
+    Raises:
+        ValidationException: If the format is unknown, or a record is invalid
+            and ``strict`` is set
+    """
+    source = Path(path)
+    fmt = fmt or _detect_format(source)
+    if fmt not in FORMATS:
+        msg = f"Unsupported format {fmt!r}; expected one of {', '.join(FORMATS)}"
+        raise ValidationException(msg)
+    stats = stats if stats is not None else IngestStats()
+
+    for number, record in _raw_records(source, fmt, stats):
+        meter, reason = validate_meter(record, app_key)
+        if meter is None:
+            msg = f"{source}:{number}: {reason}"
+            if strict:
+                raise ValidationException(msg)
+            stats.invalid += 1
+            logger.warning(f"Skipping invalid meter at {msg}")
+            continue
+        stats.records += 1
+        yield meter
+
+
+def ingest_meters(
+    client: BillingAPIClient,
+    meters: Iterable[MeteringData],
+    *,
+    batch_size: int = DEFAULT_INGEST_BATCH_SIZE,
+    max_batch_bytes: int = DEFAULT_METER_BATCH_BYTES,
+    max_in_flight: int = DEFAULT_MAX_CONCURRENCY,
+    stats: IngestStats | None = None,
+    progress: Callable[[IngestStats], None] | None = None,
+    progress_interval: float = DEFAULT_INGEST_PROGRESS_INTERVAL,
+) -> IngestStats:
+    """Send a stream of meters in ``meterList`` batches with bounded fan-out.
+
+    At most ``max_in_flight`` batches are being sent at once; the next batch
+    is only read from ``meters`` when one completes, which pushes back on the
+    reader. A batch the API rejects counts all its meters as failed.
+
+    Args:
+        client: API client for the metering endpoint
+        meters: Valid meter records, typically from iter_meter_records
+        batch_size: Maximum meters per request
+        max_batch_bytes: Maximum encoded size of one request body
+        max_in_flight: Maximum batches in flight at once
+        stats: Counters to update (a new IngestStats if None)
+        progress: Called with the counters at most every
+            ``progress_interval`` seconds and once at the end
+        progress_interval: Seconds between progress calls
+
+    Returns:
+        Final counters
+
+    Raises:
+        ValidationException: If batch_size is out of range
+    """
+    stats = stats if stats is not None else IngestStats()
+    batch_sizes: dict[int, int] = {}
+
+    def specs() -> Iterator[RequestSpec]:
+        for index, batch in enumerate(
+            iter_meter_lists(meters, batch_size, max_batch_bytes)
+        ):
+            batch_sizes[index] = len(batch)
+            stats.batches += 1
+            yield RequestSpec(
+                HTTPMethod.POST, "billing/meters", json_data={"meterList": batch}
+            )
+
+    last_report = time.monotonic()
+    for index, outcome in client.iter_requests(specs(), max_concurrency=max_in_flight):
+        size = batch_sizes.pop(index)
+        if isinstance(outcome, APIRequestException):
+            stats.failed += size
+            logger.error(f"Metering batch {index} ({size} meters) failed: {outcome}")
+        elif isinstance(outcome, Exception):
+            raise outcome
+        else:
+            stats.sent += size
+
+        if progress is not None and time.monotonic() - last_report >= progress_interval:
+            last_report = time.monotonic()
+            progress(stats)
+
+    if progress is not None:
+        progress(stats)
+    return stats
+
+
+def ingest_file(
+    client: BillingAPIClient,
+    path: str | Path,
+    fmt: str | None = None,
+    *,
+    app_key: str | None = None,
+    strict: bool = True,
+    **kwargs: Any,
+) -> IngestStats:
+    """Stream a JSONL or CSV metering dump to the API.
+
+    Args:
+        client: API client for the metering endpoint
+        path: Input file, optionally gzip-compressed
+        fmt: ``"jsonl"`` or ``"csv"`` (inferred from the file name if None)
+        app_key: App key for records that carry none
+        strict: Stop at the first invalid record instead of skipping it
+        **kwargs: Batching and progress options for ingest_meters
+
+    Returns:
+        Final counters
+
+    Raises:
+        ValidationException: If the format is unknown, or a record is invalid
+            and ``strict`` is set
+    """
+    stats = IngestStats()
+    records = iter_meter_records(path, fmt, app_key=app_key, strict=strict, stats=stats)
+    return ingest_meters(client, records, stats=stats, **kwargs)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Command-line entry point."""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog="python -m libs.metering_ingest",
+        description="Stream a JSONL/CSV metering dump to the metering API",
+    )
+    parser.add_argument("path", type=Path, help="Input file (.jsonl/.csv, may be .gz)")
+    parser.add_argument("--format", choices=FORMATS, help="Override format detection")
+    parser.add_argument("--base-url", help="Metering API base URL (default: config)")
+    parser.add_argument("--app-key", help="App key for records without one")
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_INGEST_BATCH_SIZE,
+        help="Meters per request",
+    )
+    parser.add_argument(
+        "--max-batch-bytes",
+        type=int,
+        default=DEFAULT_METER_BATCH_BYTES,
+        help="Maximum request body size",
+    )
+    parser.add_argument(
+        "--max-in-flight",
+        type=int,
+        default=DEFAULT_MAX_CONCURRENCY,
+        help="Maximum concurrent requests",
+    )
+    parser.add_argument(
+        "--skip-invalid",
+        action="store_true",
+        help="Skip invalid records instead of stopping",
+    )
+    parser.add_argument(
+        "--progress-interval",
+        type=float,
+        default=DEFAULT_INGEST_PROGRESS_INTERVAL,
+        help="Seconds between progress reports",
+    )
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    if args.base_url is None:
+        from config import url
+
+        args.base_url = url.BASE_METERING_URL
+
+    with BillingAPIClient(args.base_url, max_workers=args.max_in_flight) as client:
+        try:
+            stats = ingest_file(
+                client,
+                args.path,
+                args.format,
+                app_key=args.app_key,
+                strict=not args.skip_invalid,
+                batch_size=args.batch_size,
+                max_batch_bytes=args.max_batch_bytes,
+                max_in_flight=args.max_in_flight,
+                progress=lambda s: logger.info(str(s)),
+                progress_interval=args.progress_interval,
+            )
+        except ValidationException as e:
+            logger.error(str(e))
+            return 2
+
+    return 1 if stats.failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
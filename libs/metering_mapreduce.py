@@ -0,0 +1,222 @@
+"""Multi-process map-reduce over metering dumps.
+
+Metering dumps are JSON-lines files, one record per line, optionally
+gzip-compressed. Plain files are split into byte ranges of ``shard_bytes``;
+each range is aggregated into a mergeable partial (a StreamingAggregator or a
+UsagePartial) in a worker process, and the partials are merged in input
+order. Because partials merge exactly, the result equals a single-process
+pass over the same records, and throughput scales with the worker count.
+"""
+
+from __future__ import annotations
+
+import gzip
+import io
+import os
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from pathlib import Path
+from typing import Any, Protocol, TypeVar
+
+from .constants import DEFAULT_HLL_PRECISION, DEFAULT_MAPREDUCE_SHARD_BYTES
+from .json_codec import get_codec
+from .metering_aggregator import AggregatedMetrics, StreamingAggregator, UsagePartial
+
+PathLike = str | os.PathLike[str]
+
+# (path, first byte, end byte); end is None for a whole-file shard
+Shard = tuple[str, int, int | None]
+
+
+class MergeablePartial(Protocol):
+    """A partial aggregate that folds records and merges with its peers."""
+
+    def update(self, records: Any) -> Any:
+        """Fold an iterable of records."""
+        ...
+
+    def merge(self, other: Any) -> Any:
+        """Fold in a partial over later records."""
+        ...
+
+
+P = TypeVar("P", bound=MergeablePartial)
+
+
+def split_shards(
+    paths: Sequence[PathLike], shard_bytes: int = DEFAULT_MAPREDUCE_SHARD_BYTES
+) -> list[Shard]:
+    """Split dump files into byte-range shards, in input order.
+
+    Gzip files cannot be read from an offset and form one shard each.
+
+    Args:
+        paths: JSON-lines dump files
+        shard_bytes: Target size of each shard
+
+    Returns:
+        Shards covering every file
+
+    Raises:
+        ValueError: If shard_bytes is not positive
+    """
+    if shard_bytes <= 0:
+        raise ValueError("shard_bytes must be positive")
+    shards: list[Shard] = []
+    for path in map(str, paths):
+        size = os.path.getsize(path)
+        if path.endswith(".gz") or size <= shard_bytes:
+            shards.append((path, 0, None))
+            continue
+        shards.extend(
+            (path, start, min(start + shard_bytes, size))
+            for start in range(0, size, shard_bytes)
+        )
+    return shards
+
+
+def read_shard(shard: Shard) -> Iterator[dict[str, Any]]:
+    """Yield the records of one shard.
+
+    A line belongs to the shard its first byte falls in, so a line crossing
+    a boundary is read by the earlier shard only.
+
+    Args:
+        shard: Shard from split_shards
+
+    Yields:
+        Decoded metering records
+    """
+    path, start, end = shard
+    loads = get_codec().loads
+    with _open(path) as stream:
+        position = start
+        if start:
+            # Skip the tail of a line that began in the previous shard
+            stream.seek(start - 1)
+            position += len(stream.readline()) - 1
+        while end is None or position < end:
+            line = stream.readline()
+            if not line:
+                break
+            position += len(line)
+            if line.strip():
+                yield loads(line)
+
+
+def map_reduce_dumps(
+    paths: Sequence[PathLike],
+    make_partial: Callable[[], P],
+    *,
+    max_workers: int | None = None,
+    shard_bytes: int = DEFAULT_MAPREDUCE_SHARD_BYTES,
+) -> P:
+    """Aggregate dump files into one partial using worker processes.
+
+    Args:
+        paths: JSON-lines dump files
+        make_partial: Picklable factory of empty partials, e.g. UsagePartial
+            or ``functools.partial(StreamingAggregator, dimensions)``
+        max_workers: Worker processes; defaults to the CPU count. With one
+            worker or one shard everything runs in the calling process.
+        shard_bytes: Target size of each shard
+
+    Returns:
+        The merged partial over every record
+    """
+    shards = split_shards(paths, shard_bytes)
+    workers = min(max_workers or os.cpu_count() or 1, len(shards))
+    result = make_partial()
+    if workers <= 1:
+        for shard in shards:
+            result.update(read_shard(shard))
+        return result
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for partial_result in executor.map(
+            _reduce_shard, shards, [make_partial] * len(shards)
+        ):
+            result.merge(partial_result)
+    return result
+
+
+def aggregate_dumps(
+    paths: Sequence[PathLike],
+    dimensions: list[str],
+    *,
+    max_workers: int | None = None,
+    shard_bytes: int = DEFAULT_MAPREDUCE_SHARD_BYTES,
+) -> dict[str, AggregatedMetrics]:
+    """aggregate_by_dimensions over dump files, in parallel.
+
+    Args:
+        paths: JSON-lines dump files
+        dimensions: Dimensions to group by (app_key, counter_name, etc.)
+        max_workers: Worker processes; defaults to the CPU count
+        shard_bytes: Target size of each shard
+
+    Returns:
+        Dictionary mapping dimension keys to aggregated metrics
+    """
+    aggregator = map_reduce_dumps(
+        paths,
+        partial(StreamingAggregator, dimensions),
+        max_workers=max_workers,
+        shard_bytes=shard_bytes,
+    )
+    return aggregator.results()
+
+
+def summarize_dumps(
+    paths: Sequence[PathLike],
+    *,
+    approximate: bool = False,
+    precision: int = DEFAULT_HLL_PRECISION,
+    include_resources: bool | None = None,
+    max_workers: int | None = None,
+    shard_bytes: int = DEFAULT_MAPREDUCE_SHARD_BYTES,
+) -> dict[str, Any]:
+    """create_usage_summary over dump files, in parallel.
+
+    In approximate mode each shard counts distinct resources with
+    HyperLogLog sketches, which merge exactly, so only fixed-size sketches
+    travel back from the workers instead of every resource id.
+
+    Args:
+        paths: JSON-lines dump files
+        approximate: Count distinct resources with HyperLogLog
+        precision: HyperLogLog precision (4-18) in approximate mode
+        include_resources: Return the exact resource list; defaults to
+            True unless approximate
+        max_workers: Worker processes; defaults to the CPU count
+        shard_bytes: Target size of each shard
+
+    Returns:
+        Dictionary containing usage summary
+    """
+    if include_resources is None:
+        include_resources = not approximate
+    make_partial = partial(
+        UsagePartial,
+        resource_precision=precision if approximate else None,
+        keep_resources=include_resources,
+    )
+    usage = map_reduce_dumps(
+        paths, make_partial, max_workers=max_workers, shard_bytes=shard_bytes
+    )
+    return usage.to_summary()
+
+
+def _reduce_shard(shard: Shard, make_partial: Callable[[], P]) -> P:
+    """Worker entry point: aggregate one shard into a fresh partial."""
+    result = make_partial()
+    result.update(read_shard(shard))
+    return result
+
+
+def _open(path: str) -> gzip.GzipFile | io.BufferedReader:
+    """Open a dump for binary reading, decompressing gzip files."""
+    if path.endswith(".gz"):
+        return gzip.open(path, "rb")
+    return Path(path).open("rb")
@@ -0,0 +1,359 @@
+"""Streaming per-counter outlier detection for metering records.
+
+Volumes of different counters live on unrelated scales, so OutlierDetector
+keeps separate statistics per counter name: a Welford mean and variance for
+the z-score method, and a mergeable KLL quantile sketch for the robust
+median/MAD method. Both are constant-size per counter, merge exactly (or,
+for the sketch, within its error bound) across shards, and can screen
+records as they stream past, so a full monthly dump never has to be held in
+memory.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from .constants import (
+    DEFAULT_MAD_THRESHOLD,
+    DEFAULT_OUTLIER_MIN_SAMPLES,
+    DEFAULT_QUANTILE_SKETCH_K,
+    DEFAULT_ZSCORE_THRESHOLD,
+)
+
+METHODS = ("zscore", "mad")
+
+# Scales MAD to the standard deviation of a normal distribution
+_MAD_SCALE = 0.6745
+
+
+class QuantileSketch:
+    """Mergeable KLL quantile sketch over floats with bounded memory.
+
+    Level h holds values that each stand for 2**h inputs. When a level
+    reaches its capacity it is sorted and every other value moves up a
+    level; capacities shrink by 2/3 per level below the top, so about 3k
+    values are kept whatever the input size and the rank error is about
+    1.7/k. The half that moves up alternates per level rather than being
+    drawn at random, so results are reproducible.
+    """
+
+    def __init__(self, k: int = DEFAULT_QUANTILE_SKETCH_K) -> None:
+        """Initialize an empty sketch.
+
+        Args:
+            k: Accuracy parameter; larger keeps more values
+
+        Raises:
+            ValueError: If k is less than 2
+        """
+        if k < 2:
+            raise ValueError("Sketch size k must be at least 2")
+        self.k = k
+        self.count = 0
+        self._levels: list[list[float]] = [[]]
+        self._parity: list[int] = [0]
+        self._base_capacity = k
+
+    def __len__(self) -> int:
+        """Number of values retained."""
+        return sum(len(values) for values in self._levels)
+
+    def add(self, value: float) -> None:
+        """Fold one value into the sketch."""
+        base = self._levels[0]
+        base.append(value)
+        self.count += 1
+        if len(base) >= self._base_capacity:
+            self._compress()
+
+    def update(self, values: Iterable[float]) -> QuantileSketch:
+        """Fold every value of an iterable; returns self for chaining."""
+        for value in values:
+            self.add(value)
+        return self
+
+    def merge(self, other: QuantileSketch) -> QuantileSketch:
+        """Fold in another sketch; returns self for chaining.
+
+        Raises:
+            ValueError: If the sketches use different k
+        """
+        if other.k != self.k:
+            raise ValueError("Cannot merge sketches of different size k")
+        while len(self._levels) < len(other._levels):
+            self._levels.append([])
+            self._parity.append(0)
+        for level, values in enumerate(other._levels):
+            self._levels[level].extend(values)
+        self.count += other.count
+        self._compress()
+        return self
+
+    def quantile(self, q: float) -> float | None:
+        """Estimated q-quantile of the values seen.
+
+        Args:
+            q: Quantile between 0 and 1
+
+        Returns:
+            The estimate, or None if the sketch is empty
+
+        Raises:
+            ValueError: If q is outside [0, 1]
+        """
+        if not 0 <= q <= 1:
+            raise ValueError(f"Quantile must be between 0 and 1: {q}")
+        if not self.count:
+            return None
+        return _weighted_quantile(self._weighted(), q)
+
+    def median_and_mad(self) -> tuple[float, float] | None:
+        """Estimated median and median absolute deviation, or None if empty."""
+        if not self.count:
+            return None
+        items = self._weighted()
+        median = _weighted_quantile(items, 0.5)
+        deviations = sorted((abs(value - median), weight) for value, weight in items)
+        return median, _weighted_quantile(deviations, 0.5)
+
+    def _weighted(self) -> list[tuple[float, int]]:
+        """Retained values with their weights, in value order."""
+        return sorted(
+            (value, 1 << level)
+            for level, values in enumerate(self._levels)
+            for value in values
+        )
+
+    def _capacity(self, level: int) -> int:
+        """Values a level may hold before it is compacted."""
+        depth = len(self._levels) - level - 1
+        return max(2, math.ceil(self.k * (2 / 3) ** depth))
+
+    def _compress(self) -> None:
+        """Compact every level at or over capacity, from the bottom up."""
+        level = -1
+        while level + 1 < len(self._levels):
+            level += 1
+            values = self._levels[level]
+            if len(values) < self._capacity(level):
+                continue
+            if level + 1 == len(self._levels):
+                self._levels.append([])
+                self._parity.append(0)
+            values.sort()
+            kept = [values.pop()] if len(values) % 2 else []
+            parity = self._parity[level]
+            self._parity[level] ^= 1
+            self._levels[level + 1].extend(values[parity::2])
+            self._levels[level] = kept
+        self._base_capacity = self._capacity(0)
+
+
+@dataclass(slots=True)
+class CounterStats:
+    """Running volume statistics of one counter."""
+
+    count: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+    sketch: QuantileSketch | None = None
+    _robust: tuple[float, float] | None = None
+    _robust_count: int = 0
+
+    def add(self, value: float) -> None:
+        """Fold one volume into the statistics."""
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        if self.sketch is not None:
+            self.sketch.add(value)
+
+    def merge(self, other: CounterStats) -> None:
+        """Fold in the statistics of the same counter over other records."""
+        if not other.count:
+            return
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.count = count
+        if self.sketch is not None and other.sketch is not None:
+            self.sketch.merge(other.sketch)
+        self._robust = None
+
+    @property
+    def std_dev(self) -> float:
+        """Population standard deviation of the volumes."""
+        return (self.m2 / self.count) ** 0.5 if self.count else 0.0
+
+    def median_and_mad(self) -> tuple[float, float] | None:
+        """Median and MAD from the sketch, or None without one.
+
+        The estimate is recomputed once the count has grown by 1/64 since
+        the last one, so screening a stream costs O(log n) sketch scans per
+        counter instead of one per record.
+        """
+        if self.sketch is None:
+            return None
+        if self._robust is None or self.count > self._robust_count + (
+            self._robust_count >> 6
+        ):
+            self._robust = self.sketch.median_and_mad()
+            self._robust_count = self.count
+        return self._robust
+
+
+class OutlierDetector:
+    """Per-counter volume outlier detection over a stream of records.
+
+    Two methods are offered:
+        - ``zscore``: distance from the counter's mean in standard
+          deviations, from a Welford running mean and variance
+        - ``mad``: the modified z-score 0.6745 * |x - median| / MAD, with
+          median and MAD estimated from a QuantileSketch; robust to the
+          outliers themselves and to skewed volumes
+
+    Records are grouped by ``counterName``. A counter is not judged until
+    it has ``min_samples`` readings, nor while its spread is zero.
+
+    Example:
+        >>> detector = OutlierDetector(method="mad")
+        >>> for record in detector.screen(read_records(path)):
+        ...     report(record)
+    """
+
+    def __init__(
+        self,
+        method: str = "zscore",
+        threshold: float | None = None,
+        min_samples: int = DEFAULT_OUTLIER_MIN_SAMPLES,
+        sketch_k: int = DEFAULT_QUANTILE_SKETCH_K,
+    ) -> None:
+        """Initialize the detector.
+
+        Args:
+            method: "zscore" or "mad"
+            threshold: Score above which a record is an outlier; defaults to
+                DEFAULT_ZSCORE_THRESHOLD or DEFAULT_MAD_THRESHOLD
+            min_samples: Readings a counter needs before records are flagged
+            sketch_k: Accuracy of the quantile sketch used by "mad"
+
+        Raises:
+            ValueError: If the method is unknown
+        """
+        if method not in METHODS:
+            raise ValueError(f"Invalid outlier method: {method}")
+        self.method = method
+        if threshold is None:
+            threshold = (
+                DEFAULT_ZSCORE_THRESHOLD
+                if method == "zscore"
+                else DEFAULT_MAD_THRESHOLD
+            )
+        self.threshold = threshold
+        self.min_samples = min_samples
+        self.sketch_k = sketch_k
+        self._counters: dict[Any, CounterStats] = {}
+
+    def __len__(self) -> int:
+        """Number of counters seen so far."""
+        return len(self._counters)
+
+    @property
+    def counters(self) -> dict[Any, CounterStats]:
+        """Running statistics per counter name."""
+        return self._counters
+
+    def add(self, record: dict[str, Any]) -> None:
+        """Fold one metering record into its counter's statistics."""
+        name = record.get("counterName")
+        stats = self._counters.get(name)
+        if stats is None:
+            sketch = QuantileSketch(self.sketch_k) if self.method == "mad" else None
+            stats = self._counters[name] = CounterStats(sketch=sketch)
+        stats.add(float(record.get("counterVolume", 0)))
+
+    def update(self, records: Iterable[dict[str, Any]]) -> OutlierDetector:
+        """Fold every record of an iterable; returns self for chaining."""
+        for record in records:
+            self.add(record)
+        return self
+
+    def merge(self, other: OutlierDetector) -> OutlierDetector:
+        """Fold in a detector over other records; returns self.
+
+        Raises:
+            ValueError: If the detectors use a different method or sketch_k
+        """
+        if other.method != self.method or other.sketch_k != self.sketch_k:
+            raise ValueError("Cannot merge detectors with different settings")
+        for name, theirs in other._counters.items():
+            mine = self._counters.get(name)
+            if mine is None:
+                sketch = QuantileSketch(self.sketch_k) if self.method == "mad" else None
+                mine = self._counters[name] = CounterStats(sketch=sketch)
+            mine.merge(theirs)
+        return self
+
+    def score(self, record: dict[str, Any]) -> float | None:
+        """Outlier score of a record against its counter's statistics so far.
+
+        Returns:
+            The z-score or modified z-score, or None if the counter has too
+            few readings or no spread
+        """
+        stats = self._counters.get(record.get("counterName"))
+        if stats is None or stats.count < self.min_samples:
+            return None
+        value = float(record.get("counterVolume", 0))
+
+        if self.method == "zscore":
+            std_dev = stats.std_dev
+            return abs(value - stats.mean) / std_dev if std_dev else None
+
+        robust = stats.median_and_mad()
+        if robust is None or not robust[1]:
+            return None
+        median, mad = robust
+        return _MAD_SCALE * abs(value - median) / mad
+
+    def is_outlier(self, record: dict[str, Any]) -> bool:
+        """Whether a record's score is above the threshold."""
+        score = self.score(record)
+        return score is not None and score > self.threshold
+
+    def screen(self, records: Iterable[dict[str, Any]]) -> Iterator[dict[str, Any]]:
+        """Yield outliers as they stream past, folding in every record.
+
+        Each record is judged against the readings before it, so the first
+        ``min_samples`` readings of a counter are never flagged.
+        """
+        for record in records:
+            flagged = self.is_outlier(record)
+            self.add(record)
+            if flagged:
+                yield record
+
+    def detect(self, records: Sequence[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Fold in the records, then return those that are outliers.
+
+        Unlike screen, every record is judged against the full statistics,
+        which needs two passes over the records.
+        """
+        self.update(records)
+        return [record for record in records if self.is_outlier(record)]
+
+
+def _weighted_quantile(items: Sequence[tuple[float, int]], q: float) -> float:
+    """Smallest value whose cumulative weight reaches q of the total."""
+    target = q * sum(weight for _, weight in items)
+    cumulative = 0
+    for value, weight in items:
+        cumulative += weight
+        if cumulative >= target:
+            return value
+    return items[-1][0]
@@ -0,0 +1,205 @@
+"""Materialized hour/day/month/year rollups of metering data.
+
+MeteringAggregator.aggregate_by_time_bucket returns raw records per bucket,
+so every coarser view re-scans and re-parses them. MeteringRollup ingests
+records once into hourly cells keyed by (counter, appKey, resource), each a
+mergeable RunningMetrics. Day, month and year cells are derived from the
+next finer level on first use, never from raw records, and range queries
+read only the cells of the buckets they cover.
+
+Bucket keys use MeteringAggregator.TIME_FORMATS, in each record's own
+offset, and every coarser key is a prefix of the finer one ("2024-01-05 13:00"
+-> "2024-01-05" -> "2024-01" -> "2024").
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable
+from dataclasses import replace
+from datetime import date, datetime
+from decimal import Decimal
+from functools import lru_cache
+from typing import Any
+
+from .constants import DEFAULT_TIMESTAMP_CACHE_SIZE
+from .metering_aggregator import AggregatedMetrics, MeteringAggregator, RunningMetrics
+from .timestamp_parser import parse_timestamp
+
+LEVELS = ("hour", "day", "month", "year")
+
+# Length of a bucket key at each level; a coarser key is a prefix of a finer
+KEY_LENGTHS = {"hour": 16, "day": 10, "month": 7, "year": 4}
+
+# (counterName, appKey, resourceId) of a cell
+CellKey = tuple[Any, Any, Any]
+Cells = dict[str, dict[CellKey, RunningMetrics]]
+
+# Sorts after every character used in bucket keys, for inclusive prefix bounds
+_PREFIX_END = "\x7f"
+
+_NO_DIMENSIONS: dict[str, Any] = {}
+
+
+class MeteringRollup:
+    """Rollup cube of metering records over hour/day/month/year buckets.
+
+    Example:
+        >>> rollup = MeteringRollup()
+        >>> rollup.update(records)
+        >>> rollup.query("day", "2024-01-01", "2024-01-07", counter_name="cpu")
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty rollup."""
+        self.record_count = 0
+        self._levels: dict[str, Cells] = {"hour": {}}
+        self._sorted_buckets: dict[str, list[str]] = {}
+
+    def add(self, record: dict[str, Any]) -> None:
+        """Fold one metering record into its hourly cell."""
+        timestamp_str = record.get("timestamp", "")
+        bucket = _hour_bucket(timestamp_str) if timestamp_str else None
+        timestamp = MeteringAggregator._parse_timestamp(timestamp_str)
+        if bucket is None:
+            # Unparseable stamps fall back to the current time, as elsewhere
+            bucket = timestamp.strftime(MeteringAggregator.TIME_FORMATS["hour"])
+        volume = Decimal(str(record.get("counterVolume", 0)))
+        key = (
+            record.get("counterName"),
+            record.get("appKey"),
+            record.get("resourceId"),
+        )
+
+        cells = self._levels["hour"].setdefault(bucket, {})
+        cell = cells.get(key)
+        if cell is None:
+            cell = RunningMetrics(_NO_DIMENSIONS, volume, volume, timestamp, timestamp)
+            cells[key] = cell
+        cell.add(volume, timestamp)
+        self.record_count += 1
+
+        if len(self._levels) > 1 or self._sorted_buckets:
+            # Derived levels and indexes are rebuilt on the next query
+            self._levels = {"hour": self._levels["hour"]}
+            self._sorted_buckets = {}
+
+    def update(self, records: Iterable[dict[str, Any]]) -> MeteringRollup:
+        """Fold every record of an iterable; returns self for chaining."""
+        for record in records:
+            self.add(record)
+        return self
+
+    def cell_counts(self) -> dict[str, int]:
+        """Number of cells at each level, materializing every level."""
+        return {
+            level: sum(len(cells) for cells in self.cells(level).values())
+            for level in LEVELS
+        }
+
+    def cells(self, level: str) -> Cells:
+        """Cells of one level as {bucket: {(counter, app, resource): metrics}}.
+
+        Raises:
+            ValueError: If the level is not hour, day, month or year
+        """
+        if level not in KEY_LENGTHS:
+            raise ValueError(f"Invalid bucket size: {level}")
+        if level not in self._levels:
+            finer = self.cells(LEVELS[LEVELS.index(level) - 1])
+            length = KEY_LENGTHS[level]
+            coarse: Cells = {}
+            # Merge in time order so ties resolve as a single pass would
+            for bucket in sorted(finer):
+                target = coarse.setdefault(bucket[:length], {})
+                for key, cell in finer[bucket].items():
+                    mine = target.get(key)
+                    if mine is None:
+                        target[key] = replace(cell)
+                    else:
+                        mine.merge(cell)
+            self._levels[level] = coarse
+        return self._levels[level]
+
+    def query(
+        self,
+        level: str,
+        start: str | date | None = None,
+        end: str | date | None = None,
+        *,
+        counter_name: str | None = None,
+        app_key: str | None = None,
+        resource_id: str | None = None,
+    ) -> dict[str, AggregatedMetrics]:
+        """Totals per bucket over an inclusive range, from precomputed cells.
+
+        Args:
+            level: Bucket size (hour, day, month, year)
+            start: First bucket, as a datetime, date or key prefix such as
+                "2024-01-03"; None for no lower bound
+            end: Last bucket, inclusive, in the same forms; None for no bound
+            counter_name: Only cells of this counter
+            app_key: Only cells of this app key
+            resource_id: Only cells of this resource
+
+        Returns:
+            Aggregated metrics per bucket key, in time order, over the cells
+            matching the filters; buckets with no match are omitted
+
+        Raises:
+            ValueError: If the level is not hour, day, month or year
+        """
+        cells = self.cells(level)
+        buckets = self._sorted_buckets.get(level)
+        if buckets is None:
+            buckets = self._sorted_buckets[level] = sorted(cells)
+
+        low = 0 if start is None else bisect_left(buckets, _bound(start, level))
+        high = (
+            len(buckets)
+            if end is None
+            else bisect_right(buckets, _bound(end, level) + _PREFIX_END)
+        )
+        wanted = (counter_name, app_key, resource_id)
+        dimensions = {
+            name: value
+            for name, value in zip(
+                ("counter_name", "app_key", "resource_id"), wanted, strict=True
+            )
+            if value is not None
+        }
+
+        results: dict[str, AggregatedMetrics] = {}
+        for bucket in buckets[low:high]:
+            total: RunningMetrics | None = None
+            for key, cell in cells[bucket].items():
+                if any(
+                    w is not None and w != k for w, k in zip(wanted, key, strict=True)
+                ):
+                    continue
+                if total is None:
+                    dims = {**dimensions, "time_bucket": bucket}
+                    total = replace(cell, dimension_values=dims)
+                else:
+                    total.merge(cell)
+            if total is not None:
+                results[bucket] = total.to_metrics()
+        return results
+
+
+@lru_cache(maxsize=DEFAULT_TIMESTAMP_CACHE_SIZE)
+def _hour_bucket(timestamp: str) -> str | None:
+    """Hour bucket key of a timestamp string, or None if it cannot be parsed."""
+    parsed = parse_timestamp(timestamp)
+    if parsed is None:
+        return None
+    return parsed.strftime(MeteringAggregator.TIME_FORMATS["hour"])
+
+
+def _bound(value: str | date, level: str) -> str:
+    """Bucket key prefix of a range bound at the given level."""
+    if isinstance(value, datetime):
+        value = value.strftime(MeteringAggregator.TIME_FORMATS["hour"])
+    elif isinstance(value, date):
+        value = value.isoformat()
+    return value[: KEY_LENGTHS[level]]
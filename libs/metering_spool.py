@@ -0,0 +1,465 @@
+"""Durable write-ahead spool for metering records.
+
+Records are appended to an on-disk spool before they are sent and
+acknowledged once the API accepted them, so meters that could not be
+delivered survive API outages and process crashes and can be replayed later.
+
+Layout of the spool directory:
+
+- ``<first seq>.seg``: append-only segment of framed records. Each frame is
+  a 16-byte header (sequence number, payload length, CRC-32 of the payload)
+  followed by the JSON-encoded meter. A segment is sealed and a new one
+  started once it reaches ``segment_bytes``.
+- ``<first seq>.ack``: sequence numbers acknowledged in that segment, as
+  8-byte big-endian integers.
+
+A sealed segment is deleted once every record in it is acknowledged. Frames
+are flushed to the OS on every append, so a process crash loses nothing;
+fsync runs at most every ``fsync_interval`` seconds, and a background timer
+syncs a burst's tail when no later append or ack does, so a machine crash
+loses at most the last ``fsync_interval`` seconds of writes. A torn frame at the end of the last segment is
+truncated on open. Delivery is at least once: a record whose ack was not yet
+on disk is sent again by the next replay.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import struct
+import threading
+import time
+import zlib
+from bisect import bisect_right
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Self
+
+from .constants import (
+    DEFAULT_INGEST_BATCH_SIZE,
+    DEFAULT_MAX_CONCURRENCY,
+    DEFAULT_METER_BATCH_BYTES,
+    DEFAULT_SPOOL_FSYNC_INTERVAL,
+    DEFAULT_SPOOL_SEGMENT_BYTES,
+)
+from .exceptions import APIRequestException
+from .http_client import HTTPMethod, RequestSpec
+from .json_codec import get_codec
+from .Metering import iter_meter_lists
+from .metering_ingest import IngestStats
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+    from .billing_types import MeteringData
+    from .http_client import BillingAPIClient
+
+logger = logging.getLogger(__name__)
+
+# Sequence number, payload length, CRC-32 of the payload
+_FRAME_HEADER = struct.Struct(">QII")
+_ACK = struct.Struct(">Q")
+_MAX_FRAME_PAYLOAD = 64 * 1024 * 1024
+
+
+@dataclass
+class _Segment:
+    """Bookkeeping for one segment file."""
+
+    first_seq: int
+    path: Path
+    count: int = 0
+    size: int = 0
+    acked_count: int = 0
+    # One bit per record, set once the record is acknowledged
+    acked: bytearray = field(default_factory=bytearray)
+
+    @property
+    def ack_path(self) -> Path:
+        return self.path.with_suffix(".ack")
+
+    @property
+    def pending(self) -> int:
+        return self.count - self.acked_count
+
+    def is_acked(self, seq: int) -> bool:
+        index = seq - self.first_seq
+        byte = index >> 3
+        return byte < len(self.acked) and bool(self.acked[byte] & (1 << (index & 7)))
+
+    def mark_acked(self, seq: int) -> bool:
+        """Set the ack bit; returns False if it was already set."""
+        index = seq - self.first_seq
+        byte = index >> 3
+        if byte >= len(self.acked):
+            self.acked.extend(bytes(byte + 1 - len(self.acked)))
+        bit = 1 << (index & 7)
+        if self.acked[byte] & bit:
+            return False
+        self.acked[byte] |= bit
+        self.acked_count += 1
+        return True
+
+
+def _read_frames(
+    stream: IO[bytes], end: int | None = None, *, verify: bool = True
+) -> Iterator[tuple[int, int, bytes]]:
+    """Yield ``(seq, end offset, payload)`` for each intact frame.
+
+    Stops at the first truncated or corrupt frame, or at ``end``. With
+    ``verify`` unset payloads are skipped rather than read and checked, and
+    the yielded payload is empty.
+    """
+    offset = stream.tell()
+    while end is None or offset < end:
+        header = stream.read(_FRAME_HEADER.size)
+        if len(header) < _FRAME_HEADER.size:
+            return
+        seq, length, checksum = _FRAME_HEADER.unpack(header)
+        if length > _MAX_FRAME_PAYLOAD:
+            return
+        if verify:
+            payload = stream.read(length)
+            if len(payload) < length or zlib.crc32(payload) != checksum:
+                return
+        else:
+            payload = b""
+            stream.seek(length, os.SEEK_CUR)
+        offset += _FRAME_HEADER.size + length
+        yield seq, offset, payload
+
+
+class MeteringSpool:
+    """Append-only on-disk spool of meters awaiting delivery.
+
+    Thread-safe. Memory use is one bit per unacknowledged-segment record,
+    independent of how many records the spool holds.
+
+    Example:
+        >>> with MeteringSpool("/var/spool/metering") as spool:
+        ...     manager = MeteringManager(month="2024-01", spool=spool)
+        ...     manager.replay_spool()  # resend anything left from last run
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        *,
+        segment_bytes: int = DEFAULT_SPOOL_SEGMENT_BYTES,
+        fsync_interval: float = DEFAULT_SPOOL_FSYNC_INTERVAL,
+    ) -> None:
+        """Open or create a spool, recovering any segments left on disk.
+
+        Args:
+            directory: Spool directory (created if missing)
+            segment_bytes: Size at which the active segment is sealed
+            fsync_interval: Seconds between fsyncs, and the longest a write
+                stays unsynced (0 syncs on every append)
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.segment_bytes = segment_bytes
+        self.fsync_interval = fsync_interval
+
+        self._codec = get_codec()
+        self._lock = threading.RLock()
+        self._segments: list[_Segment] = []
+        self._writer: IO[bytes] | None = None
+        self._ack_writers: dict[int, IO[bytes]] = {}
+        self._next_seq = 0
+        self._last_sync = time.monotonic()
+        self._dirty = False
+        self._sync_timer: threading.Timer | None = None
+        self._recover()
+
+    def __enter__(self) -> Self:
+        """Context manager entry."""
+        return self
+
+    def __exit__(
+        self,
+        _exc_type: type[BaseException] | None,
+        _exc_val: BaseException | None,
+        _exc_tb: object,
+    ) -> None:
+        """Context manager exit - sync and close files."""
+        self.close()
+
+    @property
+    def pending_count(self) -> int:
+        """Get the number of records not yet acknowledged."""
+        with self._lock:
+            return sum(segment.pending for segment in self._segments)
+
+    def append(self, meters: Iterable[MeteringData]) -> list[int]:
+        """Write meters to the spool ahead of sending them.
+
+        Args:
+            meters: Meter records to spool
+
+        Returns:
+            Sequence numbers to acknowledge once the meters are delivered
+        """
+        payloads = [self._codec.dumps(meter) for meter in meters]
+        if not payloads:
+            return []
+        with self._lock:
+            segment = self._active_segment()
+            seqs = list(range(self._next_seq, self._next_seq + len(payloads)))
+            frames = b"".join(
+                _FRAME_HEADER.pack(seq, len(payload), zlib.crc32(payload)) + payload
+                for seq, payload in zip(seqs, payloads, strict=True)
+            )
+            writer = self._open_writer(segment)
+            writer.write(frames)
+            writer.flush()
+            segment.count += len(seqs)
+            segment.size += len(frames)
+            self._next_seq += len(seqs)
+            self._dirty = True
+            self._maybe_sync()
+            if segment.size >= self.segment_bytes:
+                self._seal()
+        return seqs
+
+    def ack(self, seqs: Iterable[int]) -> None:
+        """Mark records as delivered; acking a record twice is harmless.
+
+        Args:
+            seqs: Sequence numbers returned by append
+        """
+        with self._lock:
+            firsts = [segment.first_seq for segment in self._segments]
+            touched: dict[int, list[int]] = {}
+            for seq in seqs:
+                position = bisect_right(firsts, seq) - 1
+                if position < 0:
+                    continue
+                segment = self._segments[position]
+                if seq < segment.first_seq + segment.count and segment.mark_acked(seq):
+                    touched.setdefault(position, []).append(seq)
+
+            for position, acked in touched.items():
+                segment = self._segments[position]
+                ack_writer = self._open_ack_writer(segment)
+                ack_writer.write(b"".join(_ACK.pack(seq) for seq in acked))
+                ack_writer.flush()
+            self._dirty = self._dirty or bool(touched)
+            self._maybe_sync()
+            self._drop_delivered()
+
+    def pending(self) -> Iterator[tuple[int, MeteringData]]:
+        """Stream unacknowledged records in spool order.
+
+        Only records appended before the call are returned. Records are read
+        from disk lazily, one segment at a time.
+
+        Yields:
+            ``(seq, meter)`` pairs
+        """
+        with self._lock:
+            if self._writer is not None:
+                self._writer.flush()
+            snapshot = [
+                (segment, segment.size) for segment in self._segments if segment.pending
+            ]
+
+        for segment, end in snapshot:
+            try:
+                stream = segment.path.open("rb")
+            except FileNotFoundError:
+                continue  # fully acknowledged and removed meanwhile
+            with stream:
+                offset = 0
+                for seq, offset, payload in _read_frames(stream, end):
+                    if not segment.is_acked(seq):
+                        yield seq, self._codec.loads(payload)
+                if offset < end:
+                    logger.error(
+                        f"Spool segment {segment.path} is corrupt at byte {offset}; "
+                        "skipping the rest of it"
+                    )
+
+    def replay(
+        self,
+        client: BillingAPIClient,
+        *,
+        batch_size: int = DEFAULT_INGEST_BATCH_SIZE,
+        max_batch_bytes: int = DEFAULT_METER_BATCH_BYTES,
+        max_in_flight: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> IngestStats:
+        """Send every pending record in ``meterList`` batches and ack them.
+
+        Records are streamed from disk with at most ``max_in_flight`` batches
+        outstanding. A batch the API rejects stays in the spool for the next
+        replay.
+
+        Args:
+            client: API client for the metering endpoint
+            batch_size: Maximum meters per request
+            max_batch_bytes: Maximum encoded size of one request body
+            max_in_flight: Maximum batches in flight at once
+
+        Returns:
+            Counters for the run
+
+        Raises:
+            ValidationException: If batch_size is out of range
+        """
+        stats = IngestStats()
+        # Seqs of meters pulled by the packer but not yet assigned to a batch
+        pulled: deque[int] = deque()
+        batch_seqs: dict[int, list[int]] = {}
+
+        def meters() -> Iterator[MeteringData]:
+            for seq, meter in self.pending():
+                pulled.append(seq)
+                stats.records += 1
+                yield meter
+
+        def specs() -> Iterator[RequestSpec]:
+            for index, batch in enumerate(
+                iter_meter_lists(meters(), batch_size, max_batch_bytes)
+            ):
+                batch_seqs[index] = [pulled.popleft() for _ in batch]
+                stats.batches += 1
+                yield RequestSpec(
+                    HTTPMethod.POST, "billing/meters", json_data={"meterList": batch}
+                )
+
+        for index, outcome in client.iter_requests(
+            specs(), max_concurrency=max_in_flight
+        ):
+            seqs = batch_seqs.pop(index)
+            if isinstance(outcome, APIRequestException):
+                stats.failed += len(seqs)
+                logger.error(f"Replaying {len(seqs)} spooled meters failed: {outcome}")
+            elif isinstance(outcome, Exception):
+                raise outcome
+            else:
+                self.ack(seqs)
+                stats.sent += len(seqs)
+
+        self.sync()
+        logger.info(f"Spool replay finished: {stats}")
+        return stats
+
+    def sync(self) -> None:
+        """Flush and fsync the active segment and ack files."""
+        with self._lock:
+            for stream in (self._writer, *self._ack_writers.values()):
+                if stream is not None:
+                    stream.flush()
+                    os.fsync(stream.fileno())
+            self._dirty = False
+            self._last_sync = time.monotonic()
+
+    def close(self) -> None:
+        """Sync and close the spool's files."""
+        with self._lock:
+            if self._sync_timer is not None:
+                self._sync_timer.cancel()
+                self._sync_timer = None
+            self.sync()
+            self._close_writers()
+
+    def _recover(self) -> None:
+        """Load segment state from disk and repair a torn tail."""
+        paths = sorted(self.directory.glob("*.seg"), key=lambda p: int(p.stem))
+        for position, path in enumerate(paths):
+            segment = _Segment(int(path.stem), path)
+            last = position == len(paths) - 1
+            with path.open("rb") as stream:
+                # Only the last segment can have been cut short by a crash
+                for _seq, offset, _payload in _read_frames(stream, verify=last):
+                    segment.count += 1
+                    segment.size = offset
+            if last and segment.size < path.stat().st_size:
+                logger.warning(
+                    f"Truncating torn write in {path} at byte {segment.size}"
+                )
+                os.truncate(path, segment.size)
+
+            if segment.ack_path.exists():
+                data = segment.ack_path.read_bytes()
+                usable = len(data) - len(data) % _ACK.size
+                for (seq,) in _ACK.iter_unpack(data[:usable]):
+                    if segment.first_seq <= seq < segment.first_seq + segment.count:
+                        segment.mark_acked(seq)
+            self._segments.append(segment)
+            self._next_seq = segment.first_seq + segment.count
+
+        self._drop_delivered()
+        if self.pending_count:
+            logger.info(f"Spool {self.directory} has {self.pending_count} pending")
+
+    def _active_segment(self) -> _Segment:
+        """Get the segment new records go to, starting one if needed."""
+        if not self._segments or self._segments[-1].size >= self.segment_bytes:
+            path = self.directory / f"{self._next_seq:020d}.seg"
+            self._segments.append(_Segment(self._next_seq, path))
+        return self._segments[-1]
+
+    def _open_writer(self, segment: _Segment) -> IO[bytes]:
+        if self._writer is None:
+            self._writer = segment.path.open("ab")
+        return self._writer
+
+    def _open_ack_writer(self, segment: _Segment) -> IO[bytes]:
+        writer = self._ack_writers.get(segment.first_seq)
+        if writer is None:
+            writer = self._ack_writers[segment.first_seq] = segment.ack_path.open("ab")
+        return writer
+
+    def _maybe_sync(self) -> None:
+        """Sync now if the interval has passed, else make sure a timer will."""
+        if not self._dirty:
+            return
+        remaining = self.fsync_interval - (time.monotonic() - self._last_sync)
+        if remaining <= 0:
+            self.sync()
+        elif self._sync_timer is None:
+            self._sync_timer = threading.Timer(remaining, self._timed_sync)
+            self._sync_timer.daemon = True
+            self._sync_timer.start()
+
+    def _timed_sync(self) -> None:
+        """Sync writes left dirty at the end of a burst."""
+        with self._lock:
+            self._sync_timer = None
+            if not self._dirty:
+                return
+            try:
+                self.sync()
+            except OSError:
+                logger.exception(f"Background sync of spool {self.directory} failed")
+
+    def _seal(self) -> None:
+        """Close the active segment so the next append starts a new one."""
+        self.sync()
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+    def _close_writers(self) -> None:
+        for stream in (self._writer, *self._ack_writers.values()):
+            if stream is not None:
+                stream.close()
+        self._writer = None
+        self._ack_writers.clear()
+
+    def _drop_delivered(self) -> None:
+        """Delete sealed segments whose records are all acknowledged."""
+        delivered = [
+            segment
+            for segment in self._segments[:-1]
+            if segment.pending == 0 and segment.count
+        ]
+        for segment in delivered:
+            writer = self._ack_writers.pop(segment.first_seq, None)
+            if writer is not None:
+                writer.close()
+            segment.path.unlink(missing_ok=True)
+            segment.ack_path.unlink(missing_ok=True)
+            self._segments.remove(segment)
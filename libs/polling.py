@@ -0,0 +1,162 @@
+"""Adaptive polling schedules and server-sent event parsing for progress checks."""
+
+from __future__ import annotations
+
+import random
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from .constants import (
+    DEFAULT_POLL_INITIAL_INTERVAL,
+    DEFAULT_POLL_JITTER,
+    DEFAULT_POLL_MAX_INTERVAL,
+    DEFAULT_POLL_MULTIPLIER,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+
+
+def progress_fraction(response: Any) -> float | None:
+    """Extract completion progress in [0, 1] from a progress response.
+
+    Reads ``progress``/``maxProgress`` from the top level, falling back to the
+    first entry of ``list`` (the batch progress shape). ``maxProgress``
+    defaults to 100 when only a percentage is reported.
+
+    Args:
+        response: Parsed progress response
+
+    Returns:
+        Fraction complete, or None if the response carries no progress
+    """
+    if not isinstance(response, dict):
+        return None
+
+    source = response
+    if "progress" not in source:
+        items = response.get("list")
+        if not isinstance(items, list) or not items or not isinstance(items[0], dict):
+            return None
+        source = items[0]
+
+    try:
+        progress = float(source["progress"])
+        max_raw = source.get("maxProgress")
+        max_progress = 100.0 if max_raw is None else float(max_raw)
+    except (KeyError, TypeError, ValueError):
+        return None
+
+    if max_progress <= 0:
+        return None
+    return min(max(progress / max_progress, 0.0), 1.0)
+
+
+@dataclass(frozen=True)
+class AdaptivePolling:
+    """Polling policy: quick first checks, then exponential backoff with jitter.
+
+    While progress is advancing, the delay is also capped by the estimated
+    time to completion, so a job that is about to finish is checked again
+    around when it should be done rather than after a full backoff step.
+    """
+
+    initial_interval: float = DEFAULT_POLL_INITIAL_INTERVAL
+    max_interval: float = DEFAULT_POLL_MAX_INTERVAL
+    multiplier: float = DEFAULT_POLL_MULTIPLIER
+    jitter: float = DEFAULT_POLL_JITTER
+
+    def schedule(
+        self,
+        clock: Callable[[], float] = time.monotonic,
+        rng: random.Random | None = None,
+    ) -> PollSchedule:
+        """Start a new schedule for one wait."""
+        return PollSchedule(self, clock=clock, rng=rng)
+
+
+class PollSchedule:
+    """Per-wait state of an AdaptivePolling policy."""
+
+    def __init__(
+        self,
+        policy: AdaptivePolling,
+        clock: Callable[[], float] = time.monotonic,
+        rng: random.Random | None = None,
+    ) -> None:
+        """Initialize the schedule.
+
+        Args:
+            policy: Polling policy to follow
+            clock: Monotonic time source
+            rng: Random source for jitter
+        """
+        self.policy = policy
+        self.attempt = 0
+        self._clock = clock
+        self._rng = rng or random.Random()  # nosec B311 - jitter, not crypto
+        self._last_progress: tuple[float, float] | None = None
+
+    def next_delay(self, response: Any = None) -> float:
+        """Get the delay before the next check.
+
+        Args:
+            response: Latest progress response, used to estimate completion
+
+        Returns:
+            Seconds to wait
+        """
+        policy = self.policy
+        delay = min(
+            policy.initial_interval * policy.multiplier**self.attempt,
+            policy.max_interval,
+        )
+        self.attempt += 1
+
+        fraction = progress_fraction(response)
+        if fraction is not None:
+            now = self._clock()
+            if self._last_progress is not None:
+                last_time, last_fraction = self._last_progress
+                if fraction > last_fraction and now > last_time:
+                    rate = (fraction - last_fraction) / (now - last_time)
+                    eta = (1.0 - fraction) / rate
+                    delay = min(delay, max(eta, policy.initial_interval))
+            self._last_progress = (now, fraction)
+
+        if policy.jitter:
+            delay *= self._rng.uniform(1 - policy.jitter, 1 + policy.jitter)
+        return float(min(max(delay, 0.0), policy.max_interval))
+
+
+def iter_sse_events(lines: Iterable[str]) -> Iterator[tuple[str, str]]:
+    """Parse server-sent event stream lines into events.
+
+    Args:
+        lines: Decoded lines of a text/event-stream body, without newlines
+
+    Yields:
+        ``(event, data)`` pairs; ``event`` defaults to ``"message"`` and
+        multi-line data is joined with newlines
+    """
+    event = ""
+    data: list[str] = []
+    for line in lines:
+        if not line:
+            if data:
+                yield event or "message", "\n".join(data)
+            event, data = "", []
+            continue
+        if line.startswith(":"):
+            continue
+
+        field, _, value = line.partition(":")
+        value = value.removeprefix(" ")
+        if field == "event":
+            event = value
+        elif field == "data":
+            data.append(value)
+
+    if data:
+        yield event or "message", "\n".join(data)
@@ -0,0 +1,369 @@
+"""Built-in per-endpoint request statistics for the API clients.
+
+Every request is recorded under its method and a normalized endpoint
+template (ID-like path segments become ``{id}``), with log-bucketed latency
+histograms for the whole request and its connect, time-to-first-byte and
+transfer phases, byte counts, retries and connection reuse. Works without
+OpenTelemetry. Set ``BILLING_REQUEST_STATS_FILE`` to have the process-wide
+stats written there as JSON at interpreter exit.
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import logging
+import math
+import os
+import re
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from fnmatch import fnmatchcase
+from functools import cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+    import requests
+
+logger = logging.getLogger(__name__)
+
+STATS_FILE_ENV_VAR = "BILLING_REQUEST_STATS_FILE"
+
+# Whole-segment ID shapes: numbers, UUIDs, long hex strings and prefixed IDs
+# such as PG-0001 or c-1; version segments like v1 are left alone
+_ID_SEGMENT = re.compile(
+    r"^\d+$|^[0-9a-f-]{32,36}$|^[0-9a-f]{16,}$|^[a-z]+[-_][\w-]*\d[\w-]*$",
+    re.IGNORECASE,
+)
+
+
+def endpoint_template(endpoint: str, patterns: Iterable[str] = ()) -> str:
+    """Normalize an endpoint path so requests for different IDs share stats.
+
+    Args:
+        endpoint: Endpoint path, optionally with a query string
+        patterns: Glob patterns used verbatim as the template when they match,
+            for IDs the built-in rule misses (e.g. ``billing/coupons/*``)
+
+    Returns:
+        The first matching pattern, else the path with every numeric,
+        UUID, long hex or prefixed-ID segment replaced by ``{id}``
+    """
+    path = endpoint.split("?", 1)[0].strip("/")
+    for pattern in patterns:
+        if fnmatchcase(path, pattern.strip("/")):
+            return pattern.strip("/")
+    return "/".join(
+        "{id}" if _ID_SEGMENT.match(segment) else segment for segment in path.split("/")
+    )
+
+
+class LatencyHistogram:
+    """Log-bucketed histogram of durations in milliseconds.
+
+    Bucket ``i`` holds values up to ``MIN_VALUE * GROWTH**i``, so recording
+    is O(1) and quantiles, reported as bucket upper bounds (never above the
+    exact maximum), overestimate by at most ``GROWTH - 1`` (about 9%).
+    Not thread-safe on its own.
+    """
+
+    MIN_VALUE = 0.01
+    GROWTH = 2**0.125
+
+    def __init__(self) -> None:
+        """Initialize an empty histogram."""
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self._buckets: dict[int, int] = {}
+
+    def record(self, value_ms: float) -> None:
+        """Add a duration in milliseconds."""
+        value_ms = max(value_ms, 0.0)
+        index = 0
+        if value_ms > self.MIN_VALUE:
+            index = math.ceil(math.log(value_ms / self.MIN_VALUE, self.GROWTH))
+        self._buckets[index] = self._buckets.get(index, 0) + 1
+        self.count += 1
+        self.total += value_ms
+        self.max = max(self.max, value_ms)
+
+    def quantile(self, q: float) -> float:
+        """Get the approximate ``q`` quantile (0 to 1) in milliseconds."""
+        if not self.count:
+            return 0.0
+        rank = max(math.ceil(q * self.count), 1)
+        seen = 0
+        for index in sorted(self._buckets):
+            seen += self._buckets[index]
+            if seen >= rank:
+                return min(self.MIN_VALUE * self.GROWTH**index, self.max)
+        return self.max
+
+    def summary(self) -> dict[str, float]:
+        """Get count, mean, p50, p90, p99 and max, rounded to microseconds."""
+        summary = {
+            "mean": self.total / self.count if self.count else 0.0,
+            "p50": self.quantile(0.5),
+            "p90": self.quantile(0.9),
+            "p99": self.quantile(0.99),
+            "max": self.max,
+        }
+        return {"count": self.count, **{k: round(v, 3) for k, v in summary.items()}}
+
+
+@dataclass
+class RequestPhases:
+    """Phase timings in seconds of one ``requests`` call on this thread.
+
+    ``connect`` is the time spent opening new connections (zero when a
+    pooled connection was reused), ``ttfb`` the rest of the time until the
+    last response's headers arrived, and ``transfer`` the time reading its
+    body. ``responses`` counts the responses seen, retried ones included.
+    """
+
+    connect: float = 0.0
+    new_connections: int = 0
+    responses: int = 0
+    ttfb: float | None = None
+    transfer: float | None = None
+    _headers_at: float | None = None
+
+    def finish(self) -> None:
+        """Mark the response body as fully read."""
+        if self._headers_at is not None:
+            self.transfer = time.perf_counter() - self._headers_at
+
+
+@dataclass
+class _EndpointStats:
+    """Mutable counters for one method and endpoint template."""
+
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+    connect: LatencyHistogram = field(default_factory=LatencyHistogram)
+    ttfb: LatencyHistogram = field(default_factory=LatencyHistogram)
+    transfer: LatencyHistogram = field(default_factory=LatencyHistogram)
+    errors: int = 0
+    bytes_sent: int = 0
+    bytes_received: int = 0
+    retries: int = 0
+    reused_connections: int = 0
+    new_connections: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to the snapshot representation."""
+        known = self.reused_connections + self.new_connections
+        return {
+            "count": self.latency.count,
+            "errors": self.errors,
+            "latency_ms": self.latency.summary(),
+            "phases_ms": {
+                "connect": self.connect.summary(),
+                "ttfb": self.ttfb.summary(),
+                "transfer": self.transfer.summary(),
+            },
+            "bytes_sent": self.bytes_sent,
+            "bytes_received": self.bytes_received,
+            "retries": self.retries,
+            "connection_reuse_ratio": (
+                round(self.reused_connections / known, 4) if known else None
+            ),
+        }
+
+
+class RequestStats:
+    """Thread-safe per-endpoint request statistics with snapshot/reset."""
+
+    def __init__(self, templates: Iterable[str] = ()) -> None:
+        """Initialize empty statistics.
+
+        Args:
+            templates: Extra glob patterns for endpoint_template
+        """
+        self.templates = tuple(templates)
+        self._endpoints: dict[str, _EndpointStats] = {}
+        self._lock = threading.Lock()
+        self._dump_paths: set[Path] = set()
+
+    def record(
+        self,
+        method: str,
+        endpoint: str,
+        status_code: int | None,
+        latency: float,
+        *,
+        phases: RequestPhases | None = None,
+        bytes_sent: int = 0,
+        bytes_received: int = 0,
+        retries: int = 0,
+    ) -> None:
+        """Record one finished request.
+
+        Args:
+            method: HTTP method
+            endpoint: Endpoint path as requested
+            status_code: Response status, or None if no response arrived
+            latency: Total time in seconds, including retries
+            phases: Phase timings of the final attempt, when captured
+            bytes_sent: Request body size
+            bytes_received: Response body size
+            retries: Attempts made after the first
+        """
+        key = f"{method} {endpoint_template(endpoint, self.templates)}"
+        with self._lock:
+            stats = self._endpoints.get(key)
+            if stats is None:
+                stats = self._endpoints[key] = _EndpointStats()
+
+            stats.latency.record(latency * 1000)
+            if status_code is None or status_code >= 400:
+                stats.errors += 1
+            stats.bytes_sent += bytes_sent
+            stats.bytes_received += bytes_received
+            stats.retries += retries
+
+            if phases is not None and phases.ttfb is not None:
+                stats.connect.record(phases.connect * 1000)
+                stats.ttfb.record(phases.ttfb * 1000)
+                stats.transfer.record((phases.transfer or 0.0) * 1000)
+                if phases.new_connections:
+                    stats.new_connections += 1
+                else:
+                    stats.reused_connections += 1
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """Get the statistics of every ``"METHOD template"`` key recorded so far."""
+        with self._lock:
+            return {key: stats.to_dict() for key, stats in self._endpoints.items()}
+
+    def reset(self) -> None:
+        """Discard everything recorded so far."""
+        with self._lock:
+            self._endpoints.clear()
+
+    def dump(self, path: str | Path) -> None:
+        """Write a snapshot to a JSON file.
+
+        Args:
+            path: Output file path; parent directories are created
+        """
+        output = Path(path)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        report = {
+            "generated_at": datetime.now(UTC).isoformat(),
+            "endpoints": self.snapshot(),
+        }
+        output.write_text(json.dumps(report, indent=2, sort_keys=True) + "\n")
+
+    def dump_at_exit(self, path: str | Path) -> None:
+        """Write a snapshot to ``path`` when the interpreter exits."""
+        output = Path(path)
+        with self._lock:
+            if output in self._dump_paths:
+                return
+            self._dump_paths.add(output)
+        atexit.register(self._dump_quietly, output)
+
+    def _dump_quietly(self, path: Path) -> None:
+        """Dump at exit, logging instead of raising."""
+        try:
+            self.dump(path)
+        except OSError as e:
+            logger.warning(f"Could not write request stats to {path}: {e}")
+
+
+@cache
+def get_request_stats() -> RequestStats:
+    """Get the process-wide stats used by clients not given their own.
+
+    The first call registers an exit-time dump to ``BILLING_REQUEST_STATS_FILE``
+    when that environment variable is set.
+    """
+    stats = RequestStats()
+    path = os.environ.get(STATS_FILE_ENV_VAR)
+    if path:
+        stats.dump_at_exit(path)
+    return stats
+
+
+_local = threading.local()
+
+
+@contextmanager
+def capture_phases() -> Iterator[RequestPhases]:
+    """Capture phase timings of requests made on this thread inside the block.
+
+    Needs a session with a PhaseTimingAdapter mounted and
+    ``mark_headers_received`` among its response hooks.
+    """
+    phases = RequestPhases()
+    previous = getattr(_local, "phases", None)
+    _local.phases = phases
+    try:
+        yield phases
+    finally:
+        _local.phases = previous
+
+
+def mark_headers_received(
+    response: requests.Response, *_args: Any, **_kwargs: Any
+) -> requests.Response:
+    """Session response hook recording the time-to-first-byte phase."""
+    phases: RequestPhases | None = getattr(_local, "phases", None)
+    if phases is not None:
+        phases.responses += 1
+        phases._headers_at = time.perf_counter()
+        phases.ttfb = max(response.elapsed.total_seconds() - phases.connect, 0.0)
+    return response
+
+
+def _record_connect(seconds: float) -> None:
+    """Add a new connection's setup time to the current capture, if any."""
+    phases: RequestPhases | None = getattr(_local, "phases", None)
+    if phases is not None:
+        phases.connect += seconds
+        phases.new_connections += 1
+
+
+class _TimedHTTPConnection(HTTPConnection):
+    def connect(self) -> None:
+        started = time.perf_counter()
+        super().connect()
+        _record_connect(time.perf_counter() - started)
+
+
+class _TimedHTTPSConnection(HTTPSConnection):
+    def connect(self) -> None:
+        started = time.perf_counter()
+        super().connect()
+        _record_connect(time.perf_counter() - started)
+
+
+class _TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+
+class PhaseTimingAdapter(HTTPAdapter):
+    """HTTPAdapter whose connections report their setup time to capture_phases."""
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        """Create the pool manager with timed connection pools."""
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _TimedHTTPConnectionPool,
+            "https": _TimedHTTPSConnectionPool,
+        }
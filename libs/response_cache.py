@@ -0,0 +1,231 @@
+"""TTL/LRU response cache for idempotent GET requests.
+
+The cache is opt-in: pass a ResponseCache to BillingAPIClient and repeated
+GETs of the same URL, query and headers are answered locally until their
+TTL expires. Expired entries that carry an ETag are revalidated with
+If-None-Match, so an unchanged resource costs a 304 instead of a full body.
+"""
+
+from __future__ import annotations
+
+import copy
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from fnmatch import fnmatchcase
+from typing import TYPE_CHECKING, Any
+
+from .constants import DEFAULT_CACHE_MAX_ENTRIES, DEFAULT_CACHE_TTL
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable, Mapping
+
+
+@dataclass
+class CacheStats:
+    """Counters describing cache effectiveness.
+
+    ``misses`` counts every lookup that had no fresh entry; ``revalidations``
+    is the subset of those misses the server answered with 304 Not Modified.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    revalidations: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        """Fraction of lookups answered without transferring a body."""
+        lookups = self.hits + self.misses
+        if not lookups:
+            return 0.0
+        return (self.hits + self.revalidations) / lookups
+
+    def to_dict(self) -> dict[str, int]:
+        """Convert counters to a plain dictionary."""
+        return asdict(self)
+
+
+@dataclass
+class CacheEntry:
+    """Cached response body with its validator and expiry time."""
+
+    data: dict[str, Any]
+    etag: str | None
+    expires_at: float
+
+    def is_fresh(self, now: float) -> bool:
+        """Check whether the entry can be served without revalidation."""
+        return now < self.expires_at
+
+
+class ResponseCache:
+    """Thread-safe LRU cache of GET response bodies with per-endpoint TTLs.
+
+    TTLs are chosen by matching the endpoint path against glob patterns in
+    ``endpoint_ttls`` (first match wins), falling back to ``default_ttl``.
+    A TTL of zero or less disables caching for matching endpoints, e.g.
+    ``{"billing/admin/contracts/*/products/prices": 300, "billing/admin/*": 0}``.
+    ``default_ttl`` is zero unless given, so only the listed endpoints are
+    cached and polled endpoints such as batch progress always go out.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_CACHE_MAX_ENTRIES,
+        default_ttl: float = DEFAULT_CACHE_TTL,
+        endpoint_ttls: Mapping[str, float] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of cached responses before LRU eviction
+            default_ttl: TTL in seconds for endpoints without a specific rule;
+                zero disables caching for them
+            endpoint_ttls: Glob pattern to TTL in seconds, matched in order
+            clock: Monotonic time source, injectable for tests
+        """
+        if max_entries < 1:
+            msg = f"max_entries must be positive, got {max_entries}"
+            raise ValueError(msg)
+
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self.endpoint_ttls = dict(endpoint_ttls or {})
+        self._clock = clock
+
+        self._entries: OrderedDict[Hashable, CacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = CacheStats()
+        self._generation = 0
+
+    def __len__(self) -> int:
+        """Get the number of cached responses."""
+        with self._lock:
+            return len(self._entries)
+
+    @property
+    def stats(self) -> CacheStats:
+        """Get a snapshot of the cache counters."""
+        with self._lock:
+            return CacheStats(**self._stats.to_dict())
+
+    @property
+    def generation(self) -> int:
+        """Get the invalidation generation.
+
+        Capture this before sending a request and pass it to ``store`` so a
+        response that raced with an invalidation is not cached.
+        """
+        with self._lock:
+            return self._generation
+
+    def ttl_for(self, endpoint: str) -> float:
+        """Get the TTL in seconds for an endpoint path."""
+        path = endpoint.lstrip("/")
+        for pattern, ttl in self.endpoint_ttls.items():
+            if fnmatchcase(path, pattern.lstrip("/")):
+                return ttl
+        return self.default_ttl
+
+    def get(self, key: Hashable) -> dict[str, Any] | None:
+        """Get a fresh cached response body.
+
+        A fresh entry counts as a hit and becomes most recently used. Anything
+        else counts as a miss; stale entries are kept only if they carry an
+        ETag, so the caller can revalidate them via ``etag_for``.
+
+        Args:
+            key: Request cache key
+
+        Returns:
+            A copy of the cached body, or None when it must be fetched
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.is_fresh(self._clock()):
+                self._entries.move_to_end(key)
+                self._stats.hits += 1
+                data = entry.data
+            else:
+                self._stats.misses += 1
+                if entry is not None and entry.etag is None:
+                    del self._entries[key]
+                return None
+        return copy.deepcopy(data)
+
+    def etag_for(self, key: Hashable) -> str | None:
+        """Get the ETag of a cached entry for an If-None-Match header."""
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry.etag if entry is not None else None
+
+    def store(
+        self,
+        key: Hashable,
+        data: dict[str, Any],
+        ttl: float,
+        etag: str | None = None,
+        generation: int | None = None,
+    ) -> None:
+        """Cache a response body.
+
+        Args:
+            key: Request cache key
+            data: Parsed response body
+            ttl: Seconds the response stays fresh
+            etag: Optional validator for conditional revalidation
+            generation: Generation captured before the request was sent; the
+                response is dropped if the cache was invalidated since
+        """
+        if ttl <= 0:
+            return
+
+        entry = CacheEntry(
+            data=copy.deepcopy(data), etag=etag, expires_at=self._clock() + ttl
+        )
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats.evictions += 1
+
+    def revalidate(self, key: Hashable, ttl: float) -> dict[str, Any] | None:
+        """Mark a stale entry fresh again after a 304 Not Modified.
+
+        Args:
+            key: Request cache key
+            ttl: Seconds the response stays fresh
+
+        Returns:
+            A copy of the cached body, or None if the entry is gone
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            entry.expires_at = self._clock() + ttl
+            self._entries.move_to_end(key)
+            self._stats.revalidations += 1
+            data = entry.data
+        return copy.deepcopy(data)
+
+    def invalidate(self) -> None:
+        """Drop every cached response, e.g. after a mutating request."""
+        with self._lock:
+            self._generation += 1
+            if self._entries:
+                self._entries.clear()
+                self._stats.invalidations += 1
+
+    def reset_stats(self) -> None:
+        """Reset all counters to zero."""
+        with self._lock:
+            self._stats = CacheStats()
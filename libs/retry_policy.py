@@ -0,0 +1,220 @@
+"""Deadline-aware retry policy shared by every retry layer.
+
+A RetryPolicy decides how long to back off (full jitter, capped) and whether
+a retry may happen at all. A retry is refused when the backoff would run
+past the caller's deadline, or when the client-wide RetryBudget is spent.
+Deadlines are set with ``deadline()`` and propagate through ``contextvars``
+to every nested call in the same thread or task, so a decorated function,
+the client under it and urllib3 under that all share one time limit.
+"""
+
+from __future__ import annotations
+
+import random
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING
+
+from .constants import (
+    DEFAULT_BACKOFF_MAX,
+    DEFAULT_RETRY_BUDGET_RATIO,
+    DEFAULT_RETRY_BUDGET_RESERVE,
+)
+from .exceptions import TimeoutException
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+_deadline: ContextVar[float | None] = ContextVar("billing_deadline", default=None)
+
+
+@contextmanager
+def deadline(seconds: float) -> Iterator[float]:
+    """Bound everything inside the block, including nested calls, to a time limit.
+
+    A nested deadline can only shorten the one around it.
+
+    Args:
+        seconds: Time limit from now
+
+    Yields:
+        The effective deadline on the ``time.monotonic`` clock
+    """
+    expires_at = time.monotonic() + seconds
+    current = _deadline.get()
+    if current is not None:
+        expires_at = min(expires_at, current)
+
+    token = _deadline.set(expires_at)
+    try:
+        yield expires_at
+    finally:
+        _deadline.reset(token)
+
+
+def remaining_time() -> float | None:
+    """Get the seconds left before the current deadline.
+
+    Returns:
+        Seconds left (negative once passed), or None without a deadline
+    """
+    expires_at = _deadline.get()
+    if expires_at is None:
+        return None
+    return expires_at - time.monotonic()
+
+
+def check_deadline(operation: str) -> float | None:
+    """Get the seconds left before the current deadline, failing once it passed.
+
+    Args:
+        operation: Name of the operation, for the error
+
+    Returns:
+        Seconds left, or None without a deadline
+
+    Raises:
+        TimeoutException: If the deadline has passed
+    """
+    remaining = remaining_time()
+    if remaining is not None and remaining <= 0:
+        msg = f"Deadline exceeded before {operation}"
+        raise TimeoutException(msg, operation=operation)
+    return remaining
+
+
+@dataclass
+class RetryBudgetStats:
+    """Counters for a retry budget."""
+
+    requests: int = 0
+    retries: int = 0
+    rejected: int = 0
+
+    def to_dict(self) -> dict[str, int]:
+        """Convert counters to a plain dictionary."""
+        return asdict(self)
+
+
+class RetryBudget:
+    """Token bucket that keeps retries to a fraction of requests.
+
+    Every request deposits ``ratio`` tokens and every retry withdraws one.
+    The bucket starts with, and never holds more than, ``reserve`` tokens:
+    a short burst of failures can retry freely, but a sustained outage is
+    limited to ``ratio`` retries per request instead of multiplying load.
+    """
+
+    def __init__(
+        self,
+        ratio: float = DEFAULT_RETRY_BUDGET_RATIO,
+        reserve: int = DEFAULT_RETRY_BUDGET_RESERVE,
+    ) -> None:
+        """Initialize the budget.
+
+        Args:
+            ratio: Retries earned per request
+            reserve: Retries available up front and cap on saved retries
+        """
+        if ratio < 0 or reserve < 0:
+            msg = f"ratio and reserve must not be negative, got {ratio}, {reserve}"
+            raise ValueError(msg)
+
+        self.ratio = ratio
+        self.reserve = reserve
+        self._tokens = float(reserve)
+        self._stats = RetryBudgetStats()
+        self._lock = threading.Lock()
+
+    @property
+    def stats(self) -> RetryBudgetStats:
+        """Get a snapshot of the budget counters."""
+        with self._lock:
+            return RetryBudgetStats(**self._stats.to_dict())
+
+    @property
+    def available(self) -> float:
+        """Get the number of retries currently affordable."""
+        with self._lock:
+            return self._tokens
+
+    def record_request(self) -> None:
+        """Deposit the retry allowance earned by one request."""
+        with self._lock:
+            self._stats.requests += 1
+            self._tokens = min(self._tokens + self.ratio, float(self.reserve))
+
+    def try_spend(self) -> bool:
+        """Withdraw one retry if the budget allows it."""
+        with self._lock:
+            if self._tokens < 1:
+                self._stats.rejected += 1
+                return False
+            self._tokens -= 1
+            self._stats.retries += 1
+            return True
+
+
+class RetryPolicy:
+    """Full-jitter exponential backoff bounded by deadlines and a retry budget."""
+
+    def __init__(
+        self,
+        backoff_factor: float = 2.0,
+        backoff_max: float = DEFAULT_BACKOFF_MAX,
+        budget: RetryBudget | None = None,
+        rng: random.Random | None = None,
+    ) -> None:
+        """Initialize the policy.
+
+        Args:
+            backoff_factor: Base of the exponential backoff in seconds
+            backoff_max: Cap on a single backoff sleep in seconds
+            budget: Optional retry budget shared by everything using the policy
+            rng: Random source for jitter
+        """
+        self.backoff_factor = backoff_factor
+        self.backoff_max = backoff_max
+        self.budget = budget
+        self._rng = rng or random.Random()  # nosec B311 - jitter, not crypto
+
+    def backoff(self, consecutive_errors: int) -> float:
+        """Get a full-jitter backoff before the next retry.
+
+        Args:
+            consecutive_errors: Failed attempts in a row so far
+
+        Returns:
+            Seconds drawn uniformly from zero to the capped exponential backoff
+        """
+        if consecutive_errors < 1:
+            return 0.0
+        ceiling = min(
+            self.backoff_factor * 2.0 ** (consecutive_errors - 1), self.backoff_max
+        )
+        return self._rng.uniform(0.0, max(ceiling, 0.0))
+
+    def record_request(self) -> None:
+        """Count a new request towards the retry budget."""
+        if self.budget is not None:
+            self.budget.record_request()
+
+    def admit(self, wait: float) -> bool:
+        """Check whether a retry after ``wait`` seconds may go ahead.
+
+        Refuses retries that would start after the current deadline without
+        touching the budget; otherwise spends one retry from the budget.
+
+        Args:
+            wait: Seconds the caller will sleep before retrying
+
+        Returns:
+            True if the caller should retry
+        """
+        remaining = remaining_time()
+        if remaining is not None and wait >= remaining:
+            return False
+        return self.budget is None or self.budget.try_spend()
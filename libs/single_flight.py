@@ -0,0 +1,142 @@
+"""Single-flight coalescing of concurrent identical calls.
+
+When many threads ask for the same thing at once, only the first (the
+leader) does the work; the others wait for it and share its outcome. Used by
+BillingAPIClient to collapse polling storms of identical GETs into one
+in-flight request.
+"""
+
+from __future__ import annotations
+
+import copy
+import threading
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING, Generic, TypeVar, cast
+
+from .exceptions import TimeoutException
+from .retry_policy import check_deadline
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable
+
+T = TypeVar("T")
+
+
+@dataclass
+class CoalescingStats:
+    """Counters for coalesced calls.
+
+    ``executed`` counts calls that did the work; ``collapsed`` counts calls
+    that waited on an identical in-flight call instead.
+    """
+
+    executed: int = 0
+    collapsed: int = 0
+
+    def to_dict(self) -> dict[str, int]:
+        """Convert counters to a plain dictionary."""
+        return asdict(self)
+
+
+class _Call(Generic[T]):
+    """Outcome of one in-flight call, shared with its waiters."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.waiters = 0
+        self.result: T | None = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight(Generic[T]):
+    """Collapse concurrent calls that share a key into one execution.
+
+    Waiters receive a deep copy of the leader's result, so no caller can
+    mutate another caller's data. If the leader raises, every waiter
+    re-raises the same exception. Waiters stop waiting at their own
+    ``deadline()``, if any. Calls made after the leader finishes start a new
+    flight; nothing is cached.
+    """
+
+    def __init__(self) -> None:
+        """Initialize with no calls in flight."""
+        self._calls: dict[Hashable, _Call[T]] = {}
+        self._lock = threading.Lock()
+        self._stats = CoalescingStats()
+
+    @property
+    def stats(self) -> CoalescingStats:
+        """Get a snapshot of the coalescing counters."""
+        with self._lock:
+            return CoalescingStats(**self._stats.to_dict())
+
+    def reset_stats(self) -> None:
+        """Reset all counters to zero."""
+        with self._lock:
+            self._stats = CoalescingStats()
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        """Run ``fn`` unless an identical call is already in flight.
+
+        Args:
+            key: Identity of the call; equal keys are coalesced
+            fn: Work to run when this caller becomes the leader
+
+        Returns:
+            The result of ``fn``, or a copy of the in-flight leader's result
+
+        Raises:
+            TimeoutException: If this caller's deadline passes while it waits
+                on another caller's flight
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = _Call()
+                self._calls[key] = call
+                self._stats.executed += 1
+                leader = True
+            else:
+                call.waiters += 1
+                self._stats.collapsed += 1
+                leader = False
+
+        if not leader:
+            operation = "coalesced call"
+            timeout = check_deadline(operation)
+            if not call.done.wait(timeout):
+                msg = f"Deadline exceeded waiting on {operation}"
+                raise TimeoutException(
+                    msg, timeout_seconds=timeout, operation=operation
+                )
+            if call.error is not None:
+                raise call.error
+            return copy.deepcopy(cast("T", call.result))
+
+        try:
+            result = fn()
+        except BaseException as e:
+            call.error = e
+            self._land(key, call)
+            raise
+
+        # Snapshot for waiters so the leader's caller can mutate its result
+        try:
+            if self._land(key, call):
+                call.result = copy.deepcopy(result)
+        finally:
+            call.done.set()
+        return result
+
+    def _land(self, key: Hashable, call: _Call[T]) -> int:
+        """End a flight so new callers start afresh; return its waiter count.
+
+        Waiters are released immediately on error. On success the leader
+        releases them once the shared result is in place.
+        """
+        with self._lock:
+            del self._calls[key]
+            waiters = call.waiters
+        if call.error is not None:
+            call.done.set()
+        return waiters
@@ -0,0 +1,316 @@
+"""In-process transports that call a WSGI application instead of a server.
+
+WSGIAdapter is a ``requests`` adapter and AsyncWSGITransport an ``httpx``
+transport; both hand each request straight to a WSGI callable (such as
+``mock_server.app``) in the calling process. Status, reason, headers
+(repeated ones included), cookies and streamed bodies come through as a
+server would send them, but no socket, server thread or HTTP parsing is
+involved, so tests and benchmarks measure handler cost alone.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import io
+import logging
+import sys
+from http.client import HTTPMessage
+from itertools import chain
+from typing import TYPE_CHECKING, Any
+from urllib.parse import unquote_to_bytes, urlsplit
+
+from requests.adapters import HTTPAdapter
+from requests.exceptions import RetryError
+from urllib3.exceptions import MaxRetryError
+from urllib3.response import HTTPResponse
+
+# Optional import - the async transport needs httpx
+try:
+    import httpx
+
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from wsgiref.types import WSGIApplication
+
+    import requests
+    from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+REMOTE_ADDR = "127.0.0.1"
+
+# Sent when the application raises, as waitress does
+_ERROR_BODY = b"Internal Server Error"
+
+
+def _read_body(request: requests.PreparedRequest) -> bytes:
+    """Get the full body of a prepared request as bytes."""
+    # Streamed uploads arrive as files or iterables despite the annotation
+    body: Any = request.body
+    if body is None:
+        return b""
+    if isinstance(body, str):
+        return body.encode("utf-8")
+    if isinstance(body, bytes):
+        return body
+    if hasattr(body, "read"):
+        data = body.read()
+        return data.encode("utf-8") if isinstance(data, str) else bytes(data)
+    return b"".join(
+        chunk.encode("utf-8") if isinstance(chunk, str) else bytes(chunk)
+        for chunk in body
+    )
+
+
+def build_environ(request: requests.PreparedRequest, body: bytes) -> dict[str, Any]:
+    """Build the PEP 3333 environ a server would pass for a request.
+
+    Args:
+        request: Prepared request to translate
+        body: Request body, already read
+
+    Returns:
+        WSGI environ dictionary
+    """
+    url = urlsplit(request.url or "")
+    scheme = url.scheme or "http"
+    environ: dict[str, Any] = {
+        "REQUEST_METHOD": request.method or "GET",
+        "SCRIPT_NAME": "",
+        # WSGI strings carry the raw path bytes as latin-1
+        "PATH_INFO": unquote_to_bytes(url.path or "/").decode("latin-1"),
+        "QUERY_STRING": url.query,
+        "SERVER_NAME": url.hostname or "localhost",
+        "SERVER_PORT": str(url.port or (443 if scheme == "https" else 80)),
+        "SERVER_PROTOCOL": "HTTP/1.1",
+        "REMOTE_ADDR": REMOTE_ADDR,
+        "HTTP_HOST": url.netloc,
+        "wsgi.version": (1, 0),
+        "wsgi.url_scheme": scheme,
+        "wsgi.input": io.BytesIO(body),
+        "wsgi.errors": sys.stderr,
+        "wsgi.multithread": True,
+        "wsgi.multiprocess": False,
+        "wsgi.run_once": False,
+    }
+    if body:
+        environ["CONTENT_LENGTH"] = str(len(body))
+
+    for name, value in request.headers.items():
+        key = name.upper().replace("-", "_")
+        if key in ("CONTENT_TYPE", "CONTENT_LENGTH"):
+            environ[key] = value
+        else:
+            environ[f"HTTP_{key}"] = value
+    return environ
+
+
+class _WSGIResponseBody(io.RawIOBase):
+    """Lazily read WSGI response body.
+
+    Also stands in for the ``http.client.HTTPResponse`` urllib3 wraps, so
+    ``requests`` can read cookies from ``msg`` as it does for a socket.
+    """
+
+    def __init__(
+        self,
+        chunks: Iterator[bytes],
+        result: Iterable[bytes],
+        headers: list[tuple[str, str]],
+        method: str,
+    ) -> None:
+        super().__init__()
+        self._chunks = chunks
+        self._result = result
+        self._pending = b""
+        self._method = method
+        self.msg = HTTPMessage()
+        for name, value in headers:
+            self.msg[name] = value
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        while not self._pending:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                self.close()
+                return 0
+            self._pending = chunk
+
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
+
+    def isclosed(self) -> bool:
+        return self.closed
+
+    def close(self) -> None:
+        if not self.closed:
+            close = getattr(self._result, "close", None)
+            if close is not None:
+                close()
+        super().close()
+
+
+class WSGIAdapter(HTTPAdapter):
+    """``requests`` adapter that calls a WSGI application in-process.
+
+    Status retries follow ``max_retries`` exactly as HTTPAdapter applies
+    them, so a mounted adapter behaves like the one it replaces. Timeouts,
+    TLS and proxy settings do not apply. An exception raised by the
+    application is logged and answered with a 500, like a WSGI server does.
+    """
+
+    def __init__(
+        self,
+        app: WSGIApplication,
+        max_retries: Retry | int | None = 0,
+        **kwargs: Any,
+    ) -> None:
+        """Initialize the adapter.
+
+        Args:
+            app: WSGI application to call
+            max_retries: Retry configuration, as for HTTPAdapter
+            **kwargs: Further HTTPAdapter arguments
+        """
+        super().__init__(max_retries=max_retries, **kwargs)
+        self.app = app
+
+    def send(
+        self,
+        request: requests.PreparedRequest,
+        stream: bool = False,
+        timeout: Any = None,
+        verify: bool | str = True,
+        cert: Any = None,
+        proxies: Any = None,
+    ) -> requests.Response:
+        """Dispatch a prepared request to the application.
+
+        Raises:
+            RetryError: If status retries are exhausted and ``raise_on_status``
+        """
+        method = request.method or "GET"
+        url = request.url or ""
+        body = _read_body(request)
+        retries = self.max_retries
+
+        while True:
+            response = self._call_app(request, body)
+            has_retry_after = bool(response.headers.get("Retry-After"))
+            if not retries.is_retry(method, response.status, has_retry_after):
+                break
+            try:
+                retries = retries.increment(method, url, response=response)
+            except MaxRetryError as e:
+                if retries.raise_on_status:
+                    response.drain_conn()
+                    raise RetryError(e, request=request) from e
+                break
+            response.drain_conn()
+            retries.sleep(response)
+
+        return self.build_response(request, response)
+
+    def _call_app(self, request: requests.PreparedRequest, body: bytes) -> HTTPResponse:
+        """Run the application once and wrap its response for urllib3."""
+        method = request.method or "GET"
+        started: dict[str, Any] = {}
+        written: list[bytes] = []
+
+        def start_response(
+            status: str, headers: list[tuple[str, str]], exc_info: Any = None
+        ) -> Any:
+            if exc_info and started:
+                raise exc_info[1].with_traceback(exc_info[2])
+            started["status"] = status
+            started["headers"] = headers
+            return written.append
+
+        try:
+            result = self.app(build_environ(request, body), start_response)
+            chunks = iter(result)
+            first: list[bytes] = []
+            # Generators may only call start_response on their first step
+            while "status" not in started:
+                chunk = next(chunks, None)
+                if chunk is None:
+                    break
+                first.append(chunk)
+            if "status" not in started:
+                msg = "WSGI application did not call start_response"
+                raise RuntimeError(msg)
+        except Exception:
+            logger.exception(f"WSGI application failed for {method} {request.url}")
+            started = {
+                "status": "500 Internal Server Error",
+                "headers": [
+                    ("Content-Type", "text/plain"),
+                    ("Content-Length", str(len(_ERROR_BODY))),
+                ],
+            }
+            result = [_ERROR_BODY]
+            written, first, chunks = [], [], iter(result)
+
+        code, _, reason = started["status"].partition(" ")
+        raw = _WSGIResponseBody(
+            chain(written, first, chunks), result, started["headers"], method
+        )
+        return HTTPResponse(
+            body=raw,
+            headers=started["headers"],
+            status=int(code),
+            reason=reason,
+            preload_content=False,
+            decode_content=True,
+            original_response=raw,  # type: ignore[arg-type]
+            request_method=method,
+            request_url=request.url,
+        )
+
+
+if HTTPX_AVAILABLE:
+
+    class AsyncWSGITransport(httpx.AsyncBaseTransport):
+        """``httpx`` async transport that calls a WSGI application in-process.
+
+        Each call runs in a worker thread, so the event loop keeps serving
+        other requests while the application works, as with a threaded
+        server. Response bodies are read in full before being returned.
+        """
+
+        def __init__(self, app: WSGIApplication) -> None:
+            """Initialize the transport.
+
+            Args:
+                app: WSGI application to call
+            """
+            self.app = app
+            self._transport = httpx.WSGITransport(app=app, remote_addr=REMOTE_ADDR)
+
+        async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+            """Dispatch a request to the application on a worker thread."""
+            await request.aread()
+            return await asyncio.to_thread(self._handle, request)
+
+        def _handle(self, request: httpx.Request) -> httpx.Response:
+            response = self._transport.handle_request(request)
+            # Raw bytes, so the client decodes any Content-Encoding itself
+            try:
+                content = b"".join(response.iter_raw())
+            finally:
+                response.close()
+            return httpx.Response(
+                response.status_code,
+                headers=response.headers.raw,
+                content=content,
+                extensions=response.extensions,
+            )
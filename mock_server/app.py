@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import json
 import os
 import threading
 import time
@@ -9,16 +10,19 @@ import uuid
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
-from flask import Flask, jsonify, make_response, request
+from flask import Flask, Response, jsonify, make_response, request
 from flask_caching import Cache
 from flask_cors import CORS
 
+from .idempotency import IdempotencyWindow
+from .json_provider import FastJSONProvider
 from .mock_data import (
     generate_batch_progress,
     generate_billing_detail,
     generate_credit_data,
 )
 from .pricing import VAT_RATE
+from .request_encoding import DecompressRequestMiddleware
 from .security import setup_security
 from .test_data_manager import get_data_manager
 
@@ -45,6 +49,10 @@ STATUS_ACTIVE = "ACTIVE"
 STATUS_PENDING = "PENDING"
 STATUS_SUCCESS = "SUCCESS"
 
+# Server-sent progress streams
+PROGRESS_STREAM_TICK = 0.05  # Seconds between simulated progress steps
+PROGRESS_STREAM_TIMEOUT = 60  # Seconds before an unfinished stream is closed
+
 
 # Helper functions for common operations
 def generate_uuid():
@@ -81,6 +89,13 @@ except ImportError:
 # CSRF protection is not enabled as this server is not intended for production use.
 app = Flask(__name__)
 
+# Encode/decode JSON with orjson or msgspec when installed. Keys keep the
+# order the handlers build them in, as the real API returns them; sorting
+# would also send every response through the stdlib encoder under msgspec.
+json_provider = FastJSONProvider(app)
+json_provider.sort_keys = False
+app.json = json_provider
+
 # Permissive CORS is acceptable for test mock server
 # This mock server is designed for local development and CI testing only
 # In production, use a properly configured API gateway with restricted CORS
@@ -133,9 +148,34 @@ app.config["JSONIFY_PRETTYPRINT_REGULAR"] = False
 # Get data manager instance
 data_manager = get_data_manager()
 
+# Idempotency keys of recently stored meters, per test UUID
+meter_idempotency = IdempotencyWindow()
+
 # Setup security features (rate limiting, authentication)
 setup_security(app)
 
+# Decode gzip/deflate request bodies before any endpoint reads them
+app.wsgi_app = DecompressRequestMiddleware(app.wsgi_app)  # type: ignore[method-assign]
+
+
+@app.after_request
+def add_etag(response):
+    """Tag JSON GET responses with an ETag and honor If-None-Match.
+
+    Lets clients revalidate cached responses, answering with 304 Not Modified
+    when the body is unchanged.
+    """
+    if (
+        request.method == "GET"
+        and response.status_code == 200
+        and response.is_json
+        and not response.direct_passthrough
+    ):
+        response.add_etag()
+        response = response.make_conditional(request)
+    return response
+
+
 # In-memory storage for batch jobs
 batch_jobs: dict[str, Any] = {}
 batch_progress: dict[str, int] = {}
@@ -372,6 +412,7 @@ def reset_test_data():
         from .security import rate_limiter
 
         rate_limiter.reset(client_id=uuid_param)
+        meter_idempotency.clear(uuid_param)
 
     return jsonify(
         create_success_response({"message": f"Reset data for UUID: {uuid_param}"})
@@ -382,6 +423,7 @@ def reset_test_data():
 def reset_test_data_by_uuid(uuid):
     """Reset test data for a specific UUID."""
     data_manager.clear_uuid_data(uuid)
+    meter_idempotency.clear(uuid)
 
     # Also clear contracts for this UUID
     contracts_to_delete = []
@@ -418,35 +460,48 @@ def create_metering():
         # For integration tests, use a consistent test UUID pattern
         test_uuid = "uuid-kr-test"
 
-    # Clear previous metering data for this UUID (fresh calculation)
-    data_manager.clear_uuid_data(test_uuid)
-
-    # Get UUID-specific metering store (now empty)
-    metering_store = data_manager.get_metering_data(test_uuid)
-
     # Handle meterList format (what the actual client sends)
     if "meterList" in data:
+        # Meters whose idempotency key was seen recently are retried copies;
+        # answer with the original ID instead of storing them again
         meter_ids = []
+        new_meters = []
         for meter in data["meterList"]:
             meter_id = generate_uuid()
+            key = meter.get("idempotencyKey")
+            original = (
+                meter_idempotency.claim(test_uuid, key, meter_id) if key else None
+            )
+            meter_ids.append(original or meter_id)
+            if original is None:
+                new_meters.append((meter_id, meter))
+
+        # Clear previous metering data for this UUID (fresh calculation),
+        # unless the whole request is a replay
+        if new_meters or not data["meterList"]:
+            data_manager.clear_uuid_data(test_uuid)
+        metering_store = data_manager.get_metering_data(test_uuid)
+
+        for meter_id, meter in new_meters:
             metering_store[meter_id] = {
                 "id": meter_id,
                 "timestamp": current_timestamp(),
                 "uuid": test_uuid,
                 **meter,
             }
-            meter_ids.append(meter_id)
 
-        return jsonify(
-            create_success_response(
-                {
-                    "message": f"Created {len(data['meterList'])} meters",
-                    "meterIds": meter_ids,
-                }
-            )
-        )
+        response_data: dict[str, Any] = {
+            "message": f"Created {len(new_meters)} meters",
+            "meterIds": meter_ids,
+        }
+        duplicates = len(data["meterList"]) - len(new_meters)
+        if duplicates:
+            response_data["duplicates"] = duplicates
+        return jsonify(create_success_response(response_data))
     else:
         # Handle single meter format
+        data_manager.clear_uuid_data(test_uuid)
+        metering_store = data_manager.get_metering_data(test_uuid)
         meter_id = generate_uuid()
         metering_store[meter_id] = {
             "id": meter_id,
@@ -486,10 +541,8 @@ def create_batch_job():
     return jsonify(create_success_response({"batchJobCode": job_id}))
 
 
-@app.route("/billing/admin/batch/progress", methods=["GET"])
-def get_batch_progress():
-    """Get batch job progress."""
-    # Simulate progress
+def _advance_batch_progress() -> list[dict[str, Any]]:
+    """Advance the simulated batch jobs one step and report their progress."""
     result_list = []
     for job_id, job in batch_jobs.items():
         if job_id not in batch_progress:
@@ -501,16 +554,11 @@ def get_batch_progress():
         progress_data = generate_batch_progress(job_id, batch_progress[job_id])
         result_list.append(progress_data)
 
-    return jsonify(create_success_response({"list": result_list}))
+    return result_list
 
 
-@app.route("/billing/admin/progress", methods=["GET"])
-def get_calculation_progress():
-    """Get calculation progress for batch jobs."""
-    # Get query parameters
-    month = request.args.get("month")
-    uuid_param = request.args.get("uuid")
-
+def _calculation_progress(month: str | None, uuid_param: str | None) -> dict[str, Any]:
+    """Build the calculation progress payload for a month and UUID."""
     # Check if we have a batch job for this combination
     # Always return completed status for mock to avoid timeout
     result_list = [
@@ -526,18 +574,80 @@ def get_calculation_progress():
 
     # For compatibility with wait_for_completion method
     # Include header for standard response format
-    return jsonify(
-        create_success_response(
-            {
-                "status": "COMPLETED",
-                "list": result_list,
-                "progress": 100,
-                "maxProgress": 100,
-            }
-        )
+    return create_success_response(
+        {
+            "status": "COMPLETED",
+            "list": result_list,
+            "progress": 100,
+            "maxProgress": 100,
+        }
     )
 
 
+def _sse_event(payload: dict[str, Any], event: str = "progress") -> str:
+    """Format a payload as a server-sent event."""
+    return f"event: {event}\ndata: {json.dumps(payload)}\n\n"
+
+
+def _sse_response(events: Any) -> Response:
+    """Wrap an event generator in an unbuffered text/event-stream response."""
+    return Response(
+        events,
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@app.route("/billing/admin/batch/progress", methods=["GET"])
+def get_batch_progress():
+    """Get batch job progress."""
+    # Simulate progress
+    result_list = _advance_batch_progress()
+
+    return jsonify(create_success_response({"list": result_list}))
+
+
+@app.route("/billing/admin/batch/progress/stream", methods=["GET"])
+def stream_batch_progress():
+    """Push batch job progress as server-sent events until every job is done."""
+
+    def events():
+        deadline = time.monotonic() + PROGRESS_STREAM_TIMEOUT
+        while True:
+            result_list = _advance_batch_progress()
+            done = all(item["status"] == STATUS_COMPLETED for item in result_list)
+            status = STATUS_COMPLETED if done else STATUS_RUNNING
+            yield _sse_event(
+                create_success_response({"status": status, "list": result_list})
+            )
+            if done or time.monotonic() >= deadline:
+                return
+            time.sleep(PROGRESS_STREAM_TICK)
+
+    return _sse_response(events())
+
+
+@app.route("/billing/admin/progress", methods=["GET"])
+def get_calculation_progress():
+    """Get calculation progress for batch jobs."""
+    # Get query parameters
+    month = request.args.get("month")
+    uuid_param = request.args.get("uuid")
+
+    return jsonify(_calculation_progress(month, uuid_param))
+
+
+@app.route("/billing/admin/progress/stream", methods=["GET"])
+def stream_calculation_progress():
+    """Push calculation progress as server-sent events until it completes."""
+    payload = _calculation_progress(request.args.get("month"), request.args.get("uuid"))
+
+    def events():
+        yield _sse_event(payload)
+
+    return _sse_response(events())
+
+
 def _create_default_balance_data():
     """Create default balance data structure."""
     return {
@@ -0,0 +1,63 @@
+"""Bounded idempotency-key window for the mock metering endpoint."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+
+# How long and how many meter keys the server remembers
+DEDUP_WINDOW_SECONDS = 600
+DEDUP_WINDOW_MAX_KEYS = 100_000
+
+
+class IdempotencyWindow:
+    """Remember recent idempotency keys and the IDs they were stored under.
+
+    Keys are scoped (per test UUID) and forgotten after ``ttl`` seconds or
+    once more than ``max_keys`` are held, oldest first.
+    """
+
+    def __init__(
+        self, ttl: float = DEDUP_WINDOW_SECONDS, max_keys: int = DEDUP_WINDOW_MAX_KEYS
+    ) -> None:
+        self.ttl = ttl
+        self.max_keys = max_keys
+        self._entries: OrderedDict[tuple[str, str], tuple[float, str]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def claim(self, scope: str, key: str, value: str) -> str | None:
+        """Record ``value`` for a key unless the key is already known.
+
+        Returns:
+            The value stored earlier for the key, or None if this claim won
+        """
+        now = time.monotonic()
+        with self._lock:
+            self._expire(now)
+            entry = self._entries.get((scope, key))
+            if entry is not None:
+                return entry[1]
+            self._entries[(scope, key)] = (now, value)
+            if len(self._entries) > self.max_keys:
+                self._entries.popitem(last=False)
+            return None
+
+    def clear(self, scope: str | None = None) -> None:
+        """Forget every key, or only the keys of one scope."""
+        with self._lock:
+            if scope is None:
+                self._entries.clear()
+                return
+            for entry_key in [k for k in self._entries if k[0] == scope]:
+                del self._entries[entry_key]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _expire(self, now: float) -> None:
+        while self._entries:
+            _, (stored_at, _) = next(iter(self._entries.items()))
+            if now - stored_at < self.ttl:
+                return
+            self._entries.popitem(last=False)
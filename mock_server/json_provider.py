@@ -0,0 +1,117 @@
+"""Flask JSON provider backed by orjson or msgspec when installed.
+
+Speeds up ``jsonify`` and ``request.get_json`` for large statement and
+meter payloads. The mock server image ships without the ``libs`` package,
+so this mirrors the backend selection of ``libs.json_codec`` rather than
+importing it. Set ``MOCK_SERVER_JSON_CODEC`` to force a backend.
+"""
+
+from __future__ import annotations
+
+import os
+from typing import Any
+
+from flask import Flask, Response
+from flask.json.provider import DefaultJSONProvider
+
+# Optional imports - fast JSON backends are optional speedups
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import msgspec
+
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    MSGSPEC_AVAILABLE = False
+
+CODEC_ENV_VAR = "MOCK_SERVER_JSON_CODEC"
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """JSON provider that encodes and decodes with a fast backend.
+
+    Falls back to Flask's stdlib provider for anything the backend rejects
+    and whenever formatting options such as ``indent`` are requested.
+    Unsupported types go through Flask's own default hook, so ``Decimal``
+    is still encoded as a string.
+    """
+
+    def __init__(self, app: Flask, backend: str | None = None) -> None:
+        """Initialize the provider.
+
+        Args:
+            app: Flask application
+            backend: "orjson", "msgspec" or "json"; defaults to the
+                ``MOCK_SERVER_JSON_CODEC`` environment variable, then the
+                fastest installed backend
+        """
+        super().__init__(app)
+        self.backend = backend or os.environ.get(CODEC_ENV_VAR) or _best_backend()
+        if self.backend == "msgspec" and MSGSPEC_AVAILABLE:
+            self._encoder = msgspec.json.Encoder(
+                enc_hook=self.default, decimal_format="string"
+            )
+            self._decoder = msgspec.json.Decoder()
+
+    def _encode(self, obj: Any) -> bytes | None:
+        """Encode with the fast backend, or None to use the stdlib path.
+
+        Values the backend cannot encode, such as integers wider than 64
+        bits for orjson, also return None so the stdlib encoder can try.
+        """
+        try:
+            if self.backend == "orjson" and ORJSON_AVAILABLE:
+                option = orjson.OPT_NON_STR_KEYS
+                if self.sort_keys:
+                    option |= orjson.OPT_SORT_KEYS
+                return orjson.dumps(obj, default=self.default, option=option)
+            if self.backend == "msgspec" and MSGSPEC_AVAILABLE and not self.sort_keys:
+                return self._encoder.encode(obj)
+        except (TypeError, ValueError, OverflowError):
+            return None
+        return None
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """Serialize data as JSON text."""
+        if not kwargs:
+            encoded = self._encode(obj)
+            if encoded is not None:
+                return encoded.decode()
+        return super().dumps(obj, **kwargs)
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        """Deserialize JSON text."""
+        if not kwargs:
+            if self.backend == "orjson" and ORJSON_AVAILABLE:
+                return orjson.loads(s)
+            if self.backend == "msgspec" and MSGSPEC_AVAILABLE:
+                try:
+                    return self._decoder.decode(s)
+                except msgspec.DecodeError as e:
+                    raise ValueError(str(e)) from e
+        return super().loads(s, **kwargs)
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        """Build a JSON response, skipping the str round trip when possible."""
+        if self.compact is False or (self.compact is None and self._app.debug):
+            return super().response(*args, **kwargs)
+
+        obj = self._prepare_response_obj(args, kwargs)
+        encoded = self._encode(obj)
+        if encoded is None:
+            return super().response(*args, **kwargs)
+        return self._app.response_class(encoded, mimetype=self.mimetype)
+
+
+def _best_backend() -> str:
+    """Get the fastest installed backend name."""
+    if ORJSON_AVAILABLE:
+        return "orjson"
+    if MSGSPEC_AVAILABLE:
+        return "msgspec"
+    return "json"
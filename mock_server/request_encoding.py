@@ -0,0 +1,119 @@
+"""Transparent decoding of compressed request bodies.
+
+Clients may gzip or deflate large JSON bodies and say so in
+``Content-Encoding``. DecompressRequestMiddleware decodes them before Flask
+sees the request, so ``request.json`` works unchanged in every endpoint.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import zlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from wsgiref.types import StartResponse, WSGIApplication, WSGIEnvironment
+
+# Largest decoded body accepted; guards against decompression bombs
+MAX_DECODED_BODY_BYTES = 64 * 1024 * 1024
+
+# zlib window bits per encoding; deflate falls back to raw streams below
+_WBITS = {
+    "gzip": 16 + zlib.MAX_WBITS,
+    "x-gzip": 16 + zlib.MAX_WBITS,
+    "deflate": zlib.MAX_WBITS,
+}
+
+
+class DecompressRequestMiddleware:
+    """WSGI middleware that decodes gzip/deflate request bodies."""
+
+    def __init__(
+        self, app: WSGIApplication, max_size: int = MAX_DECODED_BODY_BYTES
+    ) -> None:
+        self.app = app
+        self.max_size = max_size
+
+    def __call__(
+        self, environ: WSGIEnvironment, start_response: StartResponse
+    ) -> Iterable[bytes]:
+        encoding = environ.get("HTTP_CONTENT_ENCODING", "").strip().lower()
+        if encoding in ("", "identity"):
+            return self.app(environ, start_response)
+        if encoding not in _WBITS:
+            return _error(
+                start_response, "415 Unsupported Media Type", f"Unsupported {encoding}"
+            )
+
+        body = self._read_body(environ)
+        if body is None:
+            return _error(start_response, "411 Length Required", "Length required")
+        try:
+            decoded = self._decode(body, encoding)
+        except zlib.error as e:
+            return _error(start_response, "400 Bad Request", f"Invalid body: {e}")
+        if decoded is None:
+            return _error(
+                start_response, "413 Content Too Large", "Decoded body too large"
+            )
+
+        environ = {
+            **environ,
+            "wsgi.input": io.BytesIO(decoded),
+            "CONTENT_LENGTH": str(len(decoded)),
+        }
+        del environ["HTTP_CONTENT_ENCODING"]
+        return self.app(environ, start_response)
+
+    def _read_body(self, environ: WSGIEnvironment) -> bytes | None:
+        """Read the raw body; returns None if its end cannot be found.
+
+        Without ``Content-Length`` the body is read to the end of the stream
+        only when the server marks it terminated, as it does for chunked
+        requests.
+        """
+        stream = environ["wsgi.input"]
+        length = environ.get("CONTENT_LENGTH")
+        if length:
+            return stream.read(int(length))
+        if environ.get("wsgi.input_terminated"):
+            return stream.read()
+        return None
+
+    def _decode(self, body: bytes, encoding: str) -> bytes | None:
+        """Decompress a body; returns None if it exceeds max_size.
+
+        Raises:
+            zlib.error: If the body is corrupt, truncated or followed by
+                trailing data
+        """
+        try:
+            decompressor = zlib.decompressobj(_WBITS[encoding])
+            decoded = decompressor.decompress(body, self.max_size + 1)
+        except zlib.error:
+            if encoding != "deflate":
+                raise
+            # Some clients send raw deflate without the zlib wrapper
+            decompressor = zlib.decompressobj(-zlib.MAX_WBITS)
+            decoded = decompressor.decompress(body, self.max_size + 1)
+        if len(decoded) > self.max_size or decompressor.unconsumed_tail:
+            return None
+        if not decompressor.eof:
+            raise zlib.error("truncated compressed body")
+        if decompressor.unused_data:
+            raise zlib.error("trailing data after compressed body")
+        return decoded
+
+
+def _error(start_response: StartResponse, status: str, message: str) -> list[bytes]:
+    """Answer with the mock server's standard error envelope."""
+    body = json.dumps(
+        {"header": {"isSuccessful": False, "resultCode": -1, "resultMessage": message}}
+    ).encode()
+    start_response(
+        status,
+        [("Content-Type", "application/json"), ("Content-Length", str(len(body)))],
+    )
+    return [body]
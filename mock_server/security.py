@@ -116,21 +116,20 @@ def rate_limit_middleware(app: Any) -> None:
             return None
 
         if rate_limiter.is_rate_limited():
-            return (
-                jsonify(
-                    {
-                        "header": {
-                            "isSuccessful": False,
-                            "resultCode": 429,
-                            "resultMessage": "Too many requests - rate limit exceeded",
-                        },
-                        "error": "RATE_LIMIT_EXCEEDED",
-                        "retry_after": rate_limiter.window_seconds,
-                        "remaining_requests": 0,
-                    }
-                ),
-                429,
+            response = jsonify(
+                {
+                    "header": {
+                        "isSuccessful": False,
+                        "resultCode": 429,
+                        "resultMessage": "Too many requests - rate limit exceeded",
+                    },
+                    "error": "RATE_LIMIT_EXCEEDED",
+                    "retry_after": rate_limiter.window_seconds,
+                    "remaining_requests": 0,
+                }
             )
+            response.headers["Retry-After"] = str(rate_limiter.window_seconds)
+            return response, 429
 
         # Add rate limit info to response headers
         g.rate_limit_remaining = rate_limiter.get_remaining_requests()
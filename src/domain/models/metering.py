@@ -65,25 +65,41 @@ class UsageAggregation:
         self.meters.append(meter)
 
     def get_usage_by_counter(self, counter_name: str) -> Decimal:
-        """Get total usage for a specific counter."""
-        matching_meters = [m for m in self.meters if m.counter_name == counter_name]
+        """Get total usage for a specific counter.
 
-        if not matching_meters:
+        Runs in a single pass without collecting the matching meters. The
+        counter type is taken from the first matching meter; among gauge
+        readings with the same timestamp the earliest added wins.
+        """
+        first: MeteringData | None = None
+        total = Decimal(0)
+        latest: MeteringData | None = None
+        maximum: Decimal | None = None
+
+        for meter in self.meters:
+            if meter.counter_name != counter_name:
+                continue
+            if first is None:
+                first = meter
+            total += meter.counter_volume
+            if latest is None or meter.timestamp > latest.timestamp:
+                latest = meter
+            if maximum is None or meter.counter_volume > maximum:
+                maximum = meter.counter_volume
+
+        if first is None:
             return Decimal(0)
 
         # Aggregation logic depends on counter type
-        first_meter = matching_meters[0]
-
-        if first_meter.is_delta:
+        if first.is_delta:
             # Sum all delta values
-            return Decimal(sum(m.counter_volume for m in matching_meters))
-        if first_meter.is_gauge:
+            return total
+        if first.is_gauge and latest is not None:
             # Use latest gauge value (or average, depending on business rules)
-            latest = max(matching_meters, key=lambda m: m.timestamp)
             return latest.counter_volume
         # CUMULATIVE
         # Use maximum value
-        return max(m.counter_volume for m in matching_meters)
+        return maximum if maximum is not None else Decimal(0)
 
     def get_usage_by_app(self, app_key: str) -> dict[str, Decimal]:
         """Get usage breakdown by counter for a specific app."""
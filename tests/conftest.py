@@ -592,6 +592,9 @@ def mock_api_client():
     client.get.return_value = {"status": "SUCCESS", "data": []}
     client.put.return_value = {"status": "SUCCESS"}
     client.delete.return_value = {"status": "SUCCESS"}
+    client.map_requests.side_effect = lambda specs, **_kwargs: [
+        {"status": "SUCCESS"} for _ in specs
+    ]
 
     return client
 
@@ -0,0 +1,41 @@
+"""In-process access to the mock server for integration tests.
+
+With ``MOCK_SERVER_TRANSPORT=wsgi`` the integration fixtures skip starting
+``mock_server.run_server`` and hand clients ``mock_server.app`` to call
+through WSGIAdapter instead. Every pytest-xdist worker then has its own app
+and in-memory data, just as it would with a server per worker.
+"""
+
+import os
+from typing import Any
+
+TRANSPORT_ENV_VAR = "MOCK_SERVER_TRANSPORT"
+
+# Placeholder base URL; requests to it never leave the process
+IN_PROCESS_URL = "http://mock-server.in-process"
+
+
+def use_in_process_server() -> bool:
+    """Check whether tests should call the mock server app in-process."""
+    return os.environ.get(TRANSPORT_ENV_VAR, "").lower() == "wsgi"
+
+
+def mock_server_app() -> Any:
+    """Import the mock server's WSGI application."""
+    from mock_server.app import app
+
+    return app
+
+
+def client_options(base_url: str) -> dict[str, Any]:
+    """Get the extra BillingAPIClient arguments for a mock server URL.
+
+    Args:
+        base_url: URL the client will be created with
+
+    Returns:
+        ``{"wsgi_app": app}`` for IN_PROCESS_URL, else an empty dictionary
+    """
+    if base_url == IN_PROCESS_URL:
+        return {"wsgi_app": mock_server_app()}
+    return {}
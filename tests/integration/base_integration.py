@@ -14,6 +14,11 @@ from libs.http_client import BillingAPIClient
 from libs.Metering import MeteringManager
 from libs.payment_api_client import PaymentAPIClient
 from libs.Payments import PaymentManager
+from tests.fixtures.in_process_server import (
+    IN_PROCESS_URL,
+    client_options,
+    use_in_process_server,
+)
 
 
 class BaseIntegrationTest:
@@ -26,9 +31,16 @@ class BaseIntegrationTest:
         Function-scoped to ensure proper isolation in parallel execution.
         """
         if use_mock:
-            mock_url = os.environ.get("MOCK_SERVER_URL", "http://localhost:5000")
-            billing_client = BillingAPIClient(base_url=mock_url, use_mock=True)
-            payment_client = PaymentAPIClient(base_url=mock_url)
+            mock_url = (
+                IN_PROCESS_URL
+                if use_in_process_server()
+                else os.environ.get("MOCK_SERVER_URL", "http://localhost:5000")
+            )
+            options = client_options(mock_url)
+            billing_client = BillingAPIClient(
+                base_url=mock_url, use_mock=True, **options
+            )
+            payment_client = PaymentAPIClient(base_url=mock_url, **options)
         else:
             # Use real API with default configuration
             from config import url
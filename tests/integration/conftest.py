@@ -8,6 +8,11 @@ import time
 import pytest
 
 from libs.http_client import BillingAPIClient
+from tests.fixtures.in_process_server import (
+    IN_PROCESS_URL,
+    client_options,
+    use_in_process_server,
+)
 
 # Add project root to sys.path for imports
 sys.path.insert(
@@ -83,6 +88,12 @@ def mock_server(integration_test_config):
         yield None
         return
 
+    if use_in_process_server():
+        # Clients call mock_server.app directly; no server process needed
+        logger.info("Using in-process mock server (MOCK_SERVER_TRANSPORT=wsgi)")
+        yield IN_PROCESS_URL
+        return
+
     # Use optimized mock server for better performance
     from tests.fixtures.optimized_mock_server import OptimizedMockServerManager
 
@@ -155,7 +166,7 @@ def api_client(mock_server, integration_test_config):
             base_url = f"{base_url}"
 
         logger.info(f"Creating API client with base URL: {base_url}")
-        client = BillingAPIClient(base_url=base_url)
+        client = BillingAPIClient(base_url=base_url, **client_options(base_url))
 
     yield client
 
@@ -0,0 +1,85 @@
+"""Benchmarks comparing the asyncio client with the threaded sync client.
+
+Each round fetches console statements for N distinct UUIDs against the mock
+server, either from a thread pool sharing one BillingAPIClient or from a
+single event loop driving one AsyncBillingAPIClient.
+"""
+
+import asyncio
+import uuid as uuid_module
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import pytest
+
+from libs.constants import DEFAULT_MAX_CONCURRENCY
+from libs.http_client import BillingAPIClient
+
+pytest.importorskip("httpx")
+
+from libs.async_http_client import (  # noqa: E402
+    AsyncBillingAPIClient,
+    gather_with_concurrency,
+)
+
+MONTH = datetime.now().strftime("%Y-%m")
+STATEMENTS_ENDPOINT = "billing/console/statements"
+
+# Each round issues N requests; keep rounds low to stay under the rate limit
+BENCHMARK_CONFIG = {"rounds": 3, "iterations": 1, "warmup_rounds": 0}
+
+UUID_COUNTS = [
+    10,
+    100,
+    pytest.param(1000, marks=pytest.mark.slow),
+]
+
+
+def _make_uuids(count: int) -> list[str]:
+    return [f"PERF_ASYNC_{uuid_module.uuid4().hex[:8]}" for _ in range(count)]
+
+
+@pytest.mark.performance
+@pytest.mark.benchmark(group="client-concurrency")
+@pytest.mark.parametrize("uuid_count", UUID_COUNTS)
+def test_threaded_sync_client(benchmark, mock_server_url, uuid_count):
+    """Benchmark statement fetches with the sync client on a thread pool."""
+    uuids = _make_uuids(uuid_count)
+
+    def fetch_all():
+        with (
+            BillingAPIClient(mock_server_url) as client,
+            ThreadPoolExecutor(max_workers=DEFAULT_MAX_CONCURRENCY) as executor,
+        ):
+            return list(
+                executor.map(
+                    lambda uuid: client.get_statements_console(MONTH, uuid), uuids
+                )
+            )
+
+    results = benchmark.pedantic(fetch_all, **BENCHMARK_CONFIG)
+
+    assert len(results) == uuid_count
+
+
+@pytest.mark.performance
+@pytest.mark.benchmark(group="client-concurrency")
+@pytest.mark.parametrize("uuid_count", UUID_COUNTS)
+def test_async_client(benchmark, mock_server_url, uuid_count):
+    """Benchmark statement fetches with the asyncio client on one event loop."""
+    uuids = _make_uuids(uuid_count)
+
+    async def fetch_all():
+        async with AsyncBillingAPIClient(mock_server_url) as client:
+            results = await gather_with_concurrency(
+                (client.get_statements_console(MONTH, uuid) for uuid in uuids),
+                limit=DEFAULT_MAX_CONCURRENCY,
+            )
+        errors = [r for r in results if isinstance(r, BaseException)]
+        if errors:
+            raise errors[0]
+        return results
+
+    results = benchmark.pedantic(lambda: asyncio.run(fetch_all()), **BENCHMARK_CONFIG)
+
+    assert len(results) == uuid_count
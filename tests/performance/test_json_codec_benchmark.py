@@ -0,0 +1,67 @@
+"""Benchmarks comparing the JSON codecs on statement-sized payloads.
+
+Each installed codec encodes and decodes a console statement with N line
+items, the shape that dominates response parsing in large billing runs.
+"""
+
+from decimal import Decimal
+
+import pytest
+
+from libs.json_codec import available_codecs, get_codec
+
+LINE_ITEM_COUNTS = [10, 100, 1000]
+
+
+def _make_statement(line_items: int) -> dict:
+    return {
+        "header": {"isSuccessful": True, "resultCode": 0, "resultMessage": "SUCCESS"},
+        "statements": [
+            {
+                "paymentGroupId": "PG-0001",
+                "month": "2024-01",
+                "totalAmount": Decimal("1234567.89"),
+                "lineItems": [
+                    {
+                        "counterName": f"compute.c2.c8m8.{i}",
+                        "resourceId": f"res-{i:06d}",
+                        "counterVolume": 720.5,
+                        "unitPrice": 397,
+                        "amount": Decimal("286038.50"),
+                        "tags": ["prod", "kr1"],
+                    }
+                    for i in range(line_items)
+                ],
+            }
+        ],
+    }
+
+
+@pytest.mark.performance
+@pytest.mark.benchmark(group="json-decode")
+@pytest.mark.parametrize("codec_name", available_codecs())
+@pytest.mark.parametrize("line_items", LINE_ITEM_COUNTS)
+def test_decode_statement(benchmark, codec_name, line_items):
+    """Benchmark decoding a statement response body."""
+    codec = get_codec(codec_name)
+    body = get_codec("json").dumps(_make_statement(line_items))
+    benchmark.group = f"json-decode-{line_items}"
+
+    result = benchmark(codec.loads, body)
+
+    assert len(result["statements"][0]["lineItems"]) == line_items
+
+
+@pytest.mark.performance
+@pytest.mark.benchmark(group="json-encode")
+@pytest.mark.parametrize("codec_name", available_codecs())
+@pytest.mark.parametrize("line_items", LINE_ITEM_COUNTS)
+def test_encode_statement(benchmark, codec_name, line_items):
+    """Benchmark encoding a statement with Decimal amounts."""
+    codec = get_codec(codec_name)
+    statement = _make_statement(line_items)
+    benchmark.group = f"json-encode-{line_items}"
+
+    result = benchmark(codec.dumps, statement)
+
+    assert codec.loads(result)["statements"][0]["totalAmount"] == "1234567.89"
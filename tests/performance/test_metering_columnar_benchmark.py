@@ -0,0 +1,115 @@
+"""Benchmarks for the Decimal and columnar metering aggregation engines.
+
+``test_aggregate_records`` times aggregate_by_dimensions end to end, record
+dicts in and metrics out, on both engines up to 1e6 records.
+``test_columnar_group_by`` times only the NumPy group-by on columns built
+directly as arrays, which reaches 1e7 records without first materialising
+ten million dicts. Building the Decimal metrics costs a few microseconds per
+group, so both keep to realistic group counts rather than one per record.
+"""
+
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+
+import pytest
+
+from libs.metering_aggregator import MeteringAggregator
+
+np = pytest.importorskip("numpy")
+
+from libs.metering_columnar import (  # noqa: E402
+    DIMENSION_FIELDS,
+    Category,
+    MeteringColumns,
+)
+
+RECORD_COUNTS = [10_000, 100_000, 1_000_000]
+COLUMN_COUNTS = [10_000, 100_000, 1_000_000, 10_000_000]
+DIMENSIONS = ["app_key", "counter_name", "resource_id"]
+
+
+def _records(count: int) -> list[dict]:
+    return [
+        {
+            "appKey": f"app-{i % 10}",
+            "counterName": f"compute.c2.c{i % 8}",
+            "counterType": "DELTA",
+            "counterVolume": f"{i % 1000}.{i % 100:02d}",
+            "resourceId": f"vm-{i % 200:03d}",
+            "timestamp": f"2024-01-{i % 28 + 1:02d}T{i % 24:02d}:00:00.000+09:00",
+        }
+        for i in range(count)
+    ]
+
+
+def _columns(count: int) -> MeteringColumns:
+    rng = np.random.default_rng(18)
+    cardinality = {"appKey": 10, "counterName": 8, "counterType": 1, "resourceId": 200}
+    dimensions = {
+        field: Category(
+            rng.integers(0, cardinality[field], count),
+            [f"{field}-{i}" for i in range(cardinality[field])],
+        )
+        for field, _ in DIMENSION_FIELDS.values()
+    }
+    start = datetime(2024, 1, 1, tzinfo=UTC)
+    hours = 28 * 24
+    return MeteringColumns(
+        size=count,
+        dimensions=dimensions,
+        volumes=Category(
+            rng.integers(0, 100_000, count),
+            [Decimal(v).scaleb(-2) for v in range(100_000)],
+        ),
+        volume_scale=2,
+        scaled_volumes=np.arange(100_000, dtype=np.int64),
+        volume_exponents=np.full(100_000, -2, dtype=np.int64),
+        timestamps=Category(
+            rng.integers(0, hours, count),
+            [start + timedelta(hours=h) for h in range(hours)],
+        ),
+        epoch_us=np.arange(hours, dtype=np.int64) * 3_600_000_000,
+    )
+
+
+@pytest.mark.performance
+@pytest.mark.benchmark(group="metering-aggregate")
+@pytest.mark.parametrize("count", RECORD_COUNTS)
+@pytest.mark.parametrize("engine", ["decimal", "numpy"])
+def test_aggregate_records(benchmark, engine, count):
+    """Benchmark aggregate_by_dimensions from record dicts."""
+    records = _records(count)
+    benchmark.group = f"metering-aggregate-{count}"
+
+    result = benchmark.pedantic(
+        MeteringAggregator.aggregate_by_dimensions,
+        args=(records, DIMENSIONS),
+        kwargs={"engine": engine},
+        rounds=1 if count >= 1_000_000 else 3,
+        iterations=1,
+    )
+
+    assert sum(m.record_count for m in result.values()) == count
+    benchmark.extra_info["records_per_second"] = round(
+        count / benchmark.stats.stats.mean
+    )
+
+
+@pytest.mark.performance
+@pytest.mark.benchmark(group="metering-columnar-group-by")
+@pytest.mark.parametrize("count", COLUMN_COUNTS)
+def test_columnar_group_by(benchmark, count):
+    """Benchmark the NumPy group-by on prebuilt columns."""
+    columns = _columns(count)
+
+    result = benchmark.pedantic(
+        columns.aggregate,
+        args=(DIMENSIONS,),
+        rounds=1 if count >= 10_000_000 else 3,
+        iterations=1,
+    )
+
+    assert sum(m.record_count for m in result.values()) == count
+    benchmark.extra_info["records_per_second"] = round(
+        count / benchmark.stats.stats.mean
+    )
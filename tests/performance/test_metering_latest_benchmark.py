@@ -0,0 +1,84 @@
+"""Benchmarks for latest-gauge lookups on large metering datasets.
+
+Compares the single-pass LatestValueIndex behind
+``MeteringAggregator.get_latest_gauge_values`` with the previous approach
+of sorting every record by parsed timestamp, on 1M GAUGE records spread
+over 1,000 resources and 8 counters.
+"""
+
+from decimal import ROUND_HALF_UP, Decimal
+
+import pytest
+
+from libs.metering_aggregator import LatestValueIndex, MeteringAggregator
+
+RECORDS = 1_000_000
+
+
+def sort_based_latest_gauges(metering_data):
+    """Reference implementation: full sort by timestamp, last write wins."""
+    gauges = {}
+    sorted_data = sorted(
+        metering_data,
+        key=lambda x: MeteringAggregator._parse_timestamp(x.get("timestamp", "")),
+    )
+    for record in sorted_data:
+        if record.get("counterType") != "GAUGE":
+            continue
+        counter_name = record.get("counterName")
+        if counter_name:
+            volume = Decimal(str(record.get("counterVolume", 0)))
+            gauges[counter_name] = volume.quantize(
+                Decimal("0.01"), rounding=ROUND_HALF_UP
+            )
+    return gauges
+
+
+@pytest.fixture(scope="module")
+def records():
+    return [
+        {
+            "counterName": f"storage.volume.c{i % 8}",
+            "counterType": "GAUGE",
+            "counterVolume": f"{i % 5000}.{i % 100:02d}",
+            "resourceId": f"vol-{i % 1000:04d}",
+            "timestamp": f"2024-01-{i % 28 + 1:02d}T{i % 24:02d}:00:00.000+09:00",
+        }
+        for i in range(RECORDS)
+    ]
+
+
+@pytest.mark.performance
+@pytest.mark.benchmark(group="metering-latest-gauge")
+def test_latest_gauges_single_pass(benchmark, records):
+    """Benchmark the single-pass latest-value index."""
+    result = benchmark.pedantic(
+        MeteringAggregator.get_latest_gauge_values,
+        args=(records,),
+        rounds=2,
+        iterations=1,
+    )
+
+    assert result == sort_based_latest_gauges(records[:50_000] + records[-50_000:])
+
+
+@pytest.mark.performance
+@pytest.mark.benchmark(group="metering-latest-gauge")
+def test_latest_gauges_sort_based(benchmark, records):
+    """Benchmark the previous sort-based lookup for comparison."""
+    result = benchmark.pedantic(
+        sort_based_latest_gauges, args=(records,), rounds=2, iterations=1
+    )
+
+    assert len(result) == 8
+
+
+@pytest.mark.performance
+@pytest.mark.benchmark(group="metering-latest-gauge")
+def test_top_k_resources(benchmark, records):
+    """Benchmark top-k by newest reading over a prebuilt index."""
+    index = LatestValueIndex().update(records)
+
+    result = benchmark(index.top_k, "storage.volume.c0", 10)
+
+    assert len(result) == 10
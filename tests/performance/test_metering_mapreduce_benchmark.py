@@ -0,0 +1,56 @@
+"""Benchmarks for the multi-process metering dump map-reduce.
+
+Aggregates one JSON-lines dump of 500k records by resource with 1, 2 and 4
+worker processes. On a machine with at least that many cores the time
+should fall close to linearly with the worker count; ``extra_info`` records
+the CPU count alongside the throughput so results can be read in context.
+"""
+
+import json
+import os
+
+import pytest
+
+from libs.metering_mapreduce import aggregate_dumps
+
+RECORDS = 500_000
+SHARD_BYTES = 4 * 1024 * 1024
+
+
+@pytest.fixture(scope="module")
+def dump(tmp_path_factory):
+    path = tmp_path_factory.mktemp("dumps") / "meters.jsonl"
+    with path.open("w") as stream:
+        for i in range(RECORDS):
+            record = {
+                "appKey": "PERF_APP",
+                "counterName": f"compute.c2.c{i % 8}",
+                "counterType": "DELTA",
+                "counterVolume": f"{i % 1000}.{i % 100:02d}",
+                "resourceId": f"vm-{i % 2000:04d}",
+                "timestamp": f"2024-01-{i % 28 + 1:02d}T{i % 24:02d}:00:00.000+09:00",
+            }
+            stream.write(json.dumps(record) + "\n")
+    return path
+
+
+@pytest.mark.performance
+@pytest.mark.benchmark(group="metering-map-reduce")
+@pytest.mark.parametrize("workers", [1, 2, 4])
+def test_aggregate_dump(benchmark, dump, workers):
+    """Benchmark aggregating a dump with a given number of workers."""
+    result = benchmark.pedantic(
+        aggregate_dumps,
+        args=([dump], ["resource_id"]),
+        kwargs={"max_workers": workers, "shard_bytes": SHARD_BYTES},
+        rounds=2,
+        iterations=1,
+    )
+
+    assert sum(m.record_count for m in result.values()) == RECORDS
+    benchmark.extra_info.update(
+        {
+            "cpu_count": os.cpu_count(),
+            "records_per_second": round(RECORDS / benchmark.stats.stats.mean),
+        }
+    )
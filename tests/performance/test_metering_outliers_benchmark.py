@@ -0,0 +1,46 @@
+"""Benchmarks for streaming per-counter outlier screening.
+
+Screens 500k records over 8 counters with each method, judging every record
+against the readings before it, as a reader over a monthly dump would.
+"""
+
+import random
+
+import pytest
+
+from libs.metering_outliers import OutlierDetector
+
+RECORDS = 500_000
+
+
+@pytest.fixture(scope="module")
+def records():
+    rng = random.Random(11)
+    return [
+        {
+            "counterName": f"compute.c2.c{i % 8}",
+            "counterVolume": rng.lognormvariate(i % 8, 0.5),
+        }
+        for i in range(RECORDS)
+    ]
+
+
+@pytest.mark.performance
+@pytest.mark.benchmark(group="metering-outliers")
+@pytest.mark.parametrize("method", ["zscore", "mad"])
+def test_screen_stream(benchmark, records, method):
+    """Benchmark screening a stream with a given method."""
+
+    def screen():
+        detector = OutlierDetector(method=method)
+        return sum(1 for _ in detector.screen(iter(records))), detector
+
+    flagged, detector = benchmark.pedantic(screen, rounds=2, iterations=1)
+
+    assert sum(stats.count for stats in detector.counters.values()) == RECORDS
+    benchmark.extra_info.update(
+        {
+            "flagged": flagged,
+            "records_per_second": round(RECORDS / benchmark.stats.stats.mean),
+        }
+    )
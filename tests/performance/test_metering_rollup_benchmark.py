@@ -0,0 +1,94 @@
+"""Benchmarks for the metering rollup cube at 1M and 10M records.
+
+Each rollup is built once per module from a record generator (ten million
+dicts would not fit in memory at once) and its levels are materialized up
+front. The benchmarks then time range queries answered from the cells;
+``extra_info`` reports the ingest time, cell counts and the approximate
+memory held by the cube, which depends on the number of cells rather than
+records.
+"""
+
+import sys
+import time
+
+import pytest
+
+from libs.metering_rollup import MeteringRollup
+
+RECORD_COUNTS = [1_000_000, 10_000_000]
+
+
+def _records(count: int):
+    for i in range(count):
+        yield {
+            "appKey": f"PERF_APP_{i % 2}",
+            "counterName": f"compute.c2.c{i % 8}",
+            "counterType": "DELTA",
+            "counterVolume": f"{i % 1000}.{i % 100:02d}",
+            "resourceId": f"vm-{i % 200:03d}",
+            "timestamp": (
+                f"2024-{i // 744 % 12 + 1:02d}-{i // 24 % 28 + 1:02d}"
+                f"T{i % 24:02d}:00:00.000+09:00"
+            ),
+        }
+
+
+def _deep_size(obj, seen: set[int]) -> int:
+    """Approximate bytes held by containers, cells and their values."""
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(_deep_size(k, seen) + _deep_size(v, seen) for k, v in obj.items())
+    elif isinstance(obj, tuple | list):
+        size += sum(_deep_size(item, seen) for item in obj)
+    elif hasattr(obj, "__slots__"):
+        size += sum(_deep_size(getattr(obj, name), seen) for name in obj.__slots__)
+    return size
+
+
+@pytest.fixture(scope="module")
+def rollups():
+    built = {}
+
+    def build(count: int):
+        if count not in built:
+            start = time.perf_counter()
+            rollup = MeteringRollup().update(_records(count))
+            ingest_seconds = time.perf_counter() - start
+            cells = rollup.cell_counts()
+            memory = _deep_size(rollup._levels, set())
+            built[count] = (
+                rollup,
+                {
+                    "ingest_seconds": round(ingest_seconds, 1),
+                    "cells": cells,
+                    "memory_mb": round(memory / 2**20, 1),
+                },
+            )
+        return built[count]
+
+    return build
+
+
+@pytest.mark.performance
+@pytest.mark.benchmark(group="metering-rollup-query")
+@pytest.mark.parametrize("count", RECORD_COUNTS)
+@pytest.mark.parametrize(
+    ("level", "start", "end", "filters"),
+    [
+        ("day", "2024-03-01", "2024-03-07", {"counter_name": "compute.c2.c3"}),
+        ("hour", "2024-06-10", "2024-06-10", {"resource_id": "vm-042"}),
+        ("month", None, None, {}),
+    ],
+    ids=["daily-counter-week", "hourly-resource-day", "monthly-all"],
+)
+def test_range_query(benchmark, rollups, count, level, start, end, filters):
+    """Benchmark a range query answered from precomputed cells."""
+    rollup, info = rollups(count)
+    benchmark.extra_info.update(info)
+
+    result = benchmark(rollup.query, level, start, end, **filters)
+
+    assert result
@@ -0,0 +1,68 @@
+"""Benchmarks for compressed bulk meterList uploads.
+
+Each case posts one meterList of 1k, 10k or 100k meters to the running mock
+server, plain and gzip-compressed. ``extra_info`` records the bytes put on
+the wire so the ratio can be read next to the end-to-end timings; throughput
+is meters divided by the mean time.
+"""
+
+import json
+
+import pytest
+
+from libs.http_client import BillingAPIClient
+from libs.request_compression import RequestCompression
+
+BATCH_SIZES = [1_000, 10_000, 100_000]
+
+
+def _meter_list(count: int) -> dict:
+    return {
+        "meterList": [
+            {
+                "appKey": "PERF_COMPRESSION_APP",
+                "counterName": "compute.c2.c8m8",
+                "counterType": "DELTA",
+                "counterUnit": "HOURS",
+                "counterVolume": str(i % 24 + 1),
+                "parentResourceId": "PERF_PROJECT",
+                "resourceId": f"vm-{i % 500:04d}",
+                "resourceName": f"perf-vm-{i % 500:04d}",
+                "source": "qa.billing.test",
+                "timestamp": "2024-01-01T13:00:00.000+09:00",
+            }
+            for i in range(count)
+        ]
+    }
+
+
+@pytest.mark.performance
+@pytest.mark.benchmark(group="meter-upload-compression")
+@pytest.mark.parametrize("count", BATCH_SIZES)
+@pytest.mark.parametrize("encoding", [None, "gzip"])
+def test_bulk_meter_upload(benchmark, mock_server_url, count, encoding):
+    """Benchmark one bulk meterList upload, plain or gzip-compressed."""
+    payload = _meter_list(count)
+    compression = RequestCompression(encoding) if encoding else None
+    plain = json.dumps(payload, separators=(",", ":")).encode()
+    wire = compression.encode(plain)[0] if compression else plain
+    benchmark.extra_info.update(
+        {"meters": count, "body_bytes": len(plain), "wire_bytes": len(wire)}
+    )
+
+    with BillingAPIClient(
+        mock_server_url, timeout=120, request_compression=compression
+    ) as client:
+        result = benchmark.pedantic(
+            client.post,
+            args=("billing/meters",),
+            kwargs={"json_data": payload, "headers": {"uuid": "PERF_COMPRESSION"}},
+            rounds=3 if count >= 100_000 else 10,
+            iterations=1,
+            warmup_rounds=1,
+        )
+
+    assert len(result["meterIds"]) == count
+    benchmark.extra_info["meters_per_second"] = round(
+        count / benchmark.stats.stats.mean
+    )
@@ -0,0 +1,48 @@
+"""Microbenchmarks for metering timestamp parsing.
+
+Parses a batch of 10k timestamps three ways: the original loop over the
+``strptime`` formats, the ISO fast path without the cache, and the memoized
+parse_timestamp. The batch mixes a few distinct hourly stamps, as a month of
+MeteringManager records does, with one unique stamp per record.
+"""
+
+import pytest
+
+from libs.timestamp_parser import _parse_with_strptime, parse_timestamp
+
+BATCH_SIZE = 10_000
+
+PARSERS = {
+    "strptime": _parse_with_strptime,
+    "fromisoformat": parse_timestamp.__wrapped__,
+    "cached": parse_timestamp,
+}
+
+BATCHES = {
+    "repeated": [f"2024-01-01T{i % 24:02d}:00:00.000+09:00" for i in range(BATCH_SIZE)],
+    "unique": [
+        f"2024-01-{i % 28 + 1:02d}T{i % 24:02d}:{i % 60:02d}:{i // 60 % 60:02d}"
+        f".{i % 1000:03d}+09:00"
+        for i in range(BATCH_SIZE)
+    ],
+}
+
+
+def _parse_all(parser, values: list[str]) -> int:
+    return sum(parser(value) is not None for value in values)
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize("batch", list(BATCHES))
+@pytest.mark.parametrize("parser", list(PARSERS))
+def test_parse_timestamps(benchmark, parser, batch):
+    """Benchmark parsing one batch of timestamps."""
+    benchmark.group = f"timestamp-parse-{batch}"
+    parse_timestamp.cache_clear()
+
+    parsed = benchmark(_parse_all, PARSERS[parser], BATCHES[batch])
+
+    assert parsed == BATCH_SIZE
+    benchmark.extra_info["timestamps_per_second"] = round(
+        BATCH_SIZE / benchmark.stats.stats.mean
+    )
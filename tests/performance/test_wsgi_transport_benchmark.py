@@ -0,0 +1,52 @@
+"""Benchmarks comparing network and in-process calls to the mock server.
+
+The same statement fetch is made through a socket to the running mock server
+and through WSGIAdapter straight into ``mock_server.app``; the difference is
+the per-request cost of TCP, waitress and HTTP parsing, and the in-process
+number is what the handler itself costs.
+"""
+
+from datetime import datetime
+
+import pytest
+
+from libs.http_client import BillingAPIClient
+from tests.fixtures.in_process_server import IN_PROCESS_URL, mock_server_app
+
+pytest.importorskip("flask")
+
+MONTH = datetime.now().strftime("%Y-%m")
+STATEMENTS_ENDPOINT = "billing/console/statements"
+
+# Stay well under the mock server's per-second rate limit
+BENCHMARK_CONFIG = {"rounds": 100, "iterations": 1, "warmup_rounds": 5}
+
+
+def _fetch_statement(client: BillingAPIClient) -> dict:
+    return client.get(
+        STATEMENTS_ENDPOINT, params={"uuid": "PERF_WSGI_UUID", "month": MONTH}
+    )
+
+
+@pytest.mark.performance
+@pytest.mark.benchmark(group="mock-server-transport")
+def test_network_transport(benchmark, mock_server_url):
+    """Benchmark a statement fetch over a socket to the mock server."""
+    with BillingAPIClient(mock_server_url) as client:
+        result = benchmark.pedantic(
+            _fetch_statement, args=(client,), **BENCHMARK_CONFIG
+        )
+
+    assert result["header"]["isSuccessful"]
+
+
+@pytest.mark.performance
+@pytest.mark.benchmark(group="mock-server-transport")
+def test_in_process_transport(benchmark):
+    """Benchmark a statement fetch dispatched into mock_server.app in-process."""
+    with BillingAPIClient(IN_PROCESS_URL, wsgi_app=mock_server_app()) as client:
+        result = benchmark.pedantic(
+            _fetch_statement, args=(client,), **BENCHMARK_CONFIG
+        )
+
+    assert result["header"]["isSuccessful"]
@@ -191,22 +191,34 @@ class TestAdjustmentManager:
     # Delete adjustments tests
     def test_delete_adjustments_success(self) -> None:
         """Test successful delete_adjustments."""
-        self.mock_client.delete.return_value = None
+        self.mock_client.map_requests.return_value = [None, None]
 
         adjustment_ids = ["adj-001", "adj-002"]
         self.adjustment_manager.delete_adjustment(
             adjustment_ids, AdjustmentTarget.PROJECT
         )
 
-        assert self.mock_client.delete.call_count == 2  # Called twice for 2 IDs
+        specs = self.mock_client.map_requests.call_args.args[0]
+        assert [spec.method for spec in specs] == ["DELETE", "DELETE"]
+        assert [spec.params for spec in specs] == [
+            {"adjustmentIds": "adj-001"},
+            {"adjustmentIds": "adj-002"},
+        ]
+        assert all(
+            spec.endpoint == "billing/admin/projects/adjustments" for spec in specs
+        )
 
     def test_delete_adjustments_api_exception(self) -> None:
         """Test delete_adjustments when API request fails."""
-        self.mock_client.delete.side_effect = APIRequestException("API error")
+        self.mock_client.map_requests.return_value = [
+            None,
+            APIRequestException("API error"),
+            APIRequestException("Other error"),
+        ]
 
-        with pytest.raises(APIRequestException):
+        with pytest.raises(APIRequestException, match="API error"):
             self.adjustment_manager.delete_adjustment(
-                ["adj-001"], AdjustmentTarget.PROJECT
+                ["adj-001", "adj-002", "adj-003"], AdjustmentTarget.PROJECT
             )
 
     # Edge cases
@@ -0,0 +1,281 @@
+"""Unit tests for the asyncio HTTP client."""
+
+import asyncio
+import json
+
+import pytest
+
+from libs.exceptions import APIRequestException
+from libs.http_client import RetryConfig
+from libs.retry_policy import RetryBudget
+
+httpx = pytest.importorskip("httpx")
+
+from libs.async_http_client import (  # noqa: E402
+    AsyncBillingAPIClient,
+    gather_with_concurrency,
+)
+
+BASE_URL = "https://api.example.com"
+OK_BODY = {"header": {"isSuccessful": True, "resultMessage": "SUCCESS"}}
+
+
+def make_client(handler, **kwargs) -> AsyncBillingAPIClient:
+    """Build a client whose requests are served by ``handler``."""
+    kwargs.setdefault("retry_config", RetryConfig(total=3, backoff_factor=0))
+    return AsyncBillingAPIClient(
+        BASE_URL, transport=httpx.MockTransport(handler), **kwargs
+    )
+
+
+def run(coro):
+    """Run a coroutine to completion on a fresh event loop."""
+    return asyncio.run(coro)
+
+
+class TestAsyncBillingAPIClient:
+    """Unit tests for AsyncBillingAPIClient."""
+
+    def test_get_builds_url_and_drops_none_params(self) -> None:
+        """Test GET request URL and query parameter handling."""
+        seen = []
+
+        def handler(request):
+            seen.append(request)
+            return httpx.Response(200, json={**OK_BODY, "value": 1})
+
+        async def scenario():
+            async with make_client(handler) as client:
+                return await client.get(
+                    "/billing/meters", params={"month": "2024-01", "uuid": None}
+                )
+
+        result = run(scenario())
+
+        assert result["value"] == 1
+        assert str(seen[0].url) == f"{BASE_URL}/billing/meters?month=2024-01"
+        assert seen[0].headers["Accept"].startswith("application/json")
+
+    def test_post_sends_json_body(self) -> None:
+        """Test POST request serializes json_data."""
+        bodies = []
+
+        def handler(request):
+            bodies.append(json.loads(request.content))
+            return httpx.Response(200, json=OK_BODY)
+
+        async def scenario():
+            async with make_client(handler) as client:
+                await client.post("billing/meters", json_data={"meterList": []})
+
+        run(scenario())
+
+        assert bodies == [{"meterList": []}]
+
+    def test_unsuccessful_header_raises(self) -> None:
+        """Test header validation matches the sync client."""
+
+        def handler(_request):
+            return httpx.Response(
+                200,
+                json={"header": {"isSuccessful": False, "resultMessage": "Nope"}},
+            )
+
+        async def scenario():
+            async with make_client(handler) as client:
+                await client.get("billing/meters")
+
+        with pytest.raises(APIRequestException, match="Nope"):
+            run(scenario())
+
+    def test_retries_on_forcelist_status(self) -> None:
+        """Test 503 responses are retried until success."""
+        statuses = iter([503, 503, 200])
+
+        def handler(_request):
+            return httpx.Response(next(statuses), json=OK_BODY)
+
+        async def scenario():
+            async with make_client(handler) as client:
+                return await client.get("billing/meters")
+
+        assert run(scenario()) == OK_BODY
+
+    def test_status_retries_exhausted_returns_error(self) -> None:
+        """Test the last error response is validated once retries run out."""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(500, json={"message": "boom"})
+
+        async def scenario():
+            async with make_client(
+                handler, retry_config=RetryConfig(total=2, backoff_factor=0)
+            ) as client:
+                await client.get("billing/meters")
+
+        with pytest.raises(APIRequestException) as exc_info:
+            run(scenario())
+
+        assert exc_info.value.status_code == 500
+        assert len(calls) == 3
+
+    def test_status_not_retried_for_disallowed_method(self) -> None:
+        """Test methods outside allowed_methods are not retried on status."""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(503, json={"message": "unavailable"})
+
+        async def scenario():
+            async with make_client(
+                handler,
+                retry_config=RetryConfig(
+                    total=3, backoff_factor=0, allowed_methods=("GET",)
+                ),
+            ) as client:
+                await client.post("billing/meters", json_data={})
+
+        with pytest.raises(APIRequestException):
+            run(scenario())
+
+        assert len(calls) == 1
+
+    def test_connect_error_retried_then_raises(self) -> None:
+        """Test connection errors are retried and then surfaced."""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            raise httpx.ConnectError("refused", request=request)
+
+        async def scenario():
+            async with make_client(
+                handler, retry_config=RetryConfig(total=2, backoff_factor=0)
+            ) as client:
+                await client.get("billing/meters")
+
+        with pytest.raises(APIRequestException, match="refused"):
+            run(scenario())
+
+        assert len(calls) == 3
+
+    @pytest.mark.parametrize(
+        "retry_after", ["0", "-5", "Wed, 21 Oct 2015 07:28:00 GMT", "soon"]
+    )
+    def test_retry_after_header(self, retry_after) -> None:
+        """Test Retry-After seconds, past dates and junk never stall a retry."""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            if len(calls) == 1:
+                return httpx.Response(429, headers={"Retry-After": retry_after})
+            return httpx.Response(200, json=OK_BODY)
+
+        async def scenario():
+            async with make_client(handler) as client:
+                return await client.get("billing/meters")
+
+        assert run(scenario()) == OK_BODY
+        assert len(calls) == 2
+
+    def test_backoff_is_full_jitter(self) -> None:
+        """Test backoff is drawn below the capped exponential schedule."""
+        client = make_client(
+            lambda _request: httpx.Response(200),
+            retry_config=RetryConfig(backoff_factor=0.5, backoff_max=3.0),
+        )
+        policy = client.retry_policy
+
+        assert all(0.0 <= policy.backoff(1) <= 0.5 for _ in range(50))
+        assert all(0.0 <= policy.backoff(3) <= 2.0 for _ in range(50))
+        assert all(0.0 <= policy.backoff(20) <= 3.0 for _ in range(50))
+
+    def test_retries_stop_when_budget_spent(self) -> None:
+        """Test the client-wide retry budget caps retries across requests."""
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(503, json={"error": "down"})
+
+        async def scenario():
+            async with make_client(
+                handler, retry_budget=RetryBudget(ratio=0, reserve=2)
+            ) as client:
+                for _ in range(2):
+                    with pytest.raises(APIRequestException):
+                        await client.get("billing/meters")
+
+        run(scenario())
+
+        assert len(calls) == 4  # two retries in the budget, then none
+
+    def test_wait_for_completion(self) -> None:
+        """Test polling until the operation reports completion."""
+        statuses = iter(["PROGRESS", "COMPLETED"])
+        progress = []
+
+        def handler(_request):
+            return httpx.Response(200, json={**OK_BODY, "status": next(statuses)})
+
+        async def scenario():
+            async with make_client(handler) as client:
+                return await client.wait_for_completion(
+                    "billing/progress",
+                    check_interval=0,
+                    progress_callback=progress.append,
+                )
+
+        result = run(scenario())
+
+        assert result["status"] == "COMPLETED"
+        assert len(progress) == 1
+
+    def test_auth_token(self) -> None:
+        """Test setting and clearing the bearer token."""
+        auth_headers = []
+
+        def handler(request):
+            auth_headers.append(request.headers.get("Authorization"))
+            return httpx.Response(200, json=OK_BODY)
+
+        async def scenario():
+            async with make_client(handler) as client:
+                client.set_auth_token("token")
+                await client.get("billing/meters")
+                client.clear_auth_token()
+                await client.get("billing/meters")
+
+        run(scenario())
+
+        assert auth_headers == ["Bearer token", None]
+
+
+class TestGatherWithConcurrency:
+    """Unit tests for gather_with_concurrency."""
+
+    def test_limits_in_flight_and_preserves_order(self) -> None:
+        """Test concurrency bound, result order and exception capture."""
+        in_flight = 0
+        peak = 0
+
+        async def work(i):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            if i == 3:
+                raise ValueError(i)
+            return i
+
+        results = run(gather_with_concurrency((work(i) for i in range(10)), limit=2))
+
+        assert peak == 2
+        assert results[:3] == [0, 1, 2]
+        assert isinstance(results[3], ValueError)
+        assert results[4:] == list(range(4, 10))
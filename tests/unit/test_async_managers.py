@@ -0,0 +1,232 @@
+"""Unit tests for the asyncio manager variants."""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from libs.Adjustment import AsyncAdjustmentManager
+from libs.constants import AdjustmentTarget, AdjustmentType, PaymentStatus
+from libs.Contract import AsyncContractManager
+from libs.Credit import AsyncCreditManager
+from libs.exceptions import APIRequestException, ValidationException
+from libs.Metering import AsyncMeteringManager
+from libs.Payments import AsyncPaymentManager
+
+
+@pytest.fixture
+def async_client():
+    """Provide a mock async API client."""
+    client = Mock()
+    client.get = AsyncMock(return_value={"status": "SUCCESS"})
+    client.post = AsyncMock(return_value={"status": "SUCCESS"})
+    client.put = AsyncMock(return_value={"status": "SUCCESS"})
+    client.delete = AsyncMock(return_value={"status": "SUCCESS"})
+    client.aclose = AsyncMock()
+    return client
+
+
+class TestAsyncMeteringManager:
+    """Unit tests for AsyncMeteringManager."""
+
+    def test_send_metering(self, async_client) -> None:
+        """Test a meter is posted in the same shape as the sync manager."""
+        manager = AsyncMeteringManager("2024-01", client=async_client)
+
+        asyncio.run(
+            manager.send_metering("app", "cpu", "DELTA", "HOURS", "10", "res-1")
+        )
+
+        endpoint = async_client.post.call_args.args[0]
+        meter = async_client.post.call_args.kwargs["json_data"]["meterList"][0]
+        assert endpoint == "billing/meters"
+        assert meter["resourceId"] == "res-1"
+        assert meter["timestamp"] == "2024-01-01T13:00:00.000+09:00"
+
+    def test_invalid_month(self, async_client) -> None:
+        """Test month validation is shared with the sync manager."""
+        with pytest.raises(ValidationException):
+            AsyncMeteringManager("2024-13", client=async_client)
+
+    def test_send_batch_metering_partial_failure(self, async_client) -> None:
+        """Test batch results keep input order and capture API errors."""
+        async_client.post.side_effect = [
+            {"ok": 1},
+            APIRequestException("down"),
+            {"ok": 3},
+        ]
+        manager = AsyncMeteringManager(
+            "2024-01", client=async_client, max_concurrency=1
+        )
+        meter = {
+            "counter_name": "cpu",
+            "counter_type": "DELTA",
+            "counter_unit": "HOURS",
+            "counter_volume": "1",
+        }
+
+        result = asyncio.run(manager.send_batch_metering("app", [meter] * 3))
+
+        assert [r["success"] for r in result["results"]] == [True, False, True]
+        assert result["results"][1]["error"] == "down"
+
+    def test_send_batch_metering_batched(self, async_client) -> None:
+        """Test batching packs meters into shared meterList requests."""
+        async_client.post.side_effect = [
+            {"meterIds": ["m0", "m1"]},
+            APIRequestException("too large"),
+        ]
+        manager = AsyncMeteringManager(
+            "2024-01", client=async_client, max_concurrency=1
+        )
+        meter = {
+            "counter_name": "cpu",
+            "counter_type": "DELTA",
+            "counter_unit": "HOURS",
+            "counter_volume": "1",
+        }
+
+        result = asyncio.run(
+            manager.send_batch_metering("app", [meter] * 3, batch_size=2)
+        )
+
+        assert result["requests"] == 2
+        assert [r.get("meterId") for r in result["results"]] == ["m0", "m1", None]
+        assert result["results"][2]["error"] == "too large"
+
+    def test_delete_metering_multiple(self, async_client) -> None:
+        """Test deletion for several app keys over the month range."""
+        manager = AsyncMeteringManager("2024-02", client=async_client)
+
+        result = asyncio.run(manager.delete_metering(["a", "b"]))
+
+        assert result == {"deleted_count": 2}
+        params = async_client.delete.call_args.kwargs["params"]
+        assert params["from"] == "2024-02-01"
+        assert params["to"] == "2024-02-29"
+
+
+class TestAsyncCreditManager:
+    """Unit tests for AsyncCreditManager."""
+
+    def test_bulk_grant_credit(self, async_client) -> None:
+        """Test bulk grant maps each campaign to its result or exception."""
+        error = APIRequestException("rejected")
+        async_client.post.side_effect = [{"ok": 1}, error]
+        manager = AsyncCreditManager("uuid-1", client=async_client, max_concurrency=1)
+
+        results = asyncio.run(manager.bulk_grant_credit(["c1", "c2"], 100))
+
+        assert results == {"c1": {"ok": 1}, "c2": error}
+        endpoint = async_client.post.call_args_list[0].args[0]
+        assert endpoint == "billing/admin/campaign/c1/credits"
+
+    def test_get_credit_balance(self, async_client) -> None:
+        """Test free and paid histories are combined into a balance."""
+        async_client.get.side_effect = [
+            {"creditHistories": [{"creditType": "FREE", "amount": 100}]},
+            {"creditHistories": [{"creditType": "PAID", "amount": 50}]},
+        ]
+        manager = AsyncCreditManager("uuid-1", client=async_client)
+
+        balance = asyncio.run(manager.get_credit_balance())
+
+        assert balance == {"free": 100.0, "paid": 50.0, "total": 150.0}
+
+    def test_empty_uuid(self, async_client) -> None:
+        """Test UUID validation is shared with the sync manager."""
+        with pytest.raises(ValidationException):
+            AsyncCreditManager("", client=async_client)
+
+
+class TestAsyncContractManager:
+    """Unit tests for AsyncContractManager."""
+
+    def test_get_multiple_counter_prices(self, async_client) -> None:
+        """Test prices are fetched per counter and failures recorded."""
+
+        async def get(endpoint, headers, params):
+            if params["counterNames"] == "bad":
+                raise APIRequestException("missing")
+            return {"prices": {"price": 80, "originalPrice": 100}}
+
+        async_client.get.side_effect = get
+        manager = AsyncContractManager("2024-01", "bg-1", client=async_client)
+
+        results = asyncio.run(
+            manager.get_multiple_counter_prices("contract-1", ["cpu", "bad"])
+        )
+
+        assert results["cpu"]["discount_rate"] == 20.0
+        assert results["bad"] == {"error": "missing"}
+        # The failing counter is retried three times
+        assert async_client.get.await_count == 4
+
+
+class TestAsyncAdjustmentManager:
+    """Unit tests for AsyncAdjustmentManager."""
+
+    def test_apply_adjustment(self, async_client) -> None:
+        """Test adjustment payload and endpoint for a project target."""
+        manager = AsyncAdjustmentManager("2024-01", client=async_client)
+
+        asyncio.run(
+            manager.apply_adjustment(
+                adjustment_amount=10,
+                adjustment_type=AdjustmentType.FIXED_DISCOUNT,
+                adjustment_target=AdjustmentTarget.PROJECT,
+                target_id="proj-1",
+            )
+        )
+
+        endpoint = async_client.post.call_args.args[0]
+        data = async_client.post.call_args.kwargs["json_data"]
+        assert endpoint == "billing/admin/projects/adjustments"
+        assert data["projectId"] == "proj-1"
+
+    def test_delete_adjustment_raises_first_failure(self, async_client) -> None:
+        """Test a failed deletion is re-raised after all deletions ran."""
+        async_client.delete.side_effect = [
+            {"ok": 1},
+            APIRequestException("failed"),
+            {"ok": 3},
+        ]
+        manager = AsyncAdjustmentManager(
+            "2024-01", client=async_client, max_concurrency=1
+        )
+
+        with pytest.raises(APIRequestException, match="failed"):
+            asyncio.run(
+                manager.delete_adjustment(
+                    ["adj-1", "adj-2", "adj-3"], AdjustmentTarget.PROJECT
+                )
+            )
+
+        assert async_client.delete.await_count == 3
+
+
+class TestAsyncPaymentManager:
+    """Unit tests for AsyncPaymentManager."""
+
+    def test_get_payment_status(self, async_client) -> None:
+        """Test payment status is parsed from the console statements."""
+        async_client.get.return_value = {
+            "statements": [{"paymentGroupId": "pg-1", "paymentStatusCode": "PAID"}]
+        }
+        manager = AsyncPaymentManager("2024-01", "uuid-1", client=async_client)
+
+        payment_group_id, status = asyncio.run(manager.get_payment_status())
+
+        assert payment_group_id == "pg-1"
+        assert status == PaymentStatus.PAID
+        endpoint = async_client.get.call_args.args[0]
+        assert endpoint == "billing/payments/2024-01/statements"
+
+    def test_check_unpaid(self, async_client) -> None:
+        """Test unpaid amounts are summed."""
+        async_client.get.return_value = {
+            "statements": [{"totalAmount": 1000}, {"totalAmount": 500}]
+        }
+        manager = AsyncPaymentManager("2024-01", "uuid-1", client=async_client)
+
+        assert asyncio.run(manager.check_unpaid()) == 1500.0
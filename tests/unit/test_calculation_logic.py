@@ -67,7 +67,8 @@ class TestCalculationLogic:
             status_field="status",
             success_value="COMPLETED",
             timeout=120,
-            check_interval=3,
+            check_interval=None,
+            stream_endpoint=None,
         )
 
     def test_wait_for_completion_timeout(self, calc_manager):
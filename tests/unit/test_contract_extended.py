@@ -116,7 +116,7 @@ class TestContractManagerExtended:
     ) -> None:
         """Test successful get_multiple_counter_prices."""
         # Mock different responses for different counters
-        mock_client.get.side_effect = [
+        mock_client.map_requests.return_value = [
             {"prices": {"price": 8000, "originalPrice": 10000}},
             {"prices": {"price": 5000, "originalPrice": 6000}},
             {"prices": {"price": 3000, "originalPrice": 3000}},
@@ -127,6 +127,11 @@ class TestContractManagerExtended:
             contract_id="contract-123", counter_names=counter_names
         )
 
+        specs = mock_client.map_requests.call_args.args[0]
+        assert [spec.params["counterNames"] for spec in specs] == counter_names
+        assert (
+            specs[0].endpoint == "billing/admin/contracts/contract-123/products/prices"
+        )
         assert len(result) == 3
         assert result["Instances"]["price"] == 8000
         assert result["Storage"]["price"] == 5000
@@ -137,13 +142,15 @@ class TestContractManagerExtended:
         self, contract_manager, mock_client
     ) -> None:
         """Test get_multiple_counter_prices with some failures."""
-        # Mock mixed success and failure
-        mock_client.get.side_effect = [
-            {"prices": {"price": 8000, "originalPrice": 10000}},
-            APIRequestException("Failed to get Storage price"),
-            APIRequestException("Failed to get Storage price"),
-            APIRequestException("Failed to get Storage price"),  # All retries fail
-            {"prices": {"price": 3000, "originalPrice": 3000}},
+        # Mock mixed success and failure; failed lookups are retried as a batch
+        mock_client.map_requests.side_effect = [
+            [
+                {"prices": {"price": 8000, "originalPrice": 10000}},
+                APIRequestException("Failed to get Storage price"),
+                {"prices": {"price": 3000, "originalPrice": 3000}},
+            ],
+            [APIRequestException("Failed to get Storage price")],
+            [APIRequestException("Failed to get Storage price")],  # All retries fail
         ]
 
         counter_names = ["Instances", "Storage", "Network"]
@@ -151,12 +158,31 @@ class TestContractManagerExtended:
             contract_id="contract-123", counter_names=counter_names
         )
 
-        assert len(result) == 3
+        assert mock_client.map_requests.call_count == 3
+        retried = mock_client.map_requests.call_args.args[0]
+        assert [spec.params["counterNames"] for spec in retried] == ["Storage"]
+        assert list(result) == counter_names
         assert result["Instances"]["price"] == 8000
         assert "error" in result["Storage"]
         assert "Failed to get Storage price" in result["Storage"]["error"]
         assert result["Network"]["price"] == 3000
 
+    def test_get_multiple_counter_prices_recovers_on_retry(
+        self, contract_manager, mock_client
+    ) -> None:
+        """Test a counter that fails once is filled in by the retry round."""
+        mock_client.map_requests.side_effect = [
+            [APIRequestException("Temporary error")],
+            [{"prices": {"price": 900, "originalPrice": 1000}}],
+        ]
+
+        result = contract_manager.get_multiple_counter_prices(
+            contract_id="contract-123", counter_names=["Instances"]
+        )
+
+        assert mock_client.map_requests.call_count == 2
+        assert result["Instances"]["price"] == 900
+
     def test_validate_month_format_invalid(self) -> None:
         """Test month validation with various invalid formats."""
         invalid_months = [
@@ -8,7 +8,7 @@ from pytest import approx
 
 from libs.constants import CreditType
 from libs.Credit import CreditAPIClient, CreditHistory, CreditManager, CreditRequest
-from libs.exceptions import ValidationException
+from libs.exceptions import APIRequestException, ValidationException
 
 
 class TestCreditAPIClient:
@@ -260,10 +260,9 @@ class TestCreditManagerBase:
     def test_grant_credit_to_users_success(self) -> None:
         """Test granting credit to multiple users."""
         # Using bulk_grant_credit instead of grant_credit_to_users
-        self.mock_api_client._client.post.return_value = {  # type: ignore[attr-defined]
-            "grantedCount": 1,
-            "totalCredit": 1000,
-        }
+        self.mock_client.map_requests.return_value = [
+            {"grantedCount": 1, "totalCredit": 1000}
+        ]
 
         result = self.credit_manager.bulk_grant_credit(
             campaign_ids=["CAMP-123"], amount=1000
@@ -271,6 +270,32 @@ class TestCreditManagerBase:
 
         assert "CAMP-123" in result
         assert not isinstance(result["CAMP-123"], Exception)
+        (spec,) = self.mock_client.map_requests.call_args.args[0]
+        assert spec.endpoint == "billing/admin/campaign/CAMP-123/credits"
+        assert spec.json_data["uuidList"] == ["test-uuid-123"]
+
+    def test_bulk_grant_credit_partial_failure(self) -> None:
+        """Test invalid grants and failed requests are reported per campaign."""
+        self.mock_client.map_requests.return_value = [
+            APIRequestException("Campaign closed")
+        ]
+
+        result = self.credit_manager.bulk_grant_credit(
+            campaign_ids=["CAMP-1"], amount=1000
+        )
+
+        assert isinstance(result["CAMP-1"], APIRequestException)
+
+    def test_bulk_cancel_credit(self) -> None:
+        """Test bulk cancellation keeps campaign order."""
+        self.mock_client.map_requests.return_value = [{"ok": 1}, {"ok": 2}]
+
+        result = self.credit_manager.bulk_cancel_credit(["CAMP-1", "CAMP-2"])
+
+        assert result == {"CAMP-1": {"ok": 1}, "CAMP-2": {"ok": 2}}
+        specs = self.mock_client.map_requests.call_args.args[0]
+        assert specs[1].endpoint == "billing/admin/credits/CAMP-2/cancel"
+        assert specs[1].params == {"reason": "Bulk cancellation"}
 
     def test_grant_credit_to_users_invalid_amount(self) -> None:
         """Test granting credit with invalid amount."""
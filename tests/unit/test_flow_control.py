@@ -0,0 +1,309 @@
+"""Unit tests for adaptive concurrency limiting and circuit breaking."""
+
+import threading
+
+import pytest
+import responses
+
+from libs.exceptions import APIRequestException, CircuitOpenException
+from libs.flow_control import (
+    AdaptiveLimiter,
+    CircuitBreaker,
+    CircuitState,
+    FlowControl,
+    parse_retry_after,
+)
+from libs.http_client import BillingAPIClient, RetryConfig
+
+BASE_URL = "https://api.example.com"
+OK_BODY = {"header": {"isSuccessful": True, "resultMessage": "SUCCESS"}}
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    """Provide a controllable clock."""
+    return FakeClock()
+
+
+class TestParseRetryAfter:
+    """Unit tests for Retry-After parsing."""
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [("3", 3.0), ("0.5", 0.5), ("-1", 0.0), (None, None), ("soon", None)],
+    )
+    def test_delay_seconds(self, value, expected) -> None:
+        """Test numeric values and malformed input."""
+        assert parse_retry_after(value) == expected
+
+    def test_http_date(self) -> None:
+        """Test HTTP dates are converted to a delay."""
+        now = 1_700_000_000.0
+        value = "Tue, 14 Nov 2023 22:13:30 GMT"  # now + 10s
+
+        assert parse_retry_after(value, now=now) == pytest.approx(10.0)
+
+
+class TestAdaptiveLimiter:
+    """Unit tests for AdaptiveLimiter."""
+
+    def test_additive_increase(self, clock) -> None:
+        """Test a window of successes adds about one slot."""
+        limiter = AdaptiveLimiter(initial_limit=4, clock=clock)
+
+        for _ in range(4):
+            limiter.release(limiter.acquire())
+
+        assert limiter.limit == 4
+        limiter.release(limiter.acquire())
+        assert limiter.limit == 5
+
+    def test_multiplicative_decrease_once_per_window(self, clock) -> None:
+        """Test requests already in flight do not cut the limit again."""
+        limiter = AdaptiveLimiter(initial_limit=8, clock=clock)
+        permits = [limiter.acquire() for _ in range(3)]
+        clock.now = 1
+
+        for started in permits:
+            limiter.release(started, overloaded=True)
+        assert limiter.limit == 4
+
+        limiter.release(limiter.acquire(), overloaded=True)
+        assert limiter.limit == 2
+
+    def test_limit_bounds(self, clock) -> None:
+        """Test the limit stays within min_limit and max_limit."""
+        limiter = AdaptiveLimiter(
+            initial_limit=2, min_limit=2, max_limit=3, clock=clock
+        )
+
+        for _ in range(20):
+            limiter.release(limiter.acquire())
+        assert limiter.limit == 3
+
+        for _ in range(5):
+            limiter.release(limiter.acquire(), overloaded=True)
+        assert limiter.limit == 2
+
+    def test_latency_spike_shrinks_limit(self, clock) -> None:
+        """Test a request far slower than usual counts as overload."""
+        limiter = AdaptiveLimiter(initial_limit=8, latency_tolerance=2.0, clock=clock)
+        for _ in range(AdaptiveLimiter.LATENCY_WARMUP + 1):
+            started = limiter.acquire()
+            clock.now += 0.1
+            limiter.release(started)
+        grown = limiter.limit
+
+        started = limiter.acquire()
+        clock.now += 1.0
+        limiter.release(started)
+
+        assert limiter.limit == grown // 2
+
+    def test_full_limiter_blocks(self, clock) -> None:
+        """Test acquire waits while every slot is taken."""
+        limiter = AdaptiveLimiter(initial_limit=1, clock=clock)
+        limiter.acquire()
+
+        assert limiter.acquire(timeout=0) is None
+        assert limiter.in_flight == 1
+
+    def test_release_wakes_waiter(self) -> None:
+        """Test a blocked acquire proceeds once a slot is returned."""
+        limiter = AdaptiveLimiter(initial_limit=1)
+        started = limiter.acquire()
+        acquired = []
+        waiter = threading.Thread(target=lambda: acquired.append(limiter.acquire()))
+        waiter.start()
+
+        limiter.release(started)
+        waiter.join(timeout=5)
+
+        assert len(acquired) == 1
+        assert acquired[0] is not None
+
+    def test_retry_after_pauses_group(self, clock) -> None:
+        """Test Retry-After blocks new requests until it elapses."""
+        limiter = AdaptiveLimiter(max_retry_after=5, clock=clock)
+        limiter.release(limiter.acquire(), overloaded=True, retry_after=30)
+
+        assert limiter.pause_remaining == 5
+        assert limiter.acquire(timeout=0) is None
+        clock.now = 5
+        assert limiter.acquire(timeout=0) == 5
+
+    def test_invalid_settings(self) -> None:
+        """Test inconsistent limits are rejected."""
+        with pytest.raises(ValueError, match="min_limit"):
+            AdaptiveLimiter(initial_limit=2, max_limit=1)
+        with pytest.raises(ValueError, match="backoff_ratio"):
+            AdaptiveLimiter(backoff_ratio=1.5)
+
+
+class TestCircuitBreaker:
+    """Unit tests for CircuitBreaker."""
+
+    def test_opens_after_consecutive_failures(self, clock) -> None:
+        """Test the circuit opens at the threshold and rejects requests."""
+        breaker = CircuitBreaker(failure_threshold=3, recovery_timeout=10, clock=clock)
+        breaker.record_failure()
+        breaker.record_success()
+        for _ in range(3):
+            breaker.record_failure()
+
+        assert breaker.state is CircuitState.OPEN
+        assert not breaker.allow()
+        assert breaker.retry_after() == 10
+
+    def test_half_open_allows_single_probe(self, clock) -> None:
+        """Test only one probe is let through after the recovery timeout."""
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=10, clock=clock)
+        breaker.record_failure()
+        clock.now = 10
+
+        assert breaker.state is CircuitState.HALF_OPEN
+        assert breaker.allow()
+        assert not breaker.allow()
+
+        breaker.record_success()
+        assert breaker.state is CircuitState.CLOSED
+
+    def test_failed_probe_reopens(self, clock) -> None:
+        """Test a failed probe opens the circuit for another timeout."""
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=10, clock=clock)
+        breaker.record_failure()
+        clock.now = 10
+        breaker.allow()
+        breaker.record_failure()
+
+        assert breaker.state is CircuitState.OPEN
+        assert breaker.retry_after() == 10
+
+
+class TestFlowControl:
+    """Unit tests for FlowControl grouping and reporting."""
+
+    def test_groups_by_host_and_pattern(self) -> None:
+        """Test URLs map to host plus the first matching group."""
+        flow = FlowControl(endpoint_groups={"admin": "billing/admin/*"})
+
+        assert flow.group_for(f"{BASE_URL}/billing/admin/progress") == (
+            "api.example.com/admin"
+        )
+        assert flow.group_for(f"{BASE_URL}/billing/meters") == (
+            "api.example.com/default"
+        )
+        assert flow.group_for("http://other:5000/billing/admin/x") == "other:5000/admin"
+
+    def test_groups_are_independent(self, clock) -> None:
+        """Test overload in one group leaves the others untouched."""
+        flow = FlowControl(
+            endpoint_groups={"admin": "billing/admin/*"}, initial_limit=4, clock=clock
+        )
+        permit = flow.acquire(f"{BASE_URL}/billing/admin/calculation")
+        flow.release(permit, status_code=429, retry_after="2")
+        flow.release(flow.acquire(f"{BASE_URL}/billing/meters"), status_code=200)
+
+        snapshot = {k: v.to_dict() for k, v in flow.snapshot().items()}
+        assert snapshot == {
+            "api.example.com/admin": {
+                "limit": 2,
+                "in_flight": 0,
+                "circuit": "closed",
+                "pause_remaining": 2.0,
+            },
+            "api.example.com/default": {
+                "limit": 4,
+                "in_flight": 0,
+                "circuit": "closed",
+                "pause_remaining": 0.0,
+            },
+        }
+
+    def test_open_circuit_fails_fast(self, clock) -> None:
+        """Test acquire raises once the group's circuit opens."""
+        flow = FlowControl(failure_threshold=2, recovery_timeout=30, clock=clock)
+        url = f"{BASE_URL}/billing/meters"
+        for _ in range(2):
+            flow.release(flow.acquire(url), status_code=None)
+
+        with pytest.raises(CircuitOpenException) as exc_info:
+            flow.acquire(url)
+
+        assert exc_info.value.group == "api.example.com/default"
+        assert exc_info.value.context.retry_after == 30
+
+
+class TestClientFlowControl:
+    """Tests for BillingAPIClient with flow control attached."""
+
+    @pytest.fixture
+    def flow(self):
+        """Provide flow control with a low failure threshold."""
+        return FlowControl(initial_limit=4, failure_threshold=2, recovery_timeout=60)
+
+    @pytest.fixture
+    def client(self, flow):
+        """Provide a flow-controlled client that retries without backoff."""
+        with BillingAPIClient(
+            BASE_URL,
+            retry_config=RetryConfig(total=2, backoff_factor=0),
+            flow_control=flow,
+        ) as client:
+            yield client
+
+    @responses.activate
+    def test_rate_limited_request_retried(self, client, flow) -> None:
+        """Test a 429 shrinks the limit and is retried by the client."""
+        url = f"{BASE_URL}/billing/meters"
+        responses.add(responses.GET, url, status=429, headers={"Retry-After": "0"})
+        responses.add(responses.GET, url, json=OK_BODY)
+
+        assert client.get("billing/meters") == OK_BODY
+        assert len(responses.calls) == 2
+        assert flow.limiter("api.example.com/default").limit == 2
+
+    @responses.activate
+    def test_rate_limit_retries_exhausted(self, client) -> None:
+        """Test persistent 429s surface as an API error."""
+        url = f"{BASE_URL}/billing/meters"
+        responses.add(
+            responses.GET, url, status=429, json={"error": "RATE_LIMIT_EXCEEDED"}
+        )
+
+        with pytest.raises(APIRequestException):
+            client.get("billing/meters")
+        assert len(responses.calls) == 3
+
+    @responses.activate
+    def test_circuit_opens_on_server_errors(self, client, flow) -> None:
+        """Test repeated 5xx responses make later requests fail fast."""
+        url = f"{BASE_URL}/billing/meters"
+        responses.add(responses.GET, url, status=503, json={"error": "down"})
+
+        for _ in range(2):
+            with pytest.raises(APIRequestException):
+                client.get("billing/meters")
+        with pytest.raises(CircuitOpenException):
+            client.get("billing/meters")
+
+        assert len(responses.calls) == 6  # urllib3 still retries 5xx
+        assert flow.snapshot()["api.example.com/default"].circuit == "open"
+
+    def test_429_left_to_client_retries(self, client) -> None:
+        """Test urllib3 no longer retries 429 when flow control is on."""
+        retries = client.session.get_adapter(BASE_URL).max_retries
+
+        assert 429 not in retries.status_forcelist
+        assert 503 in retries.status_forcelist
+        assert not retries.respect_retry_after_header
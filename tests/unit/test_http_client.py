@@ -1,7 +1,9 @@
 """Unit tests for HTTP client module following pytest best practices."""
 
+import threading
+import time
 from typing import Never
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 import requests
@@ -11,10 +13,12 @@ from libs.exceptions import APIRequestException
 from libs.http_client import (
     BillingAPIClient,
     HTTPMethod,
+    RequestSpec,
     RetryConfig,
     TelemetryManager,
     retry_on_exception,
 )
+from libs.polling import AdaptivePolling
 
 
 class TestBillingAPIClientUnit:
@@ -298,6 +302,190 @@ class TestBillingAPIClientUnit:
             if len(callback_calls) > 1:
                 assert callback_calls[-1]["progress"] == 100
 
+    def test_wait_for_completion_adaptive_by_default(self, api_client) -> None:
+        """Test polling backs off from a fast first check without check_interval."""
+        polling = AdaptivePolling(initial_interval=0.01, multiplier=2, jitter=0)
+
+        with (
+            patch.object(api_client, "get") as mock_get,
+            patch("libs.http_client.time.sleep") as mock_sleep,
+        ):
+            mock_get.side_effect = [
+                {"status": "RUNNING"},
+                {"status": "RUNNING"},
+                {"status": "COMPLETED"},
+            ]
+
+            api_client.wait_for_completion("/status", polling=polling)
+
+        delays = [c.args[0] for c in mock_sleep.call_args_list]
+        assert delays == pytest.approx([0.01, 0.02])
+
+    def test_wait_for_completion_from_stream(self, api_client) -> None:
+        """Test completion is taken from pushed events without polling."""
+        events = iter([{"status": "RUNNING"}, {"status": "COMPLETED"}])
+        progress = []
+
+        with (
+            patch.object(api_client, "stream_events", return_value=events),
+            patch.object(api_client, "get") as mock_get,
+        ):
+            result = api_client.wait_for_completion(
+                "/status",
+                stream_endpoint="/status/stream",
+                progress_callback=progress.append,
+            )
+
+        assert result == {"status": "COMPLETED"}
+        assert progress == [{"status": "RUNNING"}]
+        mock_get.assert_not_called()
+
+    def test_wait_for_completion_stream_falls_back(self, api_client) -> None:
+        """Test a failing stream falls back to polling."""
+        with (
+            patch.object(
+                api_client,
+                "stream_events",
+                side_effect=APIRequestException("HTTP 404: Not found"),
+            ),
+            patch.object(api_client, "get", return_value={"status": "COMPLETED"}),
+        ):
+            result = api_client.wait_for_completion(
+                "/status", stream_endpoint="/status/stream"
+            )
+
+        assert result == {"status": "COMPLETED"}
+
+    def test_stream_events_parses_sse(self, api_client, mock_session) -> None:
+        """Test event stream lines are parsed and header-validated."""
+        response = MagicMock(status_code=200)
+        response.__enter__.return_value = response
+        response.iter_lines.return_value = [
+            ": keep-alive",
+            "event: progress",
+            'data: {"status": "RUNNING"}',
+            "",
+            'data: {"header": {"isSuccessful": false, "resultMessage": "Nope"}}',
+            "",
+        ]
+        mock_session.get.return_value = response
+
+        stream = api_client.stream_events("billing/admin/progress/stream")
+
+        assert next(stream) == {"status": "RUNNING"}
+        with pytest.raises(APIRequestException, match="Nope"):
+            next(stream)
+        headers = mock_session.get.call_args.kwargs["headers"]
+        assert headers["Accept"] == "text/event-stream"
+
+
+class TestMapRequests:
+    """Unit tests for BillingAPIClient.map_requests."""
+
+    @pytest.fixture
+    def client(self):
+        """Provide a client with a small worker pool."""
+        client = BillingAPIClient("https://api.example.com", max_workers=4)
+        yield client
+        client.close()
+
+    def test_results_in_input_order(self, client) -> None:
+        """Test results line up with specs even when they finish out of order."""
+
+        def fake_request(method, endpoint, **kwargs):
+            # Later specs finish first
+            time.sleep(0.01 * (5 - int(endpoint)))
+            return {"endpoint": endpoint, "method": method, **kwargs}
+
+        specs = [RequestSpec(HTTPMethod.GET, str(i), params={"i": i}) for i in range(5)]
+
+        with patch.object(client, "request", side_effect=fake_request):
+            results = client.map_requests(specs)
+
+        assert [r["endpoint"] for r in results] == ["0", "1", "2", "3", "4"]
+        assert results[2] == {"endpoint": "2", "method": "GET", "params": {"i": 2}}
+
+    def test_exceptions_returned_per_spec(self, client) -> None:
+        """Test a failed request does not abort the rest of the batch."""
+
+        def fake_request(method, endpoint, **kwargs):
+            if endpoint == "bad":
+                raise APIRequestException("boom")
+            return {"ok": endpoint}
+
+        specs = [
+            RequestSpec("GET", "a"),
+            RequestSpec("GET", "bad"),
+            RequestSpec("GET", "c"),
+        ]
+
+        with patch.object(client, "request", side_effect=fake_request):
+            results = client.map_requests(specs)
+
+        assert results[0] == {"ok": "a"}
+        assert isinstance(results[1], APIRequestException)
+        assert results[2] == {"ok": "c"}
+
+    def test_concurrency_cap(self, client) -> None:
+        """Test no more than max_concurrency requests are in flight."""
+        lock = threading.Lock()
+        in_flight = 0
+        peak = 0
+
+        def fake_request(method, endpoint, **kwargs):
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.01)
+            with lock:
+                in_flight -= 1
+            return {}
+
+        specs = [RequestSpec("GET", str(i)) for i in range(12)]
+
+        with patch.object(client, "request", side_effect=fake_request):
+            results = client.map_requests(specs, max_concurrency=2)
+
+        assert len(results) == 12
+        assert peak == 2
+
+    def test_iter_requests_pulls_specs_lazily(self, client) -> None:
+        """Test iter_requests reads specs only as slots free up."""
+        pulled = 0
+
+        def specs():
+            nonlocal pulled
+            for i in range(10):
+                pulled += 1
+                yield RequestSpec("GET", str(i))
+
+        with patch.object(client, "request", return_value={}):
+            stream = client.iter_requests(specs(), max_concurrency=2)
+            next(stream)
+            assert pulled == 3
+            assert len(list(stream)) == 9
+
+    def test_empty_specs(self, client) -> None:
+        """Test an empty batch does not start the worker pool."""
+        assert client.map_requests([]) == []
+        assert client._executor is None
+
+    def test_close_shuts_down_executor(self, client) -> None:
+        """Test close releases the worker pool."""
+        with patch.object(client, "request", return_value={}):
+            client.map_requests([RequestSpec("GET", "a")])
+
+        assert client._executor is not None
+        client.close()
+        assert client._executor is None
+
+    def test_request_spec_kwargs_omit_unset(self) -> None:
+        """Test RequestSpec only forwards fields that were set."""
+        spec = RequestSpec("POST", "billing/meters", json_data={"meterList": []})
+
+        assert spec.request_kwargs() == {"json_data": {"meterList": []}}
+
 
 class TestRetryDecorator:
     """Unit tests for retry decorator."""
@@ -0,0 +1,46 @@
+"""Unit tests for HyperLogLog distinct-value estimation."""
+
+import pytest
+
+from libs.hyperloglog import HyperLogLog
+
+
+class TestHyperLogLog:
+    """Unit tests for HyperLogLog."""
+
+    def test_small_counts_are_exact(self):
+        """Test linear counting gives exact answers for few values."""
+        sketch = HyperLogLog()
+
+        assert sketch.count() == 0
+        sketch.update(["vm-1", "vm-2", "vm-1", "vm-3"])
+        assert sketch.count() == 3
+
+    def test_non_string_values_are_hashed_by_str(self):
+        """Test numeric ids are accepted and count as their string form."""
+        sketch = HyperLogLog().update([1, 2, 2, "2", 3.5])
+
+        assert sketch.count() == 3
+
+    @pytest.mark.parametrize("precision", [10, 14])
+    def test_estimate_within_error_bound(self, precision):
+        """Test large counts land within a few standard errors."""
+        sketch = HyperLogLog(precision).update(f"vm-{i}" for i in range(200_000))
+
+        assert sketch.standard_error == pytest.approx(1.04 / 2 ** (precision / 2))
+        assert sketch.count() == pytest.approx(200_000, rel=3 * sketch.standard_error)
+
+    def test_merge_equals_union(self):
+        """Test merging sketches equals sketching the union of their values."""
+        first = HyperLogLog(12).update(f"vm-{i}" for i in range(30_000))
+        second = HyperLogLog(12).update(f"vm-{i}" for i in range(20_000, 50_000))
+        union = HyperLogLog(12).update(f"vm-{i}" for i in range(50_000))
+
+        assert first.merge(second).count() == union.count()
+
+    def test_invalid_precision(self):
+        """Test out-of-range precision and mismatched merges are rejected."""
+        with pytest.raises(ValueError, match="between 4 and 18"):
+            HyperLogLog(3)
+        with pytest.raises(ValueError, match="different precision"):
+            HyperLogLog(10).merge(HyperLogLog(12))
@@ -0,0 +1,162 @@
+"""Unit tests for the pluggable JSON codec layer."""
+
+import json
+from datetime import date
+from decimal import Decimal
+from unittest.mock import Mock
+from uuid import UUID
+
+import pytest
+
+from libs.constants import CounterType
+from libs.exceptions import APIRequestException, ConfigurationException
+from libs.http_client import BillingAPIClient
+from libs.json_codec import CODEC_ENV_VAR, available_codecs, get_codec
+
+CODEC_NAMES = ["orjson", "msgspec", "json"]
+
+
+@pytest.fixture(params=CODEC_NAMES)
+def codec(request):
+    """Provide each codec that is installed."""
+    if request.param not in available_codecs():
+        pytest.skip(f"{request.param} is not installed")
+    return get_codec(request.param)
+
+
+class TestJSONCodec:
+    """Behaviour every codec must share."""
+
+    def test_round_trip(self, codec) -> None:
+        """Test nested payloads survive encode/decode unchanged."""
+        payload = {"lineItems": [{"amount": 1.5, "name": "cpu", "tags": None}]}
+
+        assert codec.loads(codec.dumps(payload)) == payload
+        assert codec.loads(codec.dumps(payload).decode()) == payload
+
+    def test_decimal_amounts_encoded_exactly(self, codec) -> None:
+        """Test Decimal amounts keep every digit as strings."""
+        encoded = codec.dumps({"amount": Decimal("12345678901234567.89")})
+
+        assert codec.loads(encoded) == {"amount": "12345678901234567.89"}
+
+    def test_domain_types(self, codec) -> None:
+        """Test enums, dates, UUIDs and non-string keys encode like stdlib."""
+        uuid = UUID("12345678-1234-5678-1234-567812345678")
+        encoded = codec.dumps(
+            {
+                "type": CounterType.DELTA,
+                "day": date(2024, 1, 31),
+                "id": uuid,
+                1: "one",
+            }
+        )
+
+        assert codec.loads(encoded) == {
+            "type": "DELTA",
+            "day": "2024-01-31",
+            "id": str(uuid),
+            "1": "one",
+        }
+
+    def test_unicode_not_escaped(self, codec) -> None:
+        """Test output is UTF-8 rather than ASCII escapes."""
+        assert "결제".encode() in codec.dumps({"name": "결제"})
+
+    def test_invalid_json_raises_value_error(self, codec) -> None:
+        """Test decode errors surface as ValueError for every backend."""
+        with pytest.raises(ValueError):
+            codec.loads(b"{not json")
+
+    def test_unsupported_type_raises_type_error(self, codec) -> None:
+        """Test objects without a JSON form are rejected."""
+        with pytest.raises(TypeError):
+            codec.dumps({"value": object()})
+
+
+class TestGetCodec:
+    """Unit tests for codec selection."""
+
+    def test_default_is_fastest_installed(self, monkeypatch) -> None:
+        """Test the first available codec is preferred."""
+        monkeypatch.delenv(CODEC_ENV_VAR, raising=False)
+
+        assert get_codec().name == available_codecs()[0]
+        assert available_codecs()[-1] == "json"
+
+    def test_environment_override(self, monkeypatch) -> None:
+        """Test the environment variable forces a codec."""
+        monkeypatch.setenv(CODEC_ENV_VAR, "json")
+
+        assert get_codec().name == "json"
+
+    def test_unknown_codec(self) -> None:
+        """Test an unavailable codec is a configuration error."""
+        with pytest.raises(ConfigurationException, match="ujson"):
+            get_codec("ujson")
+
+    def test_instances_are_shared(self) -> None:
+        """Test codecs are created once per name."""
+        assert get_codec("json") is get_codec("json")
+
+
+class TestClientDecoding:
+    """Tests for response decoding in BillingAPIClient."""
+
+    def test_response_body_decoded_with_codec(self, codec) -> None:
+        """Test raw response bytes go through the client's codec."""
+        client = BillingAPIClient("https://api.example.com", codec=codec)
+        response = Mock(status_code=200, content=b'{"statements": [1, 2]}')
+
+        assert client._validate_response(response) == {"statements": [1, 2]}
+        response.json.assert_not_called()
+
+    def test_invalid_body_reported(self, codec) -> None:
+        """Test undecodable bodies raise the usual API error."""
+        client = BillingAPIClient("https://api.example.com", codec=codec)
+        response = Mock(
+            status_code=502,
+            content=b"<html>",
+            headers={"content-type": "application/json"},
+        )
+
+        with pytest.raises(APIRequestException, match="Invalid JSON response"):
+            client._validate_response(response)
+
+
+class TestMockServerProvider:
+    """Tests for the mock server's Flask JSON provider."""
+
+    @pytest.fixture
+    def app(self, codec):
+        """Provide a Flask app using the codec's backend."""
+        flask = pytest.importorskip("flask")
+        from mock_server.json_provider import FastJSONProvider
+
+        app = flask.Flask(__name__)
+        app.json = FastJSONProvider(app, backend=codec.name)
+
+        @app.post("/echo")
+        def echo():
+            body = flask.request.get_json()
+            return flask.jsonify({**body, "amount": Decimal("10.10")})
+
+        return app
+
+    def test_encode_and_decode(self, app) -> None:
+        """Test request bodies decode and responses encode with the backend."""
+        response = app.test_client().post("/echo", json={"meterList": [1, 2]})
+
+        assert response.status_code == 200
+        assert response.get_json() == {"meterList": [1, 2], "amount": "10.10"}
+
+    def test_backend_rejects_fall_back_to_stdlib(self, app) -> None:
+        """Test values a backend cannot encode are encoded by the stdlib."""
+        body = {"meterList": [2**70]}
+
+        with app.app_context():
+            assert json.loads(app.json.dumps(body)) == body
+        response = app.test_client().post("/echo", json=body)
+
+        assert response.status_code == 200
+        assert response.get_json()["meterList"] == [2**70]
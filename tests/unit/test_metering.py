@@ -6,6 +6,7 @@ import pytest
 
 from libs.constants import CounterType
 from libs.exceptions import APIRequestException, ValidationException
+from libs.json_codec import get_codec
 from libs.Metering import MeteringManager
 
 
@@ -162,13 +163,20 @@ class TestMeteringManagerUnit:
             },
         ]
 
-        self.mock_client.post.return_value = {"status": "SUCCESS"}
+        self.mock_client.map_requests.return_value = [
+            {"status": "SUCCESS"},
+            {"status": "SUCCESS"},
+        ]
 
         result = self.metering.send_batch_metering("test-app", metering_items)
 
         assert len(result["results"]) == 2
         assert all(r["success"] for r in result["results"])
-        assert self.mock_client.post.call_count == 2
+        specs = self.mock_client.map_requests.call_args.args[0]
+        assert [spec.endpoint for spec in specs] == ["billing/meters"] * 2
+        meter = specs[1].json_data["meterList"][0]
+        assert meter["appKey"] == "test-app"
+        assert meter["counterName"] == "storage.volume"
 
     def test_send_batch_metering_partial_failure(self) -> None:
         """Test batch metering with partial failures."""
@@ -188,7 +196,7 @@ class TestMeteringManagerUnit:
         ]
 
         # First call succeeds, second fails
-        self.mock_client.post.side_effect = [
+        self.mock_client.map_requests.return_value = [
             {"status": "SUCCESS"},
             APIRequestException("Failed"),
         ]
@@ -200,6 +208,106 @@ class TestMeteringManagerUnit:
         assert result["results"][1]["success"] is False
         assert "Failed" in result["results"][1]["error"]
 
+    def test_send_batch_metering_invalid_meter(self) -> None:
+        """Test an invalid meter aborts the batch before anything is sent."""
+        metering_items = [
+            {
+                "counter_name": "compute.c2.c8m8",
+                "counter_type": "INVALID",
+                "counter_unit": "HOURS",
+                "counter_volume": "100",
+            }
+        ]
+
+        with pytest.raises(ValidationException):
+            self.metering.send_batch_metering("test-app", metering_items)
+
+        self.mock_client.map_requests.assert_not_called()
+
+    def _meters(self, count: int) -> list[dict]:
+        return [
+            {
+                "counter_name": f"compute.c2.c8m8.{i}",
+                "counter_type": "DELTA",
+                "counter_unit": "HOURS",
+                "counter_volume": str(i),
+            }
+            for i in range(count)
+        ]
+
+    def test_send_batch_metering_packs_meter_lists(self) -> None:
+        """Test batching sends multi-record meterLists and maps meter IDs back."""
+        self.mock_client.map_requests.return_value = [
+            {"meterIds": ["m0", "m1"]},
+            {"meterIds": ["m2", "m3"]},
+            {"meterIds": ["m4"]},
+        ]
+
+        result = self.metering.send_batch_metering(
+            "test-app", self._meters(5), batch_size=2
+        )
+
+        specs = self.mock_client.map_requests.call_args.args[0]
+        assert [len(spec.json_data["meterList"]) for spec in specs] == [2, 2, 1]
+        assert specs[2].json_data["meterList"][0]["counterVolume"] == "4"
+        assert result["requests"] == 3
+        assert [r["meterId"] for r in result["results"]] == [
+            "m0",
+            "m1",
+            "m2",
+            "m3",
+            "m4",
+        ]
+
+    def test_send_batch_metering_byte_budget(self) -> None:
+        """Test chunks are closed before their encoded body exceeds the budget."""
+        meter_bytes = len(
+            get_codec().dumps(
+                self.metering._build_metering_data("test-app", **self._meters(1)[0])
+            )
+        )
+        self.mock_client.map_requests.side_effect = lambda specs, **_: [
+            {} for _ in specs
+        ]
+
+        self.metering.send_batch_metering(
+            "test-app",
+            self._meters(6),
+            batch_size=100,
+            max_batch_bytes=3 * meter_bytes + 20,
+        )
+
+        specs = self.mock_client.map_requests.call_args.args[0]
+        assert [len(spec.json_data["meterList"]) for spec in specs] == [3, 3]
+        for spec in specs:
+            body = get_codec().dumps(spec.json_data)
+            assert len(body) <= 3 * meter_bytes + 20
+
+    def test_send_batch_metering_chunk_failure(self) -> None:
+        """Test a rejected chunk fails every meter it carried."""
+        self.mock_client.map_requests.return_value = [
+            APIRequestException("Payload rejected"),
+            {"status": "SUCCESS"},
+        ]
+
+        result = self.metering.send_batch_metering(
+            "test-app", self._meters(3), batch_size=2
+        )
+
+        assert [r["success"] for r in result["results"]] == [False, False, True]
+        assert "Payload rejected" in result["results"][1]["error"]
+        assert "meterId" not in result["results"][2]
+
+    @pytest.mark.parametrize("batch_size", [0, 1001])
+    def test_send_batch_metering_invalid_batch_size(self, batch_size) -> None:
+        """Test out-of-range batch sizes are rejected before sending."""
+        with pytest.raises(ValidationException, match="batch_size"):
+            self.metering.send_batch_metering(
+                "test-app", self._meters(1), batch_size=batch_size
+            )
+
+        self.mock_client.map_requests.assert_not_called()
+
     def test_create_default_template(self) -> None:
         """Test creation of default metering template."""
         template = MeteringManager._create_default_template()
@@ -1,12 +1,33 @@
 """Unit tests for MeteringAggregator - pure metering aggregation logic."""
 
+import statistics
 from decimal import Decimal
 
 import pytest
 from pytest import approx
 
 from libs.constants import CounterType
-from libs.metering_aggregator import AggregationDimension, MeteringAggregator
+from libs.metering_aggregator import (
+    AggregationDimension,
+    LatestValueIndex,
+    MeteringAggregator,
+    RunningMetrics,
+    StreamingAggregator,
+    UsagePartial,
+)
+
+
+def generate_records(count, resources=4):
+    """Yield records lazily, as a reader over a large dump would."""
+    for i in range(count):
+        yield {
+            "appKey": "app-1",
+            "counterName": "cpu.usage",
+            "counterType": "DELTA",
+            "counterVolume": f"{i % 97}.{i % 10}",
+            "resourceId": f"vm-{i % resources}",
+            "timestamp": f"2024-01-{i % 28 + 1:02d}T13:00:00.000+09:00",
+        }
 
 
 class TestMeteringAggregator:
@@ -267,6 +288,19 @@ class TestMeteringAggregator:
         same_data = [{"counterVolume": "10"} for _ in range(10)]
         assert MeteringAggregator.detect_outliers(same_data) == []
 
+    def test_detect_outliers_per_counter(self):
+        """Test each counter is judged on its own scale."""
+        storage = [
+            {"counterName": "storage", "counterVolume": str(10_000 + i % 5)}
+            for i in range(20)
+        ]
+        gpu = [{"counterName": "gpu", "counterVolume": str(i % 3)} for i in range(20)]
+        spike = {"counterName": "gpu", "counterVolume": "50"}
+
+        outliers = MeteringAggregator.detect_outliers(storage + gpu + [spike])
+
+        assert outliers == [spike]
+
     def test_calculate_growth_rate(self):
         """Test growth rate calculation."""
         previous_data = [
@@ -364,3 +398,231 @@ class TestMeteringAggregator:
         assert summary["counters"] == {}
         assert summary["resources"] == []
         assert summary["time_range"] is None
+
+
+class TestStreamingAggregator:
+    """Unit tests for single-pass streaming aggregation."""
+
+    def test_matches_batch_results(self):
+        """Test streaming a generator gives the same metrics as a list."""
+        records = list(generate_records(500))
+
+        aggregator = StreamingAggregator(["resource_id"])
+        results = aggregator.update(generate_records(500)).results()
+
+        assert len(aggregator) == 4
+        assert aggregator.record_count == 500
+        assert results == MeteringAggregator.aggregate_by_dimensions(
+            records, ["resource_id"], engine="decimal"
+        )
+        vm0 = [
+            Decimal(r["counterVolume"]) for r in records if r["resourceId"] == "vm-0"
+        ]
+        assert results["resource:vm-0"].total_volume == sum(vm0)
+        assert results["resource:vm-0"].min_volume == min(vm0)
+        assert results["resource:vm-0"].max_volume == max(vm0)
+
+    def test_welford_variance(self):
+        """Test the running variance matches the two-pass population variance."""
+        aggregator = StreamingAggregator([]).update(generate_records(1000))
+        volumes = [float(r["counterVolume"]) for r in generate_records(1000)]
+
+        (group,) = aggregator.groups.values()
+
+        assert group.mean == approx(statistics.fmean(volumes))
+        assert group.variance == approx(statistics.pvariance(volumes))
+        assert group.std_dev == approx(statistics.pstdev(volumes))
+
+    def test_merged_partials_match_single_pass(self):
+        """Test aggregators over consecutive slices merge to the full result."""
+        records = list(generate_records(600, resources=7))
+        whole = StreamingAggregator(["resource_id"]).update(records)
+
+        merged = StreamingAggregator(["resource_id"])
+        bounds = [0, 50, 51, 400, 600]
+        for start, end in zip(bounds, bounds[1:]):
+            merged.merge(
+                StreamingAggregator(["resource_id"]).update(records[start:end])
+            )
+
+        assert list(merged.results()) == list(whole.results())
+        assert merged.results() == whole.results()
+        assert merged.record_count == 600
+        for key, group in merged.groups.items():
+            assert group.mean == approx(whole.groups[key].mean)
+            assert group.variance == approx(whole.groups[key].variance)
+        with pytest.raises(ValueError, match="dimensions"):
+            merged.merge(StreamingAggregator(["app_key"]))
+
+    def test_state_is_bounded_by_groups(self):
+        """Test only one RunningMetrics per group is kept, however many records."""
+        aggregator = StreamingAggregator(["resource_id"])
+        aggregator.update(generate_records(20_000, resources=4))
+
+        assert len(aggregator) == 4
+        assert all(
+            isinstance(group, RunningMetrics) for group in aggregator.groups.values()
+        )
+        assert sum(group.record_count for group in aggregator.groups.values()) == 20_000
+
+
+class TestUsagePartial:
+    """Unit tests for mergeable usage summary partials."""
+
+    @staticmethod
+    def gauge(volume, day):
+        return {
+            "counterName": "memory.usage",
+            "counterType": "GAUGE",
+            "counterVolume": volume,
+            "resourceId": f"vm-{day}",
+            "timestamp": f"2024-01-{day:02d}T13:00:00.000+09:00",
+        }
+
+    def test_merged_partials_match_single_pass(self):
+        """Test partials over slices merge to the one-pass summary."""
+        records = list(generate_records(300)) + [self.gauge("5", 3)]
+
+        merged = UsagePartial()
+        for start in range(0, len(records), 64):
+            merged.merge(UsagePartial().update(records[start : start + 64]))
+        summary = merged.to_summary()
+
+        expected = MeteringAggregator.create_usage_summary(iter(records))
+        assert sorted(summary.pop("resources")) == sorted(expected.pop("resources"))
+        assert summary == expected
+
+    def test_latest_gauge_is_chosen_by_timestamp(self):
+        """Test the newest reading wins whatever order partials arrive in."""
+        later = UsagePartial().update([self.gauge("20", 9)])
+        earlier = UsagePartial().update([self.gauge("10", 2), self.gauge("30", 1)])
+
+        summary = later.merge(earlier).to_summary()
+
+        assert summary["counters"]["memory.usage"]["latest_gauge"] == approx(20.0)
+        assert summary["time_range"]["start"].startswith("2024-01-01")
+        assert summary["total_records"] == 3
+
+    def test_approximate_distinct_resources(self):
+        """Test HyperLogLog counts replace the exact resource list."""
+        records = list(generate_records(3000, resources=500)) + [self.gauge("5", 3)]
+
+        summary = MeteringAggregator.create_usage_summary(
+            records, approximate=True, precision=12
+        )
+
+        assert "resources" not in summary
+        distinct = summary["distinct_resources"]
+        assert distinct["standard_error"] == approx(1.04 / 64)
+        assert distinct["estimate"] == approx(501, rel=3 * distinct["standard_error"])
+        cpu = summary["counters"]["cpu.usage"]
+        assert cpu["distinct_resources"]["estimate"] == approx(500, rel=0.05)
+        assert summary["counters"]["memory.usage"]["distinct_resources"] == {
+            "estimate": 1,
+            "standard_error": distinct["standard_error"],
+        }
+        exact = MeteringAggregator.create_usage_summary(records)
+        assert cpu["delta_total"] == exact["counters"]["cpu.usage"]["delta_total"]
+
+    def test_exact_resources_on_request(self):
+        """Test the exact list is kept in approximate mode when asked for."""
+        records = list(generate_records(50))
+
+        summary = MeteringAggregator.create_usage_summary(
+            records, approximate=True, include_resources=True
+        )
+
+        assert sorted(summary["resources"]) == ["vm-0", "vm-1", "vm-2", "vm-3"]
+        assert summary["distinct_resources"]["estimate"] == 4
+
+    def test_approximate_accepts_numeric_resource_ids(self):
+        """Test numeric resourceIds work in approximate mode as in exact mode."""
+        records = [
+            {**record, "resourceId": i % 7 + 1}
+            for i, record in enumerate(generate_records(100))
+        ]
+
+        summary = MeteringAggregator.create_usage_summary(records, approximate=True)
+
+        assert summary["distinct_resources"]["estimate"] == 7
+        assert summary["counters"]["cpu.usage"]["distinct_resources"]["estimate"] == 7
+
+    def test_merge_requires_same_precision(self):
+        """Test partials tracking resources differently do not merge."""
+        with pytest.raises(ValueError, match="resource precision"):
+            UsagePartial(resource_precision=10).merge(UsagePartial())
+
+
+class TestLatestValueIndex:
+    """Unit tests for the single-pass latest-value index and top-k queries."""
+
+    @staticmethod
+    def gauge(volume, resource, hour, counter="memory.usage"):
+        return {
+            "counterName": counter,
+            "counterType": "GAUGE",
+            "counterVolume": volume,
+            "resourceId": resource,
+            "timestamp": f"2024-01-01T{hour:02d}:00:00.000+09:00",
+        }
+
+    def test_latest_per_resource(self):
+        """Test the newest reading is kept for each (counter, resource)."""
+        index = LatestValueIndex().update(
+            [
+                self.gauge("10", "vm-1", 9),
+                self.gauge("30", "vm-1", 11),
+                self.gauge("20", "vm-1", 10),
+                self.gauge("5", "vm-2", 8),
+                {**self.gauge("99", "vm-1", 12), "counterType": "DELTA"},
+            ]
+        )
+
+        assert index.latest("memory.usage", "vm-1") == Decimal("30")
+        assert index.latest("memory.usage", "vm-2") == Decimal("5")
+        assert index.latest("memory.usage", "vm-3") is None
+        assert index.latest_by_counter() == {"memory.usage": Decimal("30")}
+
+    def test_equal_timestamps_keep_later_record(self):
+        """Test ties resolve as a stable sort by timestamp would."""
+        records = [
+            self.gauge("1", "vm-1", 10),
+            self.gauge("2", "vm-2", 10),
+            self.gauge("3", "vm-1", 10),
+        ]
+
+        assert LatestValueIndex().update(records).latest("memory.usage", "vm-1") == 3
+        gauges = MeteringAggregator.get_latest_gauge_values(records)
+        assert gauges == {"memory.usage": Decimal("3.00")}
+
+    def test_top_k_breaks_ties_by_resource(self):
+        """Test top-k returns the largest readings with deterministic ties."""
+        index = LatestValueIndex().update(
+            [
+                self.gauge("50", "vm-c", 9),
+                self.gauge("70", "vm-a", 9),
+                self.gauge("50", "vm-b", 9),
+                self.gauge("10", "vm-d", 9),
+            ]
+        )
+
+        assert index.top_k("memory.usage", 3) == [
+            ("vm-a", Decimal("70")),
+            ("vm-b", Decimal("50")),
+            ("vm-c", Decimal("50")),
+        ]
+        assert index.top_k("disk.usage", 3) == []
+
+    def test_top_resources_by_volume(self):
+        """Test DELTA usage is summed per resource before ranking."""
+        records = list(generate_records(400, resources=5))
+
+        top = MeteringAggregator.top_resources_by_volume(records, 2, "cpu.usage")
+
+        totals = {}
+        for record in records:
+            volume = Decimal(record["counterVolume"])
+            totals[record["resourceId"]] = totals.get(record["resourceId"], 0) + volume
+        expected = sorted(totals.items(), key=lambda item: (-item[1], item[0]))[:2]
+        assert top == {"cpu.usage": expected}
+        assert MeteringAggregator.top_resources_by_volume(records, 2, "x") == {}
@@ -0,0 +1,124 @@
+"""Unit tests for the columnar NumPy aggregation engine."""
+
+import random
+from decimal import Decimal
+
+import pytest
+
+from libs.metering_aggregator import MeteringAggregator
+
+np = pytest.importorskip("numpy")
+
+from libs.metering_columnar import MeteringColumns  # noqa: E402
+
+DIMENSION_SETS = [
+    ["app_key"],
+    ["app_key", "counter_name", "resource_id"],
+    ["counter_type", "unknown"],
+    [],
+]
+
+
+def make_records(count: int, seed: int = 3) -> list[dict]:
+    rng = random.Random(seed)
+    records = []
+    for i in range(count):
+        record = {
+            "appKey": f"app-{i % 3}",
+            "counterName": rng.choice(["cpu", "memory", "network"]),
+            "counterType": rng.choice(["DELTA", "GAUGE"]),
+            "counterVolume": rng.choice(
+                [str(rng.randint(0, 1000)), f"{rng.random() * 100:.3f}", "1.50", 7]
+            ),
+            "timestamp": (
+                f"2024-01-{rng.randint(1, 28):02d}T{rng.randint(0, 23):02d}"
+                ":00:00.000+09:00"
+            ),
+        }
+        if i % 7:
+            record["resourceId"] = f"vm-{i % 40}"
+        records.append(record)
+    return records
+
+
+class TestColumnarEngine:
+    """Unit tests for MeteringColumns and the numpy engine."""
+
+    @pytest.mark.parametrize("dimensions", DIMENSION_SETS)
+    def test_matches_decimal_path(self, dimensions) -> None:
+        """Test every metric, key and key order equals the Decimal path."""
+        records = make_records(3000)
+        # Equal volumes as int, float and string must keep their own exponents
+        for i, volume in enumerate([1, 1.0, "1", 2.50, 2, "2.5"]):
+            records[i * 11]["counterVolume"] = volume
+
+        expected = MeteringAggregator.aggregate_by_dimensions(
+            records, dimensions, engine="decimal"
+        )
+        actual = MeteringAggregator.aggregate_by_dimensions(
+            records, dimensions, engine="numpy"
+        )
+
+        assert list(actual) == list(expected)
+        assert actual == expected
+        # Same Decimal exponents too, not only equal values
+        assert [str(m.total_volume) for m in actual.values()] == [
+            str(m.total_volume) for m in expected.values()
+        ]
+        assert [str(m.avg_volume) for m in actual.values()] == [
+            str(m.avg_volume) for m in expected.values()
+        ]
+
+    def test_mixed_int_and_float_volumes_keep_exponents(self) -> None:
+        """Test 1 and 1.0 are separate values, as Decimal(str(v)) sees them."""
+        records = [
+            {"appKey": app, "counterVolume": volume, "timestamp": "2024-01-01"}
+            for app, volume in [("a", 1), ("b", 1.0), ("a", 2), ("b", 2.0)]
+        ]
+
+        def rendered(engine):
+            results = MeteringAggregator.aggregate_by_dimensions(
+                records, ["app_key"], engine=engine
+            )
+            return {
+                key: [str(m.total_volume), str(m.min_volume), str(m.max_volume)]
+                for key, m in results.items()
+            }
+
+        assert rendered("numpy") == rendered("decimal")
+        assert rendered("numpy")["app:b"] == ["3.0", "1.0", "2.0"]
+
+    def test_columns_are_exact(self) -> None:
+        """Test volumes are scaled integers and timestamps epoch microseconds."""
+        records = [
+            {"counterVolume": "0.1", "timestamp": "2024-01-01T09:00:00.000+09:00"},
+            {"counterVolume": "0.2", "timestamp": "2024-01-01T09:00:00.500+09:00"},
+        ]
+
+        columns = MeteringColumns.from_records(records)
+
+        assert columns.volume_scale == 1
+        assert columns.volume_array.tolist() == [1, 2]
+        assert columns.epoch_array.tolist() == [1704067200000000, 1704067200500000]
+        (metrics,) = columns.aggregate(["app_key"]).values()
+        assert metrics.total_volume == Decimal("0.3")
+
+    def test_unrepresentable_records(self) -> None:
+        """Test overflowing volumes fall back under auto and raise under numpy."""
+        records = [
+            {"appKey": "app-1", "counterVolume": "9" * 19, "timestamp": ""},
+            {"appKey": "app-1", "counterVolume": "9" * 19, "timestamp": ""},
+        ] * 600
+
+        with pytest.raises(ValueError, match="int64"):
+            MeteringAggregator.aggregate_by_dimensions(
+                records, ["app_key"], engine="numpy"
+            )
+        result = MeteringAggregator.aggregate_by_dimensions(records, ["app_key"])
+        assert result["app:app-1"].total_volume == Decimal("9" * 19) * 1200
+
+    def test_empty_input_and_invalid_engine(self) -> None:
+        """Test empty input gives no groups and unknown engines are rejected."""
+        assert MeteringColumns.from_records([]).aggregate(["app_key"]) == {}
+        with pytest.raises(ValueError, match="Invalid engine"):
+            MeteringAggregator.aggregate_by_dimensions([], ["app_key"], engine="gpu")
@@ -0,0 +1,208 @@
+"""Unit tests for metering idempotency keys and duplicate filtering."""
+
+import json
+import uuid
+
+import pytest
+
+from libs.http_client import BillingAPIClient
+from libs.Metering import MeteringManager
+from libs.metering_dedup import (
+    BloomFilter,
+    MeteringDedupFilter,
+    RotatingBloomFilter,
+    assign_idempotency_keys,
+)
+
+BASE_URL = "http://metering.in-process"
+OK_BODY = {"header": {"isSuccessful": True, "resultMessage": "SUCCESS"}}
+
+
+def make_meter(volume: str = "1") -> dict:
+    return {
+        "appKey": "app-1",
+        "counterName": "cpu",
+        "counterType": "DELTA",
+        "counterUnit": "HOURS",
+        "counterVolume": volume,
+        "timestamp": "2024-01-01T13:00:00.000+09:00",
+    }
+
+
+def key(i: int) -> str:
+    return uuid.uuid5(uuid.NAMESPACE_OID, str(i)).hex
+
+
+class MeterApp:
+    """WSGI metering endpoint recording the keys it receives."""
+
+    def __init__(self) -> None:
+        self.keys: list[str] = []
+        self.fail = False
+
+    def __call__(self, environ, start_response):
+        length = int(environ.get("CONTENT_LENGTH") or 0)
+        meters = json.loads(environ["wsgi.input"].read(length))["meterList"]
+        if self.fail:
+            start_response("400 Bad Request", [("Content-Type", "application/json")])
+            return [b'{"error": "rejected"}']
+        self.keys.extend(m["idempotencyKey"] for m in meters)
+        start_response("200 OK", [("Content-Type", "application/json")])
+        return [json.dumps(OK_BODY).encode()]
+
+
+class TestIdempotencyKeys:
+    """Unit tests for key assignment."""
+
+    def test_identical_events_get_distinct_keys(self) -> None:
+        """Test keys are unique per record, never derived from content."""
+        first = assign_idempotency_keys([make_meter(), make_meter()])
+        later = assign_idempotency_keys([make_meter()])
+
+        keys = [m["idempotencyKey"] for m in first + later]
+        assert len(set(keys)) == 3
+        assert all(len(k) == 32 for k in keys)
+
+    def test_existing_keys_are_kept(self) -> None:
+        """Test a meter that already carries a key is left alone."""
+        (meter,) = assign_idempotency_keys([{**make_meter(), "idempotencyKey": "k"}])
+
+        assert meter["idempotencyKey"] == "k"
+        assert assign_idempotency_keys([meter])[0]["idempotencyKey"] == "k"
+
+    def test_later_identical_event_is_not_filtered(self) -> None:
+        """Test a new event equal to a delivered one is still sent."""
+        dedup = MeteringDedupFilter(capacity=10)
+        delivered = assign_idempotency_keys([make_meter()])
+        dedup.mark_delivered(delivered)
+
+        fresh = assign_idempotency_keys([make_meter()])
+
+        assert dedup.filter(fresh) == fresh
+        assert dedup.filter(delivered) == []
+
+
+class TestBloomFilters:
+    """Unit tests for the Bloom filters."""
+
+    def test_no_false_negatives_and_few_false_positives(self) -> None:
+        """Test added keys are found and the error rate holds at capacity."""
+        bloom = BloomFilter(capacity=2000, error_rate=0.01)
+        for i in range(2000):
+            bloom.add(key(i))
+
+        assert all(key(i) in bloom for i in range(2000))
+        false_positives = sum(key(i) in bloom for i in range(2000, 12000))
+        assert false_positives < 250
+
+    def test_rotation_bounds_memory(self) -> None:
+        """Test old generations are forgotten and memory stays bounded."""
+        seen = RotatingBloomFilter(capacity=100, error_rate=0.001)
+        for i in range(350):
+            seen.add(key(i))
+
+        assert all(key(i) in seen for i in range(250, 350))
+        assert sum(key(i) in seen for i in range(100)) < 5
+        assert seen.memory_bytes == 2 * len(seen._current._bits)
+
+
+class TestManagerDedup:
+    """Tests for MeteringManager with idempotency keys and a dedup filter."""
+
+    def test_delivered_meters_are_not_resent(self) -> None:
+        """Test resends of delivered records are dropped client-side."""
+        app = MeterApp()
+        dedup = MeteringDedupFilter(capacity=1000)
+        with BillingAPIClient(BASE_URL, wsgi_app=app) as client:
+            manager = MeteringManager("2024-01", client=client, dedup=dedup)
+            delivered = [make_meter("1"), make_meter("2")]
+            manager.send_meter_list(delivered)
+            response = manager.send_meter_list(delivered)
+            partial = manager.send_meter_list([delivered[0], make_meter("3")])
+
+        assert response["header"]["resultMessage"] == "DUPLICATE"
+        assert partial["header"]["isSuccessful"]
+        assert len(app.keys) == 3
+        assert dedup.to_dict()["dropped"] == 3
+
+    def test_caller_supplied_keys_are_filtered(self) -> None:
+        """Test keys in any format, such as dashed UUIDs, are remembered."""
+        app = MeterApp()
+        dedup = MeteringDedupFilter(capacity=1000)
+        meter = {**make_meter(), "idempotencyKey": str(uuid.uuid4())}
+        with BillingAPIClient(BASE_URL, wsgi_app=app) as client:
+            manager = MeteringManager("2024-01", client=client, dedup=dedup)
+            manager.send_meter_list([meter])
+            response = manager.send_meter_list([dict(meter)])
+
+        assert response["header"]["resultMessage"] == "DUPLICATE"
+        assert app.keys == [meter["idempotencyKey"]]
+        assert dedup.to_dict()["dropped"] == 1
+
+    def test_identical_later_events_are_sent(self) -> None:
+        """Test separate usage events with equal content are all billed."""
+        app = MeterApp()
+        dedup = MeteringDedupFilter(capacity=1000)
+        with BillingAPIClient(BASE_URL, wsgi_app=app) as client:
+            manager = MeteringManager("2024-01", client=client, dedup=dedup)
+            manager.send_metering("app-1", "cpu", "DELTA", "HOURS", "1")
+            response = manager.send_metering("app-1", "cpu", "DELTA", "HOURS", "1")
+            batch = manager.send_batch_metering(
+                "app-1",
+                [
+                    {
+                        "counter_name": "cpu",
+                        "counter_type": "DELTA",
+                        "counter_unit": "HOURS",
+                        "counter_volume": "1",
+                    }
+                    for _ in range(2)
+                ],
+                batch_size=10,
+            )
+
+        assert response["header"]["isSuccessful"]
+        assert response["header"]["resultMessage"] != "DUPLICATE"
+        assert [r["success"] for r in batch["results"]] == [True, True]
+        assert len(set(app.keys)) == 4
+        assert dedup.to_dict()["dropped"] == 0
+
+    def test_failed_meters_are_not_remembered(self) -> None:
+        """Test a meter whose send failed can be sent again."""
+        app = MeterApp()
+        app.fail = True
+        with BillingAPIClient(BASE_URL, wsgi_app=app) as client:
+            manager = MeteringManager(
+                "2024-01", client=client, dedup=MeteringDedupFilter(capacity=10)
+            )
+            with pytest.raises(Exception, match="400"):
+                manager.send_metering("app-1", "cpu", "DELTA", "HOURS", "1")
+            app.fail = False
+            manager.send_metering("app-1", "cpu", "DELTA", "HOURS", "1")
+
+        assert len(app.keys) == 1
+
+
+class TestMockServerIdempotency:
+    """Tests for the mock server honouring idempotency keys."""
+
+    def test_replayed_meters_are_not_stored_twice(self) -> None:
+        """Test a replayed request returns the original IDs and stores nothing."""
+        pytest.importorskip("flask")
+        from mock_server.app import app, data_manager
+
+        meters = assign_idempotency_keys([make_meter("1"), make_meter("2")])
+        headers = {"uuid": "DEDUP_UNIT_UUID"}
+        with BillingAPIClient(BASE_URL, wsgi_app=app) as client:
+            client.delete("test/reset/DEDUP_UNIT_UUID")
+            first = client.post(
+                "billing/meters", json_data={"meterList": meters}, headers=headers
+            )
+            replay = client.post(
+                "billing/meters", json_data={"meterList": meters}, headers=headers
+            )
+
+        assert replay["meterIds"] == first["meterIds"]
+        assert replay["duplicates"] == 2
+        assert "duplicates" not in first
+        assert len(data_manager.get_metering_data("DEDUP_UNIT_UUID")) == 2
@@ -0,0 +1,231 @@
+"""Unit tests for the background buffered metering emitter."""
+
+import json
+import threading
+import time
+
+import pytest
+
+from libs.exceptions import ValidationException
+from libs.http_client import BillingAPIClient
+from libs.Metering import MeteringManager
+from libs.metering_emitter import BufferedMeteringEmitter, OverflowPolicy
+
+BASE_URL = "http://metering.in-process"
+OK_BODY = {"header": {"isSuccessful": True, "resultMessage": "SUCCESS"}}
+
+
+class MeterApp:
+    """WSGI metering endpoint that records batches and can stall or fail."""
+
+    def __init__(self, fail: bool = False) -> None:
+        self.fail = fail
+        self.batches: list[list[str]] = []
+        self.release = threading.Event()
+        self.release.set()
+
+    def __call__(self, environ, start_response):
+        length = int(environ.get("CONTENT_LENGTH") or 0)
+        meters = json.loads(environ["wsgi.input"].read(length))["meterList"]
+        self.release.wait()
+        self.batches.append([m["counterVolume"] for m in meters])
+        if self.fail:
+            start_response("400 Bad Request", [("Content-Type", "application/json")])
+            return [b'{"error": "rejected"}']
+        start_response("200 OK", [("Content-Type", "application/json")])
+        return [json.dumps(OK_BODY).encode()]
+
+
+@pytest.fixture
+def app():
+    return MeterApp()
+
+
+@pytest.fixture
+def manager(app):
+    with BillingAPIClient(BASE_URL, wsgi_app=app) as client:
+        yield MeteringManager(month="2024-01", client=client)
+
+
+def emit(emitter: BufferedMeteringEmitter, volume: int) -> bool:
+    return emitter.emit("app-1", "cpu", "DELTA", "HOURS", str(volume))
+
+
+class TestBufferedMeteringEmitter:
+    """Unit tests for BufferedMeteringEmitter."""
+
+    def test_flushes_on_batch_size(self, app, manager) -> None:
+        """Test a full batch is sent without waiting for max_age."""
+        with BufferedMeteringEmitter(manager, max_batch_size=3, max_age=60) as emitter:
+            for i in range(3):
+                emit(emitter, i)
+            deadline = time.monotonic() + 5
+            while not app.batches and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+            assert app.batches == [["0", "1", "2"]]
+
+    def test_flushes_on_age(self, app, manager) -> None:
+        """Test a partial batch is sent once the oldest event is max_age old."""
+        with BufferedMeteringEmitter(manager, max_batch_size=100, max_age=0.05) as e:
+            emit(e, 1)
+            time.sleep(0.3)
+
+            assert app.batches == [["1"]]
+            assert e.stats.sent == 1
+
+    def test_flushes_on_bytes(self, app, manager) -> None:
+        """Test batches are split to stay under max_batch_bytes."""
+        with BufferedMeteringEmitter(
+            manager, max_batch_size=100, max_batch_bytes=600, max_age=60
+        ) as emitter:
+            for i in range(5):
+                emit(emitter, i)
+            assert emitter.flush(timeout=5)
+
+        assert sum(len(b) for b in app.batches) == 5
+        assert len(app.batches) > 1
+
+    def test_flush_and_close_send_everything(self, app, manager) -> None:
+        """Test flush waits for delivery and close drains the queue."""
+        emitter = BufferedMeteringEmitter(manager, max_batch_size=2, max_age=60)
+        for i in range(5):
+            assert emit(emitter, i)
+
+        assert emitter.flush(timeout=5)
+        assert [v for b in app.batches for v in b] == ["0", "1", "2", "3", "4"]
+
+        emit(emitter, 5)
+        emitter.close()
+        emitter.close()
+        assert app.batches[-1] == ["5"]
+        with pytest.raises(RuntimeError, match="closed"):
+            emit(emitter, 6)
+
+    def test_emit_validates_immediately(self, manager) -> None:
+        """Test invalid events raise at the call site and are not queued."""
+        with BufferedMeteringEmitter(manager) as emitter:
+            with pytest.raises(ValidationException):
+                emitter.emit("app-1", "cpu", "HOURLY", "HOURS", "1")
+            assert emitter.stats.emitted == 0
+
+    @pytest.mark.parametrize(
+        ("overflow", "expected"),
+        [
+            (OverflowPolicy.DROP_NEWEST, ["0", "1"]),
+            (OverflowPolicy.DROP_OLDEST, ["2", "3"]),
+        ],
+    )
+    def test_drop_policies(self, app, manager, overflow, expected) -> None:
+        """Test a full queue drops the new or the oldest event."""
+        app.release.clear()
+        with BufferedMeteringEmitter(
+            manager, max_batch_size=1, max_age=60, max_queue_size=2, overflow=overflow
+        ) as emitter:
+            # The first event is taken by the stalled worker
+            emit(emitter, 99)
+            while emitter.stats.queue_depth:
+                time.sleep(0.01)
+            results = [emit(emitter, i) for i in range(4)]
+            app.release.set()
+
+            assert emitter.flush(timeout=5)
+            assert results.count(False) == (2 if overflow == "drop_newest" else 0)
+            assert emitter.stats.dropped == 2
+
+        assert [b[0] for b in app.batches[1:]] == expected
+
+    def test_block_policy_times_out(self, app, manager, caplog) -> None:
+        """Test a blocking emit gives up after block_timeout."""
+        app.release.clear()
+        emitter = BufferedMeteringEmitter(
+            manager, max_batch_size=1, max_queue_size=1, block_timeout=0.05
+        )
+        emit(emitter, 0)
+        while emitter.stats.queue_depth:
+            time.sleep(0.01)
+        emit(emitter, 1)
+
+        assert emit(emitter, 2) is False
+        assert "Dropped metering event" in caplog.text
+        app.release.set()
+        emitter.close()
+        assert emitter.stats.to_dict() == {
+            "emitted": 2,
+            "sent": 2,
+            "failed": 0,
+            "dropped": 1,
+            "flushes": 2,
+            "queue_depth": 0,
+            "peak_queue_depth": 1,
+        }
+
+    def test_failed_batch_reported(self, app, manager) -> None:
+        """Test failed batches are counted and passed to on_error."""
+        app.fail = True
+        errors = []
+
+        with BufferedMeteringEmitter(
+            manager, on_error=lambda batch, e: errors.append((len(batch), e))
+        ) as emitter:
+            emit(emitter, 1)
+            emit(emitter, 2)
+            emitter.flush(timeout=5)
+            snapshot = emitter.snapshot()
+
+        assert snapshot["failed"] == 2
+        assert snapshot["flush_latency_ms"]["count"] == 1
+        assert errors[0][0] == 2
+
+    def test_failing_callback_does_not_stop_the_worker(self, app, manager) -> None:
+        """Test an on_error that raises is logged and later flushes complete."""
+        app.fail = True
+
+        def on_error(batch, error):
+            raise RuntimeError("callback bug")
+
+        with BufferedMeteringEmitter(manager, on_error=on_error) as emitter:
+            emit(emitter, 1)
+            assert emitter.flush(timeout=5)
+            app.fail = False
+            emit(emitter, 2)
+            assert emitter.flush(timeout=5)
+
+            assert emitter.stats.sent == 1
+            assert emitter.stats.failed == 1
+
+    def test_block_policy_waits_for_room_by_default(self, app, manager) -> None:
+        """Test a full queue makes emit wait until the sender catches up."""
+        app.release.clear()
+        emitter = BufferedMeteringEmitter(manager, max_batch_size=1, max_queue_size=1)
+        emit(emitter, 0)
+        while emitter.stats.queue_depth:
+            time.sleep(0.01)
+        emit(emitter, 1)
+        threading.Timer(0.1, app.release.set).start()
+
+        assert emit(emitter, 2) is True
+        emitter.close()
+        assert emitter.stats.dropped == 0
+
+    def test_resent_batch_keeps_its_keys(self, app, manager) -> None:
+        """Test keys are stamped at emit time and reused when resent."""
+        app.fail = True
+        manager.idempotency_keys = True
+        failed = []
+
+        with BufferedMeteringEmitter(
+            manager, on_error=lambda batch, e: failed.append(batch)
+        ) as emitter:
+            emit(emitter, 1)
+            emitter.flush(timeout=5)
+        keys = [m["idempotencyKey"] for m in failed[0]]
+        app.fail = False
+        manager.send_meter_list(failed[0])
+
+        assert [m["idempotencyKey"] for m in failed[0]] == keys
+
+    def test_invalid_settings(self, manager) -> None:
+        """Test non-positive limits are rejected."""
+        with pytest.raises(ValueError, match="positive"):
+            BufferedMeteringEmitter(manager, max_age=0)
@@ -0,0 +1,208 @@
+"""Unit tests for streaming metering ingestion."""
+
+import csv
+import gzip
+import json
+import threading
+import time
+
+import pytest
+import responses
+
+from libs.exceptions import ValidationException
+from libs.http_client import BillingAPIClient
+from libs.metering_ingest import (
+    IngestStats,
+    ingest_file,
+    ingest_meters,
+    iter_meter_records,
+    main,
+    validate_meter,
+)
+
+BASE_URL = "http://metering.in-process"
+OK_BODY = {"header": {"isSuccessful": True, "resultMessage": "SUCCESS"}}
+
+
+def make_meter(i: int, **overrides) -> dict:
+    return {
+        "appKey": "app-1",
+        "counterName": f"compute.c2.c8m8.{i}",
+        "counterType": "DELTA",
+        "counterUnit": "HOURS",
+        "counterVolume": i,
+        "timestamp": "2024-01-01T13:00:00.000+09:00",
+        **overrides,
+    }
+
+
+def write_jsonl(path, records, compress=False) -> None:
+    data = "".join(json.dumps(r) + "\n" for r in records).encode()
+    path.write_bytes(gzip.compress(data) if compress else data)
+
+
+class MeterApp:
+    """WSGI metering endpoint that tracks batch sizes and concurrency."""
+
+    def __init__(self, delay: float = 0.0, reject_first: bool = False) -> None:
+        self.delay = delay
+        self.reject_first = reject_first
+        self.batch_sizes: list[int] = []
+        self.in_flight = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, environ, start_response):
+        length = int(environ.get("CONTENT_LENGTH") or 0)
+        meters = json.loads(environ["wsgi.input"].read(length))["meterList"]
+        with self._lock:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+            self.batch_sizes.append(len(meters))
+            reject = self.reject_first and len(self.batch_sizes) == 1
+        time.sleep(self.delay)
+        with self._lock:
+            self.in_flight -= 1
+
+        status, body = ("200 OK", OK_BODY)
+        if reject:
+            status, body = ("400 Bad Request", {"error": "bad batch"})
+        start_response(status, [("Content-Type", "application/json")])
+        return [json.dumps(body).encode()]
+
+
+class TestIterMeterRecords:
+    """Unit tests for lazy record reading and validation."""
+
+    @pytest.mark.parametrize("compress", [False, True])
+    def test_jsonl(self, tmp_path, compress) -> None:
+        """Test JSONL is read with gzip detected from the content."""
+        path = tmp_path / "meters.jsonl"
+        write_jsonl(path, [make_meter(1), make_meter(2)], compress=compress)
+        stats = IngestStats()
+
+        meters = list(iter_meter_records(path, stats=stats))
+
+        assert [m["counterVolume"] for m in meters] == ["1", "2"]
+        assert meters[0]["resourceId"] == "test"
+        assert stats.records == 2
+        assert stats.bytes_read == len(
+            "".join(json.dumps(make_meter(i)) + "\n" for i in (1, 2))
+        )
+
+    def test_csv_with_default_app_key(self, tmp_path) -> None:
+        """Test CSV rows get the default app key when they carry none."""
+        path = tmp_path / "meters.csv"
+        fields = list(make_meter(0))
+        with path.open("w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=fields)
+            writer.writeheader()
+            writer.writerow(make_meter(5, appKey=""))
+
+        (meter,) = iter_meter_records(path, app_key="fallback")
+
+        assert meter["appKey"] == "fallback"
+        assert meter["counterVolume"] == "5"
+
+    def test_strict_reports_line(self, tmp_path) -> None:
+        """Test the first invalid record stops reading in strict mode."""
+        path = tmp_path / "meters.jsonl"
+        write_jsonl(path, [make_meter(1), make_meter(2, counterType="HOURLY")])
+
+        with pytest.raises(ValidationException, match=r"meters.jsonl:2: invalid"):
+            list(iter_meter_records(path))
+
+    def test_lenient_skips_invalid(self, tmp_path) -> None:
+        """Test invalid records are counted and skipped when not strict."""
+        path = tmp_path / "meters.jsonl"
+        path.write_text(
+            json.dumps(make_meter(1)) + "\n{broken\n\n" + json.dumps([1]) + "\n"
+        )
+        stats = IngestStats()
+
+        meters = list(iter_meter_records(path, strict=False, stats=stats))
+
+        assert len(meters) == 1
+        assert stats.invalid == 2
+
+    def test_unknown_format(self, tmp_path) -> None:
+        """Test files whose format cannot be inferred are rejected."""
+        with pytest.raises(ValidationException, match="format"):
+            list(iter_meter_records(tmp_path / "meters.bin"))
+
+    def test_validate_meter_missing_fields(self) -> None:
+        """Test missing required fields are named."""
+        meter, reason = validate_meter({"counterName": "cpu"})
+
+        assert meter is None
+        assert reason.startswith("missing appKey, counterType")
+
+
+class TestIngestMeters:
+    """Tests for batching and backpressure."""
+
+    def test_batches_with_bounded_fan_out(self) -> None:
+        """Test meters are batched and at most max_in_flight batches run."""
+        app = MeterApp(delay=0.01)
+        pulled = 0
+        ahead = 0
+
+        def meters():
+            nonlocal pulled, ahead
+            for i in range(100):
+                pulled += 1
+                ahead = max(ahead, pulled - sum(app.batch_sizes))
+                yield validate_meter(make_meter(i))[0]
+
+        with BillingAPIClient(BASE_URL, wsgi_app=app) as client:
+            stats = ingest_meters(client, meters(), batch_size=10, max_in_flight=2)
+
+        assert stats.batches == 10
+        assert stats.sent == 100
+        assert sorted(app.batch_sizes) == [10] * 10
+        assert app.peak <= 2
+        # Two batches in flight plus the one being filled, never the whole file
+        assert ahead <= 3 * 10
+
+    def test_failed_batch_counts_meters(self, tmp_path) -> None:
+        """Test a rejected batch counts its meters as failed and continues."""
+        path = tmp_path / "meters.jsonl.gz"
+        write_jsonl(path, [make_meter(i) for i in range(5)], compress=True)
+        reports = []
+
+        with BillingAPIClient(BASE_URL, wsgi_app=MeterApp(reject_first=True)) as client:
+            stats = ingest_file(
+                client,
+                path,
+                batch_size=2,
+                max_in_flight=1,
+                progress=reports.append,
+                progress_interval=0,
+            )
+
+        assert (stats.sent, stats.failed) == (3, 2)
+        assert len(reports) == 4  # once per batch, then a final report
+        assert stats.to_dict()["records"] == 5
+
+
+class TestMain:
+    """Tests for the command-line entry point."""
+
+    @responses.activate
+    def test_cli_ingests_file(self, tmp_path) -> None:
+        """Test the CLI posts the file and exits cleanly."""
+        path = tmp_path / "meters.jsonl"
+        write_jsonl(path, [make_meter(i) for i in range(3)])
+        responses.add(responses.POST, f"{BASE_URL}/billing/meters", json=OK_BODY)
+
+        code = main([str(path), "--base-url", BASE_URL, "--batch-size", "2"])
+
+        assert code == 0
+        assert len(responses.calls) == 2
+
+    def test_cli_invalid_file(self, tmp_path) -> None:
+        """Test an invalid record makes the CLI exit with status 2."""
+        path = tmp_path / "meters.jsonl"
+        write_jsonl(path, [make_meter(1, counterType="BAD")])
+
+        assert main([str(path), "--base-url", BASE_URL]) == 2
@@ -0,0 +1,99 @@
+"""Unit tests for the multi-process metering dump map-reduce."""
+
+import gzip
+import json
+
+import pytest
+
+from libs.metering_aggregator import MeteringAggregator
+from libs.metering_mapreduce import (
+    aggregate_dumps,
+    read_shard,
+    split_shards,
+    summarize_dumps,
+)
+
+
+def make_records(count: int) -> list[dict]:
+    return [
+        {
+            "appKey": "app-1",
+            "counterName": ["cpu.usage", "memory.usage"][i % 2],
+            "counterType": ["DELTA", "GAUGE"][i % 2],
+            "counterVolume": f"{i % 13}.{'5' * (i % 4)}",
+            "resourceId": f"vm-{i % 9}",
+            "timestamp": f"2024-01-{i % 28 + 1:02d}T13:00:00.000+09:00",
+        }
+        for i in range(count)
+    ]
+
+
+@pytest.fixture
+def dump(tmp_path):
+    records = make_records(400)
+    path = tmp_path / "meters.jsonl"
+    path.write_text("".join(json.dumps(r) + "\n" for r in records))
+    return path, records
+
+
+class TestShards:
+    """Unit tests for splitting and reading dump shards."""
+
+    @pytest.mark.parametrize("shard_bytes", [1, 37, 150, 4096, 10**9])
+    def test_every_line_read_exactly_once(self, dump, shard_bytes) -> None:
+        """Test shards cover each record once, wherever boundaries fall."""
+        path, records = dump
+
+        shards = split_shards([path], shard_bytes)
+
+        assert [r for shard in shards for r in read_shard(shard)] == records
+
+    def test_gzip_dumps_are_one_shard(self, tmp_path) -> None:
+        """Test gzip files are read whole, since they cannot be seeked."""
+        records = make_records(10)
+        path = tmp_path / "meters.jsonl.gz"
+        path.write_bytes(
+            gzip.compress(b"\n".join(json.dumps(r).encode() for r in records))
+        )
+
+        (shard,) = split_shards([path], shard_bytes=1)
+
+        assert list(read_shard(shard)) == records
+        with pytest.raises(ValueError, match="positive"):
+            split_shards([path], shard_bytes=0)
+
+
+class TestMapReduce:
+    """Tests for aggregating dumps across worker processes."""
+
+    @pytest.mark.parametrize("max_workers", [1, 2])
+    def test_matches_single_pass(self, dump, max_workers) -> None:
+        """Test parallel results equal the single-process aggregator's."""
+        path, records = dump
+
+        aggregates = aggregate_dumps(
+            [path], ["resource_id"], max_workers=max_workers, shard_bytes=2048
+        )
+        summary = summarize_dumps([path], max_workers=max_workers, shard_bytes=2048)
+
+        assert aggregates == MeteringAggregator.aggregate_by_dimensions(
+            records, ["resource_id"], engine="decimal"
+        )
+        expected = MeteringAggregator.create_usage_summary(records)
+        assert sorted(summary.pop("resources")) == sorted(expected.pop("resources"))
+        assert summary == expected
+
+    def test_approximate_summary_matches_single_pass(self, dump) -> None:
+        """Test HyperLogLog sketches merge across workers exactly."""
+        path, records = dump
+
+        summary = summarize_dumps(
+            [path], approximate=True, precision=10, max_workers=2, shard_bytes=2048
+        )
+
+        expected = MeteringAggregator.create_usage_summary(
+            records, approximate=True, precision=10
+        )
+        assert "resources" not in summary
+        assert summary == expected
+        assert summary["distinct_resources"]["estimate"] == 9
@@ -0,0 +1,150 @@
+"""Unit tests for streaming per-counter outlier detection."""
+
+import random
+import statistics
+
+import pytest
+
+from libs.metering_outliers import OutlierDetector, QuantileSketch
+
+
+def make_records(count, seed=7):
+    rng = random.Random(seed)
+    for i in range(count):
+        if i % 2:
+            yield {"counterName": "gpu", "counterVolume": rng.gauss(4, 1)}
+        else:
+            yield {"counterName": "storage", "counterVolume": rng.gauss(5000, 100)}
+
+
+class TestQuantileSketch:
+    """Unit tests for the KLL quantile sketch."""
+
+    def test_small_inputs_are_exact(self):
+        """Test quantiles are exact while nothing has been compacted."""
+        sketch = QuantileSketch().update([5.0, 1.0, 3.0, 2.0, 4.0])
+
+        assert sketch.quantile(0) == 1.0
+        assert sketch.quantile(0.5) == 3.0
+        assert sketch.quantile(1) == 5.0
+        assert sketch.median_and_mad() == (3.0, 1.0)
+
+    def test_memory_is_bounded(self):
+        """Test the sketch keeps O(k) values and stays within its rank error."""
+        rng = random.Random(1)
+        values = [rng.random() for _ in range(100_000)]
+
+        sketch = QuantileSketch(k=200).update(values)
+
+        assert sketch.count == 100_000
+        assert len(sketch) <= 3 * 200
+        ordered = sorted(values)
+        for q in (0.1, 0.5, 0.9, 0.99):
+            rank = ordered.index(sketch.quantile(q)) / len(values)
+            assert rank == pytest.approx(q, abs=0.02)
+
+    def test_merge_matches_single_sketch(self):
+        """Test merged shard sketches estimate the same quantiles."""
+        rng = random.Random(2)
+        values = [rng.expovariate(1) for _ in range(50_000)]
+
+        merged = QuantileSketch()
+        for start in range(0, len(values), 10_000):
+            merged.merge(QuantileSketch().update(values[start : start + 10_000]))
+
+        assert merged.count == len(values)
+        median = statistics.median(values)
+        assert merged.quantile(0.5) == pytest.approx(median, rel=0.05)
+
+    def test_invalid_arguments(self):
+        """Test invalid sizes, quantiles and merges are rejected."""
+        with pytest.raises(ValueError, match="at least 2"):
+            QuantileSketch(k=1)
+        with pytest.raises(ValueError, match="between 0 and 1"):
+            QuantileSketch().quantile(1.5)
+        with pytest.raises(ValueError, match="different size"):
+            QuantileSketch(k=100).merge(QuantileSketch(k=200))
+        assert QuantileSketch().quantile(0.5) is None
+
+
+class TestOutlierDetector:
+    """Unit tests for OutlierDetector."""
+
+    @pytest.mark.parametrize("method", ["zscore", "mad"])
+    def test_counters_are_judged_separately(self, method):
+        """Test a spike is caught on its own counter's scale only."""
+        records = list(make_records(2000))
+        spike = {"counterName": "gpu", "counterVolume": 40.0}
+
+        outliers = OutlierDetector(method=method, threshold=6).detect(records + [spike])
+
+        assert outliers == [spike]
+
+    def test_zscore_matches_batch_statistics(self):
+        """Test Welford state equals the population mean and deviation."""
+        records = list(make_records(500))
+        detector = OutlierDetector().update(records)
+
+        gpu = [r["counterVolume"] for r in records if r["counterName"] == "gpu"]
+        stats = detector.counters["gpu"]
+        assert stats.mean == pytest.approx(statistics.fmean(gpu))
+        assert stats.std_dev == pytest.approx(statistics.pstdev(gpu))
+
+    def test_mad_is_robust_to_contamination(self):
+        """Test huge outliers do not mask each other under the MAD method."""
+        records = [
+            {"counterName": "cpu", "counterVolume": 10 + i % 3} for i in range(90)
+        ]
+        spikes = [{"counterName": "cpu", "counterVolume": 1e6} for _ in range(10)]
+
+        assert OutlierDetector(method="mad").detect(records + spikes) == spikes
+        assert (
+            OutlierDetector(method="zscore", threshold=3.5).detect(records + spikes)
+            == []
+        )
+
+    def test_screen_flags_against_earlier_records(self):
+        """Test streaming screening yields spikes and skips warm-up readings."""
+        stream = [
+            {"counterName": "cpu", "counterVolume": 500},
+            *({"counterName": "cpu", "counterVolume": 10 + i % 2} for i in range(50)),
+            {"counterName": "cpu", "counterVolume": 500},
+        ]
+        detector = OutlierDetector(method="mad", min_samples=10)
+
+        flagged = list(detector.screen(iter(stream)))
+
+        assert flagged == [stream[-1]]
+        assert detector.counters["cpu"].count == len(stream)
+
+    def test_zero_spread_is_not_judged(self):
+        """Test constant counters produce no scores."""
+        detector = OutlierDetector().update(
+            {"counterName": "disk", "counterVolume": 7} for _ in range(10)
+        )
+
+        assert detector.score({"counterName": "disk", "counterVolume": 99}) is None
+        assert detector.score({"counterName": "other", "counterVolume": 1}) is None
+
+    @pytest.mark.parametrize("method", ["zscore", "mad"])
+    def test_merged_shards_match_single_pass(self, method):
+        """Test detectors over shards merge to the single-pass result."""
+        records = list(make_records(4000))
+        spike = {"counterName": "storage", "counterVolume": 9000.0}
+
+        merged = OutlierDetector(method=method)
+        for start in range(0, len(records), 1000):
+            merged.merge(
+                OutlierDetector(method=method).update(records[start : start + 1000])
+            )
+        single = OutlierDetector(method=method).update(records)
+
+        assert merged.counters["gpu"].count == single.counters["gpu"].count
+        assert merged.score(spike) == pytest.approx(single.score(spike), rel=0.05)
+
+    def test_invalid_settings(self):
+        """Test unknown methods and mismatched merges are rejected."""
+        with pytest.raises(ValueError, match="Invalid outlier method"):
+            OutlierDetector(method="iqr")
+        with pytest.raises(ValueError, match="different settings"):
+            OutlierDetector(method="mad").merge(OutlierDetector())
@@ -0,0 +1,167 @@
+"""Unit tests for client-side metering pre-aggregation."""
+
+import random
+from decimal import Decimal
+from unittest.mock import Mock
+
+import pytest
+
+from libs.exceptions import APIRequestException
+from libs.metering_aggregator import MeteringAggregator
+from libs.metering_preaggregator import MeteringPreAggregator
+
+
+def make_meter(volume, minute: int = 0, hour: int = 10, **overrides) -> dict:
+    return {
+        "appKey": "app-1",
+        "counterName": "network.bytes",
+        "counterType": "DELTA",
+        "counterUnit": "KB",
+        "counterVolume": str(volume),
+        "resourceId": "vm-1",
+        "resourceName": "vm-1",
+        "parentResourceId": "project-1",
+        "source": "qa.billing.test",
+        "timestamp": f"2024-01-01T{hour:02d}:{minute:02d}:00.000+09:00",
+        **overrides,
+    }
+
+
+class TestMeteringPreAggregator:
+    """Unit tests for MeteringPreAggregator."""
+
+    def test_delta_sums_are_exact(self) -> None:
+        """Test merged DELTA totals equal the sum of the raw records."""
+        rng = random.Random(7)
+        meters = [
+            make_meter(
+                Decimal(rng.randint(1, 10**6)) / 1000,
+                minute=rng.randint(0, 59),
+                hour=rng.choice([10, 11]),
+                resourceId=rng.choice(["vm-1", "vm-2"]),
+            )
+            for _ in range(2000)
+        ]
+        aggregator = MeteringPreAggregator()
+
+        aggregator.extend(meters)
+        merged = aggregator.drain()
+
+        assert len(merged) == 4
+        assert MeteringAggregator.calculate_delta_sum(
+            merged
+        ) == MeteringAggregator.calculate_delta_sum(meters)
+        raw = MeteringAggregator.aggregate_by_dimensions(meters, ["resource_id"])
+        agg = MeteringAggregator.aggregate_by_dimensions(merged, ["resource_id"])
+        assert {k: v.total_volume for k, v in raw.items()} == {
+            k: v.total_volume for k, v in agg.items()
+        }
+        assert aggregator.compression_ratio == 500.0
+
+    def test_buckets_and_keys_are_kept_apart(self) -> None:
+        """Test records merge only within the same key and bucket."""
+        aggregator = MeteringPreAggregator(bucket="hour")
+        aggregator.extend(
+            [
+                make_meter("1", minute=5),
+                make_meter("2", minute=50),
+                make_meter("4", hour=11),
+                make_meter("8", counterUnit="MB"),
+            ]
+        )
+
+        merged = aggregator.drain()
+
+        assert [m["counterVolume"] for m in merged] == ["3", "4", "8"]
+        assert merged[0]["timestamp"] == "2024-01-01T10:50:00.000+09:00"
+
+    def test_day_bucket(self) -> None:
+        """Test the day bucket merges across hours."""
+        aggregator = MeteringPreAggregator(bucket="day")
+        aggregator.extend([make_meter("1.5", hour=1), make_meter("2.25", hour=23)])
+
+        (merged,) = aggregator.drain()
+
+        assert merged["counterVolume"] == "3.75"
+
+    def test_gauge_keeps_latest(self) -> None:
+        """Test GAUGE counters keep the latest reading, not the sum."""
+        aggregator = MeteringPreAggregator()
+        aggregator.extend(
+            [
+                make_meter("5", minute=30, counterType="GAUGE"),
+                make_meter("9", minute=10, counterType="GAUGE"),
+                make_meter("7", minute=45, counterType="GAUGE"),
+            ]
+        )
+
+        (merged,) = aggregator.drain()
+
+        assert merged["counterVolume"] == "7"
+        assert merged["timestamp"].startswith("2024-01-01T10:45")
+
+    def test_invalid_bucket(self) -> None:
+        """Test only hour and day buckets are accepted."""
+        with pytest.raises(ValueError, match="Invalid bucket size"):
+            MeteringPreAggregator(bucket="month")
+
+    def test_flush_keeps_unsent_records(self) -> None:
+        """Test flush sends batches and keeps what a failure left unsent."""
+        manager = Mock()
+        manager.send_meter_list.side_effect = [{}, APIRequestException("down"), {}]
+        aggregator = MeteringPreAggregator()
+        aggregator.extend(make_meter("1", resourceId=f"vm-{i}") for i in range(5))
+        aggregator.extend(make_meter("1", resourceId=f"vm-{i}") for i in range(5))
+
+        with pytest.raises(APIRequestException):
+            aggregator.flush(manager, batch_size=2)
+        assert len(aggregator) == 3
+
+        report = aggregator.flush(manager, batch_size=3)
+
+        assert report == {
+            "records_in": 10,
+            "records_out": 5,
+            "requests": 1,
+            "compression_ratio": 2.0,
+        }
+        assert len(aggregator) == 0
+        sent = [
+            m for call in manager.send_meter_list.call_args_list for m in call[0][0]
+        ]
+        # The rejected batch of two is sent again by the second flush
+        assert [m["counterVolume"] for m in sent] == ["2"] * 7
+
+    def test_merged_records_get_their_own_keys(self) -> None:
+        """Test a retry reuses a record's key until its volume changes."""
+        manager = Mock(idempotency_keys=True)
+        failure = APIRequestException("down")
+        manager.send_meter_list.side_effect = [failure, failure, {}]
+        aggregator = MeteringPreAggregator()
+        aggregator.extend(
+            make_meter("1", idempotencyKey=f"caller-{i}") for i in range(2)
+        )
+
+        for _ in range(2):
+            with pytest.raises(APIRequestException):
+                aggregator.flush(manager)
+        aggregator.add(make_meter("1"))
+        aggregator.flush(manager)
+        aggregator.add(make_meter("1", idempotencyKey="caller-2"))
+
+        first, retry, grown = (
+            call[0][0][0] for call in manager.send_meter_list.call_args_list
+        )
+        assert not first["idempotencyKey"].startswith("caller-")
+        assert retry["idempotencyKey"] == first["idempotencyKey"]
+        assert grown["counterVolume"] == "3"
+        assert grown["idempotencyKey"] != first["idempotencyKey"]
+        assert "idempotencyKey" not in aggregator.drain()[0]
+
+    def test_invalid_timestamp_is_rejected(self) -> None:
+        """Test records are never bucketed by the time they arrive."""
+        aggregator = MeteringPreAggregator()
+
+        with pytest.raises(ValueError, match="Invalid meter timestamp"):
+            aggregator.add(make_meter("1", timestamp="yesterday"))
+        assert aggregator.records_in == 0
@@ -0,0 +1,94 @@
+"""Unit tests for the materialized metering rollup cube."""
+
+from collections import defaultdict
+from datetime import date, datetime
+from decimal import Decimal
+
+import pytest
+
+from libs.metering_aggregator import MeteringAggregator
+from libs.metering_rollup import MeteringRollup
+
+
+def make_records(count: int) -> list[dict]:
+    return [
+        {
+            "appKey": f"app-{i % 2}",
+            "counterName": ["cpu", "memory", "network"][i % 3],
+            "counterType": "DELTA",
+            "counterVolume": f"{i % 17}.{i % 100:02d}",
+            "resourceId": f"vm-{i % 5}",
+            "timestamp": (
+                f"2024-{i % 3 + 1:02d}-{i % 28 + 1:02d}T{i % 24:02d}:{i % 60:02d}:00"
+                ".000+09:00"
+            ),
+        }
+        for i in range(count)
+    ]
+
+
+@pytest.fixture
+def records():
+    return make_records(3000)
+
+
+@pytest.fixture
+def rollup(records):
+    return MeteringRollup().update(records)
+
+
+class TestMeteringRollup:
+    """Unit tests for MeteringRollup."""
+
+    @pytest.mark.parametrize("level", ["hour", "day", "month", "year"])
+    def test_rollups_match_raw_records(self, rollup, records, level) -> None:
+        """Test every level's totals equal sums over the raw records."""
+        expected: defaultdict[str, Decimal] = defaultdict(Decimal)
+        buckets = MeteringAggregator.aggregate_by_time_bucket(records, level)
+        for bucket, bucket_records in buckets.items():
+            for record in bucket_records:
+                if record["counterName"] == "cpu":
+                    expected[bucket] += Decimal(record["counterVolume"])
+
+        result = rollup.query(level, counter_name="cpu")
+
+        assert {k: m.total_volume for k, m in result.items()} == expected
+        assert list(result) == sorted(expected)
+        assert sum(m.record_count for m in result.values()) == 1000
+
+    def test_range_bounds_are_inclusive(self, rollup) -> None:
+        """Test string, date and datetime bounds select whole buckets."""
+        by_string = rollup.query("day", "2024-01-03", "2024-01-05", resource_id="vm-1")
+        by_date = rollup.query(
+            "day", date(2024, 1, 3), datetime(2024, 1, 5, 23), resource_id="vm-1"
+        )
+        hours = rollup.query("hour", "2024-01-03", "2024-01-05", resource_id="vm-1")
+
+        assert list(by_string) == ["2024-01-03", "2024-01-04", "2024-01-05"]
+        assert by_date == by_string
+        assert sum(m.total_volume for m in hours.values()) == sum(
+            m.total_volume for m in by_string.values()
+        )
+        metrics = by_string["2024-01-04"]
+        assert metrics.dimensions.resource_id == "vm-1"
+        assert metrics.dimensions.time_bucket == "2024-01-04"
+
+    def test_derived_levels_follow_new_records(self, rollup) -> None:
+        """Test coarser levels are rebuilt after more records arrive."""
+        before = rollup.query("month", "2024-02", "2024-02")["2024-02"]
+
+        rollup.add({**make_records(2)[1], "counterVolume": "100"})
+        after = rollup.query("month", "2024-02", "2024-02")["2024-02"]
+
+        assert after.total_volume == before.total_volume + 100
+        assert after.record_count == before.record_count + 1
+
+    def test_cell_counts_and_invalid_level(self, rollup) -> None:
+        """Test cells shrink level by level and unknown levels are rejected."""
+        counts = rollup.cell_counts()
+
+        assert counts["hour"] > counts["day"] > counts["month"]
+        # Each (counter, app, resource) combination falls in a single month
+        assert counts["month"] == counts["year"] == 30
+        with pytest.raises(ValueError, match="Invalid bucket size"):
+            rollup.query("week")
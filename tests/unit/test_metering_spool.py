@@ -0,0 +1,197 @@
+"""Unit tests for the durable metering spool."""
+
+import json
+import os
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from libs.exceptions import (
+    APIRequestException,
+    TimeoutException,
+    ValidationException,
+)
+from libs.http_client import BillingAPIClient, RetryConfig
+from libs.Metering import MeteringManager
+from libs.metering_spool import MeteringSpool
+
+BASE_URL = "http://metering.in-process"
+OK_BODY = {"header": {"isSuccessful": True, "resultMessage": "SUCCESS"}}
+
+
+def make_meter(i: int) -> dict:
+    return {"appKey": "app-1", "counterName": "cpu", "counterVolume": str(i)}
+
+
+class MeterApp:
+    """WSGI metering endpoint that can be switched off."""
+
+    def __init__(self) -> None:
+        self.down = False
+        self.received: list[str] = []
+
+    def __call__(self, environ, start_response):
+        length = int(environ.get("CONTENT_LENGTH") or 0)
+        meters = json.loads(environ["wsgi.input"].read(length))["meterList"]
+        if self.down:
+            start_response("400 Bad Request", [("Content-Type", "application/json")])
+            return [b'{"error": "unavailable"}']
+        self.received.extend(m["counterVolume"] for m in meters)
+        start_response("200 OK", [("Content-Type", "application/json")])
+        return [json.dumps(OK_BODY).encode()]
+
+
+@pytest.fixture
+def app():
+    return MeterApp()
+
+
+@pytest.fixture
+def client(app):
+    retry = RetryConfig(total=0, backoff_factor=0)
+    with BillingAPIClient(BASE_URL, retry_config=retry, wsgi_app=app) as client:
+        yield client
+
+
+class TestMeteringSpool:
+    """Unit tests for MeteringSpool."""
+
+    def test_append_ack_and_pending(self, tmp_path) -> None:
+        """Test only unacknowledged records are pending."""
+        with MeteringSpool(tmp_path) as spool:
+            seqs = spool.append([make_meter(i) for i in range(4)])
+            spool.ack(seqs[1:3])
+            spool.ack(seqs[1:3])
+
+            assert seqs == [0, 1, 2, 3]
+            assert spool.pending_count == 2
+            assert [m["counterVolume"] for _, m in spool.pending()] == ["0", "3"]
+
+    def test_burst_tail_is_synced(self, tmp_path, monkeypatch) -> None:
+        """Test writes with no later append or ack are still fsynced."""
+        synced = []
+        monkeypatch.setattr(os, "fsync", synced.append)
+        with MeteringSpool(tmp_path, fsync_interval=0.05) as spool:
+            spool.append([make_meter(0)])
+            spool.append([make_meter(1)])
+            deadline = time.monotonic() + 5
+            while not synced and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+            assert synced
+            assert not spool._dirty
+
+    def test_survives_reopen(self, tmp_path) -> None:
+        """Test records and acks are recovered from disk."""
+        with MeteringSpool(tmp_path) as spool:
+            seqs = spool.append([make_meter(i) for i in range(3)])
+            spool.ack(seqs[:1])
+
+        with MeteringSpool(tmp_path) as spool:
+            assert [seq for seq, _ in spool.pending()] == [1, 2]
+            assert spool.append([make_meter(3)]) == [3]
+
+    def test_torn_tail_is_truncated(self, tmp_path) -> None:
+        """Test a partially written last frame is dropped on open."""
+        with MeteringSpool(tmp_path) as spool:
+            spool.append([make_meter(0), make_meter(1)])
+        (segment,) = tmp_path.glob("*.seg")
+        segment.write_bytes(segment.read_bytes()[:-5])
+
+        with MeteringSpool(tmp_path) as spool:
+            assert [m["counterVolume"] for _, m in spool.pending()] == ["0"]
+            assert spool.append([make_meter(2)]) == [1]
+            assert [seq for seq, _ in spool.pending()] == [0, 1]
+
+    def test_delivered_segments_are_deleted(self, tmp_path) -> None:
+        """Test sealed segments disappear once all their records are acked."""
+        with MeteringSpool(tmp_path, segment_bytes=200) as spool:
+            seqs = [seq for i in range(10) for seq in spool.append([make_meter(i)])]
+            segments = len(list(tmp_path.glob("*.seg")))
+            spool.ack(seqs)
+
+            assert segments > 2
+            # Only the active segment is kept
+            assert len(list(tmp_path.glob("*.seg"))) == 1
+            assert spool.pending_count == 0
+
+    def test_replay_sends_and_acks(self, tmp_path, client, app) -> None:
+        """Test replay delivers pending records in batches and acks them."""
+        with MeteringSpool(tmp_path, segment_bytes=300) as spool:
+            spool.append([make_meter(i) for i in range(25)])
+
+            stats = spool.replay(client, batch_size=10, max_in_flight=2)
+
+            assert (stats.records, stats.batches, stats.sent) == (25, 3, 25)
+            assert sorted(app.received, key=int) == [str(i) for i in range(25)]
+            assert spool.pending_count == 0
+
+    def test_replay_keeps_rejected_batches(self, tmp_path, client, app) -> None:
+        """Test rejected batches stay in the spool."""
+        app.down = True
+        with MeteringSpool(tmp_path) as spool:
+            spool.append([make_meter(i) for i in range(3)])
+
+            stats = spool.replay(client, batch_size=2, max_in_flight=1)
+
+            assert stats.failed == 3
+            assert spool.pending_count == 3
+
+
+class TestMeteringManagerSpool:
+    """Tests for MeteringManager writing through a spool."""
+
+    def test_failed_send_is_replayed(self, tmp_path, client, app) -> None:
+        """Test meters from a failed send are delivered by replay_spool."""
+        with MeteringSpool(tmp_path) as spool:
+            manager = MeteringManager(month="2024-01", client=client, spool=spool)
+            manager.send_metering("app-1", "cpu", "DELTA", "HOURS", "1")
+            app.down = True
+            with pytest.raises(APIRequestException):
+                manager.send_metering("app-1", "cpu", "DELTA", "HOURS", "2")
+            result = manager.send_batch_metering(
+                "app-1",
+                [
+                    {
+                        "counter_name": "cpu",
+                        "counter_type": "DELTA",
+                        "counter_unit": "HOURS",
+                        "counter_volume": "3",
+                    }
+                ],
+            )
+            assert not result["results"][0]["success"]
+            assert spool.pending_count == 2
+
+            app.down = False
+            stats = manager.replay_spool()
+
+        assert stats.sent == 2
+        assert app.received == ["1", "2", "3"]
+
+    def test_delivered_chunks_are_acked_before_raising(self, tmp_path) -> None:
+        """Test an unexpected error still lets delivered chunks be acked."""
+        client = MagicMock()
+        client.map_requests.return_value = [
+            {"status": "SUCCESS"},
+            TimeoutException("Timed out", timeout_seconds=1.0),
+            {"status": "SUCCESS"},
+        ]
+        meter = {
+            "counter_name": "cpu",
+            "counter_type": "DELTA",
+            "counter_unit": "HOURS",
+            "counter_volume": "1",
+        }
+        with MeteringSpool(tmp_path) as spool:
+            manager = MeteringManager(month="2024-01", client=client, spool=spool)
+            with pytest.raises(TimeoutException):
+                manager.send_batch_metering("app-1", [meter] * 5, batch_size=2)
+
+            assert spool.pending_count == 2
+
+    def test_replay_without_spool(self, client) -> None:
+        """Test replay_spool needs a spool."""
+        with pytest.raises(ValidationException, match="spool"):
+            MeteringManager(month="2024-01", client=client).replay_spool()
@@ -0,0 +1,139 @@
+"""Unit tests for adaptive polling schedules and server-sent event parsing."""
+
+import random
+
+import pytest
+
+from libs.polling import AdaptivePolling, iter_sse_events, progress_fraction
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestProgressFraction:
+    """Unit tests for progress_fraction."""
+
+    @pytest.mark.parametrize(
+        ("response", "expected"),
+        [
+            ({"progress": 30, "maxProgress": 60}, 0.5),
+            ({"progress": 40}, 0.4),
+            ({"list": [{"progress": 80.0, "status": "RUNNING"}]}, 0.8),
+            ({"progress": 150, "maxProgress": 100}, 1.0),
+            ({"status": "RUNNING"}, None),
+            ({"progress": "n/a"}, None),
+            ({"progress": 1, "maxProgress": 0}, None),
+            ({"list": []}, None),
+            (None, None),
+        ],
+    )
+    def test_extraction(self, response, expected) -> None:
+        """Test progress is read from the supported response shapes."""
+        assert progress_fraction(response) == expected
+
+
+class TestPollSchedule:
+    """Unit tests for AdaptivePolling schedules."""
+
+    def test_exponential_backoff_capped(self) -> None:
+        """Test delays double from the initial interval up to the cap."""
+        schedule = AdaptivePolling(
+            initial_interval=0.1, max_interval=1.0, multiplier=2, jitter=0
+        ).schedule()
+
+        delays = [schedule.next_delay() for _ in range(6)]
+
+        assert delays == pytest.approx([0.1, 0.2, 0.4, 0.8, 1.0, 1.0])
+
+    def test_jitter_stays_in_band(self) -> None:
+        """Test jitter spreads delays within the configured fraction."""
+        policy = AdaptivePolling(initial_interval=1.0, multiplier=1, jitter=0.2)
+        schedule = policy.schedule(rng=random.Random(7))
+
+        delays = [schedule.next_delay() for _ in range(50)]
+
+        assert all(0.8 <= d <= 1.2 for d in delays)
+        assert len(set(delays)) > 1
+
+    def test_progress_estimate_shortens_delay(self) -> None:
+        """Test the delay is capped by the estimated time to completion."""
+        clock = FakeClock()
+        schedule = AdaptivePolling(
+            initial_interval=0.1, max_interval=30, multiplier=4, jitter=0
+        ).schedule(clock=clock)
+
+        schedule.next_delay({"progress": 10})
+        clock.now = 0.5
+        schedule.next_delay({"progress": 50})
+        clock.now = 1.0
+        # 90% done at 80%/s: about 0.125s left, far below the 1.6s backoff
+        delay = schedule.next_delay({"progress": 90})
+
+        assert delay == pytest.approx(0.125)
+
+    def test_stalled_progress_uses_backoff(self) -> None:
+        """Test unchanged progress does not shorten the backoff."""
+        clock = FakeClock()
+        schedule = AdaptivePolling(
+            initial_interval=0.5, multiplier=2, jitter=0
+        ).schedule(clock=clock)
+
+        schedule.next_delay({"progress": 50})
+        clock.now = 1.0
+
+        assert schedule.next_delay({"progress": 50}) == pytest.approx(1.0)
+
+
+class TestIterSseEvents:
+    """Unit tests for iter_sse_events."""
+
+    def test_parses_events(self) -> None:
+        """Test event names, multi-line data, comments and a missing final blank."""
+        lines = [
+            ": comment",
+            "event: progress",
+            "data: {",
+            'data: "a": 1}',
+            "",
+            "",
+            "data:plain",
+        ]
+
+        assert list(iter_sse_events(lines)) == [
+            ("progress", '{\n"a": 1}'),
+            ("message", "plain"),
+        ]
+
+
+class TestMockServerProgressStream:
+    """Tests for the mock server's pushed progress streams."""
+
+    def test_batch_progress_stream_runs_to_completion(self) -> None:
+        """Test the batch stream pushes progress until every job completes."""
+        pytest.importorskip("flask")
+        import json
+
+        from mock_server.app import app
+
+        client = app.test_client()
+        headers = {"uuid": "test-uuid-001"}
+        client.post("/billing/admin/batch", headers=headers)
+
+        response = client.get("/billing/admin/batch/progress/stream", headers=headers)
+        events = [
+            json.loads(data)
+            for _event, data in iter_sse_events(
+                response.get_data(as_text=True).splitlines()
+            )
+        ]
+
+        assert response.mimetype == "text/event-stream"
+        assert events[-1]["status"] == "COMPLETED"
+        assert all(e["status"] == "RUNNING" for e in events[:-1])
@@ -0,0 +1,196 @@
+"""Unit tests for compressed request bodies."""
+
+import asyncio
+import gzip
+import io
+import json
+import zlib
+
+import pytest
+
+from libs.http_client import BillingAPIClient
+from libs.request_compression import RequestCompression
+
+BASE_URL = "http://app.in-process"
+OK_BODY = {"header": {"isSuccessful": True, "resultMessage": "SUCCESS"}}
+
+
+def meter_list(count: int) -> dict:
+    return {
+        "meterList": [
+            {
+                "appKey": "app-1",
+                "counterName": "compute.c2.c8m8",
+                "counterType": "DELTA",
+                "counterUnit": "HOURS",
+                "counterVolume": str(i),
+                "parentResourceId": "project-1",
+                "resourceId": f"vm-{i % 10}",
+                "resourceName": f"vm-{i % 10}",
+                "source": "qa.billing.test",
+                "timestamp": "2024-01-01T13:00:00.000+09:00",
+            }
+            for i in range(count)
+        ]
+    }
+
+
+class RecordingApp:
+    """WSGI app recording the encoding and size of request bodies."""
+
+    def __init__(self) -> None:
+        self.requests: list[tuple[str | None, int, str | None]] = []
+
+    def __call__(self, environ, start_response):
+        body = environ["wsgi.input"].read(int(environ.get("CONTENT_LENGTH") or 0))
+        self.requests.append(
+            (environ.get("HTTP_CONTENT_ENCODING"), len(body), environ["CONTENT_TYPE"])
+        )
+        start_response("200 OK", [("Content-Type", "application/json")])
+        return [json.dumps(OK_BODY).encode()]
+
+
+class TestRequestCompression:
+    """Unit tests for RequestCompression."""
+
+    @pytest.mark.parametrize(
+        ("encoding", "decode"),
+        [("gzip", gzip.decompress), ("deflate", zlib.decompress)],
+    )
+    def test_encode_round_trips(self, encoding, decode) -> None:
+        """Test large bodies are compressed and decode to the original."""
+        body = json.dumps(meter_list(100)).encode()
+
+        payload, used = RequestCompression(encoding).encode(body)
+
+        assert used == encoding
+        assert decode(payload) == body
+        assert len(payload) * 10 < len(body)
+
+    def test_small_bodies_are_left_alone(self) -> None:
+        """Test bodies under min_size are sent uncompressed."""
+        assert RequestCompression(min_size=100).encode(b"{}") == (b"{}", None)
+
+    def test_invalid_settings(self) -> None:
+        """Test unknown encodings and levels are rejected."""
+        with pytest.raises(ValueError, match="encoding"):
+            RequestCompression("br")
+        with pytest.raises(ValueError, match="level"):
+            RequestCompression(level=0)
+
+
+class TestClientCompression:
+    """Tests for clients sending compressed bodies."""
+
+    def test_sync_client(self) -> None:
+        """Test only bodies above the threshold carry Content-Encoding."""
+        app = RecordingApp()
+        compression = RequestCompression(min_size=1024)
+        with BillingAPIClient(
+            BASE_URL, wsgi_app=app, request_compression=compression
+        ) as client:
+            client.post("billing/meters", json_data=meter_list(100))
+            client.post("billing/meters", json_data={"meterList": []})
+
+        (encoding, size, content_type), small = app.requests
+        assert (encoding, content_type) == ("gzip", "application/json")
+        assert size < len(json.dumps(meter_list(100)))
+        assert small[0] is None
+
+    def test_async_client(self) -> None:
+        """Test the asyncio client compresses the same way."""
+        pytest.importorskip("httpx")
+        from libs.async_http_client import AsyncBillingAPIClient
+
+        app = RecordingApp()
+
+        async def scenario():
+            async with AsyncBillingAPIClient(
+                BASE_URL,
+                wsgi_app=app,
+                request_compression=RequestCompression("deflate", min_size=10),
+            ) as client:
+                await client.post("billing/meters", json_data=meter_list(5))
+
+        asyncio.run(scenario())
+
+        assert app.requests[0][0] == "deflate"
+
+
+class TestMockServerDecoding:
+    """Tests for the mock server decoding compressed bodies."""
+
+    @pytest.fixture
+    def client(self):
+        pytest.importorskip("flask")
+        from mock_server.app import app
+
+        with BillingAPIClient(
+            BASE_URL,
+            wsgi_app=app,
+            request_compression=RequestCompression(min_size=0),
+        ) as client:
+            yield client
+
+    def test_create_metering(self, client) -> None:
+        """Test a gzipped meterList is stored as if sent plain."""
+        response = client.post(
+            "billing/meters",
+            json_data=meter_list(50),
+            headers={"uuid": "COMPRESSION_UNIT_UUID"},
+        )
+
+        assert len(response["meterIds"]) == 50
+
+    def test_v1_endpoint(self, client) -> None:
+        """Test the v1 endpoints read compressed bodies too."""
+        response = client.post(
+            "api/v1/metering",
+            json_data={"resource_id": "vm-1", "usage": 12.5, "project_id": "p-1"},
+        )
+
+        assert response["status"] == "accepted"
+
+    @pytest.mark.parametrize(
+        ("encoding", "body", "status"),
+        [
+            ("gzip", b"not gzip", 400),
+            ("gzip", gzip.compress(b'{"meterList": []}')[:-8], 400),
+            ("gzip", gzip.compress(b'{"meterList": []}') + b"junk", 400),
+            ("br", b"{}", 415),
+            ("gzip", gzip.compress(b" " * (65 * 1024 * 1024)), 413),
+        ],
+    )
+    def test_rejected_bodies(self, client, encoding, body, status) -> None:
+        """Test corrupt, truncated, unsupported and oversized bodies are refused."""
+        response = client.session.post(
+            f"{BASE_URL}/billing/meters",
+            data=body,
+            headers={"Content-Encoding": encoding, "Content-Type": "application/json"},
+        )
+
+        assert response.status_code == status
+        assert not response.json()["header"]["isSuccessful"]
+
+    @pytest.mark.parametrize(("terminated", "status"), [(True, "200"), (False, "411")])
+    def test_body_without_length(self, terminated, status) -> None:
+        """Test chunked bodies are read to the end, unbounded ones refused."""
+        from mock_server.request_encoding import DecompressRequestMiddleware
+
+        received = []
+
+        def app(environ, start_response):
+            received.append(environ["wsgi.input"].read())
+            start_response("200 OK", [])
+            return [b""]
+
+        statuses = []
+        environ = {
+            "HTTP_CONTENT_ENCODING": "gzip",
+            "wsgi.input": io.BytesIO(gzip.compress(b'{"meterList": []}')),
+            "wsgi.input_terminated": terminated,
+        }
+        DecompressRequestMiddleware(app)(environ, lambda s, headers: statuses.append(s))
+
+        assert statuses[0].startswith(status)
+        assert received == ([b'{"meterList": []}'] if terminated else [])
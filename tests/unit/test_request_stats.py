@@ -0,0 +1,268 @@
+"""Unit tests for per-endpoint request statistics."""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import responses
+
+from libs.flow_control import FlowControl
+from libs.http_client import BillingAPIClient, RetryConfig
+from libs.request_stats import (
+    STATS_FILE_ENV_VAR,
+    LatencyHistogram,
+    RequestStats,
+    endpoint_template,
+    get_request_stats,
+)
+
+BASE_URL = "https://api.example.com"
+OK_BODY = {"header": {"isSuccessful": True, "resultMessage": "SUCCESS"}}
+
+
+class TestEndpointTemplate:
+    """Unit tests for endpoint normalization."""
+
+    @pytest.mark.parametrize(
+        ("endpoint", "expected"),
+        [
+            ("billing/meters", "billing/meters"),
+            ("/billing/payment/PG-0001/status", "billing/payment/{id}/status"),
+            (
+                "billing/admin/contracts/c-1/products/prices",
+                "billing/admin/contracts/{id}/products/prices",
+            ),
+            (
+                "billing/admin/billing-groups/deadbeefcafebabe0123",
+                "billing/admin/billing-groups/{id}",
+            ),
+            ("billing/admin/progress?uuid=u-1", "billing/admin/progress"),
+            ("api/v1/x", "api/v1/x"),
+            ("v2/billing/meters/1234", "v2/billing/meters/{id}"),
+            (
+                "api/v1/payments/123e4567-e89b-12d3-a456-426614174000",
+                "api/v1/payments/{id}",
+            ),
+        ],
+    )
+    def test_builtin_rule(self, endpoint, expected) -> None:
+        """Test ID-like segments are replaced and queries dropped."""
+        assert endpoint_template(endpoint) == expected
+
+    def test_patterns_take_precedence(self) -> None:
+        """Test glob patterns name endpoints the built-in rule misses."""
+        assert endpoint_template("billing/coupons/WELCOME", ["billing/coupons/*"]) == (
+            "billing/coupons/*"
+        )
+
+
+class TestLatencyHistogram:
+    """Unit tests for LatencyHistogram."""
+
+    def test_quantiles_within_bucket_error(self) -> None:
+        """Test quantiles are close upper bounds of the exact values."""
+        histogram = LatencyHistogram()
+        for value in range(1, 1001):
+            histogram.record(float(value))
+
+        for q, exact in [(0.5, 500), (0.9, 900), (0.99, 990)]:
+            estimate = histogram.quantile(q)
+            assert exact <= estimate <= exact * LatencyHistogram.GROWTH
+
+        assert histogram.summary()["max"] == 1000
+        assert histogram.summary()["mean"] == 500.5
+
+    def test_quantile_never_exceeds_max(self) -> None:
+        """Test a single sample is reported exactly."""
+        histogram = LatencyHistogram()
+        histogram.record(12.3)
+
+        assert histogram.quantile(0.99) == 12.3
+
+    def test_empty(self) -> None:
+        """Test an empty histogram reports zeros."""
+        assert LatencyHistogram().summary() == {
+            "count": 0,
+            "mean": 0.0,
+            "p50": 0.0,
+            "p90": 0.0,
+            "p99": 0.0,
+            "max": 0.0,
+        }
+
+
+class TestRequestStats:
+    """Unit tests for RequestStats."""
+
+    def test_record_groups_by_template(self) -> None:
+        """Test requests for different IDs share one entry."""
+        stats = RequestStats()
+        stats.record("GET", "billing/payment/PG-1", 200, 0.010, bytes_received=100)
+        stats.record("GET", "billing/payment/PG-2", 500, 0.030, retries=2)
+
+        entry = stats.snapshot()["GET billing/payment/{id}"]
+        assert entry["count"] == 2
+        assert entry["errors"] == 1
+        assert entry["retries"] == 2
+        assert entry["bytes_received"] == 100
+        assert entry["latency_ms"]["max"] == 30.0
+        assert entry["connection_reuse_ratio"] is None
+
+    def test_reset(self) -> None:
+        """Test reset discards recorded requests."""
+        stats = RequestStats()
+        stats.record("GET", "billing/meters", 200, 0.01)
+        stats.reset()
+
+        assert stats.snapshot() == {}
+
+    def test_dump(self, tmp_path) -> None:
+        """Test the JSON report contains the snapshot."""
+        stats = RequestStats()
+        stats.record("POST", "billing/meters", 200, 0.01)
+        output = tmp_path / "reports" / "stats.json"
+
+        stats.dump(output)
+
+        report = json.loads(output.read_text())
+        assert report["endpoints"] == stats.snapshot()
+        assert "generated_at" in report
+
+    def test_dump_at_exit_registers_once(self, monkeypatch, tmp_path) -> None:
+        """Test each path is registered for exit only once."""
+        registered = []
+        monkeypatch.setattr(
+            "libs.request_stats.atexit.register",
+            lambda fn, *args: registered.append((fn, args)),
+        )
+        stats = RequestStats()
+
+        stats.dump_at_exit(tmp_path / "stats.json")
+        stats.dump_at_exit(tmp_path / "stats.json")
+
+        assert len(registered) == 1
+        fn, args = registered[0]
+        fn(*args)
+        assert (tmp_path / "stats.json").exists()
+
+    def test_process_wide_stats_dump_from_environment(
+        self, monkeypatch, tmp_path
+    ) -> None:
+        """Test the shared stats register an exit dump when configured."""
+        registered = []
+        monkeypatch.setattr(
+            "libs.request_stats.atexit.register",
+            lambda fn, *args: registered.append(args),
+        )
+        monkeypatch.setenv(STATS_FILE_ENV_VAR, str(tmp_path / "stats.json"))
+        get_request_stats.cache_clear()
+        try:
+            stats = get_request_stats()
+            assert get_request_stats() is stats
+            assert registered == [(tmp_path / "stats.json",)]
+        finally:
+            get_request_stats.cache_clear()
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    """Serve a small JSON body over HTTP/1.1 keep-alive connections."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        body = json.dumps(OK_BODY).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_args) -> None:
+        pass
+
+
+@pytest.fixture
+def local_server():
+    """Run a keep-alive HTTP server on a free local port."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+class TestClientStats:
+    """Tests for request statistics recorded by BillingAPIClient."""
+
+    def test_phases_and_connection_reuse(self, local_server) -> None:
+        """Test connect time is seen once and the connection is then reused."""
+        stats = RequestStats()
+        with BillingAPIClient(local_server, stats=stats) as client:
+            client.get("billing/payment/PG-1")
+            client.get("billing/payment/PG-2")
+
+        entry = stats.snapshot()["GET billing/payment/{id}"]
+        assert entry["count"] == 2
+        assert entry["connection_reuse_ratio"] == 0.5
+        assert entry["phases_ms"]["connect"]["count"] == 2
+        assert entry["phases_ms"]["ttfb"]["max"] > 0
+        assert entry["bytes_received"] == 2 * len(json.dumps(OK_BODY))
+
+    @responses.activate
+    def test_retries_and_bytes_counted(self) -> None:
+        """Test flow-control retries and request bodies are recorded."""
+        url = f"{BASE_URL}/billing/meters"
+        responses.add(responses.POST, url, status=429, headers={"Retry-After": "0"})
+        responses.add(responses.POST, url, json=OK_BODY)
+        stats = RequestStats()
+        client = BillingAPIClient(
+            BASE_URL,
+            retry_config=RetryConfig(backoff_factor=0),
+            flow_control=FlowControl(),
+            stats=stats,
+        )
+
+        client.post("billing/meters", json_data={"meterList": []})
+
+        entry = stats.snapshot()["POST billing/meters"]
+        assert entry["retries"] == 1
+        assert entry["bytes_sent"] == len(b'{"meterList": []}')
+        assert entry["errors"] == 0
+
+    @responses.activate
+    def test_transport_failure_counted_as_error(self) -> None:
+        """Test requests that get no response are still recorded."""
+        stats = RequestStats()
+        client = BillingAPIClient(
+            BASE_URL, retry_config=RetryConfig(total=0), stats=stats
+        )
+
+        with pytest.raises(Exception, match="Request failed"):
+            client.get("billing/meters")
+
+        assert stats.snapshot()["GET billing/meters"]["errors"] == 1
+
+    def test_async_client_records(self) -> None:
+        """Test the asyncio client records into the same stats surface."""
+        httpx = pytest.importorskip("httpx")
+        import asyncio
+
+        from libs.async_http_client import AsyncBillingAPIClient
+
+        stats = RequestStats()
+
+        async def scenario():
+            async with AsyncBillingAPIClient(
+                BASE_URL,
+                transport=httpx.MockTransport(
+                    lambda _request: httpx.Response(200, json=OK_BODY)
+                ),
+                stats=stats,
+            ) as client:
+                await client.get("billing/payment/PG-1")
+
+        asyncio.run(scenario())
+
+        assert stats.snapshot()["GET billing/payment/{id}"]["count"] == 1
@@ -0,0 +1,235 @@
+"""Unit tests for the GET response cache and its BillingAPIClient integration."""
+
+import re
+
+import pytest
+import responses
+
+from libs.exceptions import APIRequestException
+from libs.http_client import BillingAPIClient
+from libs.response_cache import ResponseCache
+
+BASE_URL = "https://api.example.com"
+PRICES_ENDPOINT = "billing/admin/contracts/c-1/products/prices"
+OK_BODY = {"header": {"isSuccessful": True, "resultMessage": "SUCCESS"}}
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    """Provide a controllable clock."""
+    return FakeClock()
+
+
+@pytest.fixture
+def cache(clock):
+    """Provide a small cache driven by the fake clock."""
+    return ResponseCache(max_entries=2, default_ttl=10, clock=clock)
+
+
+class TestResponseCache:
+    """Unit tests for ResponseCache."""
+
+    def test_hit_returns_copy(self, cache) -> None:
+        """Test fresh entries are hits and callers cannot mutate the cache."""
+        cache.store("k", {"value": [1]}, ttl=10)
+
+        first = cache.get("k")
+        first["value"].append(2)
+
+        assert cache.get("k") == {"value": [1]}
+        assert cache.stats.hits == 2
+        assert cache.stats.misses == 0
+
+    def test_expired_entry_without_etag_is_dropped(self, cache, clock) -> None:
+        """Test stale entries without a validator are evicted on lookup."""
+        cache.store("k", {"value": 1}, ttl=10)
+        clock.now = 10
+
+        assert cache.get("k") is None
+        assert len(cache) == 0
+        assert cache.stats.misses == 1
+
+    def test_expired_entry_with_etag_can_revalidate(self, cache, clock) -> None:
+        """Test stale entries with an ETag survive until revalidated."""
+        cache.store("k", {"value": 1}, ttl=10, etag='"v1"')
+        clock.now = 11
+
+        assert cache.get("k") is None
+        assert cache.etag_for("k") == '"v1"'
+        assert cache.revalidate("k", ttl=10) == {"value": 1}
+        assert cache.get("k") == {"value": 1}
+
+        stats = cache.stats
+        assert (stats.hits, stats.misses, stats.revalidations) == (1, 1, 1)
+        assert stats.hit_ratio == 1.0
+
+    def test_lru_eviction(self, cache) -> None:
+        """Test the least recently used entry is evicted first."""
+        cache.store("a", {"v": "a"}, ttl=10)
+        cache.store("b", {"v": "b"}, ttl=10)
+        cache.get("a")
+        cache.store("c", {"v": "c"}, ttl=10)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == {"v": "a"}
+        assert cache.stats.evictions == 1
+
+    def test_endpoint_ttls(self) -> None:
+        """Test glob TTL rules match in order before the default."""
+        cache = ResponseCache(
+            default_ttl=5,
+            endpoint_ttls={
+                "billing/admin/contracts/*/products/prices": 300,
+                "billing/admin/*": 0,
+            },
+        )
+
+        assert cache.ttl_for(f"/{PRICES_ENDPOINT}") == 300
+        assert cache.ttl_for("billing/admin/batch") == 0
+        assert cache.ttl_for("billing/credits/balance") == 5
+
+    def test_invalidate_drops_racing_store(self, cache) -> None:
+        """Test a response fetched before an invalidation is not cached."""
+        cache.store("k", {"v": 1}, ttl=10)
+        generation = cache.generation
+
+        cache.invalidate()
+        cache.store("k", {"v": 2}, ttl=10, generation=generation)
+
+        assert len(cache) == 0
+        assert cache.stats.invalidations == 1
+
+    def test_invalid_max_entries(self) -> None:
+        """Test the size bound must be positive."""
+        with pytest.raises(ValueError, match="max_entries"):
+            ResponseCache(max_entries=0)
+
+
+class TestClientCaching:
+    """Tests for BillingAPIClient with a response cache attached."""
+
+    @pytest.fixture
+    def client(self, cache):
+        """Provide a client using the fake-clock cache."""
+        with BillingAPIClient(BASE_URL, cache=cache) as client:
+            yield client
+
+    @responses.activate
+    def test_repeated_get_is_served_from_cache(self, client, cache) -> None:
+        """Test identical GETs hit the network once."""
+        responses.add(responses.GET, f"{BASE_URL}/{PRICES_ENDPOINT}", json=OK_BODY)
+
+        client.get(PRICES_ENDPOINT, params={"counterNames": "cpu"})
+        client.get(PRICES_ENDPOINT, params={"counterNames": "cpu"})
+        client.get(PRICES_ENDPOINT, params={"counterNames": "gpu"})
+
+        assert len(responses.calls) == 2
+        assert cache.stats.hits == 1
+
+    @responses.activate
+    def test_stale_entry_revalidated_with_etag(self, client, cache, clock) -> None:
+        """Test If-None-Match is sent and a 304 refreshes the entry."""
+        url = f"{BASE_URL}/{PRICES_ENDPOINT}"
+        responses.add(
+            responses.GET, url, json={**OK_BODY, "price": 80}, headers={"ETag": '"p"'}
+        )
+        responses.add(responses.GET, url, status=304)
+
+        client.get(PRICES_ENDPOINT)
+        clock.now = 11
+        result = client.get(PRICES_ENDPOINT)
+
+        assert result["price"] == 80
+        assert responses.calls[1].request.headers["If-None-Match"] == '"p"'
+        assert cache.stats.revalidations == 1
+
+    @responses.activate
+    def test_mutation_invalidates_cache(self, client, cache) -> None:
+        """Test non-GET requests clear cached responses, even on failure."""
+        responses.add(
+            responses.GET, f"{BASE_URL}/billing/credits/balance", json=OK_BODY
+        )
+        responses.add(
+            responses.POST,
+            re.compile(r".*/campaign/.*"),
+            json={"message": "rejected"},
+            status=400,
+        )
+
+        client.get("billing/credits/balance")
+        with pytest.raises(APIRequestException, match="HTTP 400"):
+            client.post("billing/admin/campaign/c-1/credits", json_data={})
+        client.get("billing/credits/balance")
+
+        assert len(responses.calls) == 3
+        assert cache.stats.invalidations == 1
+
+    @responses.activate
+    def test_errors_are_not_cached(self, client, cache) -> None:
+        """Test failed GETs are retried rather than served from cache."""
+        url = f"{BASE_URL}/billing/credits/balance"
+        responses.add(responses.GET, url, json={"message": "boom"}, status=404)
+        responses.add(responses.GET, url, json=OK_BODY)
+
+        with pytest.raises(APIRequestException, match="HTTP 404"):
+            client.get("billing/credits/balance")
+
+        assert client.get("billing/credits/balance") == OK_BODY
+        assert len(cache) == 1
+
+    @responses.activate
+    def test_polling_is_not_served_from_cache(self) -> None:
+        """Test progress polls reach the server when only prices are cached."""
+        url = f"{BASE_URL}/billing/admin/progress"
+        responses.add(responses.GET, url, json={**OK_BODY, "status": "RUNNING"})
+        responses.add(responses.GET, url, json={**OK_BODY, "status": "COMPLETED"})
+        cache = ResponseCache(endpoint_ttls={PRICES_ENDPOINT: 300})
+
+        with BillingAPIClient(BASE_URL, cache=cache) as client:
+            result = client.wait_for_completion(
+                "billing/admin/progress", timeout=5, check_interval=0.01
+            )
+
+        assert result["status"] == "COMPLETED"
+        assert len(responses.calls) == 2
+        assert len(cache) == 0
+
+
+class TestMockServerRevalidation:
+    """End-to-end revalidation against the mock server app, in process."""
+
+    @responses.activate
+    def test_mock_server_answers_304(self, cache, clock) -> None:
+        """Test the mock server's ETags drive client revalidation."""
+        pytest.importorskip("flask")
+        from mock_server.app import app
+
+        flask_client = app.test_client()
+        statuses = []
+
+        def forward(request):
+            path = request.path_url
+            response = flask_client.get(path, headers=dict(request.headers))
+            statuses.append(response.status_code)
+            return response.status_code, dict(response.headers), response.data
+
+        responses.add_callback(responses.GET, re.compile(rf"{BASE_URL}/.*"), forward)
+
+        with BillingAPIClient(BASE_URL, cache=cache) as client:
+            first = client.get(PRICES_ENDPOINT, headers={"uuid": "test-uuid-001"})
+            clock.now = 11
+            second = client.get(PRICES_ENDPOINT, headers={"uuid": "test-uuid-001"})
+
+        assert statuses == [200, 304]
+        assert first == second
+        assert cache.stats.revalidations == 1
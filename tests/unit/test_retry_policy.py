@@ -0,0 +1,201 @@
+"""Unit tests for deadlines, retry budgets and the shared retry policy."""
+
+import random
+import time
+
+import pytest
+import responses
+from requests.exceptions import ConnectionError as RequestsConnectionError
+
+from libs.exceptions import APIRequestException, TimeoutException
+from libs.http_client import (
+    BillingAPIClient,
+    RequestSpec,
+    RetryConfig,
+    retry_on_exception,
+)
+from libs.retry_policy import (
+    RetryBudget,
+    RetryPolicy,
+    check_deadline,
+    deadline,
+    remaining_time,
+)
+
+BASE_URL = "https://api.example.com"
+OK_BODY = {"header": {"isSuccessful": True, "resultMessage": "SUCCESS"}}
+
+
+class TestDeadline:
+    """Unit tests for deadline propagation."""
+
+    def test_no_deadline_by_default(self) -> None:
+        """Test code outside a deadline block is unbounded."""
+        assert remaining_time() is None
+        assert check_deadline("anything") is None
+
+    def test_nested_deadline_only_tightens(self) -> None:
+        """Test an inner deadline cannot extend the outer one."""
+        with deadline(1.0) as outer:
+            with deadline(60.0) as inner:
+                assert inner == outer
+            with deadline(0.5) as inner:
+                assert inner < outer
+            assert 0.5 < remaining_time() <= 1.0
+        assert remaining_time() is None
+
+    def test_passed_deadline_raises(self) -> None:
+        """Test work started after the deadline fails fast."""
+        with deadline(0), pytest.raises(TimeoutException, match="Deadline exceeded"):
+            check_deadline("request")
+
+
+class TestRetryBudget:
+    """Unit tests for RetryBudget."""
+
+    def test_reserve_then_ratio(self) -> None:
+        """Test retries are limited to the reserve plus earned tokens."""
+        budget = RetryBudget(ratio=0.5, reserve=1)
+
+        assert budget.try_spend()
+        assert not budget.try_spend()
+        budget.record_request()
+        budget.record_request()
+        assert budget.try_spend()
+        assert budget.stats.to_dict() == {"requests": 2, "retries": 2, "rejected": 1}
+
+    def test_tokens_capped_at_reserve(self) -> None:
+        """Test healthy traffic cannot bank an unbounded retry burst."""
+        budget = RetryBudget(ratio=1, reserve=3)
+        for _ in range(10):
+            budget.record_request()
+
+        assert budget.available == 3
+
+    def test_negative_settings_rejected(self) -> None:
+        """Test invalid budgets are rejected."""
+        with pytest.raises(ValueError, match="must not be negative"):
+            RetryBudget(ratio=-0.1)
+
+
+class TestRetryPolicy:
+    """Unit tests for RetryPolicy."""
+
+    def test_full_jitter_backoff(self) -> None:
+        """Test backoff is uniform below the capped exponential schedule."""
+        policy = RetryPolicy(backoff_factor=1, backoff_max=4, rng=random.Random(7))
+        samples = [policy.backoff(5) for _ in range(200)]
+
+        assert policy.backoff(0) == 0.0
+        assert all(0 <= s <= 4 for s in samples)
+        assert min(samples) < 1 < 3 < max(samples)
+
+    def test_admit_respects_deadline_before_budget(self) -> None:
+        """Test retries past the deadline are refused without spending budget."""
+        budget = RetryBudget(reserve=1)
+        policy = RetryPolicy(budget=budget)
+
+        with deadline(1.0):
+            assert not policy.admit(5.0)
+        assert budget.available == 1
+        assert policy.admit(0.0)
+        assert not policy.admit(0.0)
+
+
+class TestRetryDecoratorPolicy:
+    """Tests for retry_on_exception under deadlines and budgets."""
+
+    def test_stops_at_deadline(self) -> None:
+        """Test the decorator gives up instead of sleeping past the deadline."""
+        calls = []
+
+        @retry_on_exception(max_retries=10, backoff_factor=10)
+        def always_fails() -> None:
+            calls.append(1)
+            msg = "down"
+            raise RequestsConnectionError(msg)
+
+        started = time.monotonic()
+        with deadline(0.5), pytest.raises(RequestsConnectionError):
+            always_fails()
+
+        assert time.monotonic() - started < 0.5
+        assert len(calls) < 10
+
+    def test_shares_client_budget(self) -> None:
+        """Test the decorator can spend a client's retry budget."""
+        policy = RetryPolicy(backoff_factor=0, budget=RetryBudget(ratio=0, reserve=1))
+        calls = []
+
+        @retry_on_exception(max_retries=5, policy=policy)
+        def always_fails() -> None:
+            calls.append(1)
+            msg = "down"
+            raise RequestsConnectionError(msg)
+
+        with pytest.raises(RequestsConnectionError):
+            always_fails()
+
+        assert len(calls) == 2
+
+
+class TestClientRetryPolicy:
+    """Tests for BillingAPIClient retries under the shared policy."""
+
+    @responses.activate
+    def test_budget_caps_urllib3_retries(self) -> None:
+        """Test urllib3 status retries stop once the client budget is spent."""
+        url = f"{BASE_URL}/billing/meters"
+        responses.add(responses.GET, url, status=503, json={"error": "down"})
+        client = BillingAPIClient(
+            BASE_URL,
+            retry_config=RetryConfig(total=5, backoff_factor=0),
+            retry_budget=RetryBudget(ratio=0, reserve=2),
+        )
+
+        for _ in range(2):
+            with pytest.raises(APIRequestException):
+                client.get("billing/meters")
+
+        assert len(responses.calls) == 4  # 1 + 2 retries, then 1 with no retry
+        assert client.retry_policy.budget.stats.rejected == 2
+
+    @responses.activate
+    def test_deadline_refuses_long_backoff(self) -> None:
+        """Test a retry whose backoff outlives the deadline is not attempted."""
+        url = f"{BASE_URL}/billing/meters"
+        responses.add(
+            responses.GET,
+            url,
+            status=503,
+            json={"error": "down"},
+            headers={"Retry-After": "30"},
+        )
+        client = BillingAPIClient(BASE_URL, retry_config=RetryConfig(total=5))
+
+        started = time.monotonic()
+        with deadline(2.0), pytest.raises(APIRequestException):
+            client.get("billing/meters")
+
+        assert len(responses.calls) == 1
+        assert time.monotonic() - started < 2.0
+
+    def test_expired_deadline_fails_before_sending(self) -> None:
+        """Test no request is sent once the deadline has passed."""
+        client = BillingAPIClient(BASE_URL)
+
+        with deadline(0), pytest.raises(TimeoutException):
+            client.get("billing/meters")
+
+    @responses.activate
+    def test_map_requests_inherits_deadline(self) -> None:
+        """Test worker threads see the caller's deadline."""
+        responses.add(responses.GET, f"{BASE_URL}/billing/meters", json=OK_BODY)
+        specs = [RequestSpec("GET", "billing/meters")] * 3
+
+        with BillingAPIClient(BASE_URL) as client:
+            assert client.map_requests(specs) == [OK_BODY] * 3
+            with deadline(0):
+                results = client.map_requests(specs)
+
+        assert all(isinstance(r, TimeoutException) for r in results)
@@ -0,0 +1,188 @@
+"""Unit tests for single-flight coalescing of concurrent identical GETs."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock
+
+import pytest
+
+from libs.exceptions import APIRequestException, TimeoutException
+from libs.http_client import BillingAPIClient
+from libs.retry_policy import deadline
+from libs.single_flight import SingleFlight
+
+CALLERS = 8
+
+
+def run_concurrently(fn, count=CALLERS):
+    """Call ``fn`` from ``count`` threads released at the same moment."""
+    barrier = threading.Barrier(count)
+
+    def call():
+        barrier.wait()
+        return fn()
+
+    with ThreadPoolExecutor(max_workers=count) as executor:
+        futures = [executor.submit(call) for _ in range(count)]
+    return futures
+
+
+class TestSingleFlight:
+    """Unit tests for SingleFlight."""
+
+    def test_concurrent_calls_share_one_execution(self) -> None:
+        """Test identical in-flight calls run once and get separate copies."""
+        flight = SingleFlight()
+        calls = []
+
+        def work():
+            calls.append(1)
+            time.sleep(0.05)
+            return {"items": [1]}
+
+        futures = run_concurrently(lambda: flight.do("k", work))
+        results = [f.result() for f in futures]
+
+        assert len(calls) == 1
+        assert all(r == {"items": [1]} for r in results)
+        assert len({id(r) for r in results}) == CALLERS
+        assert flight.stats.to_dict() == {"executed": 1, "collapsed": CALLERS - 1}
+
+    def test_error_shared_with_waiters(self) -> None:
+        """Test every waiter sees the leader's exception."""
+        flight = SingleFlight()
+
+        def work():
+            time.sleep(0.05)
+            raise APIRequestException("down")
+
+        futures = run_concurrently(lambda: flight.do("k", work))
+
+        for future in futures:
+            with pytest.raises(APIRequestException, match="down"):
+                future.result()
+        assert flight.stats.executed == 1
+
+    def test_waiters_honour_their_deadline(self) -> None:
+        """Test a waiter gives up at its deadline while the leader hangs."""
+        flight = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+
+        def work():
+            started.set()
+            release.wait(5)
+            return 1
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            leader = executor.submit(flight.do, "k", work)
+            started.wait(5)
+            began = time.monotonic()
+            with deadline(0.05), pytest.raises(TimeoutException, match="coalesced"):
+                flight.do("k", work)
+            waited = time.monotonic() - began
+            release.set()
+
+            assert leader.result() == 1
+        assert waited < 1
+
+    def test_sequential_calls_are_not_coalesced(self) -> None:
+        """Test nothing is reused once a flight has landed."""
+        flight = SingleFlight()
+        counter = iter(range(10))
+
+        assert flight.do("k", lambda: next(counter)) == 0
+        assert flight.do("k", lambda: next(counter)) == 1
+        assert flight.stats.collapsed == 0
+
+    def test_distinct_keys_run_separately(self) -> None:
+        """Test different keys never share a flight."""
+        flight = SingleFlight()
+        calls = []
+
+        def work(key):
+            calls.append(key)
+            time.sleep(0.02)
+            return key
+
+        barrier = threading.Barrier(2)
+
+        def call(key):
+            barrier.wait()
+            return flight.do(key, lambda: work(key))
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            results = list(executor.map(call, ["a", "b"]))
+
+        assert results == ["a", "b"]
+        assert sorted(calls) == ["a", "b"]
+
+
+class TestClientCoalescing:
+    """Tests for GET coalescing in BillingAPIClient."""
+
+    @staticmethod
+    def make_client(**kwargs):
+        """Build a client whose session answers slowly."""
+        client = BillingAPIClient("https://api.example.com", **kwargs)
+        response = Mock(status_code=200)
+        response.json.return_value = {"status": "RUNNING"}
+
+        def slow_request(**_kwargs):
+            time.sleep(0.05)
+            return response
+
+        client._session = Mock(headers={}, request=Mock(side_effect=slow_request))
+        return client
+
+    def test_polling_storm_sends_one_request(self) -> None:
+        """Test concurrent identical GETs hit the session once."""
+        client = self.make_client()
+
+        futures = run_concurrently(
+            lambda: client.get(
+                "billing/admin/progress", params={"month": "2024-01", "uuid": "u"}
+            )
+        )
+
+        assert all(f.result() == {"status": "RUNNING"} for f in futures)
+        assert client.session.request.call_count == 1
+        assert client.single_flight.stats.collapsed == CALLERS - 1
+
+    def test_different_headers_not_coalesced(self) -> None:
+        """Test requests differing in headers are sent separately."""
+        client = self.make_client()
+        uuids = iter(f"uuid-{i}" for i in range(CALLERS))
+        lock = threading.Lock()
+
+        def get():
+            with lock:
+                uuid = next(uuids)
+            return client.get("billing/credits/balance", headers={"uuid": uuid})
+
+        for future in run_concurrently(get):
+            future.result()
+
+        assert client.session.request.call_count == CALLERS
+
+    def test_mutations_never_coalesced(self) -> None:
+        """Test identical concurrent POSTs are all sent."""
+        client = self.make_client()
+
+        for future in run_concurrently(
+            lambda: client.post("billing/meters", json_data={"meterList": []})
+        ):
+            future.result()
+
+        assert client.session.request.call_count == CALLERS
+
+    def test_coalescing_can_be_disabled(self) -> None:
+        """Test coalesce_gets=False sends every GET."""
+        client = self.make_client(coalesce_gets=False)
+
+        for future in run_concurrently(lambda: client.get("billing/admin/progress")):
+            future.result()
+
+        assert client.single_flight is None
+        assert client.session.request.call_count == CALLERS
@@ -0,0 +1,89 @@
+"""Unit tests for memoized metering timestamp parsing."""
+
+from datetime import UTC, datetime, timedelta, timezone
+
+import pytest
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
+from libs.metering_aggregator import MeteringAggregator
+from libs.timestamp_parser import (
+    _parse_with_strptime,
+    epoch_microseconds,
+    parse_epoch_us,
+    parse_timestamp,
+)
+
+KST = timezone(timedelta(hours=9))
+
+SHAPES = [
+    "{:%Y-%m-%dT%H:%M:%S}.{ms:03d}+09:00",
+    "{:%Y-%m-%dT%H:%M:%S}.{us:06d}+0900",
+    "{:%Y-%m-%dT%H:%M:%S}.{ms:03d}Z",
+    "{:%Y-%m-%dT%H:%M:%S}-05:30",
+    "{:%Y-%m-%dT%H:%M:%S}",
+    "{:%Y-%m-%d %H:%M:%S}",
+    "{:%Y-%m-%dT%H:%M:%S}.{ms:03d}",
+    "{:%Y-%m-%d %H:%M:%S}+09:00",
+    "{:%Y-%m-%d}",
+    "{:%Y-%m-%dT%H:%M}",
+]
+
+
+class TestParseTimestamp:
+    """Unit tests for parse_timestamp."""
+
+    @settings(max_examples=200, deadline=None)
+    @given(
+        moment=st.datetimes(min_value=datetime(1971, 1, 1)),
+        shape=st.sampled_from(SHAPES),
+    )
+    def test_matches_strptime(self, moment, shape) -> None:
+        """Test the fast path agrees with the strptime formats, even on misses."""
+        value = shape.format(
+            moment, ms=moment.microsecond // 1000, us=moment.microsecond
+        )
+
+        assert parse_timestamp.__wrapped__(value) == _parse_with_strptime(value)
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            (
+                "2024-01-01T13:00:00.000+09:00",
+                datetime(2024, 1, 1, 13, tzinfo=KST),
+            ),
+            ("2024-01-01T04:00:00Z", datetime(2024, 1, 1, 4, tzinfo=UTC)),
+            ("2024-01-01 13:00:00", datetime(2024, 1, 1, 13)),
+            ("2024-1-5T13:00:00", datetime(2024, 1, 5, 13)),
+            ("2024-04-31T13:00:00", None),
+            ("yesterday", None),
+        ],
+    )
+    def test_values(self, value, expected) -> None:
+        """Test common, lenient and invalid strings."""
+        assert parse_timestamp(value) == expected
+
+    def test_repeats_are_cached(self) -> None:
+        """Test a repeated string is parsed once and returns the same object."""
+        parse_timestamp.cache_clear()
+
+        first = parse_timestamp("2024-02-01T13:00:00.000+09:00")
+        again = parse_timestamp("2024-02-01T13:00:00.000+09:00")
+
+        assert again is first
+        assert parse_timestamp.cache_info().hits == 1
+
+    def test_epoch_microseconds(self) -> None:
+        """Test aware times convert by instant and naive times as UTC."""
+        assert parse_epoch_us("2024-01-01T09:00:00.000+09:00") == 1704067200000000
+        assert parse_epoch_us("2024-01-01 00:00:00") == 1704067200000000
+        assert parse_epoch_us("not a time") is None
+        assert epoch_microseconds(datetime(1970, 1, 1, 0, 0, 1)) == 1_000_000
+
+    def test_aggregator_falls_back_to_now(self) -> None:
+        """Test empty and unparseable strings still map to the current time."""
+        before = datetime.now()
+
+        for value in ("", "not a time"):
+            assert MeteringAggregator._parse_timestamp(value) >= before
@@ -0,0 +1,191 @@
+"""Unit tests for the in-process WSGI transports."""
+
+import asyncio
+import json
+
+import pytest
+import requests
+from requests.exceptions import RetryError
+
+from libs.exceptions import APIRequestException
+from libs.http_client import BillingAPIClient, PolicyRetry, RetryConfig
+from libs.wsgi_transport import WSGIAdapter
+
+BASE_URL = "http://app.in-process"
+OK_BODY = {"header": {"isSuccessful": True, "resultMessage": "SUCCESS"}}
+
+
+class EchoApp:
+    """WSGI app that echoes the request and can fail on demand."""
+
+    def __init__(self, failures: int = 0, status: str = "503 Service Unavailable"):
+        self.failures = failures
+        self.status = status
+        self.calls = 0
+
+    def __call__(self, environ, start_response):
+        self.calls += 1
+        if self.calls <= self.failures:
+            start_response(self.status, [("Content-Type", "application/json")])
+            return [b'{"error": "busy"}']
+
+        body = environ["wsgi.input"].read(int(environ.get("CONTENT_LENGTH") or 0))
+        payload = {
+            **OK_BODY,
+            "method": environ["REQUEST_METHOD"],
+            "path": environ["PATH_INFO"],
+            "query": environ["QUERY_STRING"],
+            "host": environ["HTTP_HOST"],
+            "contentType": environ.get("CONTENT_TYPE"),
+            "custom": environ.get("HTTP_X_CUSTOM"),
+            "body": body.decode(),
+        }
+        start_response(
+            "201 Created",
+            [
+                ("Content-Type", "application/json"),
+                ("Set-Cookie", "a=1; Path=/"),
+                ("Set-Cookie", "b=2; Path=/"),
+            ],
+        )
+        return [json.dumps(payload).encode()]
+
+
+def streaming_app(environ, start_response):
+    """WSGI app whose generator calls start_response on its first step."""
+    start_response("200 OK", [("Content-Type", "text/event-stream")])
+    yield b"data: one\n\n"
+    yield b""
+    yield b"data: two\n\n"
+
+
+def failing_app(environ, start_response):
+    """WSGI app that raises before responding."""
+    raise RuntimeError("handler bug")
+
+
+def session_for(app, **adapter_kwargs) -> requests.Session:
+    session = requests.Session()
+    session.mount("http://", WSGIAdapter(app, **adapter_kwargs))
+    return session
+
+
+class TestWSGIAdapter:
+    """Unit tests for WSGIAdapter."""
+
+    def test_request_reaches_app_as_server_would(self) -> None:
+        """Test method, path, query, headers and body are translated."""
+        response = session_for(EchoApp()).post(
+            f"{BASE_URL}/billing/a%20b?month=2024-01",
+            json={"x": 1},
+            headers={"X-Custom": "yes"},
+        )
+
+        assert response.status_code == 201
+        assert response.reason == "Created"
+        assert response.json() == {
+            **OK_BODY,
+            "method": "POST",
+            "path": "/billing/a b",
+            "query": "month=2024-01",
+            "host": "app.in-process",
+            "contentType": "application/json",
+            "custom": "yes",
+            "body": '{"x": 1}',
+        }
+
+    def test_repeated_headers_and_cookies(self) -> None:
+        """Test repeated headers survive and cookies reach the session jar."""
+        session = session_for(EchoApp())
+
+        response = session.get(f"{BASE_URL}/")
+
+        assert response.raw.headers.getlist("Set-Cookie") == [
+            "a=1; Path=/",
+            "b=2; Path=/",
+        ]
+        assert session.cookies.get_dict() == {"a": "1", "b": "2"}
+
+    def test_streamed_body(self) -> None:
+        """Test generator bodies can be consumed incrementally."""
+        response = session_for(streaming_app).get(f"{BASE_URL}/events", stream=True)
+
+        assert response.headers["Content-Type"] == "text/event-stream"
+        assert list(response.iter_lines()) == [b"data: one", b"", b"data: two", b""]
+
+    def test_application_error_becomes_500(self) -> None:
+        """Test an exception in the app is answered like a WSGI server would."""
+        response = session_for(failing_app).get(f"{BASE_URL}/")
+
+        assert response.status_code == 500
+        assert response.text == "Internal Server Error"
+
+    def test_status_retries_follow_retry_config(self) -> None:
+        """Test retryable statuses are retried by the mounted Retry."""
+        app = EchoApp(failures=2)
+        retry = PolicyRetry(total=2, status_forcelist=[503], backoff_factor=0)
+
+        response = session_for(app, max_retries=retry).get(f"{BASE_URL}/")
+
+        assert response.status_code == 201
+        assert app.calls == 3
+
+    def test_retries_exhausted(self) -> None:
+        """Test exhausted status retries raise RetryError like HTTPAdapter."""
+        app = EchoApp(failures=10)
+        retry = PolicyRetry(total=1, status_forcelist=[503], backoff_factor=0)
+
+        with pytest.raises(RetryError):
+            session_for(app, max_retries=retry).get(f"{BASE_URL}/")
+        assert app.calls == 2
+
+
+class TestClientWSGIApp:
+    """Tests for clients created with a WSGI application."""
+
+    def test_sync_client(self) -> None:
+        """Test BillingAPIClient validates in-process responses as usual."""
+        with BillingAPIClient(BASE_URL, wsgi_app=EchoApp()) as client:
+            data = client.get("billing/meters", params={"page": 1})
+
+        assert data["path"] == "/billing/meters"
+        assert data["query"] == "page=1"
+
+    def test_sync_client_error_status(self) -> None:
+        """Test error statuses surface as API errors after retries."""
+        app = EchoApp(failures=10, status="400 Bad Request")
+
+        with (
+            BillingAPIClient(
+                BASE_URL, retry_config=RetryConfig(backoff_factor=0), wsgi_app=app
+            ) as client,
+            pytest.raises(APIRequestException, match="HTTP 400: busy"),
+        ):
+            client.get("billing/meters")
+        assert app.calls == 1
+
+    def test_async_client(self) -> None:
+        """Test AsyncBillingAPIClient calls the app through AsyncWSGITransport."""
+        pytest.importorskip("httpx")
+        from libs.async_http_client import AsyncBillingAPIClient
+
+        async def scenario():
+            async with AsyncBillingAPIClient(BASE_URL, wsgi_app=EchoApp()) as client:
+                return await client.post("billing/meters", json_data={"n": 1})
+
+        data = asyncio.run(scenario())
+
+        assert data["method"] == "POST"
+        assert json.loads(data["body"]) == {"n": 1}
+
+    def test_mock_server_app(self) -> None:
+        """Test the mock server answers in-process with its real headers."""
+        pytest.importorskip("flask")
+        from mock_server.app import app
+
+        with BillingAPIClient(BASE_URL, wsgi_app=app) as client:
+            response = client.session.get(f"{BASE_URL}/health")
+
+        assert response.status_code == 200
+        assert response.headers["Content-Type"] == "application/json"
+        assert "ETag" in response.headers